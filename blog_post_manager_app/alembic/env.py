@@ -12,7 +12,7 @@ from src.database import Base
 from src.config import settings
 
 # Import all models so Alembic can detect them
-from src.models import User, Post, Tag  # noqa: F401
+from src.models import IdempotencyKey, User, Post, PostBody, PostCard, PostRevision, Tag  # noqa: F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
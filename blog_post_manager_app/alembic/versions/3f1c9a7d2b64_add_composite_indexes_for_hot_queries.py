@@ -0,0 +1,52 @@
+"""Add composite indexes for hot list, search and tag queries
+
+Revision ID: 3f1c9a7d2b64
+Revises: 877a5d043661
+Create Date: 2026-10-19 09:12:40.118203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a7d2b64'
+down_revision: Union[str, Sequence[str], None] = '877a5d043661'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # list_posts: WHERE status = ? ORDER BY created_at DESC LIMIT ?
+    op.create_index(
+        'ix_posts_status_created_at',
+        'posts',
+        ['status', 'created_at'],
+        unique=False,
+    )
+
+    # search / posts-by-tag: WHERE status = 'published' ORDER BY publication_date DESC
+    op.create_index(
+        'ix_posts_status_publication_date',
+        'posts',
+        ['status', 'publication_date'],
+        unique=False,
+    )
+
+    # post_tags primary key is (post_id, tag_id); tag -> posts lookups need tag_id first
+    op.create_index(
+        'ix_post_tags_tag_id',
+        'post_tags',
+        ['tag_id', 'post_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_post_tags_tag_id', table_name='post_tags')
+    op.drop_index('ix_posts_status_publication_date', table_name='posts')
+    op.drop_index('ix_posts_status_created_at', table_name='posts')
@@ -0,0 +1,32 @@
+"""Add a row version to posts for optimistic concurrency
+
+Revision ID: 5b2e8c41d7a9
+Revises: 976b7d950764
+Create Date: 2026-10-19 16:20:37.512904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b2e8c41d7a9'
+down_revision: Union[str, Sequence[str], None] = '976b7d950764'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A constant default: existing rows get version 1 without a table rewrite
+    op.add_column(
+        'posts',
+        sa.Column('version', sa.Integer(), server_default='1', nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('posts', 'version')
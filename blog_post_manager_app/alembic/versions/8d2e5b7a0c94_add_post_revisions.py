@@ -0,0 +1,78 @@
+"""Add post_revisions, stored as snapshots and compressed deltas
+
+Revision ID: 8d2e5b7a0c94
+Revises: f4c1a8d27e53
+Create Date: 2026-10-20 03:18:45.917302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2e5b7a0c94'
+down_revision: Union[str, Sequence[str], None] = 'f4c1a8d27e53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Removes the revisions of deleted posts, in place of ON DELETE CASCADE
+POST_REVISION_DDL = [
+    """
+    CREATE OR REPLACE FUNCTION posts_revisions_cascade_delete() RETURNS trigger AS $$
+    BEGIN
+        DELETE FROM post_revisions WHERE post_id IN (SELECT id FROM deleted_posts);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS posts_revisions_cascade_delete ON posts",
+    """
+    CREATE TRIGGER posts_revisions_cascade_delete
+        AFTER DELETE ON posts
+        REFERENCING OLD TABLE AS deleted_posts
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION posts_revisions_cascade_delete()
+    """,
+]
+
+POST_REVISION_DROP_DDL = [
+    "DROP TRIGGER IF EXISTS posts_revisions_cascade_delete ON posts",
+    "DROP FUNCTION IF EXISTS posts_revisions_cascade_delete()",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing posts get no history here: their first update records a snapshot
+    op.create_table(
+        'post_revisions',
+        sa.Column('post_id', sa.Integer(), nullable=False),
+        sa.Column('revision', sa.Integer(), nullable=False),
+        sa.Column('deltas', sa.SmallInteger(), nullable=False),
+        sa.Column('title', sa.String(length=200), nullable=False),
+        sa.Column('excerpt', sa.String(length=500), nullable=True),
+        sa.Column('data', sa.LargeBinary(), nullable=True),
+        sa.Column('blob_key', sa.String(length=64), nullable=True),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.CheckConstraint(
+            '(data IS NULL) <> (blob_key IS NULL) AND (blob_key IS NULL OR deltas = 0)',
+            name='ck_post_revisions_data_or_blob',
+        ),
+        sa.PrimaryKeyConstraint('post_id', 'revision'),
+    )
+    for statement in POST_REVISION_DDL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for statement in POST_REVISION_DROP_DDL:
+        op.execute(statement)
+    op.drop_table('post_revisions')
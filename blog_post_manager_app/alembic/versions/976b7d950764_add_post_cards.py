@@ -0,0 +1,206 @@
+"""Add post_cards with pre-serialized list items, kept current by triggers
+
+Revision ID: 976b7d950764
+Revises: 3f1c9a7d2b64
+Create Date: 2026-10-19 14:05:12.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '976b7d950764'
+down_revision: Union[str, Sequence[str], None] = '3f1c9a7d2b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The card builder as of this revision: the card upsert PostService runs
+# (src.services.post_cards), for an array of post IDs
+REFRESH_POST_CARDS_FUNCTION = """
+    CREATE OR REPLACE FUNCTION refresh_post_cards(post_ids integer[]) RETURNS void AS $$
+    INSERT INTO post_cards (post_id, author_id, status, publication_date, created_at, document)
+    SELECT
+        posts.id,
+        posts.author_id,
+        posts.status,
+        posts.publication_date,
+        posts.created_at,
+        json_build_object(
+            'id', posts.id,
+            'title', posts.title,
+            'excerpt', posts.excerpt,
+            'status', CAST(posts.status AS TEXT),
+            'publication_date',
+                to_char(posts.publication_date AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS')
+                || CASE WHEN to_char(posts.publication_date AT TIME ZONE 'UTC', '.US') = '.000000'
+                   THEN '' ELSE to_char(posts.publication_date AT TIME ZONE 'UTC', '.US') END
+                || 'Z',
+            'created_at',
+                to_char(posts.created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS')
+                || CASE WHEN to_char(posts.created_at AT TIME ZONE 'UTC', '.US') = '.000000'
+                   THEN '' ELSE to_char(posts.created_at AT TIME ZONE 'UTC', '.US') END
+                || 'Z',
+            'author', json_build_object(
+                'email', users.email,
+                'username', users.username,
+                'full_name', users.full_name,
+                'id', users.id,
+                'is_active', users.is_active,
+                'created_at',
+                    to_char(users.created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS')
+                    || CASE WHEN to_char(users.created_at AT TIME ZONE 'UTC', '.US') = '.000000'
+                       THEN '' ELSE to_char(users.created_at AT TIME ZONE 'UTC', '.US') END
+                    || 'Z',
+                'updated_at',
+                    to_char(users.updated_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS')
+                    || CASE WHEN to_char(users.updated_at AT TIME ZONE 'UTC', '.US') = '.000000'
+                       THEN '' ELSE to_char(users.updated_at AT TIME ZONE 'UTC', '.US') END
+                    || 'Z'
+            ),
+            'tags', post_tags_json.tags
+        )
+    FROM posts
+    JOIN users ON posts.author_id = users.id
+    JOIN LATERAL (
+        SELECT coalesce(
+            json_agg(
+                json_build_object(
+                    'name', tags.name,
+                    'id', tags.id,
+                    'created_at',
+                        to_char(tags.created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS')
+                        || CASE WHEN to_char(tags.created_at AT TIME ZONE 'UTC', '.US') = '.000000'
+                           THEN '' ELSE to_char(tags.created_at AT TIME ZONE 'UTC', '.US') END
+                        || 'Z',
+                    'post_count', NULL
+                )
+                ORDER BY tags.name
+            ),
+            CAST('[]' AS JSON)
+        ) AS tags
+        FROM post_tags JOIN tags ON tags.id = post_tags.tag_id
+        WHERE post_tags.post_id = posts.id
+    ) AS post_tags_json ON true
+    WHERE posts.id = ANY (post_ids)
+    ON CONFLICT (post_id) DO UPDATE SET
+        author_id = excluded.author_id,
+        status = excluded.status,
+        publication_date = excluded.publication_date,
+        created_at = excluded.created_at,
+        document = excluded.document;
+    $$ LANGUAGE sql
+    """
+
+# Triggers keeping cards current when an author or a tag changes. On tag
+# delete the tag's links are removed first, so the rebuilt cards no longer
+# list it when the cascade runs after.
+POST_CARD_TRIGGER_DDL = [
+    """
+    CREATE OR REPLACE FUNCTION post_cards_author_trigger() RETURNS trigger AS $$
+    BEGIN
+        PERFORM refresh_post_cards(ARRAY(SELECT id FROM posts WHERE author_id = NEW.id));
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION post_cards_tag_trigger() RETURNS trigger AS $$
+    DECLARE
+        affected integer[];
+    BEGIN
+        affected := ARRAY(SELECT post_id FROM post_tags WHERE tag_id = OLD.id);
+
+        IF TG_OP = 'DELETE' THEN
+            DELETE FROM post_tags WHERE tag_id = OLD.id;
+            PERFORM refresh_post_cards(affected);
+            RETURN OLD;
+        END IF;
+
+        PERFORM refresh_post_cards(affected);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS post_cards_author_update ON users",
+    """
+    CREATE TRIGGER post_cards_author_update
+        AFTER UPDATE ON users
+        FOR EACH ROW
+        EXECUTE FUNCTION post_cards_author_trigger()
+    """,
+    "DROP TRIGGER IF EXISTS post_cards_tag_update ON tags",
+    """
+    CREATE TRIGGER post_cards_tag_update
+        AFTER UPDATE ON tags
+        FOR EACH ROW
+        WHEN (OLD.name IS DISTINCT FROM NEW.name OR OLD.created_at IS DISTINCT FROM NEW.created_at)
+        EXECUTE FUNCTION post_cards_tag_trigger()
+    """,
+    "DROP TRIGGER IF EXISTS post_cards_tag_delete ON tags",
+    """
+    CREATE TRIGGER post_cards_tag_delete
+        BEFORE DELETE ON tags
+        FOR EACH ROW
+        EXECUTE FUNCTION post_cards_tag_trigger()
+    """,
+]
+
+POST_CARD_DROP_DDL = [
+    "DROP TRIGGER IF EXISTS post_cards_tag_delete ON tags",
+    "DROP TRIGGER IF EXISTS post_cards_tag_update ON tags",
+    "DROP TRIGGER IF EXISTS post_cards_author_update ON users",
+    "DROP FUNCTION IF EXISTS post_cards_tag_trigger()",
+    "DROP FUNCTION IF EXISTS post_cards_author_trigger()",
+    "DROP FUNCTION IF EXISTS refresh_post_cards(integer[])",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'post_cards',
+        sa.Column('post_id', sa.Integer(), nullable=False),
+        sa.Column('author_id', sa.Integer(), nullable=False),
+        sa.Column(
+            'status',
+            postgresql.ENUM('draft', 'published', 'archived', name='poststatus', create_type=False),
+            nullable=False,
+        ),
+        sa.Column('publication_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('document', sa.JSON(), nullable=False),
+        sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('post_id'),
+    )
+    op.create_index('ix_post_cards_author_id', 'post_cards', ['author_id'], unique=False)
+    op.create_index(
+        'ix_post_cards_status_created_at', 'post_cards', ['status', 'created_at'], unique=False
+    )
+    op.create_index(
+        'ix_post_cards_status_publication_date',
+        'post_cards',
+        ['status', 'publication_date'],
+        unique=False,
+    )
+
+    op.execute(REFRESH_POST_CARDS_FUNCTION)
+    for statement in POST_CARD_TRIGGER_DDL:
+        op.execute(statement)
+
+    # Backfill cards for existing posts
+    op.execute("SELECT refresh_post_cards(ARRAY(SELECT id FROM posts))")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for statement in POST_CARD_DROP_DDL:
+        op.execute(statement)
+
+    op.drop_index('ix_post_cards_status_publication_date', table_name='post_cards')
+    op.drop_index('ix_post_cards_status_created_at', table_name='post_cards')
+    op.drop_index('ix_post_cards_author_id', table_name='post_cards')
+    op.drop_table('post_cards')
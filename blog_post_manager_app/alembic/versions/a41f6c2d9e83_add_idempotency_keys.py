@@ -0,0 +1,39 @@
+"""Add idempotency_keys with the recorded responses of idempotent requests
+
+Revision ID: a41f6c2d9e83
+Revises: 5b2e8c41d7a9
+Create Date: 2026-10-19 18:05:12.284113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41f6c2d9e83'
+down_revision: Union[str, Sequence[str], None] = '5b2e8c41d7a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'idempotency_keys',
+        sa.Column('key', sa.String(length=320), nullable=False),
+        sa.Column('fingerprint', sa.String(length=64), nullable=False),
+        sa.Column('response', sa.Text(), nullable=True),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('key'),
+    )
+    op.create_index(
+        op.f('ix_idempotency_keys_expires_at'), 'idempotency_keys', ['expires_at'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_idempotency_keys_expires_at'), table_name='idempotency_keys')
+    op.drop_table('idempotency_keys')
@@ -0,0 +1,230 @@
+"""Soft-delete posts with deleted_at; hot indexes cover live posts only
+
+Revision ID: c7d3e9a15f20
+Revises: a41f6c2d9e83
+Create Date: 2026-10-19 19:02:51.640377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d3e9a15f20'
+down_revision: Union[str, Sequence[str], None] = 'a41f6c2d9e83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Indexes rebuilt as partial indexes over live posts: (name, columns, using)
+LIVE_INDEXES = [
+    ('ix_posts_status_created_at', ['status', 'created_at'], None),
+    ('ix_posts_status_publication_date', ['status', 'publication_date'], None),
+    ('ix_posts_search_vector', ['search_vector'], 'gin'),
+]
+
+# The card builder dropping the cards of deleted posts instead of rebuilding them
+REFRESH_POST_CARDS_FUNCTION = """
+    CREATE OR REPLACE FUNCTION refresh_post_cards(post_ids integer[]) RETURNS void AS $$
+    DELETE FROM post_cards USING posts
+    WHERE post_cards.post_id = posts.id
+        AND posts.id = ANY (post_ids)
+        AND posts.deleted_at IS NOT NULL;
+    INSERT INTO post_cards (post_id, author_id, status, publication_date, created_at, document)
+    SELECT
+        posts.id,
+        posts.author_id,
+        posts.status,
+        posts.publication_date,
+        posts.created_at,
+        json_build_object(
+            'id', posts.id,
+            'title', posts.title,
+            'excerpt', posts.excerpt,
+            'status', CAST(posts.status AS TEXT),
+            'publication_date',
+                to_char(posts.publication_date AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS')
+                || CASE WHEN to_char(posts.publication_date AT TIME ZONE 'UTC', '.US') = '.000000'
+                   THEN '' ELSE to_char(posts.publication_date AT TIME ZONE 'UTC', '.US') END
+                || 'Z',
+            'created_at',
+                to_char(posts.created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS')
+                || CASE WHEN to_char(posts.created_at AT TIME ZONE 'UTC', '.US') = '.000000'
+                   THEN '' ELSE to_char(posts.created_at AT TIME ZONE 'UTC', '.US') END
+                || 'Z',
+            'author', json_build_object(
+                'email', users.email,
+                'username', users.username,
+                'full_name', users.full_name,
+                'id', users.id,
+                'is_active', users.is_active,
+                'created_at',
+                    to_char(users.created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS')
+                    || CASE WHEN to_char(users.created_at AT TIME ZONE 'UTC', '.US') = '.000000'
+                       THEN '' ELSE to_char(users.created_at AT TIME ZONE 'UTC', '.US') END
+                    || 'Z',
+                'updated_at',
+                    to_char(users.updated_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS')
+                    || CASE WHEN to_char(users.updated_at AT TIME ZONE 'UTC', '.US') = '.000000'
+                       THEN '' ELSE to_char(users.updated_at AT TIME ZONE 'UTC', '.US') END
+                    || 'Z'
+            ),
+            'tags', post_tags_json.tags
+        )
+    FROM posts
+    JOIN users ON posts.author_id = users.id
+    JOIN LATERAL (
+        SELECT coalesce(
+            json_agg(
+                json_build_object(
+                    'name', tags.name,
+                    'id', tags.id,
+                    'created_at',
+                        to_char(tags.created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS')
+                        || CASE WHEN to_char(tags.created_at AT TIME ZONE 'UTC', '.US') = '.000000'
+                           THEN '' ELSE to_char(tags.created_at AT TIME ZONE 'UTC', '.US') END
+                        || 'Z',
+                    'post_count', NULL
+                )
+                ORDER BY tags.name
+            ),
+            CAST('[]' AS JSON)
+        ) AS tags
+        FROM post_tags JOIN tags ON tags.id = post_tags.tag_id
+        WHERE post_tags.post_id = posts.id
+    ) AS post_tags_json ON true
+    WHERE posts.id = ANY (post_ids) AND posts.deleted_at IS NULL
+    ON CONFLICT (post_id) DO UPDATE SET
+        author_id = excluded.author_id,
+        status = excluded.status,
+        publication_date = excluded.publication_date,
+        created_at = excluded.created_at,
+        document = excluded.document;
+    $$ LANGUAGE sql
+    """
+
+# The card builder as installed by add_post_cards, restored on downgrade
+REFRESH_POST_CARDS_FUNCTION_WITH_DELETED = """
+    CREATE OR REPLACE FUNCTION refresh_post_cards(post_ids integer[]) RETURNS void AS $$
+    INSERT INTO post_cards (post_id, author_id, status, publication_date, created_at, document)
+    SELECT
+        posts.id,
+        posts.author_id,
+        posts.status,
+        posts.publication_date,
+        posts.created_at,
+        json_build_object(
+            'id', posts.id,
+            'title', posts.title,
+            'excerpt', posts.excerpt,
+            'status', CAST(posts.status AS TEXT),
+            'publication_date',
+                to_char(posts.publication_date AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS')
+                || CASE WHEN to_char(posts.publication_date AT TIME ZONE 'UTC', '.US') = '.000000'
+                   THEN '' ELSE to_char(posts.publication_date AT TIME ZONE 'UTC', '.US') END
+                || 'Z',
+            'created_at',
+                to_char(posts.created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS')
+                || CASE WHEN to_char(posts.created_at AT TIME ZONE 'UTC', '.US') = '.000000'
+                   THEN '' ELSE to_char(posts.created_at AT TIME ZONE 'UTC', '.US') END
+                || 'Z',
+            'author', json_build_object(
+                'email', users.email,
+                'username', users.username,
+                'full_name', users.full_name,
+                'id', users.id,
+                'is_active', users.is_active,
+                'created_at',
+                    to_char(users.created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS')
+                    || CASE WHEN to_char(users.created_at AT TIME ZONE 'UTC', '.US') = '.000000'
+                       THEN '' ELSE to_char(users.created_at AT TIME ZONE 'UTC', '.US') END
+                    || 'Z',
+                'updated_at',
+                    to_char(users.updated_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS')
+                    || CASE WHEN to_char(users.updated_at AT TIME ZONE 'UTC', '.US') = '.000000'
+                       THEN '' ELSE to_char(users.updated_at AT TIME ZONE 'UTC', '.US') END
+                    || 'Z'
+            ),
+            'tags', post_tags_json.tags
+        )
+    FROM posts
+    JOIN users ON posts.author_id = users.id
+    JOIN LATERAL (
+        SELECT coalesce(
+            json_agg(
+                json_build_object(
+                    'name', tags.name,
+                    'id', tags.id,
+                    'created_at',
+                        to_char(tags.created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS')
+                        || CASE WHEN to_char(tags.created_at AT TIME ZONE 'UTC', '.US') = '.000000'
+                           THEN '' ELSE to_char(tags.created_at AT TIME ZONE 'UTC', '.US') END
+                        || 'Z',
+                    'post_count', NULL
+                )
+                ORDER BY tags.name
+            ),
+            CAST('[]' AS JSON)
+        ) AS tags
+        FROM post_tags JOIN tags ON tags.id = post_tags.tag_id
+        WHERE post_tags.post_id = posts.id
+    ) AS post_tags_json ON true
+    WHERE posts.id = ANY (post_ids)
+    ON CONFLICT (post_id) DO UPDATE SET
+        author_id = excluded.author_id,
+        status = excluded.status,
+        publication_date = excluded.publication_date,
+        created_at = excluded.created_at,
+        document = excluded.document;
+    $$ LANGUAGE sql
+    """
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Nullable without a default: no table rewrite
+    op.add_column('posts', sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True))
+
+    # Cards of deleted posts are dropped instead of rebuilt
+    op.execute(REFRESH_POST_CARDS_FUNCTION)
+
+    # Build each partial index next to the full one and swap them, so reads
+    # and writes are not blocked while posts is indexed
+    with op.get_context().autocommit_block():
+        for name, columns, using in LIVE_INDEXES:
+            op.create_index(
+                f'{name}_live',
+                'posts',
+                columns,
+                unique=False,
+                postgresql_using=using,
+                postgresql_where=sa.text('deleted_at IS NULL'),
+                postgresql_concurrently=True,
+            )
+            op.drop_index(name, table_name='posts', postgresql_concurrently=True)
+            op.execute(f'ALTER INDEX {name}_live RENAME TO {name}')
+
+        # The purger's scan over deleted posts
+        op.create_index(
+            'ix_posts_deleted_at',
+            'posts',
+            ['deleted_at'],
+            unique=False,
+            postgresql_where=sa.text('deleted_at IS NOT NULL'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Posts awaiting the purger are removed for good
+    op.execute('DELETE FROM posts WHERE deleted_at IS NOT NULL')
+    op.execute(REFRESH_POST_CARDS_FUNCTION_WITH_DELETED)
+
+    op.drop_index('ix_posts_deleted_at', table_name='posts')
+    for name, columns, using in LIVE_INDEXES:
+        op.drop_index(name, table_name='posts')
+        op.create_index(name, 'posts', columns, unique=False, postgresql_using=using)
+
+    op.drop_column('posts', 'deleted_at')
@@ -0,0 +1,169 @@
+"""Move post content and search vectors to post_bodies
+
+Revision ID: d5a8f2c61b39
+Revises: c7d3e9a15f20
+Create Date: 2026-10-19 21:14:07.518266
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from src.services.post_bodies import supports_lz4
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a8f2c61b39'
+down_revision: Union[str, Sequence[str], None] = 'c7d3e9a15f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The search vector function and triggers as of this revision; later ones
+# replace them (see src.services.post_bodies for the current definitions)
+POST_BODY_DDL = [
+    """
+    CREATE OR REPLACE FUNCTION post_search_vector(title text, content text, excerpt text)
+    RETURNS tsvector AS $$
+        SELECT setweight(to_tsvector('english', COALESCE(title, '')), 'A') ||
+               setweight(to_tsvector('english', COALESCE(content, '')), 'B') ||
+               setweight(to_tsvector('english', COALESCE(excerpt, '')), 'C')
+    $$ LANGUAGE sql IMMUTABLE
+    """,
+    """
+    CREATE OR REPLACE FUNCTION post_bodies_search_vector_trigger() RETURNS trigger AS $$
+    BEGIN
+        SELECT post_search_vector(p.title, NEW.content, p.excerpt)
+        INTO NEW.search_vector
+        FROM posts AS p
+        WHERE p.id = NEW.post_id;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION posts_search_text_trigger() RETURNS trigger AS $$
+    BEGIN
+        UPDATE post_bodies
+        SET search_vector = post_search_vector(NEW.title, content, NEW.excerpt)
+        WHERE post_id = NEW.id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS post_bodies_search_vector_update ON post_bodies",
+    """
+    CREATE TRIGGER post_bodies_search_vector_update
+        BEFORE INSERT OR UPDATE OF content ON post_bodies
+        FOR EACH ROW
+        EXECUTE FUNCTION post_bodies_search_vector_trigger()
+    """,
+    "DROP TRIGGER IF EXISTS posts_search_text_update ON posts",
+    """
+    CREATE TRIGGER posts_search_text_update
+        AFTER UPDATE OF title, excerpt ON posts
+        FOR EACH ROW
+        WHEN (OLD.title IS DISTINCT FROM NEW.title OR OLD.excerpt IS DISTINCT FROM NEW.excerpt)
+        EXECUTE FUNCTION posts_search_text_trigger()
+    """,
+]
+
+POST_BODY_DROP_DDL = [
+    "DROP TRIGGER IF EXISTS posts_search_text_update ON posts",
+    "DROP TRIGGER IF EXISTS post_bodies_search_vector_update ON post_bodies",
+    "DROP FUNCTION IF EXISTS posts_search_text_trigger()",
+    "DROP FUNCTION IF EXISTS post_bodies_search_vector_trigger()",
+    "DROP FUNCTION IF EXISTS post_search_vector(text, text, text)",
+]
+
+POST_BODY_LZ4_DDL = (
+    "ALTER TABLE post_bodies "
+    "ALTER COLUMN content SET COMPRESSION lz4, "
+    "ALTER COLUMN search_vector SET COMPRESSION lz4"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'post_bodies',
+        sa.Column('post_id', sa.Integer(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True),
+        sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('post_id'),
+    )
+
+    if supports_lz4(op.get_bind()):
+        op.execute(POST_BODY_LZ4_DDL)
+        # Values copied as they are would keep their pglz compression: building
+        # new ones has them compressed with LZ4 on the way in
+        op.execute(
+            "INSERT INTO post_bodies (post_id, content, search_vector) "
+            "SELECT id, content || '', search_vector || ''::tsvector FROM posts"
+        )
+    else:
+        op.execute(
+            "INSERT INTO post_bodies (post_id, content, search_vector) "
+            "SELECT id, content, search_vector FROM posts"
+        )
+    op.create_index(
+        'ix_post_bodies_search_vector',
+        'post_bodies',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+    op.execute("DROP TRIGGER IF EXISTS posts_search_vector_update ON posts")
+    op.execute("DROP FUNCTION IF EXISTS posts_search_vector_trigger()")
+    op.drop_index('ix_posts_search_vector', table_name='posts')
+    op.drop_column('posts', 'search_vector')
+    op.drop_column('posts', 'content')
+
+    for statement in POST_BODY_DDL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for statement in POST_BODY_DROP_DDL:
+        op.execute(statement)
+
+    op.add_column('posts', sa.Column('content', sa.Text(), nullable=True))
+    op.add_column('posts', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    op.execute(
+        "UPDATE posts SET content = b.content, search_vector = b.search_vector "
+        "FROM post_bodies AS b WHERE b.post_id = posts.id"
+    )
+    op.alter_column('posts', 'content', nullable=False)
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION posts_search_vector_trigger() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('english', COALESCE(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('english', COALESCE(NEW.content, '')), 'B') ||
+            setweight(to_tsvector('english', COALESCE(NEW.excerpt, '')), 'C');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+    CREATE TRIGGER posts_search_vector_update
+        BEFORE INSERT OR UPDATE ON posts
+        FOR EACH ROW
+        EXECUTE FUNCTION posts_search_vector_trigger();
+    """)
+    op.create_index(
+        'ix_posts_search_vector',
+        'posts',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+    op.drop_index('ix_post_bodies_search_vector', table_name='post_bodies')
+    op.drop_table('post_bodies')
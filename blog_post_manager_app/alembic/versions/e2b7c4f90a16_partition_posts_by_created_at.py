@@ -0,0 +1,197 @@
+"""Partition posts by month of created_at
+
+Revision ID: e2b7c4f90a16
+Revises: d5a8f2c61b39
+Create Date: 2026-10-19 23:02:41.730518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from src.config import settings
+from src.services.post_bodies import supports_lz4
+from src.services.post_partitions import initial_partition_ddl, utc_today
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7c4f90a16'
+down_revision: Union[str, Sequence[str], None] = 'd5a8f2c61b39'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+POST_COLUMNS = (
+    "id, author_id, title, excerpt, status, publication_date, "
+    "created_at, updated_at, version, deleted_at"
+)
+
+# Tables keyed by post ID, which referenced posts with ON DELETE CASCADE
+POST_KEYED_TABLES = ('post_tags', 'post_bodies', 'post_cards')
+
+# Removes the rows of POST_KEYED_TABLES for deleted posts, in place of the
+# foreign keys
+POST_CASCADE_DDL = [
+    """
+    CREATE OR REPLACE FUNCTION posts_cascade_delete() RETURNS trigger AS $$
+    BEGIN
+        DELETE FROM post_tags WHERE post_id IN (SELECT id FROM deleted_posts);
+        DELETE FROM post_bodies WHERE post_id IN (SELECT id FROM deleted_posts);
+        DELETE FROM post_cards WHERE post_id IN (SELECT id FROM deleted_posts);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS posts_cascade_delete ON posts",
+    """
+    CREATE TRIGGER posts_cascade_delete
+        AFTER DELETE ON posts
+        REFERENCING OLD TABLE AS deleted_posts
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION posts_cascade_delete()
+    """,
+]
+
+POST_CASCADE_DROP_DDL = [
+    "DROP TRIGGER IF EXISTS posts_cascade_delete ON posts",
+    "DROP FUNCTION IF EXISTS posts_cascade_delete()",
+]
+
+UPDATED_AT_TRIGGER = """
+    CREATE TRIGGER update_posts_updated_at
+        BEFORE UPDATE ON posts
+        FOR EACH ROW
+        EXECUTE FUNCTION update_updated_at_column()
+"""
+
+# Recomputes post_bodies.search_vector on title and excerpt changes; its
+# function, installed by add_post_bodies, outlives the table swap
+SEARCH_TEXT_TRIGGER = """
+    CREATE TRIGGER posts_search_text_update
+        AFTER UPDATE OF title, excerpt ON posts
+        FOR EACH ROW
+        WHEN (OLD.title IS DISTINCT FROM NEW.title OR OLD.excerpt IS DISTINCT FROM NEW.excerpt)
+        EXECUTE FUNCTION posts_search_text_trigger()
+"""
+
+
+def _create_posts(**kw) -> None:
+    """Create an empty posts table, without its keys and indexes."""
+    op.create_table(
+        'posts',
+        sa.Column(
+            'id',
+            sa.Integer(),
+            server_default=sa.text("nextval('posts_id_seq'::regclass)"),
+            nullable=False,
+        ),
+        sa.Column('author_id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(length=200), nullable=False),
+        sa.Column('excerpt', sa.String(length=500), nullable=True),
+        sa.Column(
+            'status',
+            postgresql.ENUM(name='poststatus', create_type=False),
+            nullable=False,
+        ),
+        sa.Column('publication_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.Column('version', sa.Integer(), server_default='1', nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+        **kw,
+    )
+
+
+def _replace_posts(create_partitions) -> None:
+    """Swap posts for a new, empty table, copy its rows over, then drop the old one."""
+    # Index and constraint names are per schema: move the old ones aside
+    op.execute("ALTER SEQUENCE posts_id_seq OWNED BY NONE")
+    op.execute("ALTER TABLE posts RENAME TO posts_old")
+    op.execute("ALTER TABLE posts_old RENAME CONSTRAINT posts_pkey TO posts_old_pkey")
+    op.execute("DROP TRIGGER IF EXISTS update_posts_updated_at ON posts_old")
+    op.execute("DROP TRIGGER IF EXISTS posts_search_text_update ON posts_old")
+
+    create_partitions()
+    op.execute(f"INSERT INTO posts ({POST_COLUMNS}) SELECT {POST_COLUMNS} FROM posts_old")
+    op.drop_table('posts_old')
+    op.execute("ALTER SEQUENCE posts_id_seq OWNED BY posts.id")
+
+    op.create_foreign_key(
+        'posts_author_id_fkey', 'posts', 'users', ['author_id'], ['id'], ondelete='RESTRICT'
+    )
+    op.create_index('ix_posts_id', 'posts', ['id'], unique=False)
+    op.create_index('ix_posts_author_id', 'posts', ['author_id'], unique=False)
+    op.create_index('ix_posts_status', 'posts', ['status'], unique=False)
+    op.create_index('ix_posts_publication_date', 'posts', ['publication_date'], unique=False)
+    op.create_index(
+        'ix_posts_status_created_at',
+        'posts',
+        ['status', 'created_at'],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+    op.create_index(
+        'ix_posts_status_publication_date',
+        'posts',
+        ['status', 'publication_date'],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+    op.create_index(
+        'ix_posts_deleted_at',
+        'posts',
+        ['deleted_at'],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NOT NULL'),
+    )
+
+    op.execute(UPDATED_AT_TRIGGER)
+    op.execute(SEARCH_TEXT_TRIGGER)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in POST_KEYED_TABLES:
+        op.drop_constraint(f'{table}_post_id_fkey', table, type_='foreignkey')
+
+    def create_partitions() -> None:
+        _create_posts(postgresql_partition_by='RANGE (created_at)')
+        for statement in initial_partition_ddl(
+            utc_today(),
+            settings.post_partition_hot_months,
+            settings.post_partition_premake_months,
+            supports_lz4(op.get_bind()),
+        ):
+            op.execute(statement)
+
+    _replace_posts(create_partitions)
+    # The key must include the partition key; built once the rows are in
+    op.create_primary_key('posts_pkey', 'posts', ['id', 'created_at'])
+
+    for statement in POST_CASCADE_DDL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for statement in POST_CASCADE_DROP_DDL:
+        op.execute(statement)
+
+    _replace_posts(_create_posts)
+    op.create_primary_key('posts_pkey', 'posts', ['id'])
+
+    for table in POST_KEYED_TABLES:
+        op.create_foreign_key(
+            f'{table}_post_id_fkey', table, 'posts', ['post_id'], ['id'], ondelete='CASCADE'
+        )
@@ -0,0 +1,133 @@
+"""Offload large post bodies to a blob store
+
+Revision ID: f4c1a8d27e53
+Revises: e2b7c4f90a16
+Create Date: 2026-10-20 01:37:12.204815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from src.config import settings
+from src.services.post_bodies import supports_lz4
+from src.utils.blob_store import create_blob_store
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4c1a8d27e53'
+down_revision: Union[str, Sequence[str], None] = 'e2b7c4f90a16'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The search vector functions as of this revision: an overload building the
+# vector from an offloaded content's stored terms, and trigger functions
+# picking it when content is NULL. The triggers themselves are unchanged.
+SEARCH_VECTOR_DDL = [
+    """
+    CREATE OR REPLACE FUNCTION post_search_vector(title text, content_vector tsvector, excerpt text)
+    RETURNS tsvector AS $$
+        SELECT setweight(to_tsvector('english', COALESCE(title, '')), 'A') ||
+               COALESCE(content_vector, ''::tsvector) ||
+               setweight(to_tsvector('english', COALESCE(excerpt, '')), 'C')
+    $$ LANGUAGE sql IMMUTABLE
+    """,
+    """
+    CREATE OR REPLACE FUNCTION post_bodies_search_vector_trigger() RETURNS trigger AS $$
+    BEGIN
+        SELECT CASE
+                   WHEN NEW.content IS NULL
+                   THEN post_search_vector(p.title, NEW.content_vector, p.excerpt)
+                   ELSE post_search_vector(p.title, NEW.content, p.excerpt)
+               END
+        INTO NEW.search_vector
+        FROM posts AS p
+        WHERE p.id = NEW.post_id;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION posts_search_text_trigger() RETURNS trigger AS $$
+    BEGIN
+        UPDATE post_bodies
+        SET search_vector = CASE
+                WHEN content IS NULL
+                THEN post_search_vector(NEW.title, content_vector, NEW.excerpt)
+                ELSE post_search_vector(NEW.title, content, NEW.excerpt)
+            END
+        WHERE post_id = NEW.id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+]
+
+CONTENT_VECTOR_LZ4_DDL = (
+    "ALTER TABLE post_bodies ALTER COLUMN content_vector SET COMPRESSION lz4"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('post_bodies', sa.Column('blob_key', sa.String(length=64), nullable=True))
+    op.add_column('post_bodies', sa.Column('content_vector', postgresql.TSVECTOR(), nullable=True))
+    op.alter_column('post_bodies', 'content', nullable=True)
+    op.create_check_constraint(
+        'ck_post_bodies_content_or_blob', 'post_bodies', '(content IS NULL) <> (blob_key IS NULL)'
+    )
+    if supports_lz4(op.get_bind()):
+        op.execute(CONTENT_VECTOR_LZ4_DDL)
+
+    for statement in SEARCH_VECTOR_DDL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Bring offloaded contents back inline; the search vector trigger then
+    # recomputes their vectors from the content
+    bind = op.get_bind()
+    offloaded = bind.execute(
+        sa.text("SELECT post_id, blob_key FROM post_bodies WHERE blob_key IS NOT NULL")
+    ).all()
+    if offloaded:
+        blobs = create_blob_store(settings)
+        for post_id, key in offloaded:
+            bind.execute(
+                sa.text(
+                    "UPDATE post_bodies SET content = :content, blob_key = NULL, "
+                    "content_vector = NULL WHERE post_id = :post_id"
+                ),
+                {"content": blobs.read(key).decode(), "post_id": post_id},
+            )
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION post_bodies_search_vector_trigger() RETURNS trigger AS $$
+    BEGIN
+        SELECT post_search_vector(p.title, NEW.content, p.excerpt)
+        INTO NEW.search_vector
+        FROM posts AS p
+        WHERE p.id = NEW.post_id;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+    CREATE OR REPLACE FUNCTION posts_search_text_trigger() RETURNS trigger AS $$
+    BEGIN
+        UPDATE post_bodies
+        SET search_vector = post_search_vector(NEW.title, content, NEW.excerpt)
+        WHERE post_id = NEW.id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """)
+    op.execute("DROP FUNCTION IF EXISTS post_search_vector(text, tsvector, text)")
+
+    op.drop_constraint('ck_post_bodies_content_or_blob', 'post_bodies', type_='check')
+    op.alter_column('post_bodies', 'content', nullable=False)
+    op.drop_column('post_bodies', 'content_vector')
+    op.drop_column('post_bodies', 'blob_key')
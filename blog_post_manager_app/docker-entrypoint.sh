@@ -5,4 +5,4 @@ echo "Running database migrations..."
 alembic upgrade head
 
 echo "Starting application..."
-exec uvicorn src.main:app --host 0.0.0.0 --port 8000
+exec python -m src.server
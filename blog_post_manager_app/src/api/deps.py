@@ -2,19 +2,89 @@
 
 from typing import AsyncGenerator
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
 from src.database import get_db
+from src.middleware.metrics import route_template
 from src.models.user import User
+from src.utils.idempotency import create_idempotency_store
+from src.utils.metrics import RATE_LIMITED_REQUESTS
+from src.utils.rate_limit import create_rate_limiter, retry_after_header
 from src.utils.security import decode_token
 
 # HTTP Bearer token scheme for authentication
 security = HTTPBearer()
 
+# Shared by all API routes; see src/utils/rate_limit.py for backends
+rate_limiter = create_rate_limiter(settings)
+
+# Recorded responses of requests sent with an Idempotency-Key; see
+# src/utils/idempotency.py for backends
+idempotency_store = create_idempotency_store(settings)
+
+
+def rate_limit_key(request: Request) -> str:
+    """
+    Identify the client for rate limiting.
+
+    Uses the JWT subject when the request carries a valid bearer token, so a
+    user keeps one budget across IPs, and the client IP otherwise.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        "user:<id>" or "ip:<address>"
+    """
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            subject = decode_token(token).get("sub")
+        except JWTError:
+            subject = None
+        if subject:
+            return f"user:{subject}"
+
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
+async def rate_limit(request: Request, response: Response) -> None:
+    """
+    Dependency enforcing the per-route request budget.
+
+    Args:
+        request: Incoming request
+        response: Response used to report the remaining budget
+
+    Raises:
+        HTTPException: 429 if the client has used up its budget for this route
+    """
+    if not rate_limiter.enabled:
+        return
+
+    route = f"{request.method} {route_template(request)}"
+    result = await rate_limiter.check(rate_limit_key(request), route)
+
+    if not result.allowed:
+        RATE_LIMITED_REQUESTS.labels(route=route).inc()
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Rate limit exceeded",
+            headers={
+                "Retry-After": retry_after_header(result),
+                "X-RateLimit-Limit": str(result.limit),
+                "X-RateLimit-Remaining": "0",
+            },
+        )
+
+    response.headers["X-RateLimit-Limit"] = str(result.limit)
+    response.headers["X-RateLimit-Remaining"] = str(result.remaining)
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -2,16 +2,29 @@
 
 from typing import List
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.deps import get_current_user
-from src.database import get_db
+from src.api.deps import get_current_user, idempotency_store
+from src.database import get_db, get_read_db
 from src.models.post import PostStatus
 from src.models.user import User
 from src.schemas.common import PaginatedResponse
-from src.schemas.post import PostCreate, PostListResponse, PostResponse, PostUpdate
+from src.schemas.post import (
+    PostBulkResult,
+    PostBulkSelection,
+    PostBulkUpdate,
+    PostCreate,
+    PostListResponse,
+    PostResponse,
+    PostRevisionResponse,
+    PostRevisionSummary,
+    PostUpdate,
+)
+from src.services.post_revisions import PostRevisionService
 from src.services.post_service import PostService
+from src.utils.etags import parse_if_match, post_etag
+from src.utils.idempotency import IdempotentRequest, request_fingerprint
 
 router = APIRouter()
 
@@ -21,10 +34,17 @@ router = APIRouter()
     response_model=PostResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create new post",
-    description="Create a new blog post (requires authentication)",
+    description=(
+        "Create a new blog post (requires authentication). Retries sent with the same "
+        "Idempotency-Key get the first response back instead of creating another post"
+    ),
 )
 async def create_post(
     post_data: PostCreate,
+    response: Response,
+    idempotency_key: str | None = Header(
+        None, max_length=255, description="Client-chosen key shared by retries of this request"
+    ),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> PostResponse:
@@ -33,6 +53,8 @@ async def create_post(
 
     Args:
         post_data: Post creation data
+        response: Response, for the ETag and Idempotent-Replayed headers
+        idempotency_key: Idempotency-Key header
         current_user: Authenticated user
         db: Database session
 
@@ -40,10 +62,25 @@ async def create_post(
         PostResponse: Created post
 
     Raises:
-        HTTPException: 422 if validation fails (e.g., more than 10 tags)
+        HTTPException: 409 if a request with the same Idempotency-Key is still in progress
+        HTTPException: 422 if validation fails (e.g., more than 10 tags), or if
+            the Idempotency-Key was used for a different request
     """
+    idempotent = None
+    if idempotency_key is not None:
+        # Keys are per user, so clients cannot replay each other's responses
+        idempotent = IdempotentRequest(
+            idempotency_store,
+            f"user:{current_user.id}|POST /posts|{idempotency_key}",
+            request_fingerprint(post_data),
+        )
+
     post_service = PostService(db)
-    return await post_service.create_post(post_data, current_user)
+    post = await post_service.create_post(post_data, current_user, idempotent)
+    response.headers["ETag"] = post_etag(post.version)
+    if idempotent is not None and idempotent.replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+    return post
 
 
 @router.get(
@@ -62,8 +99,8 @@ async def list_posts(
     tags: str | None = Query(
         None, description="Comma-separated tag names (posts must have ALL tags)"
     ),
-    db: AsyncSession = Depends(get_db),
-) -> PaginatedResponse[PostListResponse]:
+    db: AsyncSession = Depends(get_read_db, scope="function"),
+) -> PaginatedResponse[PostListResponse] | Response:
     """
     List posts with pagination and filters.
 
@@ -76,13 +113,24 @@ async def list_posts(
         db: Database session
 
     Returns:
-        PaginatedResponse with posts
+        PaginatedResponse with posts (as PostgreSQL-rendered JSON bytes with
+        the 'json' list strategy)
     """
     post_service = PostService(db)
 
     # Parse tags from comma-separated string
     tag_list = [t.strip() for t in tags.split(",")] if tags else None
 
+    if post_service.list_strategy in ("json", "cards"):
+        content = await post_service.list_posts_json(
+            page=page,
+            page_size=page_size,
+            status_filter=status_filter,
+            author_id=author_id,
+            tag_names=tag_list,
+        )
+        return Response(content=content, media_type="application/json")
+
     return await post_service.list_posts(
         page=page,
         page_size=page_size,
@@ -100,13 +148,17 @@ async def list_posts(
 )
 async def get_post(
     post_id: int,
-    db: AsyncSession = Depends(get_db),
+    response: Response,
+    db: AsyncSession = Depends(get_read_db, scope="function"),
 ) -> PostResponse:
     """
     Get post by ID.
 
+    The ETag header carries the post version, for If-Match on later writes.
+
     Args:
         post_id: Post ID
+        response: Response, for the ETag header
         db: Database session
 
     Returns:
@@ -116,18 +168,25 @@ async def get_post(
         HTTPException: 404 if post not found
     """
     post_service = PostService(db)
-    return await post_service.get_post_by_id(post_id)
+    post = await post_service.get_post_by_id(post_id)
+    response.headers["ETag"] = post_etag(post.version)
+    return post
 
 
 @router.patch(
     "/{post_id}",
     response_model=PostResponse,
     summary="Update post",
-    description="Update a post (requires authentication and ownership)",
+    description=(
+        "Update a post (requires authentication and ownership). With If-Match, only "
+        "applies while the post still has that ETag"
+    ),
 )
 async def update_post(
     post_id: int,
     post_data: PostUpdate,
+    response: Response,
+    if_match: str | None = Header(None, description="ETag of the version being edited"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> PostResponse:
@@ -137,6 +196,8 @@ async def update_post(
     Args:
         post_id: Post ID
         post_data: Update data
+        response: Response, for the ETag header
+        if_match: If-Match header
         current_user: Authenticated user (must be post author)
         db: Database session
 
@@ -146,20 +207,29 @@ async def update_post(
     Raises:
         HTTPException: 404 if not found
         HTTPException: 403 if not post author
+        HTTPException: 412 if the post no longer matches If-Match
         HTTPException: 422 if validation fails
     """
     post_service = PostService(db)
-    return await post_service.update_post(post_id, post_data, current_user)
+    post = await post_service.update_post(
+        post_id, post_data, current_user, parse_if_match(if_match)
+    )
+    response.headers["ETag"] = post_etag(post.version)
+    return post
 
 
 @router.delete(
     "/{post_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete post",
-    description="Delete a post (requires authentication and ownership)",
+    description=(
+        "Delete a post (requires authentication and ownership). With If-Match, only "
+        "applies while the post still has that ETag"
+    ),
 )
 async def delete_post(
     post_id: int,
+    if_match: str | None = Header(None, description="ETag of the version being deleted"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> None:
@@ -168,12 +238,195 @@ async def delete_post(
 
     Args:
         post_id: Post ID
+        if_match: If-Match header
+        current_user: Authenticated user (must be post author)
+        db: Database session
+
+    Raises:
+        HTTPException: 404 if not found
+        HTTPException: 403 if not post author
+        HTTPException: 412 if the post no longer matches If-Match
+    """
+    post_service = PostService(db)
+    await post_service.delete_post(post_id, current_user, parse_if_match(if_match))
+
+
+@router.get(
+    "/{post_id}/revisions",
+    response_model=PaginatedResponse[PostRevisionSummary],
+    summary="List post revisions",
+    description=(
+        "List the revisions of a post, newest first (requires authentication and ownership)"
+    ),
+)
+async def list_post_revisions(
+    post_id: int,
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
+) -> PaginatedResponse[PostRevisionSummary]:
+    """
+    List a post's revisions.
+
+    Args:
+        post_id: Post ID
+        page: Page number (1-indexed)
+        page_size: Number of items per page
         current_user: Authenticated user (must be post author)
         db: Database session
 
+    Returns:
+        PaginatedResponse with revisions, without their contents
+
     Raises:
         HTTPException: 404 if not found
         HTTPException: 403 if not post author
     """
+    revision_service = PostRevisionService(db)
+    return await revision_service.list_revisions(post_id, current_user, page, page_size)
+
+
+@router.get(
+    "/{post_id}/revisions/{revision}",
+    response_model=PostRevisionResponse,
+    summary="Get post revision",
+    description=(
+        "Get a revision of a post with its content (requires authentication and ownership)"
+    ),
+)
+async def get_post_revision(
+    post_id: int,
+    revision: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
+) -> PostRevisionResponse:
+    """
+    Get a post revision.
+
+    Args:
+        post_id: Post ID
+        revision: Revision number
+        current_user: Authenticated user (must be post author)
+        db: Database session
+
+    Returns:
+        PostRevisionResponse: Revision with its content
+
+    Raises:
+        HTTPException: 404 if the post or revision is not found
+        HTTPException: 403 if not post author
+    """
+    revision_service = PostRevisionService(db)
+    return await revision_service.get_revision(post_id, revision, current_user)
+
+
+@router.post(
+    "/{post_id}/revisions/{revision}:restore",
+    response_model=PostResponse,
+    summary="Restore post revision",
+    description=(
+        "Restore a post's title, excerpt and content to a revision, recording a new one "
+        "(requires authentication and ownership). With If-Match, only applies while the "
+        "post still has that ETag"
+    ),
+)
+async def restore_post_revision(
+    post_id: int,
+    revision: int,
+    response: Response,
+    if_match: str | None = Header(None, description="ETag of the version being replaced"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> PostResponse:
+    """
+    Restore a post revision.
+
+    Args:
+        post_id: Post ID
+        revision: Revision number
+        response: Response, for the ETag header
+        if_match: If-Match header
+        current_user: Authenticated user (must be post author)
+        db: Database session
+
+    Returns:
+        PostResponse: Restored post
+
+    Raises:
+        HTTPException: 404 if the post or revision is not found
+        HTTPException: 403 if not post author
+        HTTPException: 412 if the post no longer matches If-Match
+    """
+    post_service = PostService(db)
+    post = await post_service.restore_revision(
+        post_id, revision, current_user, parse_if_match(if_match)
+    )
+    response.headers["ETag"] = post_etag(post.version)
+    return post
+
+
+@router.post(
+    ":bulk-update",
+    response_model=PostBulkResult,
+    summary="Bulk update post status",
+    description=(
+        "Move the caller's posts selected by ID list or filter to a status (requires "
+        "authentication). Other authors' posts are never affected"
+    ),
+)
+async def bulk_update_posts(
+    bulk_data: PostBulkUpdate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> PostBulkResult:
+    """
+    Move many posts to a status.
+
+    Args:
+        bulk_data: Post IDs or filter, and the new status
+        current_user: Authenticated user (only their posts are updated)
+        db: Database session
+
+    Returns:
+        PostBulkResult: Number of posts updated
+
+    Raises:
+        HTTPException: 422 if validation fails (e.g., both or neither of ids and filter)
+    """
+    post_service = PostService(db)
+    affected = await post_service.bulk_update_status(bulk_data, current_user)
+    return PostBulkResult(affected=affected)
+
+
+@router.post(
+    ":bulk-delete",
+    response_model=PostBulkResult,
+    summary="Bulk delete posts",
+    description=(
+        "Delete the caller's posts selected by ID list or filter (requires "
+        "authentication). Other authors' posts are never affected"
+    ),
+)
+async def bulk_delete_posts(
+    selection: PostBulkSelection,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> PostBulkResult:
+    """
+    Delete many posts.
+
+    Args:
+        selection: Post IDs or filter
+        current_user: Authenticated user (only their posts are deleted)
+        db: Database session
+
+    Returns:
+        PostBulkResult: Number of posts deleted
+
+    Raises:
+        HTTPException: 422 if validation fails (e.g., both or neither of ids and filter)
+    """
     post_service = PostService(db)
-    await post_service.delete_post(post_id, current_user)
+    affected = await post_service.bulk_delete(selection, current_user)
+    return PostBulkResult(affected=affected)
@@ -3,7 +3,7 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database import get_db
+from src.database import get_read_db
 from src.schemas.common import PaginatedResponse
 from src.schemas.post import PostListResponse
 from src.services.search_service import SearchService
@@ -30,7 +30,7 @@ async def search_posts(
         pattern="^(relevance|date)$",
         description="Sort order: 'relevance' or 'date'",
     ),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
 ) -> PaginatedResponse[PostListResponse]:
     """
     Full-text search on published posts.
@@ -76,7 +76,7 @@ async def search_posts(
 )
 async def get_popular_tags(
     limit: int = Query(20, ge=1, le=100, description="Maximum number of tags to return"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
 ) -> list:
     """
     Get most popular tags with post counts.
@@ -1,19 +1,42 @@
 """Tags API routes."""
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy import Select, func, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from src.database import get_db
+from src.config import settings
+from src.database import execute_with_count, get_read_db
 from src.models.post import Post, PostStatus
+from src.models.post_card import PostCard
 from src.models.tag import Tag
 from src.schemas.common import PaginatedResponse
 from src.schemas.post import PostListResponse
 from src.schemas.tag import TagResponse
+from src.services.post_cards import CARDS_BY_PUBLICATION_DATE, cards_page, has_tag
+from src.services.post_json import POSTS_JSON_BY_PUBLICATION_DATE, json_page, paginated_json
+from src.services.post_rows import POST_ROWS, post_list_items
 
 router = APIRouter()
 
+# Parameterless statements are built once at import and reused for every request
+_TAGS_WITH_COUNTS: Select = (
+    select(
+        Tag.id,
+        Tag.name,
+        Tag.created_at,
+        func.count(Post.id).label("post_count"),
+    )
+    .outerjoin(Tag.posts)
+    .where(
+        ((Post.status == PostStatus.published) & Post.deleted_at.is_(None))
+        | Post.id.is_(None)
+    )
+    .group_by(Tag.id, Tag.name, Tag.created_at)
+    .order_by(Tag.name)
+)
+_TAGS_BY_NAME = select(Tag).order_by(Tag.name)
+
 
 @router.get(
     "",
@@ -23,7 +46,7 @@ router = APIRouter()
 )
 async def list_tags(
     include_count: bool = Query(True, description="Include post count for each tag"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
 ) -> list[TagResponse]:
     """
     List all tags.
@@ -37,20 +60,7 @@ async def list_tags(
     """
     if include_count:
         # Query with post counts
-        query = (
-            select(
-                Tag.id,
-                Tag.name,
-                Tag.created_at,
-                func.count(Post.id).label("post_count"),
-            )
-            .outerjoin(Tag.posts)
-            .where((Post.status == PostStatus.published) | (Post.id.is_(None)))
-            .group_by(Tag.id, Tag.name, Tag.created_at)
-            .order_by(Tag.name)
-        )
-
-        result = await db.execute(query)
+        result = await db.execute(_TAGS_WITH_COUNTS)
         rows = result.all()
 
         return [
@@ -64,7 +74,7 @@ async def list_tags(
         ]
     else:
         # Simple query without counts
-        result = await db.execute(select(Tag).order_by(Tag.name))
+        result = await db.execute(_TAGS_BY_NAME)
         tags = result.scalars().all()
 
         return [TagResponse.model_validate(tag) for tag in tags]
@@ -80,8 +90,8 @@ async def get_posts_by_tag(
     tag_id: int,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    db: AsyncSession = Depends(get_db),
-) -> PaginatedResponse[PostListResponse]:
+    db: AsyncSession = Depends(get_read_db, scope="function"),
+) -> PaginatedResponse[PostListResponse] | Response:
     """
     Get posts by tag ID.
 
@@ -100,38 +110,78 @@ async def get_posts_by_tag(
     from fastapi import HTTPException, status
 
     # Verify tag exists
-    tag_result = await db.execute(select(Tag).where(Tag.id == tag_id))
+    tag_result = await db.execute(
+        lambda_stmt(lambda: select(Tag.id).where(Tag.id == tag_id))
+    )
     tag = tag_result.scalar_one_or_none()
 
-    if not tag:
+    if tag is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Tag with id {tag_id} not found",
         )
 
-    # Build query for published posts with this tag
-    query = (
-        select(Post)
-        .options(selectinload(Post.author), selectinload(Post.tags))
-        .where(Post.status == PostStatus.published)
+    offset = (page - 1) * page_size
+    strategy = settings.post_list_strategy
+
+    # Stored post cards: count and concatenate them without reading posts
+    # (deleted posts have no card)
+    if strategy == "cards":
+        tag_filter = has_tag(Tag.id == tag_id)
+        count_query = lambda_stmt(
+            lambda: select(func.count(PostCard.post_id))
+            .where(PostCard.status == PostStatus.published)
+            .where(tag_filter)
+        )
+        query = lambda_stmt(
+            lambda: CARDS_BY_PUBLICATION_DATE.where(PostCard.status == PostStatus.published)
+            .where(tag_filter)
+            .order_by(PostCard.publication_date.desc())
+            .offset(offset)
+            .limit(page_size)
+        )
+        query += lambda s: cards_page(s)
+        total, result = await execute_with_count(db, count_query, query)
+        content = paginated_json(result.scalar_one(), total, page, page_size)
+        return Response(content=content, media_type="application/json")
+
+    # Count published posts with this tag
+    count_query = lambda_stmt(
+        lambda: select(func.count(Post.id))
+        .where(Post.status == PostStatus.published, Post.deleted_at.is_(None))
         .where(Post.tags.any(Tag.id == tag_id))
     )
 
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
-
-    # Apply pagination
-    offset = (page - 1) * page_size
-    query = query.order_by(Post.publication_date.desc()).offset(offset).limit(page_size)
-
-    # Execute query
-    result = await db.execute(query)
-    posts = result.scalars().all()
+    # Get the requested page
+    if strategy == "json":
+        query = lambda_stmt(lambda: POSTS_JSON_BY_PUBLICATION_DATE)
+    elif strategy == "core":
+        query = lambda_stmt(lambda: POST_ROWS)
+    else:
+        query = lambda_stmt(
+            lambda: select(Post).options(selectinload(Post.author), selectinload(Post.tags))
+        )
+    query += (
+        lambda s: s.where(Post.status == PostStatus.published, Post.deleted_at.is_(None))
+        .where(Post.tags.any(Tag.id == tag_id))
+        .order_by(Post.publication_date.desc())
+        .offset(offset)
+        .limit(page_size)
+    )
 
-    # Convert to response models
-    items = [PostListResponse.model_validate(post) for post in posts]
+    # PostgreSQL renders the JSON page; only the envelope is added here
+    if strategy == "json":
+        query += lambda s: json_page(s)
+        total, result = await execute_with_count(db, count_query, query)
+        content = paginated_json(result.scalar_one(), total, page, page_size)
+        return Response(content=content, media_type="application/json")
+
+    # Execute with the total count and convert to response models
+    total, result = await execute_with_count(db, count_query, query)
+    if strategy == "core":
+        items = post_list_items(result.all())
+    else:
+        items = [PostListResponse.model_validate(post) for post in result.scalars().all()]
 
     return PaginatedResponse(
         items=items,
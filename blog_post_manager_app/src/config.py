@@ -1,6 +1,6 @@
 """Application configuration using pydantic-settings."""
 
-from typing import List
+from typing import FrozenSet, List
 
 from pydantic import Field, PostgresDsn, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -71,9 +71,205 @@ class Settings(BaseSettings):
         default=20, description="Maximum overflow connections", ge=0, le=100
     )
 
+    db_concurrent_count_max_saturation: float = Field(
+        default=0.5,
+        description="Pool saturation (checked out / capacity) up to which the routes in "
+        "db_concurrent_count_routes run their count query on a second connection "
+        "(0 = always sequential)",
+        ge=0,
+        le=1,
+    )
+    db_concurrent_count_routes: str = Field(
+        default="",
+        description="Comma-separated read-only list routes, as 'METHOD /route/template', "
+        "that run their count query on a second connection; pays off only for slow counts "
+        "on a database with a spare core, other routes run the count first",
+    )
+
+    @property
+    def db_concurrent_count_routes_set(self) -> FrozenSet[str]:
+        """Get the concurrent count routes as normalized 'METHOD /route/template' entries."""
+        routes = set()
+        for entry in self.db_concurrent_count_routes.split(","):
+            method, _, path = entry.strip().partition(" ")
+            if method and path.strip():
+                routes.add(f"{method.upper()} {path.strip()}")
+        return frozenset(routes)
+
+    # Connection Pooler (PgBouncer)
+    db_pooler_mode: str = Field(
+        default="none",
+        description="External connection pooler in front of PostgreSQL: 'none' or "
+        "'transaction' (PgBouncer pool_mode=transaction)",
+        pattern="^(none|transaction)$",
+    )
+    db_pooler_app_pool_size: int = Field(
+        default=0,
+        description="App-side pool size when behind a transaction pooler (0 = NullPool)",
+        ge=0,
+        le=50,
+    )
+
+    # Statement Caching
+    db_compiled_cache_size: int = Field(
+        default=1200,
+        description="SQLAlchemy compiled statement cache size per engine (0 disables)",
+        ge=0,
+    )
+    db_prepared_statement_cache_size: int = Field(
+        default=256,
+        description="asyncpg prepared statement cache size per connection (0 disables)",
+        ge=0,
+    )
+
+    # List Queries
+    post_list_strategy: str = Field(
+        default="core",
+        description="How post list pages are loaded: 'orm' (ORM entities), 'core' "
+        "(one column query mapped into lightweight row objects), 'json' (pages "
+        "rendered as JSON by PostgreSQL) or 'cards' (stored post card documents "
+        "concatenated by PostgreSQL); 'json' and 'cards' fall back to 'core' for search",
+        pattern="^(orm|core|json|cards)$",
+    )
+
+    # Bulk Writes
+    post_bulk_chunk_size: int = Field(
+        default=1000,
+        description="Posts written per statement (and transaction) by bulk update/delete",
+        ge=1,
+        le=10_000,
+    )
+
+    # Deleted Post Purging
+    post_purge_enabled: bool = Field(
+        default=True, description="Run the background purger removing deleted posts"
+    )
+    post_purge_after_seconds: int = Field(
+        default=86_400, description="How long deleted posts are kept before they are purged", ge=0
+    )
+    post_purge_batch_size: int = Field(
+        default=500, description="Deleted posts removed per purge statement", ge=1, le=10_000
+    )
+    post_purge_batch_interval_seconds: float = Field(
+        default=1.0,
+        description="Pause between purge batches, bounding the purge rate to "
+        "batch size / interval posts per second",
+        gt=0,
+    )
+    post_purge_idle_seconds: float = Field(
+        default=60.0, description="Pause before looking again once nothing is left to purge", gt=0
+    )
+
+    # Post Partitions
+    post_partition_hot_months: int = Field(
+        default=6,
+        description="Months (the current one included) kept in monthly posts partitions; "
+        "older months are moved into the cold partition by src.tools.post_partitions",
+        ge=1,
+    )
+    post_partition_premake_months: int = Field(
+        default=3, description="Monthly posts partitions created ahead of the current month", ge=1
+    )
+
+    # Post Body Storage
+    post_body_offload_bytes: int = Field(
+        default=262_144,
+        description="Post bodies of this many bytes (UTF-8) or more are kept in the blob "
+        "store instead of post_bodies",
+        ge=1,
+    )
+    post_body_store: str = Field(
+        default="filesystem",
+        description="Blob store of large post bodies: 'filesystem' or 's3'",
+        pattern="^(filesystem|s3)$",
+    )
+    post_body_dir: str = Field(
+        default="data/post_bodies",
+        description="Directory of the filesystem blob store, shared by every API process",
+    )
+    post_body_s3_bucket: str | None = Field(
+        default=None, description="Bucket of the s3 blob store"
+    )
+    post_body_s3_prefix: str = Field(
+        default="post-bodies/", description="Object key prefix in the s3 blob store"
+    )
+    post_body_s3_endpoint_url: str | None = Field(
+        default=None, description="Endpoint of an S3-compatible service (default: AWS)"
+    )
+    post_body_cache_bytes: int = Field(
+        default=33_554_432,
+        description="Memory for the per-process LRU cache of offloaded post bodies",
+        ge=0,
+    )
+
+    # Post Revisions
+    post_revision_max_deltas: int = Field(
+        default=20,
+        description="Post revisions stored as deltas between two full snapshots; rebuilding "
+        "a revision reads one snapshot and at most this many deltas",
+        ge=0,
+    )
+
+    # Idempotency Keys
+    idempotency_backend: str = Field(
+        default="database",
+        description="Idempotency key storage: 'database' (shared, recorded in the "
+        "write's transaction) or 'memory' (per process, single-node setups)",
+        pattern="^(database|memory)$",
+    )
+    idempotency_ttl_seconds: int = Field(
+        default=86_400, description="How long an idempotency key and its response are kept", ge=1
+    )
+    idempotency_wait_seconds: float = Field(
+        default=10.0,
+        description="How long a duplicate waits for the in-flight request holding its key "
+        "(memory backend; the database backend waits for its transaction)",
+        gt=0,
+    )
+    idempotency_max_keys: int = Field(
+        default=100_000,
+        description="Maximum idempotency keys kept in memory (LRU eviction)",
+        ge=1,
+    )
+
+    # Health Checks
+    health_check_cache_seconds: float = Field(
+        default=2.0,
+        description="How long a readiness database probe result is reused",
+        ge=0,
+    )
+    health_check_timeout_seconds: float = Field(
+        default=1.0, description="Timeout for the readiness database probe", gt=0
+    )
+    health_pool_saturation_threshold: float = Field(
+        default=1.0,
+        description="Pool saturation (checked out / capacity) at which the pod reports not ready",
+        gt=0,
+        le=1,
+    )
+
     # Rate Limiting
+    rate_limit_enabled: bool = Field(default=True, description="Enforce API rate limits")
     rate_limit_per_minute: int = Field(
-        default=100, description="Maximum requests per minute per user", ge=1
+        default=100, description="Maximum requests per minute per user and route", ge=1
+    )
+    rate_limit_routes: str = Field(
+        default="POST /api/v1/auth/login=20,POST /api/v1/auth/register=10,"
+        "POST /api/v1/auth/refresh=30",
+        description="Comma-separated per-route budgets as 'METHOD /route/template=N'",
+    )
+    rate_limit_backend: str = Field(
+        default="memory",
+        description="Rate limit bucket storage: 'memory' (per process) or 'redis' (shared)",
+        pattern="^(memory|redis)$",
+    )
+    rate_limit_redis_url: str | None = Field(
+        default=None, description="Redis URL for the shared rate limit backend"
+    )
+    rate_limit_max_keys: int = Field(
+        default=100_000,
+        description="Maximum rate limit buckets kept in memory (LRU eviction)",
+        ge=1,
     )
 
     # Server Configuration
@@ -82,6 +278,20 @@ class Settings(BaseSettings):
     reload: bool = Field(
         default=False, description="Enable auto-reload (development only)"
     )
+    web_workers: int = Field(
+        default=0,
+        description="Worker processes for the production launcher (0 = one per CPU)",
+        ge=0,
+    )
+    web_backlog: int = Field(
+        default=2048, description="Listen socket backlog for the production launcher", ge=1
+    )
+    db_max_connections: int | None = Field(
+        default=None,
+        description="Database connection budget shared by all workers; per-worker "
+        "pool limits are derived from it by the production launcher",
+        ge=1,
+    )
 
     @property
     def database_url_str(self) -> str:
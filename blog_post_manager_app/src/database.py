@@ -1,21 +1,129 @@
 """Async SQLAlchemy database setup and session management."""
 
-from typing import AsyncGenerator
+import asyncio
+import time
+from typing import Any, AsyncGenerator, Dict, Sequence, Tuple
+from uuid import uuid4
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from fastapi import Request
+from sqlalchemy import Connection, Executable, Result, event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, SessionTransaction, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, NullPool, Pool, QueuePool
+
+from src.config import Settings, settings
+from src.middleware.metrics import route_template
+from src.utils.metrics import (
+    instrument_engine,
+    observe_checkout_wait,
+    record_count_mode,
+    record_session_usage,
+)
+
+# Session.info key set once a session has checked out a connection
+CONNECTION_USED = "connection_used"
+
+# Session.info key set on read-only sessions of db_concurrent_count_routes
+CONCURRENT_COUNT = "concurrent_count"
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long each checkout waits."""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            observe_checkout_wait(started)
+
+
+def _connect_args(config: Settings) -> Dict[str, Any]:
+    """
+    Build asyncpg connection arguments.
+
+    Behind a transaction pooler, consecutive transactions may run on different
+    server connections, so a named prepared statement created on one is missing
+    (or clashes with another client's) on the next. Statement caches are
+    disabled and every prepared statement gets a unique name. Autocommit
+    (read-only) sessions additionally prepare and execute in separate
+    transactions, which needs PgBouncer 1.21+ with `max_prepared_statements`
+    set so it re-prepares statements on whichever server connection runs them.
+
+    Args:
+        config: Application settings
+
+    Returns:
+        connect_args for create_async_engine
+    """
+    if config.db_pooler_mode == "transaction":
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    return {"prepared_statement_cache_size": config.db_prepared_statement_cache_size}
+
+
+def engine_options(config: Settings) -> Dict[str, Any]:
+    """
+    Build create_async_engine options for the application engine.
+
+    Behind a transaction pooler the pooler does the pooling: the app uses
+    NullPool (or a small pool if db_pooler_app_pool_size is set) and skips
+    pre-ping, which would only add a round trip to the pooler.
+
+    Args:
+        config: Application settings
+
+    Returns:
+        Keyword arguments for create_async_engine
+    """
+    options: Dict[str, Any] = {
+        "echo": not config.is_production,  # SQL logging in development
+        "query_cache_size": config.db_compiled_cache_size,
+        "connect_args": _connect_args(config),
+    }
+
+    if config.db_pooler_mode == "none":
+        options.update(
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=config.db_pool_size,
+            max_overflow=config.db_max_overflow,
+            pool_pre_ping=True,  # Verify connections before using
+            pool_recycle=3600,  # Recycle connections after 1 hour
+        )
+    elif config.db_pooler_app_pool_size:
+        options.update(
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=config.db_pooler_app_pool_size,
+            max_overflow=0,
+        )
+    else:
+        options.update(poolclass=NullPool)
+
+    return options
 
-from src.config import settings
 
 # Create async engine
-engine = create_async_engine(
+engine = create_async_engine(settings.database_url_str, **engine_options(settings))
+instrument_engine(engine.sync_engine)
+
+# Dedicated single-connection engine for readiness probes, so probes never
+# queue behind request traffic waiting for a pooled connection
+health_engine = create_async_engine(
     settings.database_url_str,
-    echo=not settings.is_production,  # SQL logging in development
-    pool_size=settings.db_pool_size,
-    max_overflow=settings.db_max_overflow,
-    pool_pre_ping=True,  # Verify connections before using
-    pool_recycle=3600,  # Recycle connections after 1 hour
+    pool_size=1,
+    max_overflow=0,
+    pool_timeout=settings.health_check_timeout_seconds,
+    pool_recycle=3600,
+    connect_args=_connect_args(settings),
 )
 
 # Create async session factory
@@ -27,6 +135,135 @@ AsyncSessionLocal = sessionmaker(
     autoflush=False,
 )
 
+
+class ReadOnlySession(Session):
+    """Session that refuses to flush changes (used for read-only requests)."""
+
+    def flush(self, objects: Sequence[Any] | None = None) -> None:
+        """Reject flushing pending changes; a no-op flush is allowed."""
+        if self.new or self.dirty or self.deleted:
+            raise RuntimeError("Cannot write through a read-only database session")
+        super().flush(objects)
+
+
+# Read-only sessions run in autocommit: no BEGIN/COMMIT round trips, and the
+# connection is released as soon as the session closes
+ReadOnlySessionLocal = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    sync_session_class=ReadOnlySession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
+
+@event.listens_for(Session, "after_begin")
+def _mark_connection_used(
+    session: Session, transaction: SessionTransaction, connection: Connection
+) -> None:
+    """Flag sessions that checked out a connection (fires once per connection)."""
+    session.info[CONNECTION_USED] = True
+
+
+def used_connection(session: AsyncSession) -> bool:
+    """Whether a session has checked out a pooled connection so far."""
+    return bool(session.info.get(CONNECTION_USED, False))
+
+
+def pool_capacity(pool: Pool) -> int | None:
+    """
+    Maximum number of connections a pool hands out (pool_size + max_overflow).
+
+    Args:
+        pool: Connection pool
+
+    Returns:
+        Capacity, or None for pools without a limit: pools without a fixed
+        size (e.g. NullPool) and pools with unbounded overflow (-1)
+    """
+    if not isinstance(pool, QueuePool):
+        return None
+    max_overflow = pool._max_overflow
+    return None if max_overflow < 0 else pool.size() + max_overflow
+
+
+def has_spare_connections(bind: AsyncEngine, max_saturation: float, needed: int = 1) -> bool:
+    """
+    Whether a pool is far enough from saturation to hand out more connections.
+
+    Args:
+        bind: Engine whose pool to inspect
+        max_saturation: Highest checked out / capacity ratio the pool may reach
+            once the connections are handed out (0 never hands any out)
+        needed: Connections about to be checked out
+
+    Returns:
+        False for pools without a fixed size (e.g. NullPool behind PgBouncer),
+        where every extra connection is an extra server connection
+    """
+    pool = bind.sync_engine.pool
+    if not isinstance(pool, QueuePool):
+        return False
+
+    capacity = pool_capacity(pool)
+    if capacity is None:  # unbounded overflow
+        return max_saturation > 0
+    return (pool.checkedout() + needed) / capacity <= max_saturation
+
+
+async def execute_with_count(
+    session: AsyncSession, count_query: Executable, page_query: Executable
+) -> Tuple[int, Result]:
+    """
+    Run a count query and a page query, concurrently when it is safe.
+
+    Read-only sessions run in autocommit, so the two statements never shared
+    a snapshot; the count can run on a second pooled connection while the
+    page runs on the session's own, and the request waits for the slower of
+    the two instead of their sum. That only pays when the count outlasts the
+    extra checkout and the database has a core to run it on, so it is limited
+    to the routes listed in db_concurrent_count_routes (see get_read_db).
+    Other sessions, those that may hold uncommitted writes, and pools close
+    to saturation (see db_concurrent_count_max_saturation) run both
+    statements one after the other on the session.
+
+    Args:
+        session: Request session; the page query runs on it
+        count_query: Statement returning a single count
+        page_query: Statement returning the page rows
+
+    Returns:
+        Tuple of (count, buffered page result)
+    """
+    bind = session.bind
+    # The count's connection, plus the session's own if it has not queried yet
+    needed = 1 if used_connection(session) else 2
+    if (
+        not session.info.get(CONCURRENT_COUNT)
+        or not isinstance(session.sync_session, ReadOnlySession)
+        or not isinstance(bind, AsyncEngine)
+        or not has_spare_connections(bind, settings.db_concurrent_count_max_saturation, needed)
+    ):
+        record_count_mode("sequential")
+        total = (await session.execute(count_query)).scalar_one()
+        return total, await session.execute(page_query)
+
+    async def count() -> int:
+        async with bind.connect() as connection:
+            total: int = (await connection.execute(count_query)).scalar_one()
+        return total
+
+    record_count_mode("concurrent")
+    count_task = asyncio.create_task(count())
+    try:
+        result = await session.execute(page_query)
+    except BaseException:
+        # Never leave the count running after the request has failed
+        count_task.cancel()
+        await asyncio.gather(count_task, return_exceptions=True)
+        raise
+    return await count_task, result
+
+
 # Create declarative base for models
 Base = declarative_base()
 
@@ -35,6 +272,9 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency function to get database session.
 
+    No connection is checked out until the session runs its first query, so
+    requests that end before querying never touch the pool.
+
     Yields:
         AsyncSession: SQLAlchemy async session
 
@@ -49,12 +289,51 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
+            # Sessions check out a connection on their first query; requests that
+            # never queried (early returns, auth failures) skip the commit entirely
+            if session.in_transaction():
+                await session.commit()
         except Exception:
-            await session.rollback()
+            if session.in_transaction():
+                await session.rollback()
             raise
         finally:
             await session.close()
+            record_session_usage(used_connection(session))
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function to get a read-only database session.
+
+    Statements run in autocommit, so there is no commit round trip, and the
+    session refuses to flush writes. Declare it with `scope="function"` so the
+    connection goes back to the pool before the response is sent. Sessions of
+    the routes in db_concurrent_count_routes may run list counts on a second
+    connection (see execute_with_count).
+
+    Args:
+        request: Incoming request, whose route selects the count mode
+
+    Yields:
+        AsyncSession: SQLAlchemy async session for reads
+
+    Example:
+        ```python
+        @app.get("/posts")
+        async def get_posts(db: AsyncSession = Depends(get_read_db, scope="function")):
+            result = await db.execute(select(Post))
+            return result.scalars().all()
+        ```
+    """
+    async with ReadOnlySessionLocal() as session:
+        route = f"{request.method} {route_template(request)}"
+        session.info[CONCURRENT_COUNT] = route in settings.db_concurrent_count_routes_set
+        try:
+            yield session
+        finally:
+            await session.close()
+            record_session_usage(used_connection(session))
 
 
 async def init_db() -> None:
@@ -71,3 +350,4 @@ async def init_db() -> None:
 async def close_db() -> None:
     """Close database engine and cleanup connections."""
     await engine.dispose()
+    await health_engine.dispose()
@@ -2,29 +2,27 @@
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from prometheus_client import make_asgi_app
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
 
 from src import __version__
+from src.api.deps import idempotency_store, rate_limit, rate_limiter
 from src.config import settings
-from src.database import close_db
+from src.database import AsyncSessionLocal, close_db, engine, health_engine
 from src.middleware.correlation_id import CorrelationIdMiddleware
 from src.middleware.error_handler import ErrorHandlerMiddleware
+from src.middleware.metrics import PrometheusMiddleware, record_route_template
 from src.schemas.common import HealthResponse
+from src.services.health_service import HealthService
+from src.services.post_bodies import post_body_store
+from src.services.post_purger import PostPurger
 from src.utils.logging import get_logger, setup_logging
+from src.utils.metrics import make_metrics_app, mark_process_dead
 
 # Setup logging
 setup_logging()
 logger = get_logger(__name__)
 
-# Initialize rate limiter
-limiter = Limiter(key_func=get_remote_address)
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -38,10 +36,17 @@ async def lifespan(app: FastAPI):
         f"Starting {app.title} v{app.version}",
         extra={"environment": settings.environment},
     )
+    if settings.post_purge_enabled:
+        post_purger.start()
     yield
     # Shutdown
     logger.info("Shutting down application")
+    await post_purger.stop()
     await close_db()
+    await rate_limiter.close()
+    await idempotency_store.close()
+    await post_body_store.blobs.close()
+    mark_process_dead()
 
 
 # Create FastAPI application
@@ -53,12 +58,9 @@ app = FastAPI(
     redoc_url="/redoc",
     openapi_url=f"{settings.api_v1_prefix}/openapi.json",
     lifespan=lifespan,
+    dependencies=[Depends(record_route_template)],
 )
 
-# Add rate limiting
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -71,37 +73,119 @@ app.add_middleware(
 # Add custom middleware (order matters - first added is outermost)
 app.add_middleware(ErrorHandlerMiddleware)
 app.add_middleware(CorrelationIdMiddleware)
+app.add_middleware(PrometheusMiddleware)
+
+
+health_service = HealthService(
+    engine,
+    health_engine,
+    cache_seconds=settings.health_check_cache_seconds,
+    timeout_seconds=settings.health_check_timeout_seconds,
+    saturation_threshold=settings.health_pool_saturation_threshold,
+)
+
+# Removes soft-deleted posts in rate-limited batches; see src/services/post_purger.py
+post_purger = PostPurger(
+    AsyncSessionLocal,
+    purge_after_seconds=settings.post_purge_after_seconds,
+    batch_size=settings.post_purge_batch_size,
+    batch_interval_seconds=settings.post_purge_batch_interval_seconds,
+    idle_seconds=settings.post_purge_idle_seconds,
+)
+
+
+@app.get("/health/live", response_model=HealthResponse, tags=["Health"])
+async def liveness_check() -> HealthResponse:
+    """
+    Liveness check endpoint.
+
+    Performs no I/O: it only shows the process is serving requests.
+
+    Returns:
+        HealthResponse: Application liveness status
+    """
+    return HealthResponse(status="healthy", version=__version__)
+
+
+@app.get(
+    "/health/ready",
+    response_model=HealthResponse,
+    responses={503: {"model": HealthResponse}},
+    tags=["Health"],
+)
+async def readiness_check(response: Response) -> HealthResponse:
+    """
+    Readiness check endpoint.
+
+    Uses a cached database probe and reports pool saturation. Returns 503 when
+    the database is unreachable or the pool is saturated.
 
+    Args:
+        response: Response used to set the status code
 
-@app.get("/health", response_model=HealthResponse, tags=["Health"])
-async def health_check() -> HealthResponse:
+    Returns:
+        HealthResponse: Application readiness status
     """
-    Health check endpoint.
+    health = await health_service.readiness(__version__)
+    if health.status != "healthy":
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return health
+
+
+@app.get(
+    "/health",
+    response_model=HealthResponse,
+    responses={503: {"model": HealthResponse}},
+    tags=["Health"],
+)
+async def health_check(response: Response) -> HealthResponse:
+    """
+    Health check endpoint (same checks as /health/ready).
+
+    Args:
+        response: Response used to set the status code
 
     Returns:
         HealthResponse: Application health status
     """
-    return HealthResponse(
-        status="healthy",
-        version=__version__,
-        database="connected",  # TODO: Add actual database health check
-    )
+    return await readiness_check(response)
 
 
 # Mount Prometheus metrics endpoint
-metrics_app = make_asgi_app()
+metrics_app = make_metrics_app()
 app.mount("/metrics", metrics_app)
 
 
 # Include API routers
 from src.api.v1 import auth, posts, search, tags
 
+# Every API route is rate limited per client and route (health and metrics are not)
+api_dependencies = [Depends(rate_limit)]
+
+app.include_router(
+    auth.router,
+    prefix=f"{settings.api_v1_prefix}/auth",
+    tags=["Authentication"],
+    dependencies=api_dependencies,
+)
+app.include_router(
+    posts.router,
+    prefix=f"{settings.api_v1_prefix}/posts",
+    tags=["Posts"],
+    dependencies=api_dependencies,
+)
+app.include_router(
+    search.router,
+    prefix=f"{settings.api_v1_prefix}/search",
+    tags=["Search"],
+    dependencies=api_dependencies,
+)
 app.include_router(
-    auth.router, prefix=f"{settings.api_v1_prefix}/auth", tags=["Authentication"]
+    tags.router,
+    prefix=f"{settings.api_v1_prefix}/tags",
+    tags=["Tags"],
+    dependencies=api_dependencies,
 )
-app.include_router(posts.router, prefix=f"{settings.api_v1_prefix}/posts", tags=["Posts"])
-app.include_router(search.router, prefix=f"{settings.api_v1_prefix}/search", tags=["Search"])
-app.include_router(tags.router, prefix=f"{settings.api_v1_prefix}/tags", tags=["Tags"])
 
 
 if __name__ == "__main__":
@@ -2,5 +2,6 @@
 
 from src.middleware.correlation_id import CorrelationIdMiddleware
 from src.middleware.error_handler import ErrorHandlerMiddleware
+from src.middleware.metrics import PrometheusMiddleware
 
-__all__ = ["CorrelationIdMiddleware", "ErrorHandlerMiddleware"]
+__all__ = ["CorrelationIdMiddleware", "ErrorHandlerMiddleware", "PrometheusMiddleware"]
@@ -0,0 +1,108 @@
+"""Prometheus HTTP metrics middleware."""
+
+import time
+from typing import AsyncIterable, AsyncIterator, cast
+
+from fastapi import Request, Response
+from prometheus_client import Histogram
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.responses import Content, StreamingResponse
+
+from src.utils.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_PROGRESS,
+    HTTP_RESPONSE_SIZE,
+)
+
+# Label for requests that did not match any route (keeps label cardinality bounded)
+UNMATCHED_ROUTE = "unmatched"
+
+
+def route_template(request: Request) -> str:
+    """
+    Get the templated path of the route that handled a request.
+
+    Uses the route template (e.g. `/api/v1/posts/{post_id}`) rather than the raw
+    path so that metrics have one series per route, not one per post ID.
+
+    Recent FastAPI versions keep routes of included routers unprefixed and only
+    expose the full template while routing, so it is saved on `request.state`
+    by `record_route_template` for use after the response.
+    """
+    template = getattr(request.state, "route_template", None)
+    if template is None:
+        context = request.scope.get("fastapi", {}).get("effective_route_context")
+        route = request.scope.get("route")
+        template = getattr(context, "path_format", None) or getattr(
+            route, "path", UNMATCHED_ROUTE
+        )
+    return str(template)
+
+
+async def record_route_template(request: Request) -> None:
+    """App-wide dependency saving the route template while routing info is available."""
+    request.state.route_template = route_template(request)
+
+
+class PrometheusMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware recording per-route latency, status, in-flight and response size metrics.
+
+    The /metrics endpoint itself is not instrumented.
+    """
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        """
+        Process the request and record metrics.
+
+        Args:
+            request: The incoming request
+            call_next: The next middleware or route handler
+
+        Returns:
+            The response from the next handler
+        """
+        if request.url.path.startswith("/metrics"):
+            return await call_next(request)
+
+        method = request.method
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method=method)
+        in_progress.inc()
+        started = time.perf_counter()
+        status_code = 500
+
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+        finally:
+            route = route_template(request)
+            HTTP_REQUEST_DURATION.labels(method=method, route=route).observe(
+                time.perf_counter() - started
+            )
+            HTTP_REQUESTS.labels(method=method, route=route, status=str(status_code)).inc()
+            in_progress.dec()
+
+        size_histogram = HTTP_RESPONSE_SIZE.labels(method=method, route=route)
+        content_length = response.headers.get("content-length")
+        if content_length is not None:
+            size_histogram.observe(int(content_length))
+        else:
+            # call_next always returns a streaming response
+            streamed = cast(StreamingResponse, response)
+            streamed.body_iterator = _count_bytes(streamed.body_iterator, size_histogram)
+
+        return response
+
+
+async def _count_bytes(
+    body: AsyncIterable[Content], histogram: Histogram
+) -> AsyncIterator[Content]:
+    """Pass a streamed body through, observing its total size once it is sent."""
+    size = 0
+    async for chunk in body:
+        size += len(chunk)
+        yield chunk
+    histogram.observe(size)
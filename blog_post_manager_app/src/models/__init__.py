@@ -1,7 +1,11 @@
 """Database models for blog post management system."""
 
 from src.models.user import User
+from src.models.idempotency_key import IdempotencyKey
 from src.models.post import Post
+from src.models.post_body import PostBody
+from src.models.post_card import PostCard
+from src.models.post_revision import PostRevision
 from src.models.tag import Tag
 
-__all__ = ["User", "Post", "Tag"]
+__all__ = ["User", "IdempotencyKey", "Post", "PostBody", "PostCard", "PostRevision", "Tag"]
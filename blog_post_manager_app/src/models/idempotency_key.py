@@ -0,0 +1,35 @@
+"""Idempotency key model: the recorded response of an idempotent request."""
+
+from sqlalchemy import Column, DateTime, String, Text
+
+from src.database import Base
+
+
+class IdempotencyKey(Base):
+    """
+    Idempotency key claimed by a request, with the response it produced.
+
+    A row is inserted in the same transaction as the write it guards and
+    carries that write's response when it commits, so a retry either replays
+    the response or, while the first request is still running, waits on the
+    row until it commits. Rows past `expires_at` are taken over by a new
+    request with the same key and evicted in batches by later claims (see
+    `src.utils.idempotency.DatabaseIdempotencyStore`).
+
+    Attributes:
+        key: Client key, scoped to the user and route
+        fingerprint: SHA-256 of the request body, to detect a reused key
+        response: JSON response body recorded for replay
+        expires_at: When the key may be reused
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    key = Column(String(320), primary_key=True)
+    fingerprint = Column(String(64), nullable=False)
+    response = Column(Text, nullable=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        """String representation of IdempotencyKey."""
+        return f"<IdempotencyKey(key='{self.key}')>"
@@ -8,16 +8,17 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Table,
-    Text,
     func,
 )
-from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import relationship
 
 from src.database import Base
+from src.models.post_body import PostBody
 
 
 class PostStatus(str, enum.Enum):
@@ -28,16 +29,12 @@ class PostStatus(str, enum.Enum):
     archived = "archived"
 
 
-# Association table for many-to-many relationship between posts and tags
+# Association table for many-to-many relationship between posts and tags.
+# post_id has no foreign key: posts is partitioned (see src.services.post_partitions)
 post_tags = Table(
     "post_tags",
     Base.metadata,
-    Column(
-        "post_id",
-        Integer,
-        ForeignKey("posts.id", ondelete="CASCADE"),
-        primary_key=True,
-    ),
+    Column("post_id", Integer, primary_key=True),
     Column(
         "tag_id",
         Integer,
@@ -50,6 +47,8 @@ post_tags = Table(
         server_default=func.now(),
         nullable=False,
     ),
+    # The primary key leads with post_id; tag -> posts lookups need tag_id first
+    Index("ix_post_tags_tag_id", "tag_id", "post_id"),
 )
 
 
@@ -57,24 +56,31 @@ class Post(Base):
     """
     Post model representing blog posts.
 
+    The table is range-partitioned by created_at, so its primary key is
+    (id, created_at); IDs still come from one sequence and identify a post
+    on their own (see src.services.post_partitions).
+
     Attributes:
-        id: Primary key
+        id: Post ID
         author_id: Foreign key to users table
         title: Post title (max 200 characters)
-        content: Full post content
+        content: Full post content, stored in the post's body (see PostBody)
         excerpt: Short summary (max 500 characters)
         status: Publication status (draft, published, archived)
         publication_date: When post was published (nullable for drafts)
-        created_at: Timestamp when post was created
+        created_at: Timestamp when post was created (the partition key)
         updated_at: Timestamp when post was last updated
-        search_vector: Full-text search vector (auto-generated)
+        version: Row version, incremented by every update (sent as the ETag)
+        deleted_at: When the post was deleted; deleted posts are hidden from
+            every read and removed later by the purger (src.services.post_purger)
         author: Relationship to User model
         tags: Many-to-many relationship to Tag model
+        body: One-to-one relationship to PostBody; never loaded implicitly
     """
 
     __tablename__ = "posts"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     author_id = Column(
         Integer,
         ForeignKey("users.id", ondelete="RESTRICT"),
@@ -82,14 +88,13 @@ class Post(Base):
         index=True,
     )
     title = Column(String(200), nullable=False)
-    content = Column(Text, nullable=False)
     excerpt = Column(String(500), nullable=True)
     status = Column(
         Enum(PostStatus), default=PostStatus.draft, nullable=False, index=True
     )
     publication_date = Column(DateTime(timezone=True), nullable=True, index=True)
     created_at = Column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False, primary_key=True
     )
     updated_at = Column(
         DateTime(timezone=True),
@@ -97,16 +102,56 @@ class Post(Base):
         onupdate=func.now(),
         nullable=False,
     )
-    search_vector = Column(TSVECTOR, nullable=True)
+    version = Column(Integer, default=1, server_default="1", nullable=False)
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # Hot list queries filter on status and order by a timestamp. Reads
+        # only see live posts, so the indexes leave deleted ones out
+        Index(
+            "ix_posts_status_created_at",
+            "status",
+            "created_at",
+            postgresql_where=deleted_at.is_(None),
+        ),
+        Index(
+            "ix_posts_status_publication_date",
+            "status",
+            "publication_date",
+            postgresql_where=deleted_at.is_(None),
+        ),
+        # The purger's scan: only deleted posts, oldest first
+        Index(
+            "ix_posts_deleted_at", "deleted_at", postgresql_where=deleted_at.is_not(None)
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+    # The ORM identifies posts by ID alone
+    __mapper_args__ = {"primary_key": [id]}
 
     # Relationships
     author = relationship("User", back_populates="posts")
     tags = relationship(
         "Tag",
         secondary=post_tags,
+        primaryjoin="Post.id == foreign(post_tags.c.post_id)",
+        secondaryjoin="Tag.id == foreign(post_tags.c.tag_id)",
         back_populates="posts",
         lazy="selectin",
     )
+    # Bodies are read only where they are needed (the post detail), so a
+    # forgotten eager load fails loudly instead of querying per post
+    body = relationship(
+        "PostBody",
+        primaryjoin="Post.id == foreign(PostBody.post_id)",
+        uselist=False,
+        lazy="raise",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+    content = association_proxy(
+        "body", "content", creator=lambda content: PostBody(content=content)
+    )
 
     def __repr__(self) -> str:
         """String representation of Post."""
@@ -0,0 +1,51 @@
+"""Post body model: the full text of a post, apart from its metadata."""
+
+from sqlalchemy import CheckConstraint, Column, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from src.database import Base
+
+
+class PostBody(Base):
+    """
+    Post body holding a post's content and full-text search vector.
+
+    Bodies live in their own table, one row per post, so scans of posts and
+    ORM loads of Post only read the narrow metadata columns; only the post
+    detail and search read this table. Columns are LZ4-compressed when the
+    server supports it, and `search_vector` is kept current by triggers on
+    both tables (see `src.services.post_bodies.POST_BODY_DDL`).
+
+    Large bodies are offloaded: the content is kept in the blob store under
+    `blob_key`, and `content_vector` keeps its weighted search terms so the
+    search vector still covers the full text.
+
+    Attributes:
+        post_id: Primary key, the ID of the post
+        content: Full post content, or None when offloaded
+        blob_key: Blob store key of an offloaded content (its SHA-256)
+        content_vector: Search terms of an offloaded content, weight B
+        search_vector: Full-text search vector of title, content and excerpt
+    """
+
+    __tablename__ = "post_bodies"
+
+    # No foreign key: posts is partitioned, and its delete trigger removes
+    # the bodies of deleted posts (see src.services.post_partitions)
+    post_id = Column(Integer, primary_key=True)
+    content = Column(Text, nullable=True)
+    blob_key = Column(String(64), nullable=True)
+    content_vector = Column(TSVECTOR, nullable=True)
+    search_vector = Column(TSVECTOR, nullable=True)
+
+    __table_args__ = (
+        Index("ix_post_bodies_search_vector", "search_vector", postgresql_using="gin"),
+        # Content is either inline or offloaded, never both or neither
+        CheckConstraint(
+            "(content IS NULL) <> (blob_key IS NULL)", name="ck_post_bodies_content_or_blob"
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of PostBody."""
+        return f"<PostBody(post_id={self.post_id})>"
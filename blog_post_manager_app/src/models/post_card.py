@@ -0,0 +1,47 @@
+"""Post card model: the pre-serialized list representation of a post."""
+
+from sqlalchemy import JSON, Column, DateTime, Enum, Index, Integer
+
+from src.database import Base
+from src.models.post import PostStatus
+
+
+class PostCard(Base):
+    """
+    Post card holding a post's list item as a ready-to-send JSON document.
+
+    Cards are rebuilt by the `refresh_post_cards` SQL function, which
+    PostService calls in the same transaction as every post write and
+    database triggers call when an author or a tag changes (see
+    `src.services.post_cards.POST_CARD_DDL`). The filter and sort columns are copied from
+    the post so list pages read this table alone.
+
+    Attributes:
+        post_id: Primary key, the ID of the post
+        author_id: Copy of posts.author_id
+        status: Copy of posts.status
+        publication_date: Copy of posts.publication_date
+        created_at: Copy of posts.created_at
+        document: PostListResponse JSON of the post, with author and tags
+    """
+
+    __tablename__ = "post_cards"
+
+    # No foreign key: posts is partitioned, and its delete trigger removes
+    # the cards of deleted posts (see src.services.post_partitions)
+    post_id = Column(Integer, primary_key=True)
+    author_id = Column(Integer, nullable=False, index=True)
+    status: Column[PostStatus] = Column(Enum(PostStatus), nullable=False)
+    publication_date = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    # json, not jsonb: the stored text (and key order) is sent as is
+    document = Column(JSON, nullable=False)
+
+    __table_args__ = (
+        Index("ix_post_cards_status_created_at", "status", "created_at"),
+        Index("ix_post_cards_status_publication_date", "status", "publication_date"),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of PostCard."""
+        return f"<PostCard(post_id={self.post_id}, status='{self.status}')>"
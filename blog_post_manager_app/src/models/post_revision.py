@@ -0,0 +1,60 @@
+"""Post revision model: one recorded version of a post's title, excerpt and content."""
+
+from sqlalchemy import (
+    CheckConstraint,
+    Column,
+    DateTime,
+    Integer,
+    LargeBinary,
+    SmallInteger,
+    String,
+    func,
+)
+
+from src.database import Base
+
+
+class PostRevision(Base):
+    """
+    Post revision recording a post as one of its writes left it.
+
+    Revisions are numbered by the post version the write produced. Most store
+    their content as a compressed delta from the post's previous revision; a
+    snapshot stores it in full, compressed, or as the blob key of an offloaded
+    content (see `src.services.post_revisions`).
+
+    Attributes:
+        post_id: ID of the post (part of the primary key)
+        revision: Post version the revision recorded (part of the primary key)
+        deltas: Deltas since the last snapshot, 0 for a snapshot
+        title: Post title
+        excerpt: Post excerpt
+        data: zlib-compressed delta, or content of a snapshot kept inline
+        blob_key: Blob store key of a snapshot's offloaded content
+        created_at: When the revision was recorded
+    """
+
+    __tablename__ = "post_revisions"
+
+    # No foreign key: posts is partitioned, and a delete trigger removes the
+    # revisions of deleted posts (see src.services.post_revisions)
+    post_id = Column(Integer, primary_key=True)
+    revision = Column(Integer, primary_key=True)
+    deltas = Column(SmallInteger, nullable=False)
+    title = Column(String(200), nullable=False)
+    excerpt = Column(String(500), nullable=True)
+    data = Column(LargeBinary, nullable=True)
+    blob_key = Column(String(64), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Deltas are always inline; a snapshot is inline or offloaded
+        CheckConstraint(
+            "(data IS NULL) <> (blob_key IS NULL) AND (blob_key IS NULL OR deltas = 0)",
+            name="ck_post_revisions_data_or_blob",
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of PostRevision."""
+        return f"<PostRevision(post_id={self.post_id}, revision={self.revision})>"
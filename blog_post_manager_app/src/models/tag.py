@@ -28,12 +28,14 @@ class Tag(Base):
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
-    # Relationships
+    # Relationships (not eager: loading a tag must not pull every tagged post)
     posts = relationship(
         "Post",
         secondary=post_tags,
+        primaryjoin="Tag.id == foreign(post_tags.c.tag_id)",
+        secondaryjoin="Post.id == foreign(post_tags.c.post_id)",
         back_populates="tags",
-        lazy="selectin",
+        lazy="select",
     )
 
     def __repr__(self) -> str:
@@ -42,8 +42,8 @@ class User(Base):
         nullable=False,
     )
 
-    # Relationships
-    posts = relationship("Post", back_populates="author", lazy="selectin")
+    # Relationships (not eager: loading an author must not pull all of their posts)
+    posts = relationship("Post", back_populates="author", lazy="select")
 
     def __repr__(self) -> str:
         """String representation of User."""
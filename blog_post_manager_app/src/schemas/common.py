@@ -53,12 +53,25 @@ class PaginatedResponse(BaseModel, Generic[T]):
     }
 
 
+class PoolStatus(BaseModel):
+    """Database connection pool occupancy."""
+
+    size: int = Field(..., description="Configured pool size", ge=0)
+    checked_out: int = Field(..., description="Connections currently in use", ge=0)
+    overflow: int = Field(..., description="Connections open beyond pool size", ge=0)
+    capacity: int = Field(
+        ..., description="Maximum connections (size + max overflow; 0 = unbounded)", ge=0
+    )
+    saturation: float = Field(..., description="checked_out / capacity", ge=0)
+
+
 class HealthResponse(BaseModel):
     """Health check response schema."""
 
     status: str = Field(..., description="Health status", pattern="^(healthy|unhealthy)$")
     version: str | None = Field(None, description="Application version")
     database: str | None = Field(None, description="Database connection status")
+    pool: PoolStatus | None = Field(None, description="Connection pool occupancy")
 
     model_config = {
         "json_schema_extra": {
@@ -67,6 +80,13 @@ class HealthResponse(BaseModel):
                     "status": "healthy",
                     "version": "0.1.0",
                     "database": "connected",
+                    "pool": {
+                        "size": 10,
+                        "checked_out": 3,
+                        "overflow": 0,
+                        "capacity": 30,
+                        "saturation": 0.1,
+                    },
                 }
             ]
         }
@@ -3,7 +3,7 @@
 import enum
 from datetime import datetime
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 from src.schemas.tag import TagResponse
 from src.schemas.user import UserResponse
@@ -79,7 +79,9 @@ class PostUpdate(BaseModel):
 
     title: str | None = Field(None, min_length=1, max_length=200, description="Post title")
     content: str | None = Field(None, min_length=1, description="Full post content")
-    excerpt: str | None = Field(None, max_length=500, description="Short post summary")
+    excerpt: str | None = Field(
+        None, max_length=500, description="Short post summary (null clears it)"
+    )
     status: PostStatus | None = Field(None, description="Post publication status")
     tags: list[str] | None = Field(None, description="List of tag names (max 10 tags)", max_length=10)
 
@@ -134,6 +136,7 @@ class PostResponse(BaseModel):
     publication_date: datetime | None = Field(None, description="When post was published")
     created_at: datetime = Field(..., description="Post creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
+    version: int = Field(..., description="Row version, also sent as the ETag header")
     author: UserResponse = Field(..., description="Post author information")
     tags: list[TagResponse] = Field(default=[], description="Associated tags")
 
@@ -150,6 +153,7 @@ class PostResponse(BaseModel):
                     "publication_date": "2025-01-14T12:00:00Z",
                     "created_at": "2025-01-14T10:00:00Z",
                     "updated_at": "2025-01-14T12:00:00Z",
+                    "version": 3,
                     "author": {
                         "id": 1,
                         "email": "author@example.com",
@@ -206,3 +210,101 @@ class PostListResponse(BaseModel):
             ]
         },
     }
+
+
+# Most IDs a bulk request may list; larger selections use a filter
+MAX_BULK_IDS = 10_000
+
+
+class PostBulkFilter(BaseModel):
+    """Filter selecting the posts of a bulk operation (all given fields must match)."""
+
+    author_id: int | None = Field(
+        None, description="Author ID (only the caller's own posts are ever affected)"
+    )
+    tags: list[str] | None = Field(
+        None, min_length=1, max_length=10, description="Tag names (posts must have ALL tags)"
+    )
+    status: PostStatus | None = Field(None, description="Current post status")
+    created_after: datetime | None = Field(
+        None, description="Only posts created at or after this time"
+    )
+    created_before: datetime | None = Field(
+        None, description="Only posts created before this time"
+    )
+
+    @field_validator("tags")
+    @classmethod
+    def normalize_tags(cls, v: list[str] | None) -> list[str] | None:
+        """Normalize tag names to lowercase, as they are stored."""
+        if v is None:
+            return v
+        return list(dict.fromkeys(tag.lower().strip() for tag in v))
+
+
+class PostBulkSelection(BaseModel):
+    """Schema selecting posts for a bulk operation, by ID list or by filter."""
+
+    ids: list[int] | None = Field(
+        None, min_length=1, max_length=MAX_BULK_IDS, description="Post IDs"
+    )
+    filter: PostBulkFilter | None = Field(None, description="Filter selecting the posts")
+
+    @model_validator(mode="after")
+    def validate_selection(self) -> "PostBulkSelection":
+        """Require exactly one of ids and filter."""
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Provide exactly one of ids and filter")
+        return self
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {"ids": [12, 15, 18]},
+                {"filter": {"status": "archived", "created_before": "2023-01-01T00:00:00Z"}},
+            ]
+        }
+    }
+
+
+class PostBulkUpdate(PostBulkSelection):
+    """Schema for moving the selected posts to a status."""
+
+    status: PostStatus = Field(..., description="New post publication status")
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "filter": {"status": "published", "created_before": "2024-01-01T00:00:00Z"},
+                    "status": "archived",
+                }
+            ]
+        }
+    }
+
+
+class PostBulkResult(BaseModel):
+    """Schema for bulk operation responses."""
+
+    affected: int = Field(..., description="Number of posts updated or deleted")
+
+
+class PostRevisionSummary(BaseModel):
+    """Schema for post revision list items (without content)."""
+
+    revision: int = Field(..., description="Post version the revision recorded")
+    title: str = Field(..., description="Post title")
+    excerpt: str | None = Field(None, description="Short post summary")
+    snapshot: bool = Field(
+        ..., description="Whether the content is stored in full rather than as a delta"
+    )
+    created_at: datetime = Field(..., description="When the revision was recorded")
+
+    model_config = {"from_attributes": True}
+
+
+class PostRevisionResponse(PostRevisionSummary):
+    """Schema for post revision responses."""
+
+    content: str = Field(..., description="Full post content")
@@ -0,0 +1,221 @@
+"""Production launcher running the API in multiple pre-forked worker processes.
+
+Usage: `python -m src.server`
+
+The application is imported once in the parent, its objects are moved out of
+the garbage collector's view with `gc.freeze()`, and workers are forked from
+it so they share those pages copy-on-write. All workers accept connections
+from a single listening socket. Each worker runs uvicorn on uvloop with the
+httptools parser.
+"""
+
+import gc
+import os
+import shutil
+import signal
+import socket
+import tempfile
+import time
+from dataclasses import dataclass
+from types import FrameType
+from typing import TYPE_CHECKING, Dict, Optional
+
+from src.config import settings
+
+if TYPE_CHECKING:
+    import uvicorn
+
+# Connections each worker holds outside the request pool (the health probe engine)
+RESERVED_CONNECTIONS_PER_WORKER = 1
+
+# Pause before replacing a crashed worker, so a crash loop does not spin the CPU
+RESPAWN_DELAY_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class PoolLimits:
+    """Per-worker connection pool limits."""
+
+    pool_size: int
+    max_overflow: int
+
+
+def worker_count(configured: int) -> int:
+    """
+    Resolve the number of worker processes.
+
+    Args:
+        configured: Configured worker count (0 = one per usable CPU)
+
+    Returns:
+        Number of workers to start
+    """
+    if configured > 0:
+        return configured
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS
+        return os.cpu_count() or 1
+
+
+def derive_pool_limits(
+    budget: int | None, workers: int, pool_size: int, max_overflow: int
+) -> PoolLimits:
+    """
+    Derive per-worker pool limits that keep all workers within a connection budget.
+
+    The configured pool size and max overflow are upper bounds; they are
+    reduced so that `workers * (pool_size + max_overflow + reserved)` never
+    exceeds the budget.
+
+    Args:
+        budget: Total database connections allowed (None = no budget)
+        workers: Number of worker processes
+        pool_size: Configured pool size
+        max_overflow: Configured max overflow
+
+    Returns:
+        PoolLimits for each worker
+
+    Raises:
+        ValueError: If the budget cannot give every worker at least one pooled connection
+    """
+    if budget is None:
+        return PoolLimits(pool_size=pool_size, max_overflow=max_overflow)
+
+    per_worker = budget // workers - RESERVED_CONNECTIONS_PER_WORKER
+    if per_worker < 1:
+        raise ValueError(
+            f"Database connection budget {budget} is too small for {workers} workers "
+            f"(each needs at least {RESERVED_CONNECTIONS_PER_WORKER + 1} connections)"
+        )
+
+    limited_pool_size = min(pool_size, per_worker)
+    return PoolLimits(
+        pool_size=limited_pool_size,
+        max_overflow=min(max_overflow, per_worker - limited_pool_size),
+    )
+
+
+def _prepare_multiprocess_metrics() -> None:
+    """Point prometheus_client at a clean shared directory for worker metrics."""
+    directory = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        # Samples left by a previous run would be aggregated with the new ones
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory, exist_ok=True)
+    else:
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="prometheus-")
+
+
+def _run_worker(config: "uvicorn.Config", sock: socket.socket) -> None:
+    """Serve requests in a forked worker until it is told to stop."""
+    import uvicorn
+
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def main() -> None:
+    """Start the workers and supervise them until SIGINT or SIGTERM."""
+    workers = worker_count(settings.web_workers)
+    limits = derive_pool_limits(
+        settings.db_max_connections,
+        workers,
+        settings.db_pool_size,
+        settings.db_max_overflow,
+    )
+    # Must happen before src.database creates the engine
+    settings.db_pool_size = limits.pool_size
+    settings.db_max_overflow = limits.max_overflow
+
+    if workers > 1:
+        # Must happen before prometheus_client is imported
+        _prepare_multiprocess_metrics()
+
+    import uvicorn
+
+    from src.main import app
+    from src.utils.logging import get_logger
+    from src.utils.metrics import mark_process_dead
+
+    logger = get_logger(__name__)
+
+    config = uvicorn.Config(
+        app,
+        host=settings.host,
+        port=settings.port,
+        loop="uvloop",
+        http="httptools",
+        backlog=settings.web_backlog,
+        log_level=settings.log_level.lower(),
+        access_log=False,  # CorrelationIdMiddleware already logs each request
+    )
+    sock = config.bind_socket()
+
+    logger.info(
+        "Starting workers",
+        extra={
+            "workers": workers,
+            "db_pool_size": limits.pool_size,
+            "db_max_overflow": limits.max_overflow,
+        },
+    )
+
+    if workers == 1:
+        uvicorn.Server(config).run(sockets=[sock])
+        return
+
+    # Nothing has connected to the database yet, so children inherit empty pools
+    gc.collect()
+    gc.freeze()
+
+    children: Dict[int, int] = {}
+    stopping = False
+
+    def spawn(slot: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            try:
+                _run_worker(config, sock)
+            finally:
+                os._exit(0)
+        children[pid] = slot
+
+    def stop(signum: int, frame: Optional[FrameType]) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    for slot in range(workers):
+        spawn(slot)
+
+    while children:
+        pid, status = os.wait()
+        if pid not in children:
+            continue
+        slot = children.pop(pid)
+        mark_process_dead(pid)
+        if not stopping:
+            logger.warning(
+                "Worker exited unexpectedly, restarting",
+                extra={"pid": pid, "exit_status": os.waitstatus_to_exitcode(status)},
+            )
+            time.sleep(RESPAWN_DELAY_SECONDS)
+            if not stopping:
+                spawn(slot)
+
+    sock.close()
+    logger.info("All workers stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,10 @@
 """Service modules for business logic."""
 
+# Registers the listeners partitioning posts in schemas built with create_all
+from src.services import post_partitions  # noqa: F401
 from src.services.auth_service import AuthService
+from src.services.health_service import HealthService
 from src.services.post_service import PostService
 from src.services.search_service import SearchService
 
-__all__ = ["AuthService", "PostService", "SearchService"]
+__all__ = ["AuthService", "HealthService", "PostService", "SearchService"]
@@ -0,0 +1,125 @@
+"""Health service for liveness and readiness checks."""
+
+import asyncio
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from src.database import pool_capacity
+from src.schemas.common import HealthResponse, PoolStatus
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class HealthService:
+    """
+    Service for readiness checks.
+
+    The database probe runs `SELECT 1` on a dedicated engine and its result is
+    cached for a short interval, with concurrent callers sharing one in-flight
+    probe. Probes therefore add at most one query per interval and never wait
+    for a connection from the request pool.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        probe_engine: AsyncEngine,
+        cache_seconds: float,
+        timeout_seconds: float,
+        saturation_threshold: float,
+    ):
+        """
+        Initialize health service.
+
+        Args:
+            engine: Application engine whose pool occupancy is reported
+            probe_engine: Engine used for the database probe
+            cache_seconds: How long a probe result is reused
+            timeout_seconds: Probe timeout
+            saturation_threshold: Pool saturation at which the service is not ready
+        """
+        self.engine = engine
+        self.probe_engine = probe_engine
+        self.cache_seconds = cache_seconds
+        self.timeout_seconds = timeout_seconds
+        self.saturation_threshold = saturation_threshold
+        self._connected = False
+        self._checked_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def _probe(self) -> None:
+        """Run a trivial query against the database."""
+        async with self.probe_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    async def database_connected(self) -> bool:
+        """
+        Check database connectivity, reusing a recent probe result.
+
+        Returns:
+            True if the last probe succeeded
+        """
+        async with self._lock:
+            now = time.monotonic()
+            if self._checked_at is not None and now - self._checked_at < self.cache_seconds:
+                return self._connected
+
+            try:
+                await asyncio.wait_for(self._probe(), timeout=self.timeout_seconds)
+                self._connected = True
+            except Exception as exc:
+                logger.warning(
+                    "Database health probe failed",
+                    extra={"error": str(exc)},
+                )
+                self._connected = False
+
+            self._checked_at = time.monotonic()
+            return self._connected
+
+    def pool_status(self) -> PoolStatus | None:
+        """
+        Get the application pool occupancy.
+
+        Returns:
+            PoolStatus, or None for pools without a fixed size (e.g. NullPool)
+        """
+        pool = self.engine.pool
+        if not isinstance(pool, QueuePool):
+            return None
+
+        capacity = pool_capacity(pool)
+        checked_out = pool.checkedout()
+        return PoolStatus(
+            size=pool.size(),
+            checked_out=checked_out,
+            overflow=max(pool.overflow(), 0),
+            capacity=capacity or 0,
+            saturation=round(checked_out / capacity, 3) if capacity else 0.0,
+        )
+
+    async def readiness(self, version: str) -> HealthResponse:
+        """
+        Check whether the service can take traffic.
+
+        Args:
+            version: Application version to report
+
+        Returns:
+            HealthResponse: healthy only if the database is reachable and the
+            pool is below the saturation threshold
+        """
+        connected = await self.database_connected()
+        pool = self.pool_status()
+        saturated = pool is not None and pool.saturation >= self.saturation_threshold
+
+        return HealthResponse(
+            status="healthy" if connected and not saturated else "unhealthy",
+            version=version,
+            database="connected" if connected else "disconnected",
+            pool=pool,
+        )
@@ -0,0 +1,272 @@
+"""Post bodies: content and search vectors kept apart from post metadata.
+
+`post_bodies` holds one row per post with its content and full-text search
+vector. The vector weighs the title (A), content (B) and excerpt (C); title
+and excerpt live on posts, so it is maintained by two triggers: one computing
+it whenever a body is written, and one recomputing it when a post's title or
+excerpt changes. A body must therefore be written in a statement after its
+post's, not in the same one.
+
+Both columns are compressed with LZ4 where the server was built with it: it
+compresses and, above all, decompresses far faster than the default pglz,
+which matters for the post detail and search that read bodies. The triggers
+and compression are set up by the `add_post_bodies` migration and, for
+schemas built with `create_all`, by metadata listeners below.
+
+Bodies of `post_body_offload_bytes` or more are offloaded to a blob store
+(see src.utils.blob_store) and never stored, logged or replicated by
+PostgreSQL; the row keeps the blob key and the content's search terms,
+computed from the full text when it is written, from which the triggers
+build the search vector. Reading the content back goes through a per-process
+LRU cache, which blobs, being immutable, never invalidate.
+"""
+
+from typing import Any, List
+
+from sqlalchemy import MetaData, event, func, literal_column
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql.dml import Insert
+
+from src.config import settings
+from src.database import Base
+from src.models.post_body import PostBody
+from src.utils.blob_store import BlobCache, BlobStore, create_blob_store
+
+# Search vector of a post, shared by both triggers
+POST_SEARCH_VECTOR_FUNCTION = """
+    CREATE OR REPLACE FUNCTION post_search_vector(title text, content text, excerpt text)
+    RETURNS tsvector AS $$
+        SELECT setweight(to_tsvector('english', COALESCE(title, '')), 'A') ||
+               setweight(to_tsvector('english', COALESCE(content, '')), 'B') ||
+               setweight(to_tsvector('english', COALESCE(excerpt, '')), 'C')
+    $$ LANGUAGE sql IMMUTABLE
+"""
+
+# Same, from the stored search terms of an offloaded content
+POST_SEARCH_VECTOR_OF_TERMS_FUNCTION = """
+    CREATE OR REPLACE FUNCTION post_search_vector(title text, content_vector tsvector, excerpt text)
+    RETURNS tsvector AS $$
+        SELECT setweight(to_tsvector('english', COALESCE(title, '')), 'A') ||
+               COALESCE(content_vector, ''::tsvector) ||
+               setweight(to_tsvector('english', COALESCE(excerpt, '')), 'C')
+    $$ LANGUAGE sql IMMUTABLE
+"""
+
+# Offloaded bodies are written with content set to NULL next to their
+# content_vector, so UPDATE OF content covers both kinds of write
+POST_BODY_DDL: List[str] = [
+    POST_SEARCH_VECTOR_FUNCTION,
+    POST_SEARCH_VECTOR_OF_TERMS_FUNCTION,
+    """
+    CREATE OR REPLACE FUNCTION post_bodies_search_vector_trigger() RETURNS trigger AS $$
+    BEGIN
+        SELECT CASE
+                   WHEN NEW.content IS NULL
+                   THEN post_search_vector(p.title, NEW.content_vector, p.excerpt)
+                   ELSE post_search_vector(p.title, NEW.content, p.excerpt)
+               END
+        INTO NEW.search_vector
+        FROM posts AS p
+        WHERE p.id = NEW.post_id;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION posts_search_text_trigger() RETURNS trigger AS $$
+    BEGIN
+        UPDATE post_bodies
+        SET search_vector = CASE
+                WHEN content IS NULL
+                THEN post_search_vector(NEW.title, content_vector, NEW.excerpt)
+                ELSE post_search_vector(NEW.title, content, NEW.excerpt)
+            END
+        WHERE post_id = NEW.id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS post_bodies_search_vector_update ON post_bodies",
+    """
+    CREATE TRIGGER post_bodies_search_vector_update
+        BEFORE INSERT OR UPDATE OF content ON post_bodies
+        FOR EACH ROW
+        EXECUTE FUNCTION post_bodies_search_vector_trigger()
+    """,
+    "DROP TRIGGER IF EXISTS posts_search_text_update ON posts",
+    """
+    CREATE TRIGGER posts_search_text_update
+        AFTER UPDATE OF title, excerpt ON posts
+        FOR EACH ROW
+        WHEN (OLD.title IS DISTINCT FROM NEW.title OR OLD.excerpt IS DISTINCT FROM NEW.excerpt)
+        EXECUTE FUNCTION posts_search_text_trigger()
+    """,
+]
+
+POST_BODY_DROP_DDL: List[str] = [
+    "DROP TRIGGER IF EXISTS posts_search_text_update ON posts",
+    "DROP TRIGGER IF EXISTS post_bodies_search_vector_update ON post_bodies",
+    "DROP FUNCTION IF EXISTS posts_search_text_trigger()",
+    "DROP FUNCTION IF EXISTS post_bodies_search_vector_trigger()",
+    "DROP FUNCTION IF EXISTS post_search_vector(text, text, text)",
+    "DROP FUNCTION IF EXISTS post_search_vector(text, tsvector, text)",
+]
+
+# Compression of the body columns, for servers built with LZ4 (PostgreSQL 14+)
+POST_BODY_LZ4_DDL = (
+    "ALTER TABLE post_bodies "
+    "ALTER COLUMN content SET COMPRESSION lz4, "
+    "ALTER COLUMN search_vector SET COMPRESSION lz4"
+)
+OFFLOADED_BODY_LZ4_DDL = "ALTER TABLE post_bodies ALTER COLUMN content_vector SET COMPRESSION lz4"
+
+
+def write_body(post_id: int, content: str, blob_key: str | None = None) -> Insert:
+    """
+    Build the statement storing a post's content.
+
+    Runs after the statement writing the post, so the search vector trigger
+    sees the post's current title and excerpt.
+
+    Args:
+        post_id: Post ID
+        content: Full content
+        blob_key: Key of the content in the blob store if it is offloaded;
+            the content is then only sent to compute its search terms
+
+    Returns:
+        INSERT ... ON CONFLICT DO UPDATE statement
+    """
+    values: dict[str, Any] = (
+        {"content": content, "blob_key": None, "content_vector": None}
+        if blob_key is None
+        else {
+            "content": None,
+            "blob_key": blob_key,
+            "content_vector": func.setweight(
+                func.to_tsvector("english", content), literal_column("'B'")
+            ),
+        }
+    )
+    stmt = insert(PostBody).values(post_id=post_id, **values)
+    return stmt.on_conflict_do_update(
+        index_elements=[PostBody.post_id],
+        set_={name: getattr(stmt.excluded, name) for name in values},
+    )
+
+
+class PostBodyStore:
+    """Writes and reads post contents, offloading large ones to a blob store."""
+
+    def __init__(self, blobs: BlobStore, offload_bytes: int, cache_bytes: int):
+        """
+        Initialize post body store.
+
+        Args:
+            blobs: Blob store of offloaded contents
+            offload_bytes: Contents of this many UTF-8 bytes or more are offloaded
+            cache_bytes: Size of the LRU cache of offloaded contents
+        """
+        self.blobs = blobs
+        self.offload_bytes = offload_bytes
+        self.cache = BlobCache(cache_bytes)
+
+    async def offload(self, content: str) -> str | None:
+        """
+        Store a content in the blob store if it is large enough to be offloaded.
+
+        A blob is written before the transaction storing its key commits; if
+        the transaction fails, the blob is left unreferenced, which is harmless.
+
+        Args:
+            content: Full content
+
+        Returns:
+            Blob key, or None if the content is kept inline
+        """
+        data = content.encode()
+        if len(data) < self.offload_bytes:
+            return None
+
+        key = await self.blobs.put(data)
+        self.cache.add(key, content, len(data))
+        return key
+
+    async def write(self, post_id: int, content: str) -> Insert:
+        """
+        Offload a large content, then build the statement storing the body.
+
+        Args:
+            post_id: Post ID
+            content: Full content
+
+        Returns:
+            Statement from `write_body`
+        """
+        return write_body(post_id, content, await self.offload(content))
+
+    async def read(self, content: str | None, blob_key: str | None) -> str:
+        """
+        Get a post's content from its body columns.
+
+        Args:
+            content: Stored content, None if offloaded
+            blob_key: Blob key of an offloaded content
+
+        Returns:
+            Full content
+        """
+        if blob_key is None:
+            assert content is not None
+            return content
+
+        cached = self.cache.get(blob_key)
+        if cached is None:
+            data = await self.blobs.get(blob_key)
+            cached = data.decode()
+            self.cache.add(blob_key, cached, len(data))
+        return cached
+
+
+# Shared by every PostService of the process, so they share the cache
+post_body_store = PostBodyStore(
+    create_blob_store(settings), settings.post_body_offload_bytes, settings.post_body_cache_bytes
+)
+
+
+def supports_lz4(connection: Connection) -> bool:
+    """
+    Tell whether the server can compress TOAST values with LZ4.
+
+    Args:
+        connection: Database connection
+
+    Returns:
+        True if `lz4` is an accepted column compression method
+    """
+    return bool(
+        connection.exec_driver_sql(
+            "SELECT coalesce(bool_or(method = 'lz4'), false) FROM pg_settings, "
+            "unnest(enumvals) AS method WHERE name = 'default_toast_compression'"
+        ).scalar()
+    )
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _install_post_body_ddl(target: MetaData, connection: Connection, **kw: Any) -> None:
+    """Install the search vector triggers and compression in schemas built with create_all."""
+    if connection.dialect.name == "postgresql":
+        for statement in POST_BODY_DDL:
+            connection.exec_driver_sql(statement)
+        if supports_lz4(connection):
+            connection.exec_driver_sql(POST_BODY_LZ4_DDL)
+            connection.exec_driver_sql(OFFLOADED_BODY_LZ4_DDL)
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _drop_post_body_ddl(target: MetaData, connection: Connection, **kw: Any) -> None:
+    """Drop the search vector triggers and function before drop_all removes the tables."""
+    if connection.dialect.name == "postgresql":
+        for statement in POST_BODY_DROP_DDL:
+            connection.exec_driver_sql(statement)
@@ -0,0 +1,297 @@
+"""Post cards: list items serialized once on write and concatenated on read.
+
+With the "cards" list strategy, list pages filter and sort the `post_cards`
+table and PostgreSQL joins the stored documents into one JSON array with
+`string_agg`; nothing is joined or serialized per request.
+
+Cards have a single builder, `post_cards_upsert`. It is installed in the
+database as the `refresh_post_cards(integer[])` SQL function, which
+PostService calls before committing each post write and which triggers on
+users and tags call when an author or a tag changes. The function and
+triggers are created by the `add_post_cards` migration and, for schemas built
+with `create_all`, by a metadata listener below. Deleted posts have no card:
+the function drops the card of a post it finds deleted.
+"""
+
+from typing import Any, List
+
+from sqlalchemy import (
+    Integer,
+    MetaData,
+    Text,
+    and_,
+    any_,
+    cast,
+    delete,
+    event,
+    exists,
+    func,
+    literal,
+    literal_column,
+    select,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by, insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement, Select
+from sqlalchemy.sql.dml import Delete, Insert
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from src.database import Base
+from src.models.post import Post, PostStatus, post_tags
+from src.models.post_card import PostCard
+from src.models.tag import Tag
+from src.services.post_json import POST_ITEM_JSON, post_json_rows
+
+# Base statements for card pages, one per sort order; see post_json_rows (and
+# the note there on selecting table columns)
+_cards = PostCard.__table__
+CARDS_BY_CREATED_AT: Select = select(
+    _cards.c.document, _cards.c.created_at.label("sort_key"), _cards.c.post_id
+)
+CARDS_BY_PUBLICATION_DATE: Select = select(
+    _cards.c.document, _cards.c.publication_date.label("sort_key"), _cards.c.post_id
+)
+
+
+def post_cards_upsert(post_ids: ColumnElement | List[int]) -> Insert:
+    """
+    Build the statement that (re)builds the cards of some posts.
+
+    Args:
+        post_ids: Post IDs, or a subquery selecting them
+
+    Returns:
+        INSERT ... ON CONFLICT DO UPDATE statement
+    """
+    return _cards_upsert(and_(Post.id.in_(post_ids), Post.deleted_at.is_(None)))
+
+
+def _cards_upsert(posts_condition: ColumnElement) -> Insert:
+    """Build the card upsert for the posts matching a condition."""
+    source = post_json_rows(Post.created_at).with_only_columns(
+        Post.id,
+        Post.author_id,
+        Post.status,
+        Post.publication_date,
+        Post.created_at,
+        POST_ITEM_JSON,
+    )
+    stmt = insert(PostCard).from_select(
+        ["post_id", "author_id", "status", "publication_date", "created_at", "document"],
+        source.where(posts_condition),
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[PostCard.post_id],
+        set_={
+            "author_id": stmt.excluded.author_id,
+            "status": stmt.excluded.status,
+            "publication_date": stmt.excluded.publication_date,
+            "created_at": stmt.excluded.created_at,
+            "document": stmt.excluded.document,
+        },
+    )
+
+
+def refresh_function_sql(skip_deleted: bool = True) -> str:
+    """
+    Build the CREATE FUNCTION statement rebuilding the cards of an array of post IDs.
+
+    Args:
+        skip_deleted: Drop the cards of deleted posts rather than rebuilding
+            them. Only migrations running before posts.deleted_at exists turn
+            it off.
+
+    Returns:
+        CREATE OR REPLACE FUNCTION statement for refresh_post_cards(integer[])
+    """
+    in_array: ColumnElement[bool] = Post.id == any_(literal_column("post_ids"))
+    statements: List[Delete | Insert] = []
+    if skip_deleted:
+        statements.append(
+            delete(PostCard).where(
+                PostCard.post_id == Post.id, in_array, Post.deleted_at.is_not(None)
+            )
+        )
+        in_array = and_(in_array, Post.deleted_at.is_(None))
+    statements.append(_cards_upsert(in_array))
+
+    compiled = (
+        stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+        for stmt in statements
+    )
+    body = "".join(f"{sql};\n" for sql in compiled)
+    return (
+        "CREATE OR REPLACE FUNCTION refresh_post_cards(post_ids integer[]) "
+        f"RETURNS void AS $$\n{body}$$ LANGUAGE sql"
+    )
+
+
+# DDL installing the triggers that keep cards current when an author or a tag
+# changes. On tag delete the tag's links are removed first, so the rebuilt
+# cards no longer list it when the cascade runs after.
+POST_CARD_TRIGGER_DDL: List[str] = [
+    """
+    CREATE OR REPLACE FUNCTION post_cards_author_trigger() RETURNS trigger AS $$
+    BEGIN
+        PERFORM refresh_post_cards(ARRAY(SELECT id FROM posts WHERE author_id = NEW.id));
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION post_cards_tag_trigger() RETURNS trigger AS $$
+    DECLARE
+        affected integer[];
+    BEGIN
+        affected := ARRAY(SELECT post_id FROM post_tags WHERE tag_id = OLD.id);
+
+        IF TG_OP = 'DELETE' THEN
+            DELETE FROM post_tags WHERE tag_id = OLD.id;
+            PERFORM refresh_post_cards(affected);
+            RETURN OLD;
+        END IF;
+
+        PERFORM refresh_post_cards(affected);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS post_cards_author_update ON users",
+    """
+    CREATE TRIGGER post_cards_author_update
+        AFTER UPDATE ON users
+        FOR EACH ROW
+        EXECUTE FUNCTION post_cards_author_trigger()
+    """,
+    "DROP TRIGGER IF EXISTS post_cards_tag_update ON tags",
+    """
+    CREATE TRIGGER post_cards_tag_update
+        AFTER UPDATE ON tags
+        FOR EACH ROW
+        WHEN (OLD.name IS DISTINCT FROM NEW.name OR OLD.created_at IS DISTINCT FROM NEW.created_at)
+        EXECUTE FUNCTION post_cards_tag_trigger()
+    """,
+    "DROP TRIGGER IF EXISTS post_cards_tag_delete ON tags",
+    """
+    CREATE TRIGGER post_cards_tag_delete
+        BEFORE DELETE ON tags
+        FOR EACH ROW
+        EXECUTE FUNCTION post_cards_tag_trigger()
+    """,
+]
+
+# The card function and its triggers
+POST_CARD_DDL: List[str] = [refresh_function_sql(), *POST_CARD_TRIGGER_DDL]
+
+POST_CARD_DROP_DDL: List[str] = [
+    "DROP TRIGGER IF EXISTS post_cards_tag_delete ON tags",
+    "DROP TRIGGER IF EXISTS post_cards_tag_update ON tags",
+    "DROP TRIGGER IF EXISTS post_cards_author_update ON users",
+    "DROP FUNCTION IF EXISTS post_cards_tag_trigger()",
+    "DROP FUNCTION IF EXISTS post_cards_author_trigger()",
+    "DROP FUNCTION IF EXISTS refresh_post_cards(integer[])",
+]
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _install_post_card_ddl(target: MetaData, connection: Connection, **kw: Any) -> None:
+    """Install the card function and triggers in schemas built with create_all."""
+    if connection.dialect.name == "postgresql":
+        for statement in POST_CARD_DDL:
+            connection.exec_driver_sql(statement)
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _drop_post_card_ddl(target: MetaData, connection: Connection, **kw: Any) -> None:
+    """Drop the card triggers and functions before drop_all removes the tables."""
+    if connection.dialect.name == "postgresql":
+        for statement in POST_CARD_DROP_DDL:
+            connection.exec_driver_sql(statement)
+
+
+async def refresh_post_cards(db: AsyncSession, post_ids: List[int]) -> None:
+    """
+    Rebuild the cards of the given posts in the session's transaction.
+
+    Calls the same `refresh_post_cards` SQL function the triggers use.
+    Pending ORM changes are flushed first so the cards see them.
+
+    Args:
+        db: Database session
+        post_ids: IDs of the posts whose cards to rebuild
+    """
+    await db.flush()
+    await db.execute(select(func.refresh_post_cards(literal(post_ids, ARRAY(Integer)))))
+
+
+def card_filters(
+    stmt: StatementLambdaElement,
+    status_filter: PostStatus | None,
+    author_id: int | None,
+    tag_names: List[str] | None,
+) -> StatementLambdaElement:
+    """
+    Append list_posts filters to a lambda statement over post_cards.
+
+    Args:
+        stmt: Base statement
+        status_filter: Filter by post status
+        author_id: Filter by author ID
+        tag_names: Filter by tag names (posts must have ALL tags)
+
+    Returns:
+        The statement with the filters applied
+    """
+    if status_filter:
+        stmt += lambda s: s.where(PostCard.status == status_filter)
+
+    if author_id:
+        stmt += lambda s: s.where(PostCard.author_id == author_id)
+
+    if tag_names:
+        # One prebuilt clause, as in _post_list_filters
+        tag_filter = and_(
+            *(has_tag(Tag.name == tag_name.lower()) for tag_name in tag_names)
+        )
+        stmt += lambda s: s.where(tag_filter)
+
+    return stmt
+
+
+def has_tag(tag_condition: ColumnElement) -> ColumnElement:
+    """
+    Build an EXISTS clause matching cards whose post has a tag meeting a condition.
+
+    Args:
+        tag_condition: Condition on Tag, e.g. `Tag.id == 3`
+
+    Returns:
+        EXISTS clause correlated to post_cards
+    """
+    return exists().where(
+        post_tags.c.post_id == PostCard.post_id,
+        post_tags.c.tag_id == Tag.id,
+        tag_condition,
+    )
+
+
+def cards_page(cards: Select) -> Select:
+    """
+    Concatenate a paginated card statement into one JSON array returned as bytes.
+
+    Args:
+        cards: Filtered, ordered and paginated CARDS_BY_* statement
+
+    Returns:
+        Select of a single bytea column holding the UTF-8 JSON array
+    """
+    page = cards.subquery("page")
+    documents = func.string_agg(
+        cast(page.c.document, Text),
+        aggregate_order_by(literal_column("','"), page.c.sort_key.desc(), page.c.post_id),
+    )
+    return select(
+        func.convert_to(literal("[") + func.coalesce(documents, "") + "]", "UTF8")
+    )
@@ -0,0 +1,179 @@
+"""List pages rendered as JSON by PostgreSQL.
+
+The "json" list strategy has PostgreSQL build every list item, including the
+nested author and tags, with `json_build_object`, aggregate the page with
+`json_agg` and hand it back as UTF-8 bytes. Python only wraps those bytes in
+the pagination envelope, so it creates a handful of objects per page instead
+of several per item. Keys and timestamp formats match `PostListResponse`
+serialization, so clients see the same documents as with the other strategies.
+"""
+
+import json
+
+from sqlalchemy import (
+    JSON,
+    ColumnElement,
+    Select,
+    Text,
+    case,
+    cast,
+    func,
+    literal,
+    literal_column,
+    select,
+    true,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+
+from src.models.post import Post, post_tags
+from src.models.tag import Tag
+from src.models.user import User
+
+# List statements select table columns rather than mapped attributes: with
+# ORM attributes a lambda statement ending in json_page (or cards_page) would
+# be executed on the ORM path, which cannot handle the plain select it returns
+posts = Post.__table__
+tags = Tag.__table__
+users = User.__table__
+
+
+def iso_utc(timestamp: ColumnElement) -> ColumnElement:
+    """
+    Format a timestamptz the way Pydantic serializes an aware UTC datetime.
+
+    Microseconds are printed only when non-zero, e.g. `2025-01-14T12:00:00Z`
+    or `2025-01-14T12:00:00.120000Z`. NULL stays NULL.
+
+    Args:
+        timestamp: timestamptz expression
+
+    Returns:
+        Text expression
+    """
+    utc = timestamp.op("AT TIME ZONE")(literal("UTC"))
+    fraction = func.to_char(utc, ".US")
+    return (
+        func.to_char(utc, literal_column("'YYYY-MM-DD\"T\"HH24:MI:SS'"))
+        + case((fraction == ".000000", ""), else_=fraction)
+        + "Z"
+    )
+
+
+# Tags of each post as a JSON array (TagResponse key order), ordered by name
+_TAGS_JSON = (
+    select(
+        func.coalesce(
+            func.json_agg(
+                aggregate_order_by(
+                    func.json_build_object(
+                        "name", tags.c.name,
+                        "id", tags.c.id,
+                        "created_at", iso_utc(tags.c.created_at),
+                        "post_count", None,
+                    ),
+                    tags.c.name,
+                )
+            ),
+            cast(literal("[]"), JSON),
+        ).label("tags")
+    )
+    .select_from(post_tags.join(tags, tags.c.id == post_tags.c.tag_id))
+    .where(post_tags.c.post_id == posts.c.id)
+    .lateral("post_tags_json")
+)  # fmt: skip
+
+# One list item (PostListResponse key order, nested UserResponse)
+POST_ITEM_JSON = func.json_build_object(
+    "id", posts.c.id,
+    "title", posts.c.title,
+    "excerpt", posts.c.excerpt,
+    "status", cast(posts.c.status, Text),
+    "publication_date", iso_utc(posts.c.publication_date),
+    "created_at", iso_utc(posts.c.created_at),
+    "author", func.json_build_object(
+        "email", users.c.email,
+        "username", users.c.username,
+        "full_name", users.c.full_name,
+        "id", users.c.id,
+        "is_active", users.c.is_active,
+        "created_at", iso_utc(users.c.created_at),
+        "updated_at", iso_utc(users.c.updated_at),
+    ),
+    "tags", _TAGS_JSON.c.tags,
+)  # fmt: skip
+
+
+def post_json_rows(sort_key: ColumnElement) -> Select:
+    """
+    Build the base statement selecting list items as JSON.
+
+    Args:
+        sort_key: Column the page is ordered by; selected as `sort_key` so the
+            page aggregate can keep the order
+
+    Returns:
+        Select of (item, sort_key, id) to be filtered, ordered and paginated
+    """
+    return (
+        select(POST_ITEM_JSON.label("item"), sort_key.label("sort_key"), posts.c.id)
+        .join_from(posts, users, posts.c.author_id == users.c.id)
+        .join(_TAGS_JSON, true())
+    )
+
+
+POSTS_JSON_BY_CREATED_AT = post_json_rows(posts.c.created_at)
+POSTS_JSON_BY_PUBLICATION_DATE = post_json_rows(posts.c.publication_date)
+
+
+def json_page(items: Select) -> Select:
+    """
+    Aggregate a paginated item statement into one JSON array returned as bytes.
+
+    Args:
+        items: Filtered, ordered and paginated post_json_rows statement
+
+    Returns:
+        Select of a single bytea column holding the UTF-8 JSON array
+    """
+    page = items.subquery("page")
+    return select(
+        func.convert_to(
+            cast(
+                func.coalesce(
+                    func.json_agg(
+                        aggregate_order_by(
+                            page.c.item, page.c.sort_key.desc(), page.c.id
+                        )
+                    ),
+                    cast(literal("[]"), JSON),
+                ),
+                Text,
+            ),
+            "UTF8",
+        )
+    )
+
+
+def paginated_json(items: bytes, total: int, page: int, page_size: int) -> bytes:
+    """
+    Wrap a JSON array of items in the PaginatedResponse envelope.
+
+    Args:
+        items: UTF-8 JSON array built by json_page
+        total: Total number of items
+        page: Page number (1-indexed)
+        page_size: Number of items per page
+
+    Returns:
+        UTF-8 JSON document
+    """
+    envelope = json.dumps(
+        {
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": (total + page_size - 1) // page_size,
+        },
+        separators=(",", ":"),
+    )
+    return b'{"items":' + items + b"," + envelope[1:].encode()
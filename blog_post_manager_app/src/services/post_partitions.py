@@ -0,0 +1,190 @@
+"""Time partitions of posts.
+
+`posts` is range-partitioned by `created_at`:
+
+- `posts_cold` holds everything before the hot window, from MINVALUE. Its rows
+  are old and rarely written, so it is packed (fillfactor 100) and compresses
+  values early (toast_tuple_target 128, LZ4 where the server has it).
+- `posts_pYYYYMM` holds one month of the hot window, or a month created ahead.
+- `posts_future` runs from the last monthly partition to MAXVALUE, so inserts
+  never fail when months were not created in time.
+
+There is deliberately no DEFAULT partition: with ordered, non-overlapping
+bounds the planner reads partitions newest first for `ORDER BY created_at DESC
+LIMIT n` pages and never starts the older ones, and a query bounding
+created_at is pruned to the months it covers.
+
+Unique constraints on a partitioned table must include the partition key, so
+the tables keyed by post ID (post_tags, post_bodies, post_cards) cannot
+reference posts with foreign keys; a statement trigger on posts deletes their
+rows instead, as ON DELETE CASCADE did.
+
+`src.tools.post_partitions` creates months ahead of time and moves the months
+leaving the hot window into `posts_cold`.
+"""
+
+from datetime import date, datetime, timezone
+from typing import Any, List
+
+from sqlalchemy import MetaData, event
+from sqlalchemy.engine import Connection
+
+from src.config import settings
+from src.database import Base
+from src.services.post_bodies import supports_lz4
+
+COLD_PARTITION = "posts_cold"
+FUTURE_PARTITION = "posts_future"
+# Valid CHECK constraint matching the cold partition's bound: it lets the
+# partition be re-attached with a wider bound without scanning it
+COLD_CHECK = "posts_cold_created_at_check"
+
+# Removes the rows keyed by deleted posts, in place of ON DELETE CASCADE
+POST_CASCADE_DDL: List[str] = [
+    """
+    CREATE OR REPLACE FUNCTION posts_cascade_delete() RETURNS trigger AS $$
+    BEGIN
+        DELETE FROM post_tags WHERE post_id IN (SELECT id FROM deleted_posts);
+        DELETE FROM post_bodies WHERE post_id IN (SELECT id FROM deleted_posts);
+        DELETE FROM post_cards WHERE post_id IN (SELECT id FROM deleted_posts);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS posts_cascade_delete ON posts",
+    """
+    CREATE TRIGGER posts_cascade_delete
+        AFTER DELETE ON posts
+        REFERENCING OLD TABLE AS deleted_posts
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION posts_cascade_delete()
+    """,
+]
+
+POST_CASCADE_DROP_DDL: List[str] = [
+    "DROP TRIGGER IF EXISTS posts_cascade_delete ON posts",
+    "DROP FUNCTION IF EXISTS posts_cascade_delete()",
+]
+
+
+def month_start(day: date) -> date:
+    """First day of the month containing `day`."""
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    """First day of the month `months` after (or before, if negative) `month`."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def hot_window_start(today: date, hot_months: int) -> date:
+    """First month of the hot window: the current month and the ones before it."""
+    return add_months(month_start(today), 1 - hot_months)
+
+
+def partition_name(month: date) -> str:
+    """Name of the monthly partition starting at `month`."""
+    return f"posts_p{month:%Y%m}"
+
+
+def bound(month: date) -> str:
+    """Partition bound literal for midnight UTC on `month`."""
+    return f"'{month.isoformat()} 00:00:00+00'"
+
+
+def month_partition_sql(month: date) -> str:
+    """CREATE TABLE statement for the monthly partition starting at `month`."""
+    return (
+        f"CREATE TABLE {partition_name(month)} PARTITION OF posts "
+        f"FOR VALUES FROM ({bound(month)}) TO ({bound(add_months(month, 1))})"
+    )
+
+
+def future_partition_sql(start: date) -> str:
+    """CREATE TABLE statement for the open-ended partition after the monthly ones."""
+    return (
+        f"CREATE TABLE {FUTURE_PARTITION} PARTITION OF posts "
+        f"FOR VALUES FROM ({bound(start)}) TO (MAXVALUE)"
+    )
+
+
+def cold_partition_ddl(end: date, lz4: bool) -> List[str]:
+    """
+    Build the statements creating the cold partition.
+
+    Args:
+        end: First month not in the cold partition
+        lz4: Compress title and excerpt with LZ4 rather than pglz
+
+    Returns:
+        DDL statements, in order
+    """
+    statements = [
+        f"CREATE TABLE {COLD_PARTITION} PARTITION OF posts "
+        f"FOR VALUES FROM (MINVALUE) TO ({bound(end)}) "
+        "WITH (fillfactor = 100, toast_tuple_target = 128)",
+        f"ALTER TABLE {COLD_PARTITION} ADD CONSTRAINT {COLD_CHECK} "
+        f"CHECK (created_at < {bound(end)})",
+    ]
+    if lz4:
+        statements.append(
+            f"ALTER TABLE {COLD_PARTITION} "
+            "ALTER COLUMN title SET COMPRESSION lz4, "
+            "ALTER COLUMN excerpt SET COMPRESSION lz4"
+        )
+    return statements
+
+
+def initial_partition_ddl(
+    today: date, hot_months: int, premake_months: int, lz4: bool
+) -> List[str]:
+    """
+    Build the statements creating the partitions of a new posts table.
+
+    Args:
+        today: Current date (UTC)
+        hot_months: Months, the current one included, in monthly partitions
+        premake_months: Monthly partitions created ahead of the current month
+        lz4: Whether the server supports LZ4 compression
+
+    Returns:
+        DDL statements, in order
+    """
+    first = hot_window_start(today, hot_months)
+    end = add_months(month_start(today), premake_months + 1)
+
+    statements = cold_partition_ddl(first, lz4)
+    month = first
+    while month < end:
+        statements.append(month_partition_sql(month))
+        month = add_months(month, 1)
+    statements.append(future_partition_sql(end))
+    return statements
+
+
+def utc_today() -> date:
+    """Current date in UTC, the time zone partition bounds are written in."""
+    return datetime.now(timezone.utc).date()
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _install_post_partitions(target: MetaData, connection: Connection, **kw: Any) -> None:
+    """Create the partitions and delete cascade of posts in schemas built with create_all."""
+    if connection.dialect.name == "postgresql":
+        statements = initial_partition_ddl(
+            utc_today(),
+            settings.post_partition_hot_months,
+            settings.post_partition_premake_months,
+            supports_lz4(connection),
+        )
+        for statement in [*statements, *POST_CASCADE_DDL]:
+            connection.exec_driver_sql(statement)
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _drop_post_partitions(target: MetaData, connection: Connection, **kw: Any) -> None:
+    """Drop the delete cascade before drop_all removes the tables."""
+    if connection.dialect.name == "postgresql":
+        for statement in POST_CASCADE_DROP_DDL:
+            connection.exec_driver_sql(statement)
@@ -0,0 +1,129 @@
+"""Background purger removing soft-deleted posts.
+
+Deleting a post only sets its `deleted_at` (see PostService.delete_post), so
+the request never waits for cascades over tag links and other dependent rows.
+Posts deleted more than `post_purge_after_seconds` ago are removed here, in
+batches of `post_purge_batch_size`: each batch is one short DELETE of the
+oldest deleted posts, and batches are spaced `post_purge_batch_interval_seconds`
+apart, so each worker process purges at most batch size / interval posts per
+second however large the backlog. Rows are claimed with SKIP LOCKED, so the
+purgers of several workers never wait on each other.
+"""
+
+import asyncio
+from datetime import timedelta
+from typing import Callable, cast
+
+from sqlalchemy import ColumnElement, Select, delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.dml import ReturningDelete
+
+from src.models.post import Post
+from src.utils.logging import get_logger
+from src.utils.metrics import POSTS_PURGED
+
+logger = get_logger(__name__)
+
+
+def purge_statement(purge_after_seconds: int, batch_size: int) -> ReturningDelete:
+    """
+    Build the statement removing one batch of deleted posts.
+
+    Args:
+        purge_after_seconds: How long posts stay deleted before they are removed
+        batch_size: Maximum number of posts removed
+
+    Returns:
+        DELETE ... RETURNING the removed post IDs
+    """
+    # Ordering comparisons on unannotated Columns type-check as bool
+    due = cast(
+        ColumnElement[bool],
+        Post.deleted_at < func.now() - timedelta(seconds=purge_after_seconds),
+    )
+    # Served by the partial index over deleted posts, oldest first
+    batch: Select = (
+        select(Post.id)
+        .where(due)
+        .order_by(Post.deleted_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    return delete(Post).where(Post.id.in_(batch)).returning(Post.id)
+
+
+class PostPurger:
+    """Rate-limited background task removing soft-deleted posts."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        purge_after_seconds: int,
+        batch_size: int,
+        batch_interval_seconds: float,
+        idle_seconds: float,
+    ):
+        """
+        Initialize post purger.
+
+        Args:
+            session_factory: Creates the session each batch runs in
+            purge_after_seconds: How long posts stay deleted before they are removed
+            batch_size: Posts removed per statement (and transaction)
+            batch_interval_seconds: Pause between batches
+            idle_seconds: Pause once no deleted post is due
+        """
+        self.session_factory = session_factory
+        self.purge_after_seconds = purge_after_seconds
+        self.batch_size = batch_size
+        self.batch_interval_seconds = batch_interval_seconds
+        self.idle_seconds = idle_seconds
+        self._task: asyncio.Task | None = None
+
+    async def purge_batch(self, db: AsyncSession) -> int:
+        """
+        Remove one batch of due deleted posts and commit.
+
+        Tag links and other dependent rows go with them by cascade.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of posts removed
+        """
+        result = await db.execute(purge_statement(self.purge_after_seconds, self.batch_size))
+        purged = len(result.all())
+        await db.commit()
+        POSTS_PURGED.inc(purged)
+        return purged
+
+    async def run(self) -> None:
+        """Purge batches until cancelled, pausing between them."""
+        while True:
+            try:
+                async with self.session_factory() as db:
+                    purged = await self.purge_batch(db)
+            except Exception as exc:
+                logger.warning("Purging deleted posts failed", extra={"error": str(exc)})
+                purged = 0
+
+            # A full batch means more posts are due: carry on after the interval
+            full = purged == self.batch_size
+            await asyncio.sleep(self.batch_interval_seconds if full else self.idle_seconds)
+
+    def start(self) -> None:
+        """Start purging in a background task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Cancel the background task and wait for it to end."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
@@ -0,0 +1,393 @@
+"""Post revisions: the edit history of posts, stored as compressed deltas.
+
+Creating a post and every update of it through PostService record a
+revision in `post_revisions`, numbered by the post version the write produced.
+Storing each revision's full content would multiply a post's storage by its
+number of saves (an autosaved 50 KB body, every few seconds), so most
+revisions store a delta from the post's previous revision instead: the runs of
+its content copied from that revision and the text in between,
+zlib-compressed. Contents are compared by segments ending at a line break or
+sentence end, so an edit inside a long paragraph stores about the sentences it
+touched.
+
+After `post_revision_max_deltas` deltas the next revision is a full snapshot,
+compressed, or for a content large enough to be offloaded, the key of its blob
+(see src.services.post_bodies). Rebuilding any revision thus reads one
+snapshot and at most `post_revision_max_deltas` deltas, in one range scan of
+the primary key.
+
+Revisions are kept off the post read path: posts have no relationship to
+them, and only the revision endpoints read them. Writes pay one indexed
+lookup of the latest revision, and for a delta of a new content one read of
+the previous content, before storing the revision. A post's revisions are
+removed with it by a delete trigger on posts, installed next to the one in
+src.services.post_partitions.
+"""
+
+import asyncio
+import json
+import re
+import zlib
+from difflib import SequenceMatcher
+from typing import Any, List, Sequence, cast
+
+from fastapi import HTTPException, status
+from sqlalchemy import ColumnElement, MetaData, Row, event, func, insert, lambda_stmt, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.database import Base, execute_with_count
+from src.models.post import Post
+from src.models.post_body import PostBody
+from src.models.post_revision import PostRevision
+from src.models.user import User
+from src.schemas.common import PaginatedResponse
+from src.schemas.post import PostRevisionResponse, PostRevisionSummary
+from src.services.post_bodies import PostBodyStore, post_body_store
+
+# Removes the revisions of deleted posts, in place of ON DELETE CASCADE
+POST_REVISION_DDL: List[str] = [
+    """
+    CREATE OR REPLACE FUNCTION posts_revisions_cascade_delete() RETURNS trigger AS $$
+    BEGIN
+        DELETE FROM post_revisions WHERE post_id IN (SELECT id FROM deleted_posts);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS posts_revisions_cascade_delete ON posts",
+    """
+    CREATE TRIGGER posts_revisions_cascade_delete
+        AFTER DELETE ON posts
+        REFERENCING OLD TABLE AS deleted_posts
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION posts_revisions_cascade_delete()
+    """,
+]
+
+POST_REVISION_DROP_DDL: List[str] = [
+    "DROP TRIGGER IF EXISTS posts_revisions_cascade_delete ON posts",
+    "DROP FUNCTION IF EXISTS posts_revisions_cascade_delete()",
+]
+
+# Zero-width split points after each line break and sentence end
+_SEGMENT_END = re.compile(r"(?<=[\n.!?])")
+
+
+def _segments(text: str) -> List[str]:
+    """Split a text into segments that join back into it."""
+    return [segment for segment in _SEGMENT_END.split(text) if segment]
+
+
+def encode_delta(base: str, content: str) -> bytes:
+    """
+    Encode a content as a compressed delta from a base content.
+
+    The delta is a JSON list of operations: `[start, end]` copies those
+    segments of the base, and a string is inserted as is.
+
+    Args:
+        base: Content the delta applies to
+        content: Content the delta rebuilds
+
+    Returns:
+        zlib-compressed delta
+    """
+    segments = _segments(content)
+    operations: List[Any] = []
+    matcher = SequenceMatcher(None, _segments(base), segments)
+    for tag, base_start, base_end, start, end in matcher.get_opcodes():
+        if tag == "equal":
+            operations.append([base_start, base_end])
+        elif tag != "delete":
+            operations.append("".join(segments[start:end]))
+    return zlib.compress(json.dumps(operations, separators=(",", ":")).encode())
+
+
+def apply_delta(base: str, delta: bytes) -> str:
+    """
+    Rebuild a content from its base and a delta from `encode_delta`.
+
+    Args:
+        base: Content the delta applies to
+        delta: zlib-compressed delta
+
+    Returns:
+        Rebuilt content
+    """
+    segments = _segments(base)
+    return "".join(
+        operation if isinstance(operation, str) else "".join(segments[slice(*operation)])
+        for operation in json.loads(zlib.decompress(delta))
+    )
+
+
+class PostRevisionService:
+    """Service recording and reading post revisions."""
+
+    def __init__(self, db: AsyncSession, body_store: PostBodyStore | None = None):
+        """
+        Initialize post revision service.
+
+        Args:
+            db: Database session
+            body_store: Store of post contents (defaults to the process-wide one)
+        """
+        self.db = db
+        self.body_store = body_store or post_body_store
+
+    async def record_snapshot(
+        self, post_id: int, revision: int, title: str, excerpt: str | None, content: str
+    ) -> None:
+        """
+        Record a revision of a post as a full snapshot.
+
+        Starts the history of a new post, and every delta chain.
+
+        Args:
+            post_id: Post ID
+            revision: Post version the write produced
+            title: Post title after the write
+            excerpt: Post excerpt after the write
+            content: Post content after the write
+        """
+        key = await self.body_store.offload(content)
+        await self.db.execute(
+            insert(PostRevision).values(
+                post_id=post_id,
+                revision=revision,
+                deltas=0,
+                title=title,
+                excerpt=excerpt,
+                data=None if key else zlib.compress(content.encode()),
+                blob_key=key,
+            )
+        )
+
+    async def record(
+        self,
+        post_id: int,
+        revision: int,
+        title: str,
+        excerpt: str | None,
+        content: str,
+        content_changed: bool = True,
+    ) -> None:
+        """
+        Record the revision a post update produced.
+
+        Runs in the update's transaction, after the post row was written (and
+        so locked) and before a new content is written to the post's body:
+        the post's previous content is then still stored, and concurrent
+        updates of the post record their revisions one after the other.
+
+        Args:
+            post_id: Post ID
+            revision: Post version the update produced
+            title: Post title after the update
+            excerpt: Post excerpt after the update
+            content: Post content after the update
+            content_changed: Whether the update changed the content
+        """
+        deltas = await self.db.scalar(
+            lambda_stmt(
+                lambda: select(PostRevision.deltas)
+                .where(PostRevision.post_id == post_id)
+                .order_by(PostRevision.revision.desc())
+                .limit(1)
+            )
+        )
+        if deltas is None or deltas >= settings.post_revision_max_deltas:
+            # A post without history yet (created before revisions were
+            # recorded), or the end of a delta chain
+            await self.record_snapshot(post_id, revision, title, excerpt, content)
+            return
+
+        base = content
+        if content_changed:
+            body = (
+                await self.db.execute(
+                    lambda_stmt(
+                        lambda: select(PostBody.content, PostBody.blob_key).where(
+                            PostBody.post_id == post_id
+                        )
+                    )
+                )
+            ).one()
+            base = await self.body_store.read(body.content, body.blob_key)
+        # Diffing is CPU-bound: keep it off the event loop
+        delta = await asyncio.to_thread(encode_delta, base, content)
+
+        await self.db.execute(
+            insert(PostRevision).values(
+                post_id=post_id,
+                revision=revision,
+                deltas=deltas + 1,
+                title=title,
+                excerpt=excerpt,
+                data=delta,
+            )
+        )
+
+    async def _check_author(self, post_id: int, author: User) -> None:
+        """
+        Check that a post exists and belongs to `author`.
+
+        Raises:
+            HTTPException: 404 if the post does not exist, 403 if it is someone else's
+        """
+        author_id = await self.db.scalar(
+            lambda_stmt(
+                lambda: select(Post.author_id).where(
+                    Post.id == post_id, Post.deleted_at.is_(None)
+                )
+            )
+        )
+        if author_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Post with id {post_id} not found",
+            )
+        if author_id != author.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to access this post",
+            )
+
+    async def list_revisions(
+        self, post_id: int, author: User, page: int = 1, page_size: int = 20
+    ) -> PaginatedResponse[PostRevisionSummary]:
+        """
+        List a post's revisions, newest first, without their contents.
+
+        Args:
+            post_id: Post ID
+            author: Caller, who must be the post's author
+            page: Page number (1-indexed)
+            page_size: Number of items per page
+
+        Returns:
+            PaginatedResponse with revisions
+
+        Raises:
+            HTTPException: 404 if the post does not exist, 403 if it is someone else's
+        """
+        await self._check_author(post_id, author)
+
+        offset = (page - 1) * page_size
+        total, result = await execute_with_count(
+            self.db,
+            select(func.count()).select_from(PostRevision).where(PostRevision.post_id == post_id),
+            select(
+                PostRevision.revision,
+                PostRevision.title,
+                PostRevision.excerpt,
+                (PostRevision.deltas == 0).label("snapshot"),
+                PostRevision.created_at,
+            )
+            .where(PostRevision.post_id == post_id)
+            .order_by(PostRevision.revision.desc())
+            .offset(offset)
+            .limit(page_size),
+        )
+
+        return PaginatedResponse(
+            items=[PostRevisionSummary.model_validate(row) for row in result.all()],
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=(total + page_size - 1) // page_size,
+        )
+
+    async def get_revision(
+        self, post_id: int, revision: int, author: User
+    ) -> PostRevisionResponse:
+        """
+        Get a revision of a post, with its content rebuilt.
+
+        Reads the revision's snapshot and the deltas from it up to the
+        revision, then applies them in order.
+
+        Args:
+            post_id: Post ID
+            revision: Revision number
+            author: Caller, who must be the post's author
+
+        Returns:
+            PostRevisionResponse: The revision
+
+        Raises:
+            HTTPException: 404 if the post or revision does not exist, 403 if
+                the post is someone else's
+        """
+        await self._check_author(post_id, author)
+
+        snapshot = (
+            select(func.max(PostRevision.revision))
+            .where(
+                PostRevision.post_id == post_id,
+                # Ordering comparisons on unannotated Columns type-check as bool
+                cast(ColumnElement[bool], PostRevision.revision <= revision),
+                PostRevision.deltas == 0,
+            )
+            .scalar_subquery()
+        )
+        chain: Sequence[Row] = (
+            await self.db.execute(
+                select(
+                    PostRevision.revision,
+                    PostRevision.title,
+                    PostRevision.excerpt,
+                    PostRevision.deltas,
+                    PostRevision.data,
+                    PostRevision.blob_key,
+                    PostRevision.created_at,
+                )
+                .where(
+                    PostRevision.post_id == post_id,
+                    PostRevision.revision.between(snapshot, revision),
+                )
+                .order_by(PostRevision.revision)
+            )
+        ).all()
+        if not chain or chain[-1].revision != revision:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Revision {revision} of post {post_id} not found",
+            )
+
+        first = chain[0]
+        content = (
+            zlib.decompress(first.data).decode()
+            if first.blob_key is None
+            else await self.body_store.read(None, first.blob_key)
+        )
+        for delta in chain[1:]:
+            content = apply_delta(content, delta.data)
+
+        last = chain[-1]
+        return PostRevisionResponse(
+            revision=last.revision,
+            title=last.title,
+            excerpt=last.excerpt,
+            snapshot=last.deltas == 0,
+            created_at=last.created_at,
+            content=content,
+        )
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _install_post_revision_ddl(target: MetaData, connection: Connection, **kw: Any) -> None:
+    """Install the delete cascade of revisions in schemas built with create_all."""
+    if connection.dialect.name == "postgresql":
+        for statement in POST_REVISION_DDL:
+            connection.exec_driver_sql(statement)
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _drop_post_revision_ddl(target: MetaData, connection: Connection, **kw: Any) -> None:
+    """Drop the delete cascade of revisions before drop_all removes the tables."""
+    if connection.dialect.name == "postgresql":
+        for statement in POST_REVISION_DROP_DDL:
+            connection.exec_driver_sql(statement)
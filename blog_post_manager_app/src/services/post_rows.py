@@ -0,0 +1,160 @@
+"""Core-level list queries mapped into lightweight row objects.
+
+List pages do not need ORM entities: building them costs identity-map
+lookups, instance state and relationship collections per post, plus two
+selectin queries for authors and tags. The "core" list strategy selects the
+columns a list item needs in one statement, with each post's tags aggregated
+into parallel arrays by a lateral `array_agg` subquery, and maps every row into
+`__slots__` objects that `PostListResponse` validates from attributes.
+"""
+
+from datetime import datetime
+from typing import Iterable, List, Sequence
+
+from sqlalchemy import Select, func, select, true
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+
+from src.models.post import Post, PostStatus, post_tags
+from src.models.tag import Tag
+from src.models.user import User
+from src.schemas.post import PostListResponse
+
+
+class AuthorRow:
+    """Post author fields needed by a list item."""
+
+    __slots__ = ("id", "email", "username", "full_name", "is_active", "created_at", "updated_at")
+
+    def __init__(
+        self,
+        id: int,
+        email: str,
+        username: str,
+        full_name: str | None,
+        is_active: bool,
+        created_at: datetime,
+        updated_at: datetime | None,
+    ) -> None:
+        self.id = id
+        self.email = email
+        self.username = username
+        self.full_name = full_name
+        self.is_active = is_active
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+
+class TagRow:
+    """Tag fields needed by a list item."""
+
+    __slots__ = ("id", "name", "created_at", "post_count")
+
+    def __init__(self, id: int, name: str, created_at: datetime) -> None:
+        self.id = id
+        self.name = name
+        self.created_at = created_at
+        self.post_count: int | None = None
+
+
+class PostRow:
+    """Post fields needed by a list item, with its author and tags."""
+
+    __slots__ = (
+        "id",
+        "title",
+        "excerpt",
+        "status",
+        "publication_date",
+        "created_at",
+        "author",
+        "tags",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        title: str,
+        excerpt: str | None,
+        status: PostStatus,
+        publication_date: datetime | None,
+        created_at: datetime,
+        author: AuthorRow,
+        tags: List[TagRow],
+    ) -> None:
+        self.id = id
+        self.title = title
+        self.excerpt = excerpt
+        self.status = status
+        self.publication_date = publication_date
+        self.created_at = created_at
+        self.author = author
+        self.tags = tags
+
+
+# One row of tag arrays per post, ordered by tag name. Aggregates without
+# GROUP BY always return a row, so posts without tags get NULL arrays.
+_TAG_ARRAYS = (
+    select(
+        func.array_agg(aggregate_order_by(Tag.id, Tag.name)).label("tag_ids"),
+        func.array_agg(aggregate_order_by(Tag.name, Tag.name)).label("tag_names"),
+        func.array_agg(aggregate_order_by(Tag.created_at, Tag.name)).label("tag_created_at"),
+    )
+    .select_from(post_tags.join(Tag, Tag.id == post_tags.c.tag_id))
+    .where(post_tags.c.post_id == Post.id)
+    .lateral("post_tag_arrays")
+)
+
+# Base statement for list pages; filters, ordering and extra columns (such as a
+# search rank) are appended by the caller. Column order is what post_row reads.
+POST_ROWS: Select = (
+    select(
+        Post.id,
+        Post.title,
+        Post.excerpt,
+        Post.status,
+        Post.publication_date,
+        Post.created_at,
+        User.id.label("author_id"),
+        User.email,
+        User.username,
+        User.full_name,
+        User.is_active,
+        User.created_at.label("author_created_at"),
+        User.updated_at.label("author_updated_at"),
+        _TAG_ARRAYS.c.tag_ids,
+        _TAG_ARRAYS.c.tag_names,
+        _TAG_ARRAYS.c.tag_created_at,
+    )
+    .join_from(Post, User, Post.author_id == User.id)
+    .join(_TAG_ARRAYS, true())
+)
+
+
+def post_row(row: Sequence) -> PostRow:
+    """
+    Map one POST_ROWS result row to a PostRow.
+
+    Args:
+        row: Result row; columns past the POST_ROWS columns are ignored
+
+    Returns:
+        PostRow with its author and tags
+    """
+    tag_ids = row[13]
+    tags = (
+        [TagRow(*tag) for tag in zip(tag_ids, row[14], row[15])] if tag_ids is not None else []
+    )
+    return PostRow(*row[:6], AuthorRow(*row[6:13]), tags)
+
+
+def post_list_items(rows: Iterable[Sequence]) -> List[PostListResponse]:
+    """
+    Build list response items from POST_ROWS result rows.
+
+    Args:
+        rows: Result rows
+
+    Returns:
+        PostListResponse items in row order
+    """
+    return [PostListResponse.model_validate(post_row(row)) for row in rows]
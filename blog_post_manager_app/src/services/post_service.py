@@ -1,102 +1,320 @@
 """Post service for blog post CRUD operations."""
 
 from datetime import datetime, timezone
-from typing import List
+from typing import Any, Dict, List, Sequence, cast
 
 from fastapi import HTTPException, status
-from sqlalchemy import func, select
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Row,
+    Update,
+    and_,
+    any_,
+    func,
+    insert,
+    lambda_stmt,
+    literal,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
+from src.config import settings
+from src.database import execute_with_count
 from src.models.post import Post, PostStatus
+from src.models.post_body import PostBody
+from src.models.post_card import PostCard
 from src.models.tag import Tag
 from src.models.user import User
 from src.schemas.common import PaginatedResponse
-from src.schemas.post import PostCreate, PostListResponse, PostResponse, PostUpdate
+from src.schemas.post import (
+    PostBulkSelection,
+    PostBulkUpdate,
+    PostCreate,
+    PostListResponse,
+    PostResponse,
+    PostUpdate,
+)
+from src.schemas.tag import TagResponse
+from src.services.post_bodies import PostBodyStore, post_body_store
+from src.services.post_cards import (
+    CARDS_BY_CREATED_AT,
+    card_filters,
+    cards_page,
+    refresh_post_cards,
+)
+from src.services.post_json import POSTS_JSON_BY_CREATED_AT, json_page, paginated_json
+from src.services.post_revisions import PostRevisionService
+from src.services.post_rows import POST_ROWS, post_list_items
+from src.services.post_writes import (
+    POST_COLUMNS,
+    TAG_ARRAYS,
+    bulk_chunk,
+    content_differs,
+    link_tags,
+    post_response,
+    publication_date_on_publish,
+    returned_tags,
+    tags_differ,
+    unlink_other_tags,
+)
+from src.utils.etags import post_etag
+from src.utils.idempotency import IdempotentRequest
+
+# Hot queries are built as lambda statements: SQLAlchemy caches the construct per
+# code location, so repeat requests skip building the select and generating its
+# cache key, and only extract the new bound values.
+
+
+def _post_list_filters(
+    stmt: StatementLambdaElement,
+    status_filter: PostStatus | None,
+    author_id: int | None,
+    tag_names: List[str] | None,
+) -> StatementLambdaElement:
+    """
+    Append list_posts filters to a lambda statement.
+
+    Shared by the count and page queries so both always filter identically.
+    Deleted posts are always left out.
+
+    Args:
+        stmt: Base statement
+        status_filter: Filter by post status
+        author_id: Filter by author ID
+        tag_names: Filter by tag names (posts must have ALL tags)
+
+    Returns:
+        The statement with the filters applied
+    """
+    stmt += lambda s: s.where(Post.deleted_at.is_(None))
+
+    if status_filter:
+        stmt += lambda s: s.where(Post.status == status_filter)
+
+    if author_id:
+        stmt += lambda s: s.where(Post.author_id == author_id)
+
+    if tag_names:
+        # One prebuilt clause instead of a lambda per tag: lambdas created in a
+        # loop share a code location and would all bind the last tag name
+        tag_filter = and_(
+            *(Post.tags.any(Tag.name == tag_name.lower()) for tag_name in tag_names)
+        )
+        stmt += lambda s: s.where(tag_filter)
+
+    return stmt
+
+
+def _bulk_conditions(
+    selection: PostBulkSelection, author: User
+) -> List[ColumnElement[bool]]:
+    """
+    Build the conditions selecting the posts of a bulk operation.
+
+    Args:
+        selection: Post IDs or filter
+        author: Caller; only their own posts are selected
+
+    Returns:
+        Conditions on Post
+    """
+    conditions: List[ColumnElement[bool]] = [
+        Post.author_id == author.id,
+        Post.deleted_at.is_(None),
+    ]
+
+    if selection.ids is not None:
+        # One array parameter rather than one bound parameter per ID
+        conditions.append(Post.id == any_(literal(selection.ids, ARRAY(Integer))))
+        return conditions
+
+    post_filter = selection.filter
+    assert post_filter is not None
+    if post_filter.author_id is not None:
+        conditions.append(Post.author_id == post_filter.author_id)
+    if post_filter.tags:
+        conditions.extend(Post.tags.any(Tag.name == tag_name) for tag_name in post_filter.tags)
+    if post_filter.status is not None:
+        conditions.append(Post.status == post_filter.status)
+    # Ordering comparisons on unannotated Columns type-check as bool
+    if post_filter.created_after is not None:
+        conditions.append(
+            cast(ColumnElement[bool], Post.created_at >= post_filter.created_after)
+        )
+    if post_filter.created_before is not None:
+        conditions.append(
+            cast(ColumnElement[bool], Post.created_at < post_filter.created_before)
+        )
+    return conditions
 
 
 class PostService:
     """Service for post operations."""
 
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        list_strategy: str | None = None,
+        body_store: PostBodyStore | None = None,
+    ):
         """
         Initialize post service.
 
         Args:
             db: Database session
+            list_strategy: 'orm', 'core', 'json' or 'cards' list pages (defaults
+                to settings.post_list_strategy)
+            body_store: Store of post contents (defaults to the process-wide one)
         """
         self.db = db
+        self.list_strategy = list_strategy or settings.post_list_strategy
+        self.body_store = body_store or post_body_store
+        self.revisions = PostRevisionService(db, self.body_store)
 
-    async def _get_or_create_tags(self, tag_names: List[str]) -> List[Tag]:
+    async def _link_tags(self, post_id: int, tag_names: List[str]) -> List[Row]:
         """
-        Get existing tags or create new ones.
+        Create missing tags and link a post to them in one statement.
 
         Args:
+            post_id: Post ID
             tag_names: List of tag names (lowercase)
 
         Returns:
-            List of Tag objects
+            Linked tags (id, name, created_at), ordered by name
         """
-        tags = []
-        for tag_name in tag_names:
-            # Try to find existing tag
-            result = await self.db.execute(
-                select(Tag).where(Tag.name == tag_name.lower())
-            )
-            tag = result.scalar_one_or_none()
+        stmt = link_tags(post_id, tag_names)
+        tags = (await self.db.execute(stmt)).all()
+        if len(tags) < len(tag_names):
+            # A concurrent request created one of the tags after the statement
+            # started; it is visible to a second run
+            tags = (await self.db.execute(stmt)).all()
+        return list(tags)
+
+    @staticmethod
+    def _check_write(
+        current: Row | None,
+        post_id: int,
+        author: User,
+        action: str,
+        expected_versions: List[int] | None,
+    ) -> Row:
+        """
+        Raise the error explaining why an ownership-checked write matched no row.
 
-            # Create if doesn't exist
-            if not tag:
-                tag = Tag(name=tag_name.lower())
-                self.db.add(tag)
-                await self.db.flush()  # Flush to get ID without committing
+        Returns the post when none applies, i.e. an update had nothing to change.
 
-            tags.append(tag)
+        Args:
+            current: The post's author_id and version, or None if there is no such post
+            post_id: Post ID
+            author: Author attempting the write
+            action: Attempted action, for the error message
+            expected_versions: Versions accepted by the request's If-Match, if any
 
-        return tags
+        Returns:
+            The current post row
+
+        Raises:
+            HTTPException: 404 if the post does not exist, 403 if it is someone
+                else's, 412 if its version is not one the request accepts
+        """
+        if current is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Post with id {post_id} not found",
+            )
+        if current.author_id != author.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"You don't have permission to {action} this post",
+            )
+        if expected_versions is not None and current.version not in expected_versions:
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail="Post has been modified; fetch it again and retry",
+                headers={"ETag": post_etag(current.version)},
+            )
+        return current
 
     async def create_post(
-        self, post_data: PostCreate, author: User
+        self,
+        post_data: PostCreate,
+        author: User,
+        idempotent: IdempotentRequest | None = None,
     ) -> PostResponse:
         """
         Create a new blog post.
 
+        With an idempotency key, the key is claimed first and the response is
+        recorded before the post commits; a request whose key was already used
+        gets the recorded response and creates nothing.
+
         Args:
             post_data: Post creation data
             author: Post author
+            idempotent: The request's idempotency key, if it sent one
 
         Returns:
-            PostResponse: Created post
+            PostResponse: Created (or, for a repeated key, previously created) post
 
         Raises:
             ValueError: If more than 10 tags provided
+            HTTPException: 422 if the idempotency key was used for another
+                request, 409 if its first request is still in progress
         """
         if len(post_data.tags) > 10:
             raise ValueError("Maximum 10 tags allowed per post")
 
-        # Create post
-        post = Post(
-            title=post_data.title,
-            content=post_data.content,
-            excerpt=post_data.excerpt,
-            status=post_data.status,
-            author_id=author.id,
-        )
+        if idempotent is not None:
+            recorded = await idempotent.claim(self.db)
+            if recorded is not None:
+                return PostResponse.model_validate_json(recorded)
 
         # Set publication date if status is published
-        if post_data.status == PostStatus.published:
-            post.publication_date = datetime.now(timezone.utc)
-
-        # Get or create tags
-        if post_data.tags:
-            tags = await self._get_or_create_tags(post_data.tags)
-            post.tags = tags
-
-        self.db.add(post)
-        await self.db.commit()
-        await self.db.refresh(post, ["author", "tags"])
+        publication_date = (
+            datetime.now(timezone.utc) if post_data.status == PostStatus.published else None
+        )
 
-        return PostResponse.model_validate(post)
+        try:
+            row: Row = (
+                await self.db.execute(
+                    insert(Post)
+                    .values(
+                        title=post_data.title,
+                        excerpt=post_data.excerpt,
+                        status=post_data.status,
+                        publication_date=publication_date,
+                        author_id=author.id,
+                    )
+                    .returning(*POST_COLUMNS)
+                )
+            ).one()
+            # After the post, so the search vector trigger sees its title and excerpt
+            await self.db.execute(await self.body_store.write(row.id, post_data.content))
+            await self.revisions.record_snapshot(
+                row.id, row.version, row.title, row.excerpt, post_data.content
+            )
+            tags = await self._link_tags(row.id, post_data.tags) if post_data.tags else []
+
+            await refresh_post_cards(self.db, [row.id])
+            response = post_response(row, author, tags, post_data.content)
+            if idempotent is not None:
+                await idempotent.record(self.db, response.model_dump_json())
+            await self.db.commit()
+        except BaseException:
+            if idempotent is not None:
+                await idempotent.release()
+            raise
+
+        if idempotent is not None:
+            await idempotent.complete()
+        return response
 
     async def get_post_by_id(
         self, post_id: int, author: User | None = None
@@ -115,9 +333,13 @@ class PostService:
             HTTPException: 404 if post not found or doesn't belong to author
         """
         result = await self.db.execute(
-            select(Post)
-            .options(selectinload(Post.author), selectinload(Post.tags))
-            .where(Post.id == post_id)
+            lambda_stmt(
+                lambda: select(Post)
+                .options(
+                    joinedload(Post.body), selectinload(Post.author), selectinload(Post.tags)
+                )
+                .where(Post.id == post_id, Post.deleted_at.is_(None))
+            )
         )
         post = result.scalar_one_or_none()
 
@@ -134,6 +356,14 @@ class PostService:
                 detail="You don't have permission to access this post",
             )
 
+        body = post.body
+        if body.blob_key is not None:
+            # Fetched only here, for the detail; set as loaded, so the session
+            # never writes it back
+            set_committed_value(
+                body, "content", await self.body_store.read(body.content, body.blob_key)
+            )
+
         return PostResponse.model_validate(post)
 
     async def list_posts(
@@ -157,40 +387,29 @@ class PostService:
         Returns:
             PaginatedResponse with posts
         """
-        # Build query
-        query = select(Post).options(
-            selectinload(Post.author), selectinload(Post.tags)
-        )
-
-        # Apply filters
-        if status_filter:
-            query = query.where(Post.status == status_filter)
-
-        if author_id:
-            query = query.where(Post.author_id == author_id)
-
-        if tag_names:
-            # Join with tags and filter (posts must have ALL specified tags)
-            for tag_name in tag_names:
-                query = query.where(
-                    Post.tags.any(Tag.name == tag_name.lower())
+        # Build page query
+        if self.list_strategy == "orm":
+            query = lambda_stmt(
+                lambda: select(Post).options(
+                    selectinload(Post.author), selectinload(Post.tags)
                 )
-
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar_one()
+            )
+        else:
+            query = lambda_stmt(lambda: POST_ROWS)
+        query = _post_list_filters(query, status_filter, author_id, tag_names)
 
         # Apply pagination
         offset = (page - 1) * page_size
-        query = query.order_by(Post.created_at.desc()).offset(offset).limit(page_size)
-
-        # Execute query
-        result = await self.db.execute(query)
-        posts = result.scalars().all()
+        query += lambda s: s.order_by(Post.created_at.desc()).offset(offset).limit(page_size)
 
-        # Convert to response models
-        items = [PostListResponse.model_validate(post) for post in posts]
+        # Execute with the total count and convert to response models
+        total, result = await execute_with_count(
+            self.db, self._count_query(status_filter, author_id, tag_names), query
+        )
+        if self.list_strategy == "orm":
+            items = [PostListResponse.model_validate(post) for post in result.scalars().all()]
+        else:
+            items = post_list_items(result.all())
 
         return PaginatedResponse(
             items=items,
@@ -200,99 +419,371 @@ class PostService:
             total_pages=(total + page_size - 1) // page_size,
         )
 
+    async def list_posts_json(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        status_filter: PostStatus | None = None,
+        author_id: int | None = None,
+        tag_names: List[str] | None = None,
+    ) -> bytes:
+        """
+        List posts as a JSON document rendered by PostgreSQL.
+
+        Same filters and result as list_posts, but PostgreSQL builds the items
+        (or, with the 'cards' strategy, concatenates stored post cards) and
+        only the pagination envelope is added in Python.
+
+        Args:
+            page: Page number (1-indexed)
+            page_size: Number of items per page
+            status_filter: Filter by post status
+            author_id: Filter by author ID
+            tag_names: Filter by tag names (posts must have ALL tags)
+
+        Returns:
+            UTF-8 JSON of a PaginatedResponse[PostListResponse]
+        """
+        offset = (page - 1) * page_size
+
+        if self.list_strategy == "cards":
+            count_query = card_filters(
+                lambda_stmt(lambda: select(func.count(PostCard.post_id))),
+                status_filter,
+                author_id,
+                tag_names,
+            )
+            query = card_filters(
+                lambda_stmt(lambda: CARDS_BY_CREATED_AT), status_filter, author_id, tag_names
+            )
+            query += (
+                lambda s: s.order_by(PostCard.created_at.desc()).offset(offset).limit(page_size)
+            )
+            query += lambda s: cards_page(s)
+        else:
+            count_query = self._count_query(status_filter, author_id, tag_names)
+            query = _post_list_filters(
+                lambda_stmt(lambda: POSTS_JSON_BY_CREATED_AT), status_filter, author_id, tag_names
+            )
+            query += lambda s: s.order_by(Post.created_at.desc()).offset(offset).limit(page_size)
+            query += lambda s: json_page(s)
+
+        total, result = await execute_with_count(self.db, count_query, query)
+        return paginated_json(result.scalar_one(), total, page, page_size)
+
+    @staticmethod
+    def _count_query(
+        status_filter: PostStatus | None,
+        author_id: int | None,
+        tag_names: List[str] | None,
+    ) -> StatementLambdaElement:
+        """Build the count of the posts matching list_posts filters."""
+        return _post_list_filters(
+            lambda_stmt(lambda: select(func.count(Post.id))),
+            status_filter,
+            author_id,
+            tag_names,
+        )
+
     async def update_post(
-        self, post_id: int, post_data: PostUpdate, author: User
+        self,
+        post_id: int,
+        post_data: PostUpdate,
+        author: User,
+        expected_versions: List[int] | None = None,
     ) -> PostResponse:
         """
         Update a post.
 
+        An update that would leave the post as it is writes nothing: the post
+        keeps its updated_at, and no triggers, card refresh or revision run.
+        Every other update records a revision (see src.services.post_revisions).
+
+        With expected_versions (from If-Match) the post is only updated while
+        its version is one of them, checked in the UPDATE itself rather than
+        by locking the row first.
+
         Args:
             post_id: Post ID
             post_data: Update data
             author: Post author (for permission check)
+            expected_versions: Versions the client accepts, or None for any
 
         Returns:
-            PostResponse: Updated post
+            PostResponse: Updated (or unchanged) post
 
         Raises:
-            HTTPException: 404 if not found, 403 if not author
+            HTTPException: 404 if not found, 403 if not author, 412 on a version mismatch
             ValueError: If more than 10 tags provided
         """
-        # Get post
-        result = await self.db.execute(
-            select(Post).where(Post.id == post_id)
-        )
-        post = result.scalar_one_or_none()
-
-        if not post:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Post with id {post_id} not found",
-            )
-
-        # Verify ownership
-        if post.author_id != author.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You don't have permission to update this post",
-            )
+        if post_data.tags is not None and len(post_data.tags) > 10:
+            raise ValueError("Maximum 10 tags allowed per post")
 
-        # Update fields
+        # Fields to write, and for each a condition telling whether it differs
+        # from the stored value: the UPDATE only matches a post it would change
+        values: Dict[str, Any] = {}
+        changed: List[ColumnElement[bool]] = []
         if post_data.title is not None:
-            post.title = post_data.title
+            values["title"] = post_data.title
+            changed.append(Post.title != post_data.title)
 
         if post_data.content is not None:
-            post.content = post_data.content
+            # Written to the post's body after the post, if it differs
+            changed.append(content_differs(post_data.content))
 
-        if post_data.excerpt is not None:
-            post.excerpt = post_data.excerpt
+        # An explicit null clears the excerpt
+        if "excerpt" in post_data.model_fields_set:
+            values["excerpt"] = post_data.excerpt
+            changed.append(Post.excerpt.is_distinct_from(post_data.excerpt))
 
         if post_data.status is not None:
+            values["status"] = post_data.status
+            changed.append(Post.status != post_data.status)
             # Set publication date when changing to published
-            if post_data.status == PostStatus.published and post.status != PostStatus.published:
-                post.publication_date = datetime.now(timezone.utc)
-            post.status = post_data.status
+            if post_data.status == PostStatus.published:
+                values["publication_date"] = publication_date_on_publish()
+
+        if post_data.tags is not None:
+            changed.append(tags_differ(post_data.tags))
+
+        if not values:
+            # A tags- or content-only update still marks the post as updated
+            values["updated_at"] = func.now()
+        values["version"] = Post.version + 1
+
+        conditions = [Post.id == post_id, Post.author_id == author.id, Post.deleted_at.is_(None)]
+        if expected_versions is not None:
+            conditions.append(Post.version.in_(expected_versions))
+
+        # The stored content when it is kept, else only whether the new one differs
+        body_columns: Sequence[ColumnElement] = (
+            (PostBody.content, PostBody.blob_key)
+            if post_data.content is None
+            else (content_differs(post_data.content).label("content_changed"),)
+        )
+
+        row: Row | None = None
+        if changed:
+            row = (
+                await self.db.execute(
+                    update(Post)
+                    .where(PostBody.post_id == Post.id, *conditions, or_(*changed))
+                    .values(values)
+                    .returning(*POST_COLUMNS, *body_columns, *TAG_ARRAYS)
+                )
+            ).one_or_none()
+
+        if row is None:
+            # Missing, deleted, someone else's, modified since the client read
+            # it, or already as requested (e.g. an autosave of unchanged
+            # content): no write, trigger work or card refresh
+            current: Row | None = (
+                await self.db.execute(
+                    select(
+                        Post.author_id,
+                        *POST_COLUMNS,
+                        PostBody.content,
+                        PostBody.blob_key,
+                        *TAG_ARRAYS,
+                    )
+                    .join_from(Post, PostBody, PostBody.post_id == Post.id)
+                    .where(Post.id == post_id, Post.deleted_at.is_(None))
+                )
+            ).one_or_none()
+            unchanged = self._check_write(current, post_id, author, "update", expected_versions)
+            return post_response(
+                unchanged,
+                author,
+                returned_tags(unchanged),
+                await self.body_store.read(unchanged.content, unchanged.blob_key),
+            )
+
+        content_changed = post_data.content is not None and row.content_changed
+        if post_data.content is None:
+            content = await self.body_store.read(row.content, row.blob_key)
+        else:
+            content = post_data.content
+        # Before the body is written: a delta is taken from the previous content
+        await self.revisions.record(
+            post_id, row.version, row.title, row.excerpt, content, content_changed
+        )
+        if content_changed:
+            await self.db.execute(await self.body_store.write(post_id, content))
 
+        tags: Sequence[Row | TagResponse]
         if post_data.tags is not None:
-            if len(post_data.tags) > 10:
-                raise ValueError("Maximum 10 tags allowed per post")
-            tags = await self._get_or_create_tags(post_data.tags)
-            post.tags = tags
+            await self.db.execute(unlink_other_tags(post_id, post_data.tags))
+            tags = await self._link_tags(post_id, post_data.tags) if post_data.tags else []
+        else:
+            tags = returned_tags(row)
 
+        await refresh_post_cards(self.db, [post_id])
         await self.db.commit()
-        await self.db.refresh(post, ["author", "tags"])
 
-        return PostResponse.model_validate(post)
+        return post_response(row, author, tags, content)
 
-    async def delete_post(self, post_id: int, author: User) -> None:
+    async def restore_revision(
+        self,
+        post_id: int,
+        revision: int,
+        author: User,
+        expected_versions: List[int] | None = None,
+    ) -> PostResponse:
         """
-        Delete a post.
+        Restore a post's title, excerpt and content to those of one of its revisions.
+
+        The restore is an update like any other: it records a new revision,
+        and the revision restored stays in the history.
 
         Args:
             post_id: Post ID
+            revision: Revision to restore
             author: Post author (for permission check)
+            expected_versions: Versions the client accepts (from If-Match), or None for any
+
+        Returns:
+            PostResponse: Restored post
 
         Raises:
-            HTTPException: 404 if not found, 403 if not author
+            HTTPException: 404 if the post or revision does not exist, 403 if
+                not author, 412 on a version mismatch
         """
-        # Get post
-        result = await self.db.execute(
-            select(Post).where(Post.id == post_id)
+        restored = await self.revisions.get_revision(post_id, revision, author)
+        return await self.update_post(
+            post_id,
+            PostUpdate(title=restored.title, content=restored.content, excerpt=restored.excerpt),
+            author,
+            expected_versions,
         )
-        post = result.scalar_one_or_none()
 
-        if not post:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Post with id {post_id} not found",
-            )
+    async def bulk_update_status(self, bulk_data: PostBulkUpdate, author: User) -> int:
+        """
+        Move the caller's selected posts to a status.
 
-        # Verify ownership
-        if post.author_id != author.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You don't have permission to delete this post",
-            )
+        Posts already in the status are left as they are. Publishing sets the
+        publication date of posts that were not published yet; other moves
+        keep it.
+
+        Args:
+            bulk_data: Post IDs or filter, and the new status
+            author: Caller (only their posts are updated)
+
+        Returns:
+            Number of posts updated
+        """
+        values: Dict[str, Any] = {"status": bulk_data.status, "version": Post.version + 1}
+        if bulk_data.status == PostStatus.published:
+            values["publication_date"] = publication_date_on_publish()
+
+        conditions = _bulk_conditions(bulk_data, author)
+        conditions.append(Post.status != bulk_data.status)
+        return await self._write_in_chunks(conditions, update(Post).values(values))
+
+    async def bulk_delete(self, selection: PostBulkSelection, author: User) -> int:
+        """
+        Delete the caller's selected posts.
+
+        Posts are soft-deleted, as by delete_post.
+
+        Args:
+            selection: Post IDs or filter
+            author: Caller (only their posts are deleted)
+
+        Returns:
+            Number of posts deleted
+        """
+        return await self._write_in_chunks(
+            _bulk_conditions(selection, author),
+            update(Post).values(deleted_at=func.now(), version=Post.version + 1),
+        )
+
+    async def _write_in_chunks(
+        self, conditions: List[ColumnElement[bool]], write: Update
+    ) -> int:
+        """
+        Apply a bulk write one chunk of posts at a time, committing each chunk.
+
+        Chunks keep row locks and transactions short, so a 100k-post operation
+        does not block concurrent edits of those posts until it ends; an
+        operation that fails part way keeps the chunks already committed.
+
+        The cards of written posts are rebuilt (or, for deleted posts,
+        dropped) in each chunk's transaction.
+
+        Args:
+            conditions: Conditions selecting the posts
+            write: UPDATE of Post to apply
+
+        Returns:
+            Number of posts written
+        """
+        written = 0
+        after_id = 0
+        while True:
+            chunk = (
+                await self.db.execute(
+                    bulk_chunk(conditions, write, after_id, settings.post_bulk_chunk_size)
+                )
+            ).one()
+            if chunk.last_id is None:
+                break
+
+            post_ids = chunk.post_ids or []
+            if post_ids:
+                await refresh_post_cards(self.db, post_ids)
+            await self.db.commit()
+
+            written += len(post_ids)
+            after_id = chunk.last_id
+
+        if written:
+            # Unlike update_post's ORM-enabled UPDATE, the chunk statements do
+            # not synchronize posts already loaded in the session; expire them
+            for instance in list(self.db.identity_map.values()):
+                if isinstance(instance, Post):
+                    self.db.expire(instance)
+        return written
+
+    async def delete_post(
+        self, post_id: int, author: User, expected_versions: List[int] | None = None
+    ) -> None:
+        """
+        Delete a post.
+
+        The post is soft-deleted: one UPDATE sets deleted_at and its card is
+        dropped, and from then on every read leaves it out. Its row, tag
+        links and any other dependent rows are removed later, in small
+        batches, by the purger (see src.services.post_purger).
+
+        Args:
+            post_id: Post ID
+            author: Post author (for permission check)
+            expected_versions: Versions the client accepts (from If-Match), or None for any
+
+        Raises:
+            HTTPException: 404 if not found, 403 if not author, 412 on a version mismatch
+        """
+        conditions = [Post.id == post_id, Post.author_id == author.id, Post.deleted_at.is_(None)]
+        if expected_versions is not None:
+            conditions.append(Post.version.in_(expected_versions))
+
+        deleted = await self.db.scalar(
+            update(Post)
+            .where(*conditions)
+            .values(deleted_at=func.now(), version=Post.version + 1)
+            .returning(Post.id)
+        )
+        if deleted is None:
+            current = (
+                await self.db.execute(
+                    lambda_stmt(
+                        lambda: select(Post.author_id, Post.version).where(
+                            Post.id == post_id, Post.deleted_at.is_(None)
+                        )
+                    )
+                )
+            ).one_or_none()
+            self._check_write(current, post_id, author, "delete", expected_versions)
 
-        await self.db.delete(post)
+        await refresh_post_cards(self.db, [post_id])
         await self.db.commit()
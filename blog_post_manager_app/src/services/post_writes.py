@@ -0,0 +1,270 @@
+"""Statements for single-round-trip post writes.
+
+Create, update and delete each run as one INSERT/UPDATE/DELETE ... RETURNING
+statement with the ownership check in its WHERE clause, instead of loading the
+post through the ORM, checking it in Python and then writing; bulk updates and
+deletes run one such statement per chunk of posts. Tags are created and linked
+to the post in one statement, content is written to the post's body by a
+statement of its own (see src.services.post_bodies), and responses are built
+from the returned row plus the author the caller already has in memory.
+"""
+
+from typing import List, Sequence, cast
+
+from sqlalchemy import (
+    ColumnElement,
+    Delete,
+    Integer,
+    Row,
+    ScalarSelect,
+    Select,
+    String,
+    Update,
+    any_,
+    case,
+    func,
+    literal,
+    select,
+    true,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by, insert
+
+from src.models.post import Post, PostStatus, post_tags
+from src.models.post_body import PostBody
+from src.models.tag import Tag
+from src.models.user import User
+from src.schemas.post import PostResponse
+from src.schemas.tag import TagResponse
+from src.schemas.user import UserResponse
+from src.utils.blob_store import blob_key
+
+# Post columns returned by writes, i.e. everything PostResponse needs but the
+# content, author and tags
+POST_COLUMNS = (
+    Post.id,
+    Post.title,
+    Post.excerpt,
+    Post.status,
+    Post.publication_date,
+    Post.created_at,
+    Post.updated_at,
+    Post.version,
+)
+
+
+def _tag_array(column: ColumnElement) -> ScalarSelect:
+    """A correlated array of one column of the written post's tags, ordered by name."""
+    return (
+        select(func.array_agg(aggregate_order_by(column, Tag.name)))
+        .select_from(post_tags.join(Tag, Tag.id == post_tags.c.tag_id))
+        .where(post_tags.c.post_id == Post.id)
+        .correlate(Post)
+        .scalar_subquery()
+    )
+
+
+# The post's tags as parallel arrays, for RETURNING clauses (see returned_tags)
+TAG_ARRAYS = (
+    _tag_array(Tag.id).label("tag_ids"),
+    _tag_array(Tag.name).label("tag_names"),
+    _tag_array(Tag.created_at).label("tag_created_at"),
+)
+
+
+def publication_date_on_publish() -> ColumnElement:
+    """
+    Build the publication date SET expression of an update publishing posts.
+
+    SET expressions see the row as it was before the update, so posts that
+    were already published keep their date and the others get the current time.
+    """
+    return case(
+        (Post.status != PostStatus.published, func.now()),
+        else_=Post.publication_date,
+    )
+
+
+def content_differs(content: str) -> ColumnElement[bool]:
+    """
+    Build a condition that is true when a post body's stored content is not `content`.
+
+    An offloaded content is compared by its blob key, i.e. its hash. For an
+    inline one, octet_length reads the size from the TOAST pointer, so a body
+    of another length is told apart without decompressing it; CASE makes
+    PostgreSQL compare the full text only when the lengths match.
+
+    Args:
+        content: New content
+
+    Returns:
+        Boolean expression on PostBody
+    """
+    data = content.encode()
+    return case(
+        (PostBody.blob_key.is_not(None), PostBody.blob_key != blob_key(data)),
+        (func.octet_length(PostBody.content) != len(data), true()),
+        else_=PostBody.content != content,
+    )
+
+
+def tags_differ(tag_names: List[str]) -> ColumnElement[bool]:
+    """
+    Build a condition that is true when a post's tags are not exactly `tag_names`.
+
+    Args:
+        tag_names: New tag names (unique, any order)
+
+    Returns:
+        Boolean expression on Post
+    """
+    # Both sides sorted by PostgreSQL, so they compare under the same collation;
+    # both are NULL when there are no tags
+    new = func.unnest(literal(tag_names, ARRAY(String(50)))).column_valued("name")
+    new_names = select(func.array_agg(aggregate_order_by(new, new)))
+    return _tag_array(Tag.name).is_distinct_from(new_names.scalar_subquery())
+
+
+def link_tags(post_id: int, tag_names: List[str]) -> Select:
+    """
+    Build the statement creating missing tags and linking a post to all of them.
+
+    Existing tags are read from the statement's snapshot, so a tag created by
+    a concurrent request after it started is neither inserted nor returned;
+    callers run the statement again when fewer tags than names come back.
+
+    Args:
+        post_id: Post to link
+        tag_names: Tag names (lowercase, unique, at least one)
+
+    Returns:
+        Select of the linked tags (id, name, created_at), ordered by name
+    """
+    names = literal(tag_names, ARRAY(String(50)))
+    created = (
+        insert(Tag)
+        .from_select(["name"], select(func.unnest(names)))
+        .on_conflict_do_nothing(index_elements=[Tag.name])
+        .returning(Tag.id, Tag.name, Tag.created_at)
+        .cte("created_tags")
+    )
+    tags = union_all(
+        select(created.c.id, created.c.name, created.c.created_at),
+        select(Tag.id, Tag.name, Tag.created_at).where(Tag.name == any_(names)),
+    ).cte("post_tag_rows")
+    linked = (
+        insert(post_tags)
+        .from_select(["post_id", "tag_id"], select(literal(post_id, Integer), tags.c.id))
+        .on_conflict_do_nothing()
+        .cte("linked_tags")
+    )
+    return (
+        select(tags.c.id, tags.c.name, tags.c.created_at)
+        .add_cte(linked)
+        .order_by(tags.c.name)
+    )
+
+
+def unlink_other_tags(post_id: int, tag_names: List[str]) -> Delete:
+    """
+    Build the statement removing a post's links to tags not in a list.
+
+    Runs before link_tags on updates, so the tag limit trigger counts the new
+    set of tags rather than the old and new ones together.
+
+    Args:
+        post_id: Post to unlink
+        tag_names: Names of the tags to keep (may be empty)
+
+    Returns:
+        DELETE statement
+    """
+    return post_tags.delete().where(
+        post_tags.c.post_id == post_id,
+        post_tags.c.tag_id.not_in(
+            select(Tag.id).where(Tag.name == any_(literal(tag_names, ARRAY(String(50)))))
+        ),
+    )
+
+
+def bulk_chunk(
+    conditions: Sequence[ColumnElement[bool]], write: Update | Delete, after_id: int, size: int
+) -> Select:
+    """
+    Build the statement writing one chunk of a bulk update or delete.
+
+    The chunk is the next `size` posts matching `conditions` after `after_id`
+    in id order, so every chunk starts from the primary key index rather than
+    rescanning rows already handled. The write repeats the conditions, since a
+    post changed concurrently is re-checked against the write's own WHERE
+    clause only.
+
+    Args:
+        conditions: Conditions on Post selecting the posts (ownership included)
+        write: UPDATE or DELETE of Post, without WHERE clause
+        after_id: Last post ID of the previous chunk (0 for the first)
+        size: Posts per chunk
+
+    Returns:
+        Select of one row: last_id, the chunk's highest post ID (NULL when no
+        posts are left), and post_ids, the IDs written (NULL when none)
+    """
+    after = cast(ColumnElement[bool], Post.id > after_id)
+    chunk = (
+        select(Post.id)
+        .where(*conditions, after)
+        .order_by(Post.id)
+        .limit(size)
+        .cte("chunk")
+    )
+    written = (
+        write.where(Post.id.in_(select(chunk.c.id)), *conditions)
+        .returning(Post.id)
+        .cte("written")
+    )
+    return select(
+        select(func.max(chunk.c.id)).scalar_subquery().label("last_id"),
+        select(func.array_agg(written.c.id)).scalar_subquery().label("post_ids"),
+    )
+
+
+def returned_tags(row: Row) -> List[TagResponse]:
+    """Build the tags of a row returned with TAG_ARRAYS."""
+    if not row.tag_ids:
+        return []
+    return [
+        TagResponse(id=tag_id, name=name, created_at=created_at)
+        for tag_id, name, created_at in zip(row.tag_ids, row.tag_names, row.tag_created_at)
+    ]
+
+
+def post_response(
+    row: Row, author: User, tags: Sequence[Row | TagResponse], content: str
+) -> PostResponse:
+    """
+    Build a post response from a row returned with POST_COLUMNS.
+
+    Args:
+        row: Returned post row
+        author: Post author
+        tags: Linked tags (rows or responses with id, name and created_at)
+        content: Post content
+
+    Returns:
+        PostResponse
+    """
+    return PostResponse(
+        id=row.id,
+        title=row.title,
+        content=content,
+        excerpt=row.excerpt,
+        status=row.status,
+        publication_date=row.publication_date,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+        version=row.version,
+        author=UserResponse.model_validate(author),
+        tags=[
+            TagResponse(id=tag.id, name=tag.name, created_at=tag.created_at) for tag in tags
+        ],
+    )
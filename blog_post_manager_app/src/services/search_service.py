@@ -2,27 +2,76 @@
 
 from typing import List
 
-from sqlalchemy import func, select
+from sqlalchemy import and_, desc, func, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
+from src.config import settings
+from src.database import execute_with_count
 from src.models.post import Post, PostStatus
+from src.models.post_body import PostBody
 from src.models.tag import Tag
 from src.schemas.common import PaginatedResponse
 from src.schemas.post import PostListResponse
+from src.services.post_rows import POST_ROWS, post_list_items
+
+
+def _search_filters(
+    stmt: StatementLambdaElement,
+    query: str,
+    tags: List[str] | None,
+    author_id: int | None,
+) -> StatementLambdaElement:
+    """
+    Append search filters to a lambda statement.
+
+    Shared by the count and page queries so both always filter identically.
+
+    Args:
+        stmt: Base statement
+        query: Search query string (ignored when blank)
+        tags: Filter by tag names
+        author_id: Filter by author ID
+
+    Returns:
+        The statement with the filters applied
+    """
+    stmt += lambda s: s.where(Post.status == PostStatus.published, Post.deleted_at.is_(None))
+
+    if query.strip():
+        # Search vectors live with the post bodies
+        stmt += lambda s: s.join(PostBody, PostBody.post_id == Post.id).where(
+            PostBody.search_vector.op("@@")(func.plainto_tsquery("english", query))
+        )
+
+    if tags:
+        # One prebuilt clause: per-tag lambdas would share a code location
+        tag_filter = and_(
+            *(Post.tags.any(Tag.name == tag_name.lower()) for tag_name in tags)
+        )
+        stmt += lambda s: s.where(tag_filter)
+
+    if author_id:
+        stmt += lambda s: s.where(Post.author_id == author_id)
+
+    return stmt
 
 
 class SearchService:
     """Service for search operations."""
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, list_strategy: str | None = None):
         """
         Initialize search service.
 
         Args:
             db: Database session
+            list_strategy: 'orm' or 'core'/'json' result pages (defaults to
+                settings.post_list_strategy; search has no JSON rendering)
         """
         self.db = db
+        self.list_strategy = list_strategy or settings.post_list_strategy
 
     async def search_posts(
         self,
@@ -56,67 +105,63 @@ class SearchService:
             )
             ```
         """
-        # Build base query for published posts only
-        search_query = (
-            select(Post)
-            .options(selectinload(Post.author), selectinload(Post.tags))
-            .where(Post.status == PostStatus.published)
-        )
+        rank_by_relevance = sort_by == "relevance" and bool(query.strip())
 
-        # Add full-text search if query provided
-        if query.strip():
-            # Convert query to tsquery format
-            ts_query = func.plainto_tsquery("english", query)
+        count_query = _search_filters(
+            lambda_stmt(lambda: select(func.count(Post.id))), query, tags, author_id
+        )
 
-            # Filter by search vector match
-            search_query = search_query.where(
-                Post.search_vector.op("@@")(ts_query)
+        # Build page query, with a relevance rank column when sorting by it
+        core = self.list_strategy != "orm"
+        if core and rank_by_relevance:
+            search_query = lambda_stmt(
+                lambda: POST_ROWS.add_columns(
+                    func.ts_rank(
+                        PostBody.search_vector, func.plainto_tsquery("english", query)
+                    ).label("rank")
+                )
             )
-
-            # Add relevance ranking for sorting
-            if sort_by == "relevance":
-                rank = func.ts_rank(Post.search_vector, ts_query)
-                search_query = search_query.add_columns(rank.label("rank"))
-
-        # Apply additional filters
-        if tags:
-            for tag_name in tags:
-                search_query = search_query.where(
-                    Post.tags.any(Tag.name == tag_name.lower())
+        elif core:
+            search_query = lambda_stmt(lambda: POST_ROWS)
+        elif rank_by_relevance:
+            search_query = lambda_stmt(
+                lambda: select(
+                    Post,
+                    func.ts_rank(
+                        PostBody.search_vector, func.plainto_tsquery("english", query)
+                    ).label("rank"),
+                ).options(selectinload(Post.author), selectinload(Post.tags))
+            )
+        else:
+            search_query = lambda_stmt(
+                lambda: select(Post).options(
+                    selectinload(Post.author), selectinload(Post.tags)
                 )
+            )
+        search_query = _search_filters(search_query, query, tags, author_id)
 
-        if author_id:
-            search_query = search_query.where(Post.author_id == author_id)
-
-        # Get total count
-        count_query = select(func.count()).select_from(search_query.subquery())
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar_one()
-
-        # Apply sorting
-        if sort_by == "relevance" and query.strip():
-            # Sort by relevance (rank column)
-            search_query = search_query.order_by(func.text("rank DESC"))
+        # Apply sorting; ties (equal ranks are common) go to the newest post,
+        # so pages never overlap and every strategy returns the same order
+        if rank_by_relevance:
+            search_query += lambda s: s.order_by(desc("rank"), Post.id.desc())
         else:
             # Sort by publication date (newest first)
-            search_query = search_query.order_by(Post.publication_date.desc())
+            search_query += lambda s: s.order_by(Post.publication_date.desc(), Post.id.desc())
 
         # Apply pagination
         offset = (page - 1) * page_size
-        search_query = search_query.offset(offset).limit(page_size)
+        search_query += lambda s: s.offset(offset).limit(page_size)
 
-        # Execute query
-        result = await self.db.execute(search_query)
+        # Execute with the total count
+        total, result = await execute_with_count(self.db, count_query, search_query)
 
-        # Extract posts (handle the rank column if present)
-        if sort_by == "relevance" and query.strip():
-            rows = result.all()
-            posts = [row[0] for row in rows]  # First element is Post
+        # Convert to response models (the first element of each ORM row is the
+        # Post; core rows carry the rank after the POST_ROWS columns)
+        if core:
+            items = post_list_items(result.all())
         else:
-            posts = result.scalars().all()
-
-        # Convert to response models
-        items = [PostListResponse.model_validate(post) for post in posts]
+            posts = [row[0] for row in result.all()]
+            items = [PostListResponse.model_validate(post) for post in posts]
 
         return PaginatedResponse(
             items=items,
@@ -137,14 +182,14 @@ class SearchService:
             List of dicts with tag info and post count
         """
         # Query tags with count of published posts
-        query = (
-            select(
+        query = lambda_stmt(
+            lambda: select(
                 Tag.id,
                 Tag.name,
                 func.count(Post.id).label("post_count"),
             )
             .join(Tag.posts)
-            .where(Post.status == PostStatus.published)
+            .where(Post.status == PostStatus.published, Post.deleted_at.is_(None))
             .group_by(Tag.id, Tag.name)
             .order_by(func.count(Post.id).desc())
             .limit(limit)
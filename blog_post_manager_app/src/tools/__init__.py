@@ -0,0 +1 @@
+"""Operational command-line tools (run with `python -m src.tools.<name>`)."""
@@ -0,0 +1,389 @@
+"""High-speed synthetic data generator for large-scale testing.
+
+Generates users, tags, posts with their bodies and post_tags with Zipf-distributed tag and author
+popularity and log-normal content lengths, and loads them with binary COPY.
+
+Triggers are disabled and non-unique secondary indexes are dropped for the
+duration of the load, then rebuilt once at the end together with search
+vectors, post cards and planner statistics. Everything runs in one transaction, so a failed
+run leaves the schema (triggers, indexes) exactly as it was.
+
+Run against a quiet database: generated IDs continue from the current maximum.
+
+Usage:
+    python -m src.tools.generate_data --users 10000 --tags 2000 --posts 1000000
+"""
+
+import argparse
+import asyncio
+import itertools
+import math
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List, Sequence, Set, Tuple
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from src.config import settings
+from src.utils.logging import get_logger, setup_logging
+from src.utils.security import get_password_hash
+
+logger = get_logger(__name__)
+
+# Password shared by every generated user, so any of them can log in
+GENERATED_PASSWORD = "GeneratedPass123"
+
+WORDS = (
+    "python fastapi postgres async database query index cache latency throughput "
+    "service api client server request response schema model migration deploy "
+    "docker kubernetes cluster pod container metric trace log alert incident "
+    "design pattern testing review release feature bug performance memory cpu "
+    "network socket protocol json token auth security encryption storage backup "
+    "replica partition vacuum planner statistics histogram budget scale worker"
+).split()
+
+# Relative weights for the number of tags on a post (0..6 tags)
+TAG_COUNT_WEIGHTS = [4, 14, 24, 24, 17, 10, 7]
+
+# (status, probability); long-lived blogs are dominated by old content
+STATUS_WEIGHTS = [("published", 0.55), ("archived", 0.35), ("draft", 0.10)]
+
+# Tables whose user triggers and non-unique indexes are deferred during load
+DEFERRED_TABLES = ("posts", "post_bodies", "post_tags")
+
+# The function the search vector triggers use (see src.services.post_bodies)
+SEARCH_VECTOR_SQL = "post_search_vector(title, content, excerpt)"
+
+
+@dataclass
+class GeneratorConfig:
+    """Shape of the generated dataset."""
+
+    users: int
+    tags: int
+    posts: int
+    tag_zipf_exponent: float = 1.1
+    author_zipf_exponent: float = 0.9
+    median_content_chars: int = 4000
+    content_sigma: float = 0.9
+    years: float = 5.0
+    batch_size: int = 50_000
+    seed: int = 42
+
+
+def zipf_cum_weights(n: int, exponent: float) -> List[float]:
+    """
+    Cumulative Zipf weights for ranks 1..n, for use with `random.choices`.
+
+    Args:
+        n: Number of ranks
+        exponent: Zipf exponent (larger means more skew towards rank 1)
+
+    Returns:
+        List of cumulative weights
+    """
+    return list(itertools.accumulate(1.0 / (rank**exponent) for rank in range(1, n + 1)))
+
+
+class DataGenerator:
+    """Produces rows for every table as COPY-ready tuples."""
+
+    def __init__(self, config: GeneratorConfig, user_base: int, tag_base: int, post_base: int):
+        self.config = config
+        self.user_base = user_base
+        self.tag_base = tag_base
+        self.post_base = post_base
+        self.rng = random.Random(config.seed)
+        self.now = datetime.now(timezone.utc)
+
+        self.tag_cum_weights = zipf_cum_weights(config.tags, config.tag_zipf_exponent)
+        self.author_cum_weights = zipf_cum_weights(config.users, config.author_zipf_exponent)
+        self.tag_ids = range(tag_base + 1, tag_base + config.tags + 1)
+        # Shuffle so the most prolific authors are not simply the lowest IDs
+        self.author_ids = list(range(user_base + 1, user_base + config.users + 1))
+        self.rng.shuffle(self.author_ids)
+
+        # Content is sliced out of one large corpus instead of joined word by word
+        self.corpus = " ".join(self.rng.choices(WORDS, k=400_000))
+        self.password_hash = get_password_hash(GENERATED_PASSWORD)
+
+    def users(self) -> Iterator[Tuple]:
+        """Yield user rows."""
+        for i in range(self.user_base + 1, self.user_base + self.config.users + 1):
+            created = self.now - timedelta(days=self.rng.uniform(0, 365 * self.config.years))
+            yield (
+                i,
+                f"gen{i}@example.com",
+                f"gen{i}",
+                self.password_hash,
+                f"Generated User {i}",
+                self.rng.random() > 0.02,
+                created,
+                created,
+            )
+
+    def tags(self) -> Iterator[Tuple]:
+        """Yield tag rows; names are unique and match the tag name format."""
+        for i in self.tag_ids:
+            word = WORDS[i % len(WORDS)]
+            yield (i, f"{word}-{i}", self.now)
+
+    def _content(self) -> str:
+        length = int(
+            self.rng.lognormvariate(math.log(self.config.median_content_chars), self.config.content_sigma)
+        )
+        length = max(200, min(length, len(self.corpus) // 2))
+        start = self.rng.randrange(0, len(self.corpus) - length)
+        return self.corpus[start : start + length]
+
+    def _created_at(self) -> datetime:
+        # sqrt skews towards recent dates: publishing volume grows over time
+        span = timedelta(days=365 * self.config.years)
+        return self.now - span * (1 - math.sqrt(self.rng.random()))
+
+    def posts(self, start: int, stop: int) -> Tuple[List[Tuple], List[Tuple]]:
+        """
+        Generate one batch of posts and their post_tags rows.
+
+        Args:
+            start: First post offset (0-based, inclusive)
+            stop: Last post offset (exclusive)
+
+        Returns:
+            (post rows, post_tag rows)
+        """
+        statuses = [status for status, _ in STATUS_WEIGHTS]
+        status_weights = [weight for _, weight in STATUS_WEIGHTS]
+        post_rows = []
+        tag_rows: List[Tuple] = []
+
+        authors = self.rng.choices(self.author_ids, cum_weights=self.author_cum_weights, k=stop - start)
+        for offset, author_id in zip(range(start, stop), authors):
+            post_id = self.post_base + offset + 1
+            status = self.rng.choices(statuses, status_weights)[0]
+            created = self._created_at()
+            published = (
+                created + timedelta(hours=self.rng.uniform(0, 72)) if status != "draft" else None
+            )
+            content = self._content()
+            title = " ".join(self.rng.choices(WORDS, k=self.rng.randint(4, 10))).capitalize()
+            excerpt = content[:200] if self.rng.random() < 0.7 else None
+
+            post_rows.append(
+                (post_id, author_id, title, content, excerpt, status, published, created)
+            )
+
+            tag_count = self.rng.choices(range(len(TAG_COUNT_WEIGHTS)), TAG_COUNT_WEIGHTS)[0]
+            chosen: Set[int] = set()
+            while len(chosen) < min(tag_count, self.config.tags):
+                chosen.add(
+                    self.rng.choices(self.tag_ids, cum_weights=self.tag_cum_weights)[0]
+                )
+            tag_rows.extend((post_id, tag_id, created) for tag_id in chosen)
+
+        return post_rows, tag_rows
+
+
+async def _max_id(conn: asyncpg.Connection, table: str) -> int:
+    return int(await conn.fetchval(f"SELECT COALESCE(MAX(id), 0) FROM {table}"))
+
+
+async def _drop_secondary_indexes(conn: asyncpg.Connection, tables: Sequence[str]) -> List[str]:
+    """
+    Drop non-unique indexes that do not back a constraint.
+
+    Returns:
+        CREATE INDEX statements to restore them
+    """
+    rows = await conn.fetch(
+        """
+        SELECT i.indexrelid::regclass::text AS name, pg_get_indexdef(i.indexrelid) AS definition
+        FROM pg_index AS i
+        LEFT JOIN pg_constraint AS c ON c.conindid = i.indexrelid
+        WHERE i.indrelid::regclass::text = ANY($1::text[])
+          AND NOT i.indisunique
+          AND c.oid IS NULL
+        """,
+        list(tables),
+    )
+    for row in rows:
+        await conn.execute(f"DROP INDEX {row['name']}")
+    # Definitions of partitioned indexes read ON ONLY, which would leave the
+    # partitions without them
+    return [row["definition"].replace(" ON ONLY ", " ON ", 1) for row in rows]
+
+
+async def generate(config: GeneratorConfig, dsn: str) -> None:
+    """
+    Generate and load the dataset described by `config`.
+
+    Args:
+        config: Dataset shape
+        dsn: libpq-style PostgreSQL DSN
+    """
+    conn = await asyncpg.connect(dsn)
+    started = time.perf_counter()
+
+    try:
+        async with conn.transaction():
+            generator = DataGenerator(
+                config,
+                user_base=await _max_id(conn, "users"),
+                tag_base=await _max_id(conn, "tags"),
+                post_base=await _max_id(conn, "posts"),
+            )
+
+            for table in DEFERRED_TABLES:
+                await conn.execute(f"ALTER TABLE {table} DISABLE TRIGGER USER")
+            index_definitions = await _drop_secondary_indexes(conn, DEFERRED_TABLES)
+
+            await conn.copy_records_to_table(
+                "users",
+                records=generator.users(),
+                columns=[
+                    "id", "email", "username", "hashed_password", "full_name",
+                    "is_active", "created_at", "updated_at",
+                ],
+            )
+            await conn.copy_records_to_table(
+                "tags", records=generator.tags(), columns=["id", "name", "created_at"]
+            )
+            logger.info("Loaded users and tags", extra={"users": config.users, "tags": config.tags})
+
+            # Posts go through a temp staging table, split into posts and their
+            # bodies, so search vectors are computed in the same pass that writes
+            # the body instead of by per-row triggers
+            await conn.execute(
+                """
+                CREATE TEMP TABLE posts_staging (
+                    id integer, author_id integer, title varchar(200), content text,
+                    excerpt varchar(500), status poststatus,
+                    publication_date timestamptz, created_at timestamptz
+                ) ON COMMIT DROP
+                """
+            )
+
+            for start in range(0, config.posts, config.batch_size):
+                stop = min(start + config.batch_size, config.posts)
+                post_rows, tag_rows = generator.posts(start, stop)
+
+                await conn.copy_records_to_table("posts_staging", records=post_rows)
+                await conn.execute(
+                    """
+                    INSERT INTO posts (
+                        id, author_id, title, excerpt, status,
+                        publication_date, created_at, updated_at
+                    )
+                    SELECT id, author_id, title, excerpt, status,
+                           publication_date, created_at, created_at
+                    FROM posts_staging
+                    """
+                )
+                await conn.execute(
+                    f"""
+                    INSERT INTO post_bodies (post_id, content, search_vector)
+                    SELECT id, content, {SEARCH_VECTOR_SQL}
+                    FROM posts_staging
+                    """
+                )
+                await conn.execute("TRUNCATE posts_staging")
+                await conn.copy_records_to_table(
+                    "post_tags", records=tag_rows, columns=["post_id", "tag_id", "created_at"]
+                )
+                logger.info(
+                    "Loaded post batch",
+                    extra={"posts": stop, "elapsed_seconds": round(time.perf_counter() - started, 1)},
+                )
+
+            for definition in index_definitions:
+                await conn.execute(definition)
+            for table in DEFERRED_TABLES:
+                await conn.execute(f"ALTER TABLE {table} ENABLE TRIGGER USER")
+            # One set-based pass instead of per-row card maintenance during the load
+            await conn.execute(
+                "SELECT refresh_post_cards(ARRAY(SELECT id FROM posts WHERE id > $1))",
+                generator.post_base,
+            )
+            for table in ("users", "tags", "posts"):
+                await conn.execute(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                    f"(SELECT MAX(id) FROM {table}))"
+                )
+
+        await conn.execute("ANALYZE users, tags, posts, post_bodies, post_tags, post_cards")
+    finally:
+        await conn.close()
+
+    logger.info(
+        "Data generation complete",
+        extra={"posts": config.posts, "elapsed_seconds": round(time.perf_counter() - started, 1)},
+    )
+
+
+def asyncpg_dsn(database_url: str) -> str:
+    """Convert a SQLAlchemy URL (postgresql+asyncpg://...) to a libpq DSN."""
+    url = make_url(database_url).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+def _non_negative_int(value: str) -> int:
+    """argparse type for row counts."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {number}")
+    return number
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for sizes that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {number}")
+    return number
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=_non_negative_int, default=1_000)
+    parser.add_argument("--tags", type=_non_negative_int, default=500)
+    parser.add_argument("--posts", type=_non_negative_int, default=100_000)
+    parser.add_argument("--tag-zipf-exponent", type=float, default=1.1)
+    parser.add_argument("--author-zipf-exponent", type=float, default=0.9)
+    parser.add_argument("--median-content-chars", type=_positive_int, default=4000)
+    parser.add_argument("--years", type=float, default=5.0, help="Time span of created_at")
+    parser.add_argument("--batch-size", type=_positive_int, default=50_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--database-url", default=settings.database_url_str, help="Defaults to DATABASE_URL"
+    )
+    args = parser.parse_args(argv)
+    # Every post needs an author from the generated users
+    if args.posts > 0 and args.users < 1:
+        parser.error("--users must be >= 1 when --posts > 0")
+    return args
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """CLI entry point."""
+    setup_logging()
+    args = parse_args(argv)
+    config = GeneratorConfig(
+        users=args.users,
+        tags=args.tags,
+        posts=args.posts,
+        tag_zipf_exponent=args.tag_zipf_exponent,
+        author_zipf_exponent=args.author_zipf_exponent,
+        median_content_chars=args.median_content_chars,
+        years=args.years,
+        batch_size=args.batch_size,
+        seed=args.seed,
+    )
+    asyncio.run(generate(config, asyncpg_dsn(args.database_url)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""Maintain the monthly partitions of posts.
+
+`ensure` creates the monthly partitions up to `post_partition_premake_months`
+ahead of the current month, carving them out of `posts_future` (and moving
+any rows that already landed there). `tier` moves every month older than the
+`post_partition_hot_months` hot window into the compressed `posts_cold`
+partition, so the hot partitions and their indexes stay small.
+
+Each month is moved in its own transaction, which holds an exclusive lock on
+posts while that month's rows are copied: run `tier` off-peak, e.g. nightly
+from cron together with `ensure`. The cold partition's CHECK constraint is
+widened beforehand, without blocking writes, so re-attaching it with a wider
+bound does not scan it again.
+
+Usage:
+    python -m src.tools.post_partitions ensure
+    python -m src.tools.post_partitions tier
+"""
+
+import argparse
+import asyncio
+import re
+from datetime import date
+from typing import List, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+
+from src.config import settings
+from src.services.post_partitions import (
+    COLD_CHECK,
+    COLD_PARTITION,
+    FUTURE_PARTITION,
+    add_months,
+    bound,
+    hot_window_start,
+    month_partition_sql,
+    month_start,
+    partition_name,
+    utc_today,
+)
+from src.utils.logging import get_logger, setup_logging
+
+logger = get_logger(__name__)
+
+MONTH_PARTITION = re.compile(r"^posts_p(\d{4})(\d{2})$")
+
+
+async def monthly_partitions(conn: AsyncConnection) -> List[date]:
+    """
+    List the monthly partitions of posts.
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        First day of each partition's month, oldest first
+    """
+    result = await conn.exec_driver_sql(
+        "SELECT c.relname FROM pg_inherits AS i JOIN pg_class AS c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = 'posts'::regclass"
+    )
+    months = []
+    for (name,) in result.all():
+        match = MONTH_PARTITION.match(name)
+        if match:
+            months.append(date(int(match.group(1)), int(match.group(2)), 1))
+    return sorted(months)
+
+
+async def ensure_partitions(engine: AsyncEngine, today: date, premake_months: int) -> List[str]:
+    """
+    Create the monthly partitions missing up to `premake_months` ahead.
+
+    Args:
+        engine: Database engine
+        today: Current date (UTC)
+        premake_months: Months to have partitions for after the current one
+
+    Returns:
+        Names of the partitions created
+    """
+    end = add_months(month_start(today), premake_months + 1)
+    async with engine.begin() as conn:
+        months = await monthly_partitions(conn)
+        if not months:
+            raise RuntimeError("posts has no monthly partitions; is it partitioned?")
+        month = add_months(months[-1], 1)
+        if month >= end:
+            return []
+
+        # posts_future starts where the new months end; rows that landed in
+        # their range are routed into them
+        await conn.exec_driver_sql(f"ALTER TABLE posts DETACH PARTITION {FUTURE_PARTITION}")
+        created = []
+        while month < end:
+            await conn.exec_driver_sql(month_partition_sql(month))
+            created.append(partition_name(month))
+            month = add_months(month, 1)
+        await conn.exec_driver_sql(
+            f"INSERT INTO posts SELECT * FROM {FUTURE_PARTITION} WHERE created_at < {bound(end)}"
+        )
+        await conn.exec_driver_sql(
+            f"DELETE FROM {FUTURE_PARTITION} WHERE created_at < {bound(end)}"
+        )
+        await conn.exec_driver_sql(
+            f"ALTER TABLE posts ATTACH PARTITION {FUTURE_PARTITION} "
+            f"FOR VALUES FROM ({bound(end)}) TO (MAXVALUE)"
+        )
+
+    logger.info("Created posts partitions", extra={"partitions": created})
+    return created
+
+
+async def _widen_cold_check(engine: AsyncEngine, end: date) -> None:
+    """Prepare a valid CHECK constraint for the cold partition's next bound."""
+    pending = f"{COLD_CHECK}_next"
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql(
+            f"ALTER TABLE {COLD_PARTITION} DROP CONSTRAINT IF EXISTS {pending}"
+        )
+        await conn.exec_driver_sql(
+            f"ALTER TABLE {COLD_PARTITION} ADD CONSTRAINT {pending} "
+            f"CHECK (created_at < {bound(end)}) NOT VALID"
+        )
+    # Scans the partition under a lock that lets reads and writes through
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql(f"ALTER TABLE {COLD_PARTITION} VALIDATE CONSTRAINT {pending}")
+
+
+async def tier_partitions(engine: AsyncEngine, today: date, hot_months: int) -> List[str]:
+    """
+    Move the months before the hot window into the cold partition.
+
+    Args:
+        engine: Database engine
+        today: Current date (UTC)
+        hot_months: Months, the current one included, kept in monthly partitions
+
+    Returns:
+        Names of the partitions moved (and dropped), oldest first
+    """
+    async with engine.connect() as conn:
+        months = await monthly_partitions(conn)
+    hot_start = hot_window_start(today, hot_months)
+
+    moved = []
+    for month in (month for month in months if month < hot_start):
+        name = partition_name(month)
+        end = add_months(month, 1)
+        await _widen_cold_check(engine, end)
+
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql(f"ALTER TABLE posts DETACH PARTITION {name}")
+            await conn.exec_driver_sql(f"ALTER TABLE posts DETACH PARTITION {COLD_PARTITION}")
+            await conn.exec_driver_sql(
+                f"ALTER TABLE {COLD_PARTITION} DROP CONSTRAINT {COLD_CHECK}"
+            )
+            await conn.exec_driver_sql(
+                f"ALTER TABLE {COLD_PARTITION} RENAME CONSTRAINT {COLD_CHECK}_next TO {COLD_CHECK}"
+            )
+            await conn.exec_driver_sql(f"INSERT INTO {COLD_PARTITION} SELECT * FROM {name}")
+            await conn.exec_driver_sql(f"DROP TABLE {name}")
+            # The CHECK constraint spares the scan proving the new bound
+            await conn.exec_driver_sql(
+                f"ALTER TABLE posts ATTACH PARTITION {COLD_PARTITION} "
+                f"FOR VALUES FROM (MINVALUE) TO ({bound(end)})"
+            )
+        moved.append(name)
+        logger.info("Moved posts partition to cold storage", extra={"partition": name})
+
+    if moved:
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql(f"ANALYZE {COLD_PARTITION}")
+    return moved
+
+
+async def run(command: str, database_url: str) -> None:
+    """Run one maintenance command against `database_url`."""
+    engine = create_async_engine(database_url)
+    try:
+        if command == "ensure":
+            await ensure_partitions(engine, utc_today(), settings.post_partition_premake_months)
+        else:
+            await tier_partitions(engine, utc_today(), settings.post_partition_hot_months)
+    finally:
+        await engine.dispose()
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=["ensure", "tier"])
+    parser.add_argument(
+        "--database-url", default=settings.database_url_str, help="Defaults to DATABASE_URL"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """CLI entry point."""
+    setup_logging()
+    args = parse_args(argv)
+    asyncio.run(run(args.command, args.database_url))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""Content-addressed blob storage with filesystem and S3 backends.
+
+Blobs are immutable and keyed by the SHA-256 of their bytes, so identical
+content is stored once, writing a blob that exists is a no-op, and a cached
+blob can never be stale. Nothing is ever overwritten or deleted here: a blob
+no longer referenced costs only its storage.
+
+Backends are synchronous (local files, boto3) and run in a worker thread
+through the async `get` and `put`; the synchronous methods remain usable
+where no event loop runs, e.g. in migrations.
+"""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from src.config import Settings
+
+
+def blob_key(data: bytes) -> str:
+    """Key of a blob: the hex SHA-256 of its bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class BlobStore(ABC):
+    """Blob storage interface."""
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        """Tell whether a blob is stored."""
+
+    @abstractmethod
+    def read(self, key: str) -> bytes:
+        """
+        Read a blob.
+
+        Args:
+            key: Blob key
+
+        Returns:
+            Blob bytes
+
+        Raises:
+            KeyError: If no blob has this key
+        """
+
+    @abstractmethod
+    def write(self, key: str, data: bytes) -> None:
+        """Store a blob under `key`, which must be `blob_key(data)`."""
+
+    async def get(self, key: str) -> bytes:
+        """Read a blob without blocking the event loop."""
+        return await asyncio.to_thread(self.read, key)
+
+    async def put(self, data: bytes) -> str:
+        """
+        Store a blob unless an identical one is already stored.
+
+        Args:
+            data: Blob bytes
+
+        Returns:
+            Blob key
+        """
+        key = blob_key(data)
+
+        def store() -> None:
+            if not self.exists(key):
+                self.write(key, data)
+
+        await asyncio.to_thread(store)
+        return key
+
+    async def close(self) -> None:
+        """Release backend resources."""
+
+
+class FilesystemBlobStore(BlobStore):
+    """Blobs as files under a directory, fanned out by key prefix."""
+
+    def __init__(self, root: str):
+        """
+        Initialize filesystem backend.
+
+        Args:
+            root: Directory holding the blobs; created if missing. Every
+                process serving the API must see the same directory.
+        """
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / key[2:4] / key
+
+    def exists(self, key: str) -> bool:
+        """Tell whether a blob is stored."""
+        return self._path(key).is_file()
+
+    def read(self, key: str) -> bytes:
+        """Read a blob."""
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError as exc:
+            raise KeyError(key) from exc
+
+    def write(self, key: str, data: bytes) -> None:
+        """Store a blob, atomically: readers never see a partial file."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary, path)
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+
+
+class S3BlobStore(BlobStore):
+    """Blobs as objects in an S3-compatible bucket."""
+
+    def __init__(self, bucket: str, prefix: str = "", endpoint_url: str | None = None):
+        """
+        Initialize S3 backend.
+
+        Credentials and region come from the usual AWS environment variables
+        or configuration files.
+
+        Args:
+            bucket: Bucket name
+            prefix: Prefix of the object keys
+            endpoint_url: Endpoint of an S3-compatible service, e.g. MinIO
+
+        Raises:
+            ImportError: If the boto3 package is not installed
+        """
+        try:
+            import boto3
+        except ImportError as exc:
+            raise ImportError(
+                "The S3 blob store requires the 'boto3' package "
+                "(pip install 'blog-post-manager[s3]')"
+            ) from exc
+
+        self.bucket = bucket
+        self.prefix = prefix
+        self._client: Any = boto3.client("s3", endpoint_url=endpoint_url)
+
+    def exists(self, key: str) -> bool:
+        """Tell whether a blob is stored."""
+        try:
+            self._client.head_object(Bucket=self.bucket, Key=self.prefix + key)
+        except self._client.exceptions.ClientError as exc:
+            if exc.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                return False
+            raise
+        return True
+
+    def read(self, key: str) -> bytes:
+        """Read a blob."""
+        try:
+            response = self._client.get_object(Bucket=self.bucket, Key=self.prefix + key)
+        except self._client.exceptions.NoSuchKey as exc:
+            raise KeyError(key) from exc
+        data: bytes = response["Body"].read()
+        return data
+
+    def write(self, key: str, data: bytes) -> None:
+        """Store a blob."""
+        self._client.put_object(Bucket=self.bucket, Key=self.prefix + key, Body=data)
+
+
+class BlobCache:
+    """LRU cache of blobs decoded as text, bounded by their total size."""
+
+    def __init__(self, max_bytes: int):
+        """
+        Initialize cache.
+
+        Args:
+            max_bytes: Maximum total size of the cached blobs; least recently
+                used ones are evicted, and larger blobs are not cached
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[str, tuple[str, int]] = OrderedDict()
+
+    def get(self, key: str) -> str | None:
+        """Cached text of a blob, if any."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def add(self, key: str, text: str, size: int) -> None:
+        """Cache the text of a blob of `size` bytes."""
+        if size > self.max_bytes or key in self._entries:
+            return
+        while self.size + size > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.size -= evicted
+        self._entries[key] = (text, size)
+        self.size += size
+
+
+def create_blob_store(config: Settings) -> BlobStore:
+    """
+    Build the post body blob store described by the settings.
+
+    Args:
+        config: Application settings
+
+    Returns:
+        BlobStore with the configured backend
+
+    Raises:
+        ValueError: If the s3 backend is selected without a bucket
+    """
+    if config.post_body_store == "s3":
+        if not config.post_body_s3_bucket:
+            raise ValueError("post_body_s3_bucket is required for the s3 post body store")
+        return S3BlobStore(
+            config.post_body_s3_bucket,
+            prefix=config.post_body_s3_prefix,
+            endpoint_url=config.post_body_s3_endpoint_url,
+        )
+    return FilesystemBlobStore(config.post_body_dir)
@@ -0,0 +1,45 @@
+"""Entity tags for conditional post writes.
+
+A post's ETag is its row version in quotes, e.g. `"3"`. Clients send it back
+in `If-Match` so that an update or delete only applies to the version they
+read, and get 412 Precondition Failed when someone else changed it since.
+"""
+
+from typing import List
+
+
+def post_etag(version: int) -> str:
+    """
+    Build the ETag of a post version.
+
+    Args:
+        version: Post row version
+
+    Returns:
+        Strong entity tag, e.g. `"3"`
+    """
+    return f'"{version}"'
+
+
+def parse_if_match(header: str | None) -> List[int] | None:
+    """
+    Parse an If-Match header into the post versions it accepts.
+
+    If-Match uses strong comparison, so weak (`W/"3"`) and malformed tags
+    never match; they add no version and can only lead to 412.
+
+    Args:
+        header: If-Match header value, if sent
+
+    Returns:
+        Accepted versions, or None when any version is acceptable (no header or `*`)
+    """
+    if header is None or header.strip() == "*":
+        return None
+
+    versions = []
+    for tag in header.split(","):
+        tag = tag.strip()
+        if len(tag) > 2 and tag[0] == tag[-1] == '"' and tag[1:-1].isdigit():
+            versions.append(int(tag[1:-1]))
+    return versions
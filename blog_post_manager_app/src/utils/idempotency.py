@@ -0,0 +1,288 @@
+"""Idempotency keys: replay the recorded response of a retried write.
+
+A client sends the same `Idempotency-Key` header on every retry of a request.
+The first request claims the key and runs; its response is recorded under the
+key, and later requests with the key get that response back instead of
+running again. A duplicate that arrives while the first request is still
+running waits for its result.
+
+Keys are kept for `ttl_seconds` and then evicted, in both backends:
+
+- database: one row per key, claimed in the transaction of the write it
+  guards. A duplicate's claim blocks on the uncommitted row until the first
+  request commits (and replays its response) or rolls back (and runs
+  itself), so the write and its recorded response are never separated.
+  Shared by all workers and replicas.
+- memory: per-process LRU dict bounded by `max_keys`; duplicates wait on an
+  event for up to `wait_seconds`. For single-node setups only.
+"""
+
+import asyncio
+import hashlib
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from sqlalchemy import Select, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import Settings
+from src.models.idempotency_key import IdempotencyKey
+
+# Expired keys deleted by each database claim
+EVICTION_BATCH_SIZE = 10
+
+
+def request_fingerprint(body: BaseModel) -> str:
+    """
+    Fingerprint a request body, to refuse a key reused for another request.
+
+    Args:
+        body: Validated request body
+
+    Returns:
+        Hex SHA-256 of the body's JSON
+    """
+    return hashlib.sha256(body.model_dump_json().encode()).hexdigest()
+
+
+def _key_reused() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        detail="Idempotency-Key was already used for a different request",
+    )
+
+
+class IdempotencyStore(ABC):
+    """Recorded response storage interface."""
+
+    def __init__(self, ttl_seconds: int):
+        """
+        Initialize store.
+
+        Args:
+            ttl_seconds: How long a key and its response are kept
+        """
+        self.ttl_seconds = ttl_seconds
+
+    @abstractmethod
+    async def claim(self, db: AsyncSession, key: str, fingerprint: str) -> str | None:
+        """
+        Claim a key for a request, waiting while another request holds it.
+
+        Args:
+            db: The request's session (the write's transaction)
+            key: Scoped idempotency key
+            fingerprint: Request fingerprint
+
+        Returns:
+            The recorded response if the key was used before, else None: the
+            caller holds the key and runs the request
+
+        Raises:
+            HTTPException: 422 if the key was used for a different request,
+                409 if the request holding it is still running after the wait
+        """
+
+    @abstractmethod
+    async def record(self, db: AsyncSession, key: str, response: str) -> None:
+        """Record the response of a claimed key, before the write commits."""
+
+    async def complete(self, key: str) -> None:
+        """Make a recorded response visible to waiting duplicates, after the commit."""
+
+    async def release(self, key: str) -> None:
+        """Give a claimed key up after the request failed, so a retry runs it."""
+
+    async def close(self) -> None:
+        """Release store resources."""
+
+
+class DatabaseIdempotencyStore(IdempotencyStore):
+    """Keys stored in the idempotency_keys table, in the request's transaction."""
+
+    async def claim(self, db: AsyncSession, key: str, fingerprint: str) -> str | None:
+        """Claim a key with one INSERT, evicting a batch of expired keys in passing."""
+        expired: Select = (
+            select(IdempotencyKey.key)
+            .where(IdempotencyKey.expires_at < func.now(), IdempotencyKey.key != key)
+            .limit(EVICTION_BATCH_SIZE)
+            .with_for_update(skip_locked=True)
+        )
+        evicted = delete(IdempotencyKey).where(IdempotencyKey.key.in_(expired)).cte("evicted")
+        stmt = insert(IdempotencyKey).values(
+            key=key,
+            fingerprint=fingerprint,
+            expires_at=func.now() + timedelta(seconds=self.ttl_seconds),
+        )
+        # Blocks while another transaction holds an uncommitted row for the key;
+        # an expired key is taken over
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[IdempotencyKey.key],
+            set_={
+                "fingerprint": stmt.excluded.fingerprint,
+                "response": None,
+                "expires_at": stmt.excluded.expires_at,
+            },
+            where=IdempotencyKey.expires_at < func.now(),
+        )
+        claimed = await db.scalar(stmt.returning(IdempotencyKey.key).add_cte(evicted))
+        if claimed is not None:
+            return None
+
+        recorded = (
+            await db.execute(
+                select(IdempotencyKey.fingerprint, IdempotencyKey.response).where(
+                    IdempotencyKey.key == key
+                )
+            )
+        ).one_or_none()
+        if recorded is None:
+            # Evicted between the two statements; it had expired, so claim it anew
+            return await self.claim(db, key, fingerprint)
+        if recorded.fingerprint != fingerprint:
+            raise _key_reused()
+        return recorded.response
+
+    async def record(self, db: AsyncSession, key: str, response: str) -> None:
+        """Store the response on the claimed row."""
+        await db.execute(
+            update(IdempotencyKey).where(IdempotencyKey.key == key).values(response=response)
+        )
+
+
+@dataclass
+class _MemoryEntry:
+    """A key held in memory: in flight until `done` is set."""
+
+    fingerprint: str
+    expires_at: float
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+    response: str | None = None
+
+
+class MemoryIdempotencyStore(IdempotencyStore):
+    """Per-process keys in an LRU-bounded ordered dict."""
+
+    def __init__(self, ttl_seconds: int, max_keys: int, wait_seconds: float):
+        """
+        Initialize memory store.
+
+        Args:
+            ttl_seconds: How long a key and its response are kept
+            max_keys: Maximum number of keys kept; least recently used are evicted
+            wait_seconds: How long a duplicate waits for the request holding its key
+        """
+        super().__init__(ttl_seconds)
+        self.max_keys = max_keys
+        self.wait_seconds = wait_seconds
+        self._entries: "OrderedDict[str, _MemoryEntry]" = OrderedDict()
+
+    async def claim(self, db: AsyncSession, key: str, fingerprint: str) -> str | None:
+        """Claim a key, waiting on its event while another request holds it."""
+        while True:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at < time.monotonic():
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                if len(self._entries) >= self.max_keys:
+                    self._entries.popitem(last=False)
+                self._entries[key] = _MemoryEntry(
+                    fingerprint, time.monotonic() + self.ttl_seconds
+                )
+                return None
+
+            self._entries.move_to_end(key)
+            if entry.fingerprint != fingerprint:
+                raise _key_reused()
+            if entry.done.is_set() and entry.response is not None:
+                return entry.response
+
+            try:
+                await asyncio.wait_for(entry.done.wait(), self.wait_seconds)
+            except asyncio.TimeoutError:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="A request with this Idempotency-Key is still in progress",
+                ) from None
+            # Completed (replay it) or released (claim it): look again
+
+    async def record(self, db: AsyncSession, key: str, response: str) -> None:
+        """Keep the response until the write commits."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.response = response
+
+    async def complete(self, key: str) -> None:
+        """Wake duplicates waiting for the response."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.done.set()
+
+    async def release(self, key: str) -> None:
+        """Forget the key and wake duplicates, one of which then claims it."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            entry.done.set()
+
+
+class IdempotentRequest:
+    """One request's use of an idempotency key, passed to the service doing the write."""
+
+    def __init__(self, store: IdempotencyStore, key: str, fingerprint: str):
+        """
+        Initialize idempotent request.
+
+        Args:
+            store: Key storage
+            key: Idempotency key, scoped to the user and route
+            fingerprint: Request fingerprint (see request_fingerprint)
+        """
+        self.store = store
+        self.key = key
+        self.fingerprint = fingerprint
+        self.replayed = False
+
+    async def claim(self, db: AsyncSession) -> str | None:
+        """Claim the key; returns the recorded response when replaying."""
+        response = await self.store.claim(db, self.key, self.fingerprint)
+        self.replayed = response is not None
+        return response
+
+    async def record(self, db: AsyncSession, response: str) -> None:
+        """Record the response, in the write's transaction."""
+        await self.store.record(db, self.key, response)
+
+    async def complete(self) -> None:
+        """Publish the response once the write committed."""
+        await self.store.complete(self.key)
+
+    async def release(self) -> None:
+        """Give the key up after a failure."""
+        await self.store.release(self.key)
+
+
+def create_idempotency_store(config: Settings) -> IdempotencyStore:
+    """
+    Build the idempotency store described by the settings.
+
+    Args:
+        config: Application settings
+
+    Returns:
+        IdempotencyStore with the configured backend
+    """
+    if config.idempotency_backend == "memory":
+        return MemoryIdempotencyStore(
+            config.idempotency_ttl_seconds,
+            config.idempotency_max_keys,
+            config.idempotency_wait_seconds,
+        )
+    return DatabaseIdempotencyStore(config.idempotency_ttl_seconds)
@@ -0,0 +1,290 @@
+"""Prometheus metrics for HTTP traffic, SQL statements and the connection pool.
+
+Metrics work in prometheus_client multiprocess mode: when
+`PROMETHEUS_MULTIPROC_DIR` is set before this module is imported, every worker
+process writes its samples to that directory and `/metrics` aggregates them.
+Gauges use the `livesum` mode so values from exited workers are dropped.
+"""
+
+import os
+import time
+from typing import Any, Callable
+
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    make_asgi_app,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExceptionContext
+from sqlalchemy.engine.interfaces import CacheStats, DBAPIConnection, ExecutionContext
+from sqlalchemy.pool import ConnectionPoolEntry, Pool, PoolProxiedConnection, QueuePool
+
+# Latency buckets tuned for an API whose typical request takes a few ms
+LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+SIZE_BUCKETS = (128, 512, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# HTTP metrics
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "Total HTTP requests",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency until response headers are ready",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being processed",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "HTTP response body size",
+    ["method", "route"],
+    buckets=SIZE_BUCKETS,
+)
+
+RATE_LIMITED_REQUESTS = Counter(
+    "http_rate_limited_requests_total",
+    "Requests rejected by the rate limiter",
+    ["route"],
+)
+
+POSTS_PURGED = Counter(
+    "posts_purged_total",
+    "Soft-deleted posts removed by the background purger",
+)
+
+# Database metrics
+DB_STATEMENT_DURATION = Histogram(
+    "db_statement_duration_seconds",
+    "SQL statement execution time by statement class",
+    ["statement"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_COMPILED_CACHE = Counter(
+    "db_compiled_cache_total",
+    "SQLAlchemy compiled statement cache lookups by result (hit/miss/uncached)",
+    ["result"],
+)
+DB_PREPARED_STATEMENT_CACHE = Counter(
+    "db_prepared_statement_cache_total",
+    "asyncpg prepared statement cache lookups by result (hit/miss)",
+    ["result"],
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection (including connect)",
+    buckets=LATENCY_BUCKETS,
+)
+DB_POOL_CONNECTION_HOLD = Histogram(
+    "db_pool_connection_hold_seconds",
+    "Time a connection stays checked out of the pool",
+    buckets=LATENCY_BUCKETS,
+)
+DB_REQUEST_SESSIONS = Counter(
+    "db_request_sessions_total",
+    "Request database sessions by whether they checked out a connection (used/unused)",
+    ["connection"],
+)
+DB_LIST_COUNT_QUERIES = Counter(
+    "db_list_count_queries_total",
+    "List page count queries by execution mode (concurrent/sequential)",
+    ["mode"],
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Connections currently checked out of the pool",
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "Connections open beyond pool_size (max_overflow in use)",
+    multiprocess_mode="livesum",
+)
+
+STATEMENT_CLASSES = frozenset({"select", "insert", "update", "delete", "with"})
+
+COMPILED_CACHE_RESULTS = {CacheStats.CACHE_HIT: "hit", CacheStats.CACHE_MISS: "miss"}
+
+
+def statement_class(statement: str) -> str:
+    """
+    Classify a SQL statement by its leading keyword.
+
+    Args:
+        statement: SQL text
+
+    Returns:
+        One of select/insert/update/delete/with, or "other"
+    """
+    keyword = statement.lstrip().split(None, 1)[0].lower() if statement.strip() else ""
+    return keyword if keyword in STATEMENT_CLASSES else "other"
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Attach statement timing and pool occupancy listeners to an engine.
+
+    Args:
+        engine: Sync engine (use `async_engine.sync_engine` for async engines)
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+        record_cache_lookups(cursor, statement, context, executemany)
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        started = conn.info["query_start_time"].pop()
+        DB_STATEMENT_DURATION.labels(statement=statement_class(statement)).observe(
+            time.perf_counter() - started
+        )
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(context: ExceptionContext) -> None:
+        # after_cursor_execute does not fire for failed statements
+        if context.cursor is not None and context.connection is not None:
+            stack = context.connection.info.get("query_start_time")
+            if stack:
+                stack.pop()
+
+    instrument_pool(engine.pool)
+
+
+def record_cache_lookups(cursor: Any, statement: str, context: Any, executemany: bool) -> None:
+    """
+    Count compiled-cache and prepared-statement-cache hits for a statement.
+
+    Hit rates are derived in Prometheus, e.g.
+    `rate(db_compiled_cache_total{result="hit"}[5m]) / rate(db_compiled_cache_total[5m])`.
+
+    Args:
+        cursor: DBAPI cursor (the SQLAlchemy asyncpg adapter for this app)
+        statement: SQL text about to be executed
+        context: SQLAlchemy execution context
+        executemany: Whether this is an executemany call
+    """
+    if context is not None:
+        result = COMPILED_CACHE_RESULTS.get(context.cache_hit, "uncached")
+        DB_COMPILED_CACHE.labels(result=result).inc()
+
+    # executemany goes through asyncpg directly without the statement cache
+    adapt_connection = getattr(cursor, "_adapt_connection", None)
+    cache = getattr(adapt_connection, "_prepared_statement_cache", None)
+    if cache is not None and not executemany:
+        result = "hit" if statement in cache else "miss"
+        DB_PREPARED_STATEMENT_CACHE.labels(result=result).inc()
+
+
+def instrument_pool(pool: Pool) -> None:
+    """Keep the pool occupancy gauges in sync with checkouts and checkins."""
+    if not isinstance(pool, QueuePool):
+        return  # NullPool and friends have no occupancy to report
+
+    def _update() -> None:
+        DB_POOL_CHECKED_OUT.set(pool.checkedout())
+        DB_POOL_OVERFLOW.set(max(pool.overflow(), 0))
+
+    def _checkout(
+        dbapi_connection: DBAPIConnection,
+        connection_record: ConnectionPoolEntry,
+        connection_proxy: PoolProxiedConnection,
+    ) -> None:
+        connection_record.info["checkout_time"] = time.perf_counter()
+        _update()
+
+    def _checkin(
+        dbapi_connection: DBAPIConnection | None, connection_record: ConnectionPoolEntry
+    ) -> None:
+        started = connection_record.info.pop("checkout_time", None)
+        if started is not None:
+            DB_POOL_CONNECTION_HOLD.observe(time.perf_counter() - started)
+        _update()
+
+    event.listen(pool, "checkout", _checkout)
+    event.listen(pool, "checkin", _checkin)
+
+
+def record_session_usage(used_connection: bool) -> None:
+    """
+    Count a finished request session by whether it touched the pool.
+
+    The share of requests served without a connection is
+    `rate(db_request_sessions_total{connection="unused"}[5m])
+    / rate(db_request_sessions_total[5m])`.
+
+    Args:
+        used_connection: Whether the session checked out a connection
+    """
+    DB_REQUEST_SESSIONS.labels(connection="used" if used_connection else "unused").inc()
+
+
+def record_count_mode(mode: str) -> None:
+    """
+    Count a list request by how its count and page queries ran.
+
+    Args:
+        mode: "concurrent" (count on a second connection) or "sequential"
+    """
+    DB_LIST_COUNT_QUERIES.labels(mode=mode).inc()
+
+
+def observe_checkout_wait(started: float) -> None:
+    """Record how long a pool checkout took, given its perf_counter start."""
+    DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+
+
+def is_multiprocess() -> bool:
+    """Whether prometheus_client multiprocess mode is active."""
+    return "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+
+def make_metrics_app() -> Callable[..., Any]:
+    """
+    Build the ASGI app served at /metrics.
+
+    In multiprocess mode, samples from every worker are aggregated from
+    PROMETHEUS_MULTIPROC_DIR instead of reading this process's registry.
+    """
+    if is_multiprocess():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return make_asgi_app(registry=registry)
+    return make_asgi_app()
+
+
+def mark_process_dead(pid: int | None = None) -> None:
+    """
+    Drop a worker's live gauges when it exits (multiprocess mode only).
+
+    Args:
+        pid: Worker process ID (defaults to the current process)
+    """
+    if is_multiprocess():
+        multiprocess.mark_process_dead(pid or os.getpid())
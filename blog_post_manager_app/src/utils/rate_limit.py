@@ -0,0 +1,270 @@
+"""Token-bucket rate limiting with in-memory and Redis backends.
+
+Each client key (JWT subject, else IP address) gets one bucket per route. A
+bucket holds up to `budget` tokens and refills at `budget` tokens per minute;
+each request takes one token. Checks are O(1) in both backends, and the number
+of buckets is bounded: the memory backend evicts the least recently used bucket
+past `max_keys`, and Redis buckets expire once they would be full again.
+
+The memory backend is per process, so with several workers or replicas each
+one enforces the budget separately; use the Redis backend to share buckets.
+"""
+
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+from src.config import Settings
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    """Outcome of taking a token from a bucket."""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float
+
+
+class RateLimitBackend(ABC):
+    """Bucket storage interface."""
+
+    @abstractmethod
+    async def hit(self, key: str, capacity: int, refill_per_second: float) -> RateLimitResult:
+        """
+        Take one token from a bucket.
+
+        Args:
+            key: Bucket key
+            capacity: Bucket size (burst)
+            refill_per_second: Tokens added per second
+
+        Returns:
+            RateLimitResult for this request
+        """
+
+    async def close(self) -> None:
+        """Release backend resources."""
+
+
+def _result(allowed: bool, tokens: float, capacity: int, refill_per_second: float) -> RateLimitResult:
+    retry_after = 0.0 if allowed else (1 - tokens) / refill_per_second
+    return RateLimitResult(
+        allowed=allowed, limit=capacity, remaining=int(tokens), retry_after=retry_after
+    )
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Per-process token buckets in an LRU-bounded ordered dict."""
+
+    def __init__(self, max_keys: int):
+        """
+        Initialize memory backend.
+
+        Args:
+            max_keys: Maximum number of buckets kept; least recently used are evicted
+        """
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def hit(self, key: str, capacity: int, refill_per_second: float) -> RateLimitResult:
+        """Take one token from a bucket."""
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+
+        if bucket is None:
+            tokens = float(capacity)
+            if len(self._buckets) >= self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            tokens, updated_at = bucket
+            tokens = min(float(capacity), tokens + (now - updated_at) * refill_per_second)
+            self._buckets.move_to_end(key)
+
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        self._buckets[key] = (tokens, now)
+
+        return _result(allowed, tokens, capacity, refill_per_second)
+
+
+# Atomic token bucket; Redis server time avoids clock skew between replicas.
+# The key expires once the bucket would be full again, bounding stored keys.
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1])
+if tokens == nil then
+    tokens = capacity
+else
+    tokens = math.min(capacity, tokens + (now - tonumber(bucket[2])) * rate)
+end
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate * 1000) + 1000)
+return {allowed, tostring(tokens)}
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Token buckets shared by all workers and replicas through Redis."""
+
+    def __init__(self, url: str, key_prefix: str = "ratelimit:"):
+        """
+        Initialize Redis backend.
+
+        Args:
+            url: Redis URL
+            key_prefix: Prefix for bucket keys
+
+        Raises:
+            ImportError: If the redis package is not installed
+        """
+        try:
+            import redis.asyncio as redis
+        except ImportError as exc:
+            raise ImportError(
+                "The Redis rate limit backend requires the 'redis' package "
+                "(pip install 'blog-post-manager[redis]')"
+            ) from exc
+
+        self.key_prefix = key_prefix
+        self._client = redis.from_url(url)
+        self._script = self._client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    async def hit(self, key: str, capacity: int, refill_per_second: float) -> RateLimitResult:
+        """Take one token from a bucket, allowing the request if Redis is unavailable."""
+        try:
+            allowed, tokens = await self._script(
+                keys=[self.key_prefix + key], args=[capacity, refill_per_second]
+            )
+        except Exception as exc:
+            # Fail open: an unavailable limiter must not take the API down
+            logger.warning("Rate limit backend unavailable", extra={"error": str(exc)})
+            return RateLimitResult(allowed=True, limit=capacity, remaining=capacity, retry_after=0.0)
+
+        return _result(bool(allowed), float(tokens), capacity, refill_per_second)
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        await self._client.aclose()
+
+
+class RateLimiter:
+    """Applies per-route request budgets to client keys."""
+
+    def __init__(
+        self,
+        backend: RateLimitBackend,
+        default_per_minute: int,
+        route_budgets: Dict[str, int] | None = None,
+        enabled: bool = True,
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            backend: Bucket storage
+            default_per_minute: Budget for routes without their own
+            route_budgets: Budgets keyed by "METHOD /route/template"
+            enabled: Whether limits are enforced
+        """
+        self.backend = backend
+        self.default_per_minute = default_per_minute
+        self.route_budgets = route_budgets or {}
+        self.enabled = enabled
+
+    def budget(self, route: str) -> int:
+        """Get the per-minute budget for a "METHOD /route/template" key."""
+        return self.route_budgets.get(route, self.default_per_minute)
+
+    async def check(self, client_key: str, route: str) -> RateLimitResult:
+        """
+        Take one request from a client's budget for a route.
+
+        Args:
+            client_key: Client identity (e.g. "user:42" or "ip:10.0.0.1")
+            route: "METHOD /route/template"
+
+        Returns:
+            RateLimitResult for this request
+        """
+        per_minute = self.budget(route)
+        return await self.backend.hit(f"{client_key}|{route}", per_minute, per_minute / 60)
+
+    async def close(self) -> None:
+        """Release backend resources."""
+        await self.backend.close()
+
+
+def parse_route_budgets(value: str) -> Dict[str, int]:
+    """
+    Parse route budgets from "METHOD /path=N,METHOD /path=N".
+
+    Args:
+        value: Comma-separated budgets
+
+    Returns:
+        Budgets keyed by "METHOD /path"
+
+    Raises:
+        ValueError: If an entry is malformed
+    """
+    budgets: Dict[str, int] = {}
+    for entry in value.split(","):
+        if not entry.strip():
+            continue
+        route, separator, limit = entry.rpartition("=")
+        method, _, path = route.strip().partition(" ")
+        if not separator or not method or not path.strip() or not limit.strip().isdigit():
+            raise ValueError(f"Invalid rate limit route budget: {entry!r}")
+        budgets[f"{method.upper()} {path.strip()}"] = int(limit)
+    return budgets
+
+
+def create_rate_limiter(config: Settings) -> RateLimiter:
+    """
+    Build the rate limiter described by the settings.
+
+    Args:
+        config: Application settings
+
+    Returns:
+        RateLimiter with the configured backend and budgets
+
+    Raises:
+        ValueError: If the redis backend is selected without a URL
+    """
+    if config.rate_limit_backend == "redis":
+        if not config.rate_limit_redis_url:
+            raise ValueError("rate_limit_redis_url is required for the redis rate limit backend")
+        backend: RateLimitBackend = RedisRateLimitBackend(config.rate_limit_redis_url)
+    else:
+        backend = MemoryRateLimitBackend(config.rate_limit_max_keys)
+
+    return RateLimiter(
+        backend,
+        default_per_minute=config.rate_limit_per_minute,
+        route_budgets=parse_route_budgets(config.rate_limit_routes),
+        enabled=config.rate_limit_enabled,
+    )
+
+
+def retry_after_header(result: RateLimitResult) -> str:
+    """Format a Retry-After header value (whole seconds, at least 1)."""
+    return str(max(1, math.ceil(result.retry_after)))
@@ -9,8 +9,9 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool
 
+from src.api.deps import rate_limit
 from src.config import settings
-from src.database import Base, get_db
+from src.database import Base, get_db, get_read_db
 from src.main import app
 from src.models.post import Post, PostStatus
 from src.models.tag import Tag
@@ -72,7 +73,13 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
         yield db_session
 
+    async def override_rate_limit() -> None:
+        return None
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    # Tests make many requests from one client; rate limits are tested separately
+    app.dependency_overrides[rate_limit] = override_rate_limit
 
     async with AsyncClient(app=app, base_url="http://test") as ac:
         yield ac
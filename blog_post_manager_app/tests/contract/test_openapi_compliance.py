@@ -35,6 +35,27 @@ class TestOpenAPICompliance:
         assert "version" in data
         assert "database" in data
 
+    async def test_liveness_endpoint_schema(self, client: AsyncClient):
+        """Test liveness endpoint responds without database details."""
+        response = await client.get("/health/live")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "healthy"
+        assert data["database"] is None
+
+    async def test_readiness_endpoint_schema(self, client: AsyncClient):
+        """Test readiness endpoint reports database and pool status."""
+        response = await client.get("/health/ready")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "healthy"
+        assert data["database"] == "connected"
+        assert {"size", "checked_out", "overflow", "capacity", "saturation"} <= set(
+            data["pool"]
+        )
+
     async def test_register_response_schema(self, client: AsyncClient):
         """Test registration response matches UserResponse schema."""
         response = await client.post(
@@ -174,6 +174,39 @@ class TestPostsAPI:
         assert data["status"] == "published"
         assert data["publication_date"] is not None
 
+    async def test_update_post_if_match(
+        self, client: AsyncClient, test_post: Post, auth_headers: dict
+    ):
+        """Test that If-Match applies an update once and rejects the stale retry."""
+        etag = (await client.get(f"/api/v1/posts/{test_post.id}")).headers["etag"]
+
+        first = await client.patch(
+            f"/api/v1/posts/{test_post.id}",
+            json={"title": "First editor"},
+            headers={**auth_headers, "If-Match": etag},
+        )
+        second = await client.patch(
+            f"/api/v1/posts/{test_post.id}",
+            json={"title": "Second editor"},
+            headers={**auth_headers, "If-Match": etag},
+        )
+
+        assert first.status_code == 200
+        assert first.headers["etag"] != etag
+        assert second.status_code == 412
+        assert second.headers["etag"] == first.headers["etag"]
+
+    async def test_delete_post_if_match_mismatch(
+        self, client: AsyncClient, test_post: Post, auth_headers: dict
+    ):
+        """Test that a delete with a stale If-Match is refused."""
+        response = await client.delete(
+            f"/api/v1/posts/{test_post.id}",
+            headers={**auth_headers, "If-Match": '"999"'},
+        )
+
+        assert response.status_code == 412
+
     async def test_delete_post_success(
         self, client: AsyncClient, test_post: Post, auth_headers: dict
     ):
@@ -189,6 +222,19 @@ class TestPostsAPI:
         get_response = await client.get(f"/api/v1/posts/{test_post.id}")
         assert get_response.status_code == 404
 
+    async def test_deleted_post_hidden_from_tags(
+        self, client: AsyncClient, test_post: Post, auth_headers: dict
+    ):
+        """Test that a deleted post no longer counts for or lists under its tags."""
+        tag_id = test_post.tags[0].id
+        response = await client.delete(f"/api/v1/posts/{test_post.id}", headers=auth_headers)
+        assert response.status_code == 204
+
+        tags = (await client.get("/api/v1/tags")).json()
+        assert {tag["name"]: tag["post_count"] for tag in tags}.get("python", 0) == 0
+        by_tag = (await client.get(f"/api/v1/tags/{tag_id}/posts")).json()
+        assert (by_tag["total"], by_tag["items"]) == (0, [])
+
     async def test_delete_post_unauthorized(
         self, client: AsyncClient, test_post: Post
     ):
@@ -248,3 +294,109 @@ class TestPostsAPI:
         data = response.json()
         assert data["excerpt"] == "New excerpt"
         assert data["content"] == original_content  # Unchanged
+
+    async def test_bulk_update_posts(
+        self, client: AsyncClient, multiple_posts: list[Post], auth_headers: dict
+    ):
+        """Test archiving the caller's posts by filter."""
+        response = await client.post(
+            "/api/v1/posts:bulk-update",
+            json={"filter": {"status": "published"}, "status": "archived"},
+            headers=auth_headers,
+        )
+
+        # Posts 2 and 4 are test_user's published posts
+        assert response.status_code == 200
+        assert response.json() == {"affected": 2}
+
+        response = await client.get("/api/v1/posts", params={"status_filter": "archived"})
+        assert response.json()["total"] == 2
+
+    async def test_bulk_delete_posts(
+        self, client: AsyncClient, multiple_posts: list[Post], auth_headers_user2: dict
+    ):
+        """Test deleting posts by ID list, skipping other authors' posts."""
+        ids = [post.id for post in multiple_posts[3:6]]
+
+        response = await client.post(
+            "/api/v1/posts:bulk-delete", json={"ids": ids}, headers=auth_headers_user2
+        )
+
+        # Post 4 belongs to test_user
+        assert response.status_code == 200
+        assert response.json() == {"affected": 2}
+        assert (await client.get(f"/api/v1/posts/{ids[0]}")).status_code == 200
+        assert (await client.get(f"/api/v1/posts/{ids[1]}")).status_code == 404
+
+    async def test_bulk_posts_validation(self, client: AsyncClient, auth_headers: dict):
+        """Test that a bulk request needs exactly one of ids and filter."""
+        for body in ({}, {"ids": [1], "filter": {"status": "draft"}}, {"ids": []}):
+            response = await client.post(
+                "/api/v1/posts:bulk-delete", json=body, headers=auth_headers
+            )
+            assert response.status_code == 422, body
+
+    async def test_create_post_idempotency_key(self, client: AsyncClient, auth_headers: dict):
+        """Test that a retried create replays the first response."""
+        headers = {**auth_headers, "Idempotency-Key": "retry-1"}
+        body = {"title": "Retried", "content": "Sent twice", "tags": ["python"]}
+
+        first = await client.post("/api/v1/posts", json=body, headers=headers)
+        retry = await client.post("/api/v1/posts", json=body, headers=headers)
+
+        assert first.status_code == retry.status_code == 201
+        assert retry.json() == first.json()
+        assert "Idempotent-Replayed" not in first.headers
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        listed = await client.get("/api/v1/posts", params={"status_filter": "draft"})
+        assert listed.json()["total"] == 1
+
+        reused = await client.post(
+            "/api/v1/posts", json={**body, "title": "Other"}, headers=headers
+        )
+        assert reused.status_code == 422
+
+    async def test_post_revisions(
+        self, client: AsyncClient, auth_headers: dict, auth_headers_user2: dict
+    ):
+        """Test listing, reading and restoring revisions, for the author only."""
+        created = await client.post(
+            "/api/v1/posts",
+            json={"title": "Draft", "content": "First version."},
+            headers=auth_headers,
+        )
+        post_id = created.json()["id"]
+        await client.patch(
+            f"/api/v1/posts/{post_id}",
+            json={"content": "Second version."},
+            headers=auth_headers,
+        )
+
+        listed = await client.get(f"/api/v1/posts/{post_id}/revisions", headers=auth_headers)
+        assert listed.status_code == 200
+        assert [item["revision"] for item in listed.json()["items"]] == [2, 1]
+        assert "content" not in listed.json()["items"][0]
+
+        first = await client.get(f"/api/v1/posts/{post_id}/revisions/1", headers=auth_headers)
+        assert first.status_code == 200
+        assert first.json()["content"] == "First version."
+
+        for url in (f"/api/v1/posts/{post_id}/revisions", f"/api/v1/posts/{post_id}/revisions/1"):
+            response = await client.get(url, headers=auth_headers_user2)
+            assert response.status_code == 403, url
+        missing = await client.get(f"/api/v1/posts/{post_id}/revisions/9", headers=auth_headers)
+        assert missing.status_code == 404
+
+        restored = await client.post(
+            f"/api/v1/posts/{post_id}/revisions/1:restore",
+            headers={**auth_headers, "If-Match": '"2"'},
+        )
+        assert restored.status_code == 200
+        assert restored.json()["content"] == "First version."
+        assert restored.headers["etag"] == '"3"'
+
+        stale = await client.post(
+            f"/api/v1/posts/{post_id}/revisions/2:restore",
+            headers={**auth_headers, "If-Match": '"2"'},
+        )
+        assert stale.status_code == 412
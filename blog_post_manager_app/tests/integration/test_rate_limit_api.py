@@ -0,0 +1,63 @@
+"""Integration tests for API rate limiting."""
+
+import pytest
+from httpx import AsyncClient
+
+from src.api import deps
+from src.main import app
+from src.utils.rate_limit import MemoryRateLimitBackend, RateLimiter
+
+
+@pytest.fixture
+def rate_limited(client: AsyncClient, monkeypatch) -> RateLimiter:
+    """Enable a fresh rate limiter with small budgets for one test."""
+    limiter = RateLimiter(
+        MemoryRateLimitBackend(max_keys=100),
+        default_per_minute=2,
+        route_budgets={"GET /api/v1/tags": 3},
+    )
+    monkeypatch.setattr(deps, "rate_limiter", limiter)
+    app.dependency_overrides.pop(deps.rate_limit, None)
+    return limiter
+
+
+@pytest.mark.asyncio
+class TestRateLimitAPI:
+    """Test cases for rate-limited API routes."""
+
+    async def test_route_budget_exceeded(self, client: AsyncClient, rate_limited):
+        """Test that requests over the route budget get 429 with Retry-After."""
+        statuses = [(await client.get("/api/v1/tags")).status_code for _ in range(3)]
+        response = await client.get("/api/v1/tags")
+
+        assert statuses == [200, 200, 200]
+        assert response.status_code == 429
+        assert int(response.headers["retry-after"]) >= 1
+        assert response.headers["x-ratelimit-limit"] == "3"
+
+    async def test_remaining_budget_header(self, client: AsyncClient, rate_limited):
+        """Test that successful responses report the remaining budget."""
+        response = await client.get("/api/v1/posts")
+
+        assert response.status_code == 200
+        assert response.headers["x-ratelimit-limit"] == "2"
+        assert response.headers["x-ratelimit-remaining"] == "1"
+
+    async def test_authenticated_users_have_own_budget(
+        self, client: AsyncClient, rate_limited, auth_headers: dict
+    ):
+        """Test that JWT-authenticated requests are keyed by user, not IP."""
+        for _ in range(2):
+            await client.get("/api/v1/posts")
+
+        anonymous = await client.get("/api/v1/posts")
+        authenticated = await client.get("/api/v1/posts", headers=auth_headers)
+
+        assert anonymous.status_code == 429
+        assert authenticated.status_code == 200
+
+    async def test_health_is_not_rate_limited(self, client: AsyncClient, rate_limited):
+        """Test that probes are never throttled."""
+        statuses = {(await client.get("/health/live")).status_code for _ in range(5)}
+
+        assert statuses == {200}
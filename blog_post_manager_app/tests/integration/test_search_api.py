@@ -2,9 +2,12 @@
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
 from src.models.post import Post
 from src.models.tag import Tag
+from src.services.post_cards import refresh_post_cards
 
 
 @pytest.mark.asyncio
@@ -168,6 +171,38 @@ class TestTagsAPI:
         assert len(data["items"]) <= 5
         assert data["page"] == 1
 
+    async def test_get_posts_by_tag_json_strategy_matches_core(
+        self, client: AsyncClient, test_post: Post, monkeypatch
+    ):
+        """Test that the PostgreSQL-rendered page equals the Core path's page."""
+        tag_id = test_post.tags[0].id
+        monkeypatch.setattr(settings, "post_list_strategy", "core")
+        expected = (await client.get(f"/api/v1/tags/{tag_id}/posts")).json()
+
+        monkeypatch.setattr(settings, "post_list_strategy", "json")
+        response = await client.get(f"/api/v1/tags/{tag_id}/posts")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == expected
+
+    async def test_get_posts_by_tag_cards_strategy_matches_core(
+        self, client: AsyncClient, db_session: AsyncSession, test_post: Post, monkeypatch
+    ):
+        """Test that the page concatenated from post cards equals the Core path's page."""
+        await refresh_post_cards(db_session, [test_post.id])
+        await db_session.commit()
+        tag_id = test_post.tags[0].id
+        monkeypatch.setattr(settings, "post_list_strategy", "core")
+        expected = (await client.get(f"/api/v1/tags/{tag_id}/posts")).json()
+
+        monkeypatch.setattr(settings, "post_list_strategy", "cards")
+        response = await client.get(f"/api/v1/tags/{tag_id}/posts")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == expected
+
     async def test_get_posts_by_nonexistent_tag(self, client: AsyncClient):
         """Test getting posts by non-existent tag."""
         response = await client.get("/api/v1/tags/99999/posts")
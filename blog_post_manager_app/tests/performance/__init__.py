@@ -0,0 +1 @@
+"""Performance and query-plan regression tests."""
@@ -0,0 +1,166 @@
+"""Helpers for in-process endpoint latency benchmarks."""
+
+import asyncio
+import json
+import platform
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+from httpx import AsyncClient, Response
+
+# Issues request number `i` and returns the response
+RequestFactory = Callable[[AsyncClient, int], Awaitable[Response]]
+
+
+@dataclass
+class LatencyResult:
+    """Latency and throughput for one route at one concurrency level."""
+
+    route: str
+    concurrency: int
+    requests: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    throughput_rps: float
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    """
+    Compute p50/p95/p99 of latency samples.
+
+    Args:
+        samples: Latencies in seconds
+
+    Returns:
+        Dict with p50_ms, p95_ms and p99_ms
+    """
+    if len(samples) < 2:
+        value = samples[0] * 1000 if samples else 0.0
+        return {"p50_ms": value, "p95_ms": value, "p99_ms": value}
+
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50_ms": cuts[49] * 1000,
+        "p95_ms": cuts[94] * 1000,
+        "p99_ms": cuts[98] * 1000,
+    }
+
+
+async def run_load(
+    client: AsyncClient,
+    route: str,
+    make_request: RequestFactory,
+    concurrency: int,
+    total_requests: int,
+    expected_status: int,
+) -> LatencyResult:
+    """
+    Issue `total_requests` requests with `concurrency` requests in flight.
+
+    Args:
+        client: Client bound to the ASGI app
+        route: Route label used in the results (method + path template)
+        make_request: Factory issuing request number i
+        concurrency: Number of concurrent workers
+        total_requests: Total requests across all workers
+        expected_status: Status code counted as success
+
+    Returns:
+        LatencyResult for this route and concurrency level
+    """
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(total_requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for i in counter:
+            started = time.perf_counter()
+            response = await make_request(client, i)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != expected_status:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return LatencyResult(
+        route=route,
+        concurrency=concurrency,
+        requests=total_requests,
+        errors=errors,
+        throughput_rps=total_requests / elapsed if elapsed else 0.0,
+        **percentiles(latencies),
+    )
+
+
+def run_metadata(**extra: Any) -> Dict[str, Any]:
+    """
+    Describe a benchmark run: when it was recorded and on what.
+
+    Args:
+        **extra: Benchmark-specific fields to record alongside
+
+    Returns:
+        Metadata dict for write_results
+    """
+    return {
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        **extra,
+    }
+
+
+def write_results(path: Path, results: List[Any], metadata: Dict[str, Any]) -> None:
+    """Write benchmark results (dataclass instances, e.g. LatencyResult) as JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"metadata": metadata, "results": [asdict(result) for result in results]}
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+
+
+def load_results(path: Path) -> Dict[tuple, Dict[str, Any]]:
+    """Load a results file keyed by (route, concurrency)."""
+    payload = json.loads(path.read_text())
+    return {(item["route"], item["concurrency"]): item for item in payload["results"]}
+
+
+def compare_to_baseline(
+    results: List[LatencyResult], baseline: Dict[tuple, Dict[str, Any]], tolerance: float
+) -> List[str]:
+    """
+    Compare results with a stored baseline.
+
+    A result regresses when its p95 latency grows, or its throughput drops, by
+    more than `tolerance` (a fraction, e.g. 0.25 for 25%). Routes missing from
+    the baseline are ignored.
+
+    Returns:
+        Human-readable descriptions of every regression
+    """
+    regressions = []
+
+    for result in results:
+        reference = baseline.get((result.route, result.concurrency))
+        if reference is None:
+            continue
+
+        label = f"{result.route} @ c={result.concurrency}"
+        if result.p95_ms > reference["p95_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{label}: p95 {result.p95_ms:.1f}ms vs baseline {reference['p95_ms']:.1f}ms"
+            )
+        if result.throughput_rps < reference["throughput_rps"] * (1 - tolerance):
+            regressions.append(
+                f"{label}: {result.throughput_rps:.0f} rps vs baseline "
+                f"{reference['throughput_rps']:.0f} rps"
+            )
+
+    return regressions
@@ -0,0 +1,182 @@
+"""Fixtures for performance tests: a representative, planner-ready dataset."""
+
+from typing import AsyncGenerator
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api import deps
+from src.config import Settings, settings
+from src.database import Base, engine
+from src.main import app
+from src.models.post import Post
+from src.services.post_cards import post_cards_upsert
+from src.utils.rate_limit import MemoryRateLimitBackend, RateLimiter
+from tests.conftest import TestSessionLocal, test_engine
+
+# Dataset shape. Most rows are archived or draft so that the published subset is
+# selective, the way it is in a long-lived production database.
+SEED_USERS = 200
+SEED_TAGS = 100
+SEED_POSTS = 20_000
+
+# A word that appears in roughly 1% of posts, used for selective search plans
+RARE_SEARCH_TERM = "kubernetes"
+
+# Password of the author registered by bench_auth
+BENCH_PASSWORD = "BenchPass123"
+
+# A mid-popularity tag (tag popularity is skewed towards low numbers)
+SAMPLE_TAG_NAME = "tag-40"
+
+SEED_STATEMENTS = [
+    "SELECT setseed(0.42)",
+    f"""
+    INSERT INTO users (email, username, hashed_password, full_name, is_active)
+    SELECT 'user' || i || '@example.com', 'user' || i, 'not-a-real-hash',
+           'Seed User ' || i, i % 50 <> 0
+    FROM generate_series(1, {SEED_USERS}) AS i
+    """,
+    f"""
+    INSERT INTO tags (name)
+    SELECT 'tag-' || i FROM generate_series(1, {SEED_TAGS}) AS i
+    """,
+    f"""
+    INSERT INTO posts (
+        author_id, title, excerpt, status,
+        publication_date, created_at, updated_at
+    )
+    SELECT
+        s.author_id, s.title, s.excerpt, s.status,
+        CASE WHEN s.status <> 'draft' THEN s.created_at + interval '1 hour' END,
+        s.created_at, s.created_at
+    FROM (
+        SELECT
+            1 + (i % {SEED_USERS}) AS author_id,
+            'Seed post ' || i AS title,
+            'Excerpt ' || i AS excerpt,
+            CASE
+                WHEN r < 0.20 THEN 'published'
+                WHEN r < 0.90 THEN 'archived'
+                ELSE 'draft'
+            END::poststatus AS status,
+            now() - (random() * interval '1095 days') AS created_at
+        FROM (
+            SELECT i, random() AS r FROM generate_series(1, {SEED_POSTS}) AS i
+        ) AS g
+    ) AS s
+    """,
+    # Bodies after their posts, whose titles and excerpts the search vector
+    # trigger reads; the schema is fresh, so post IDs run from 1 like i above
+    f"""
+    INSERT INTO post_bodies (post_id, content)
+    SELECT
+        id,
+        'Seed content for post ' || id || ' about ' ||
+            (ARRAY['python', 'fastapi', 'postgres', 'testing', 'async'])[1 + id % 5] ||
+            CASE WHEN id % 97 = 0 THEN ' {RARE_SEARCH_TERM}' ELSE '' END ||
+            repeat(' lorem ipsum dolor sit amet', 10 + (id % 40))
+    FROM posts
+    """,
+    f"""
+    INSERT INTO post_tags (post_id, tag_id)
+    SELECT p.id, 1 + floor({SEED_TAGS} * power(random(), 3))::int
+    FROM posts AS p, generate_series(1, 3) AS n
+    ON CONFLICT DO NOTHING
+    """,
+]
+
+
+@pytest.fixture(scope="module")
+async def seeded_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Create the schema, seed a representative dataset and refresh statistics.
+
+    The dataset is shared by every test in a module and dropped afterwards.
+    """
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        for statement in SEED_STATEMENTS:
+            await conn.exec_driver_sql(statement)
+        await conn.execute(post_cards_upsert(select(Post.id)))
+
+    # VACUUM cannot run inside a transaction block
+    async with test_engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.exec_driver_sql("VACUUM ANALYZE")
+
+    async with TestSessionLocal() as session:
+        yield session
+
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+
+@pytest.fixture(scope="module")
+async def sample_tag_id(seeded_session: AsyncSession) -> int:
+    """ID of a mid-popularity tag from the seeded dataset."""
+    result = await seeded_session.execute(
+        text("SELECT id FROM tags WHERE name = :name"), {"name": SAMPLE_TAG_NAME}
+    )
+    return result.scalar_one()
+
+
+@pytest.fixture(scope="module")
+async def bench_client(seeded_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+    """
+    Client bound to the real app and its real connection pool.
+
+    Benchmarks may switch settings and dependency overrides between runs;
+    both are restored afterwards.
+    """
+    # SQL echo in development mode would dominate every measurement
+    engine.sync_engine.echo = False
+
+    # Keep the limiter on the request path, with a budget no run can exhaust
+    configured_limiter = deps.rate_limiter
+    configured_settings = settings.model_copy()
+    configured_overrides = dict(app.dependency_overrides)
+    deps.rate_limiter = RateLimiter(
+        MemoryRateLimitBackend(max_keys=10_000), default_per_minute=10**9
+    )
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        yield client
+
+    deps.rate_limiter = configured_limiter
+    for field in Settings.model_fields:
+        setattr(settings, field, getattr(configured_settings, field))
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(configured_overrides)
+    await engine.dispose()
+
+
+@pytest.fixture(scope="module")
+async def bench_auth(bench_client: AsyncClient) -> dict:
+    """Register a benchmark author and return its tokens and user ID."""
+    response = await bench_client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "bench@example.com",
+            "username": "bench",
+            "password": BENCH_PASSWORD,
+            "full_name": "Benchmark Author",
+        },
+    )
+    assert response.status_code == 201
+    user_id = response.json()["id"]
+
+    response = await bench_client.post(
+        "/api/v1/auth/login", json={"email": "bench@example.com", "password": BENCH_PASSWORD}
+    )
+    assert response.status_code == 200
+    tokens = response.json()
+
+    return {
+        "user_id": user_id,
+        "headers": {"Authorization": f"Bearer {tokens['access_token']}"},
+        "refresh_headers": {"Authorization": f"Bearer {tokens['refresh_token']}"},
+    }
@@ -0,0 +1,128 @@
+"""Helpers for capturing and inspecting PostgreSQL query plans."""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+
+@dataclass
+class PlanSummary:
+    """Condensed view of an `EXPLAIN (FORMAT JSON)` result."""
+
+    statement: str
+    total_cost: float
+    seq_scans: set[str] = field(default_factory=set)
+    indexes: set[str] = field(default_factory=set)
+    raw: Dict[str, Any] = field(default_factory=dict)
+
+
+class StatementRecorder:
+    """
+    Record every statement an engine sends to the database.
+
+    Example:
+        ```python
+        with StatementRecorder(engine) as recorder:
+            await PostService(session).list_posts()
+        plans = await explain_all(session, recorder.statements)
+        ```
+    """
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self.statements: List[Tuple[str, Any]] = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        self.statements.append((statement, parameters))
+
+    def __enter__(self) -> "StatementRecorder":
+        event.listen(self.engine.sync_engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        event.remove(self.engine.sync_engine, "before_cursor_execute", self._record)
+
+
+def iter_plan_nodes(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Yield a plan node and all of its descendants."""
+    yield node
+    for child in node.get("Plans", []):
+        yield from iter_plan_nodes(child)
+
+
+def summarize_plan(
+    statement: str, explain_output: Any, index_roots: Dict[str, str] | None = None
+) -> PlanSummary:
+    """
+    Build a PlanSummary from raw EXPLAIN JSON output.
+
+    Seq scans are reported on the relation scanned, partitions included, so a
+    scan of one month of posts can be told from a scan of all of them; index
+    scans are reported on the partitioned index they belong to.
+
+    Args:
+        statement: SQL statement that was explained
+        explain_output: Value of the single EXPLAIN result row (str or parsed JSON)
+        index_roots: Partition index names mapped to their partitioned index
+
+    Returns:
+        PlanSummary with sequentially scanned relations and used indexes
+    """
+    if isinstance(explain_output, str):
+        explain_output = json.loads(explain_output)
+    index_roots = index_roots or {}
+
+    root = explain_output[0]["Plan"]
+    summary = PlanSummary(statement=statement, total_cost=root["Total Cost"], raw=root)
+
+    for node in iter_plan_nodes(root):
+        if node["Node Type"] == "Seq Scan":
+            summary.seq_scans.add(node["Relation Name"])
+        if "Index Name" in node:
+            summary.indexes.add(index_roots.get(node["Index Name"], node["Index Name"]))
+
+    return summary
+
+
+async def index_roots(session: AsyncSession) -> Dict[str, str]:
+    """Map the indexes of partitions to the partitioned index they belong to."""
+    conn = await session.connection()
+    result = await conn.exec_driver_sql(
+        "SELECT relname, pg_partition_root(oid)::regclass::text "
+        "FROM pg_class WHERE relispartition AND relkind = 'i'"
+    )
+    return dict(result.all())
+
+
+async def explain_all(
+    session: AsyncSession, statements: List[Tuple[str, Any]]
+) -> List[PlanSummary]:
+    """
+    Run `EXPLAIN (FORMAT JSON)` for each recorded statement.
+
+    Statements are re-sent with their original driver-level parameters so the
+    planner sees exactly what the application sent.
+
+    Args:
+        session: Session connected to the seeded database
+        statements: (statement, parameters) pairs from a StatementRecorder
+
+    Returns:
+        List of PlanSummary objects, one per statement
+    """
+    roots = await index_roots(session)
+    conn = await session.connection()
+    summaries = []
+
+    for statement, parameters in statements:
+        if not statement.lstrip().upper().startswith("SELECT"):
+            continue
+        result = await conn.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement}", tuple(parameters or ())
+        )
+        summaries.append(summarize_plan(statement, result.scalar_one(), roots))
+
+    return summaries
@@ -0,0 +1,177 @@
+"""Bulk write throughput: bulk endpoints vs. one request per post.
+
+Gives the benchmark author BULK_POSTS posts (100k by default) on top of the
+seeded dataset, then times archiving, publishing and deleting all of them
+through `POST /api/v1/posts:bulk-update` and `:bulk-delete`, and compares the
+posts per second with archiving a sample through `PATCH /api/v1/posts/{id}`.
+
+Opt-in like the other benchmarks:
+
+    RUN_BENCHMARKS=1 ENVIRONMENT=production pytest tests/performance/test_bulk_writes.py
+
+Environment variables:
+    BULK_POSTS: posts written by each bulk operation (default 100000)
+    BULK_PATCH_SAMPLE: posts archived one PATCH at a time (default 500)
+
+Results are written to `tests/performance/results/bulk_writes.json`.
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.models.post import Post
+from src.services.post_cards import post_cards_upsert
+from tests.performance.benchmark import run_metadata, write_results
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1", reason="set RUN_BENCHMARKS=1 to run benchmarks"
+)
+
+RESULTS_PATH = Path(__file__).parent / "results" / "bulk_writes.json"
+
+BULK_POSTS = int(os.getenv("BULK_POSTS", "100000"))
+PATCH_SAMPLE = int(os.getenv("BULK_PATCH_SAMPLE", "500"))
+
+
+@dataclass
+class BulkResult:
+    """Throughput of one bulk operation."""
+
+    operation: str
+    posts: int
+    seconds: float
+    posts_per_second: float
+
+
+async def _insert_bulk_posts(session: AsyncSession, author_id: int) -> None:
+    """Give the author BULK_POSTS published posts, tagged and with cards, over three years."""
+    await session.execute(
+        text(
+            """
+            INSERT INTO posts (author_id, title, status, publication_date, created_at)
+            SELECT :author_id, 'Bulk post ' || i, 'published', t, t
+            FROM (
+                SELECT i, now() - (i * interval '1095 days') / :count AS t
+                FROM generate_series(1, :count) AS i
+            ) AS g
+            """
+        ),
+        {"author_id": author_id, "count": BULK_POSTS},
+    )
+    await session.execute(
+        text(
+            """
+            INSERT INTO post_bodies (post_id, content)
+            SELECT id, 'Bulk content ' || id || repeat(' lorem ipsum dolor sit amet', 20)
+            FROM posts WHERE author_id = :author_id
+            ON CONFLICT DO NOTHING
+            """
+        ),
+        {"author_id": author_id},
+    )
+    await session.execute(
+        text(
+            """
+            INSERT INTO post_tags (post_id, tag_id)
+            SELECT p.id, 1 + (p.id + n * 7) % 100
+            FROM posts AS p, generate_series(1, 3) AS n
+            WHERE p.author_id = :author_id
+            """
+        ),
+        {"author_id": author_id},
+    )
+    await session.execute(
+        post_cards_upsert(select(Post.id).where(Post.author_id == author_id))
+    )
+    await session.commit()
+    await session.execute(text("ANALYZE posts"))
+    await session.execute(text("ANALYZE post_tags"))
+    await session.commit()
+
+
+async def _timed_bulk(
+    client: AsyncClient, operation: str, path: str, body: dict, headers: dict
+) -> BulkResult:
+    """Run one bulk request and measure its throughput."""
+    started = time.perf_counter()
+    response = await client.post(path, json=body, headers=headers)
+    elapsed = time.perf_counter() - started
+
+    assert response.status_code == 200, response.text
+    posts = response.json()["affected"]
+    return BulkResult(operation, posts, elapsed, posts / elapsed)
+
+
+@pytest.mark.asyncio
+async def test_bulk_write_throughput(
+    bench_client: AsyncClient, bench_auth: dict, seeded_session: AsyncSession
+):
+    """Bulk endpoints write all posts, far faster than one PATCH per post."""
+    headers = bench_auth["headers"]
+    await _insert_bulk_posts(seeded_session, bench_auth["user_id"])
+    ids = (
+        await seeded_session.scalars(
+            select(Post.id)
+            .where(Post.author_id == bench_auth["user_id"])
+            .order_by(Post.id)
+            .limit(PATCH_SAMPLE)
+        )
+    ).all()
+
+    # Baseline: one request (and round of statements) per post
+    started = time.perf_counter()
+    for post_id in ids:
+        response = await bench_client.patch(
+            f"/api/v1/posts/{post_id}", json={"status": "archived"}, headers=headers
+        )
+        assert response.status_code == 200
+    elapsed = time.perf_counter() - started
+    results = [BulkResult("PATCH /api/v1/posts/{id}", len(ids), elapsed, len(ids) / elapsed)]
+
+    results.append(
+        await _timed_bulk(
+            bench_client,
+            "bulk-update by filter (published -> archived)",
+            "/api/v1/posts:bulk-update",
+            {"filter": {"status": "published"}, "status": "archived"},
+            headers,
+        )
+    )
+    results.append(
+        await _timed_bulk(
+            bench_client,
+            "bulk-update by filter (archived -> published)",
+            "/api/v1/posts:bulk-update",
+            {"filter": {"status": "archived"}, "status": "published"},
+            headers,
+        )
+    )
+    results.append(
+        await _timed_bulk(
+            bench_client,
+            "bulk-delete by filter",
+            "/api/v1/posts:bulk-delete",
+            {"filter": {"author_id": bench_auth["user_id"]}},
+            headers,
+        )
+    )
+
+    write_results(
+        RESULTS_PATH,
+        results,
+        run_metadata(bulk_posts=BULK_POSTS, chunk_size=settings.post_bulk_chunk_size),
+    )
+
+    patch, archive, publish, delete = results
+    assert archive.posts == BULK_POSTS - len(ids)
+    assert publish.posts == delete.posts == BULK_POSTS
+    for bulk in (archive, publish, delete):
+        assert bulk.posts_per_second > 10 * patch.posts_per_second, bulk
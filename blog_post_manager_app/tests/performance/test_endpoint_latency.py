@@ -0,0 +1,210 @@
+"""Endpoint latency benchmarks over the in-process ASGI app.
+
+Runs `src.main:app` through httpx's ASGI transport against the seeded
+database and measures p50/p95/p99 latency and throughput for every route under
+`/api/v1` at several concurrency levels.
+
+Benchmarks are opt-in because they take minutes:
+
+    RUN_BENCHMARKS=1 ENVIRONMENT=production pytest tests/performance/test_endpoint_latency.py
+
+Environment variables:
+    BENCHMARK_REQUESTS: requests per route and concurrency level (default 200)
+    BENCHMARK_CONCURRENCY: comma-separated concurrency levels (default 1,8,32)
+    BENCHMARK_TOLERANCE: allowed regression vs. baseline as a fraction (default 0.25)
+    BENCHMARK_UPDATE_BASELINE: set to 1 to store this run as the new baseline
+
+Results are written to `tests/performance/results/endpoint_latency.json`. The
+baseline lives in `tests/performance/baselines/endpoint_latency.json`; record
+it on the machine that runs the comparison, since numbers are hardware-bound.
+"""
+
+import itertools
+import os
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.performance.benchmark import (
+    compare_to_baseline,
+    load_results,
+    run_load,
+    run_metadata,
+    write_results,
+)
+from tests.performance.conftest import BENCH_PASSWORD, RARE_SEARCH_TERM
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1", reason="set RUN_BENCHMARKS=1 to run benchmarks"
+)
+
+PERFORMANCE_DIR = Path(__file__).parent
+RESULTS_PATH = PERFORMANCE_DIR / "results" / "endpoint_latency.json"
+BASELINE_PATH = PERFORMANCE_DIR / "baselines" / "endpoint_latency.json"
+
+REQUESTS_PER_LEVEL = int(os.getenv("BENCHMARK_REQUESTS", "200"))
+CONCURRENCY_LEVELS = [int(c) for c in os.getenv("BENCHMARK_CONCURRENCY", "1,8,32").split(",")]
+TOLERANCE = float(os.getenv("BENCHMARK_TOLERANCE", "0.25"))
+
+SEARCH_TERMS = ["python", "fastapi", "postgres", RARE_SEARCH_TERM]
+
+
+async def _insert_owned_posts(session: AsyncSession, author_id: int, count: int) -> list[int]:
+    """Insert `count` draft posts owned by the benchmark author."""
+    result = await session.execute(
+        text(
+            """
+            INSERT INTO posts (author_id, title, status)
+            SELECT :author_id, 'Bench post ' || i, 'draft'
+            FROM generate_series(1, :count) AS i
+            RETURNING id
+            """
+        ),
+        {"author_id": author_id, "count": count},
+    )
+    ids = list(result.scalars().all())
+    await session.execute(
+        text(
+            """
+            INSERT INTO post_bodies (post_id, content)
+            SELECT id, 'Bench content ' || id FROM unnest(CAST(:ids AS integer[])) AS id
+            """
+        ),
+        {"ids": ids},
+    )
+    await session.commit()
+    return ids
+
+
+async def _register(client: AsyncClient, n: int):
+    return await client.post(
+        "/api/v1/auth/register",
+        json={"email": f"bench{n}@example.com", "username": f"bench{n}", "password": BENCH_PASSWORD},
+    )
+
+
+@pytest.mark.asyncio
+async def test_endpoint_latency(
+    bench_client: AsyncClient,
+    bench_auth: dict,
+    seeded_session: AsyncSession,
+    sample_tag_id: int,
+):
+    """Every /api/v1 route stays within tolerance of the stored baseline."""
+    headers = bench_auth["headers"]
+    unique = itertools.count()
+
+    published = await seeded_session.execute(
+        text("SELECT id FROM posts WHERE status = 'published' ORDER BY id LIMIT 100")
+    )
+    published_ids = list(published.scalars().all())
+    owned_ids = await _insert_owned_posts(seeded_session, bench_auth["user_id"], 50)
+
+    read_routes = [
+        ("GET /api/v1/posts", 200, lambda c, i: c.get("/api/v1/posts", params={"page": 1 + i % 5})),
+        (
+            "GET /api/v1/posts/{post_id}",
+            200,
+            lambda c, i: c.get(f"/api/v1/posts/{published_ids[i % len(published_ids)]}"),
+        ),
+        (
+            "GET /api/v1/search/posts",
+            200,
+            lambda c, i: c.get(
+                "/api/v1/search/posts", params={"q": SEARCH_TERMS[i % len(SEARCH_TERMS)]}
+            ),
+        ),
+        ("GET /api/v1/search/tags/popular", 200, lambda c, i: c.get("/api/v1/search/tags/popular")),
+        ("GET /api/v1/tags", 200, lambda c, i: c.get("/api/v1/tags")),
+        (
+            "GET /api/v1/tags/{tag_id}/posts",
+            200,
+            lambda c, i: c.get(f"/api/v1/tags/{sample_tag_id}/posts"),
+        ),
+    ]
+
+    write_routes = [
+        ("POST /api/v1/auth/register", 201, lambda c, i: _register(c, next(unique))),
+        (
+            "POST /api/v1/auth/login",
+            200,
+            lambda c, i: c.post(
+                "/api/v1/auth/login",
+                json={"email": "bench@example.com", "password": BENCH_PASSWORD},
+            ),
+        ),
+        (
+            "POST /api/v1/auth/refresh",
+            200,
+            lambda c, i: c.post(
+                "/api/v1/auth/refresh",
+                json={"refresh_token": "unused"},
+                headers=bench_auth["refresh_headers"],
+            ),
+        ),
+        (
+            "POST /api/v1/posts",
+            201,
+            lambda c, i: c.post(
+                "/api/v1/posts",
+                json={"title": f"Bench {i}", "content": "Bench content", "tags": ["bench"]},
+                headers=headers,
+            ),
+        ),
+        (
+            "PATCH /api/v1/posts/{post_id}",
+            200,
+            lambda c, i: c.patch(
+                f"/api/v1/posts/{owned_ids[i % len(owned_ids)]}",
+                json={"title": f"Bench edit {i}"},
+                headers=headers,
+            ),
+        ),
+    ]
+
+    results = []
+    for concurrency in CONCURRENCY_LEVELS:
+        for route, expected_status, factory in read_routes + write_routes:
+            results.append(
+                await run_load(
+                    bench_client, route, factory, concurrency, REQUESTS_PER_LEVEL, expected_status
+                )
+            )
+
+        # Each delete needs its own post; create them outside the measured window
+        doomed = await _insert_owned_posts(
+            seeded_session, bench_auth["user_id"], REQUESTS_PER_LEVEL
+        )
+        results.append(
+            await run_load(
+                bench_client,
+                "DELETE /api/v1/posts/{post_id}",
+                lambda c, i, ids=doomed: c.delete(f"/api/v1/posts/{ids[i]}", headers=headers),
+                concurrency,
+                REQUESTS_PER_LEVEL,
+                204,
+            )
+        )
+
+    metadata = run_metadata(
+        requests_per_level=REQUESTS_PER_LEVEL,
+    )
+    write_results(RESULTS_PATH, results, metadata)
+
+    failed = [r for r in results if r.errors]
+    assert not failed, "Requests failed: " + ", ".join(
+        f"{r.route} @ c={r.concurrency} ({r.errors} errors)" for r in failed
+    )
+
+    if os.getenv("BENCHMARK_UPDATE_BASELINE") == "1":
+        write_results(BASELINE_PATH, results, metadata)
+        return
+
+    if not BASELINE_PATH.exists():
+        pytest.skip(f"No baseline at {BASELINE_PATH}; rerun with BENCHMARK_UPDATE_BASELINE=1")
+
+    regressions = compare_to_baseline(results, load_results(BASELINE_PATH), TOLERANCE)
+    assert not regressions, "Latency regressions:\n" + "\n".join(regressions)
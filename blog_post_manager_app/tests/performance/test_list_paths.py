@@ -0,0 +1,110 @@
+"""CPU cost of list pages: ORM entities vs. Core rows vs. PostgreSQL-built JSON.
+
+Fetches 100-item pages from the list endpoints through the in-process ASGI app
+with each `post_list_strategy` and records the Python CPU time per page
+(`time.process_time`, so database time is excluded) alongside wall time. The
+"json" and "cards" strategies are measured only on routes that render JSON in
+PostgreSQL. Cards move work out of the database rather than out of Python, so
+they are compared with "json" on wall time instead of CPU time.
+
+Opt-in like the other benchmarks:
+
+    RUN_BENCHMARKS=1 ENVIRONMENT=production pytest tests/performance/test_list_paths.py
+
+Results are written to `tests/performance/results/list_paths.json`.
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient
+
+from src.config import settings
+from tests.performance.benchmark import run_metadata, write_results
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1", reason="set RUN_BENCHMARKS=1 to run benchmarks"
+)
+
+RESULTS_PATH = Path(__file__).parent / "results" / "list_paths.json"
+
+PAGES = int(os.getenv("BENCHMARK_PAGES", "50"))
+PAGE_SIZE = 100
+
+
+@dataclass
+class PageCost:
+    """Python CPU and wall time per list page for one route and strategy."""
+
+    route: str
+    cpu_ms_per_page: float
+    wall_ms_per_page: float
+
+
+@pytest.mark.asyncio
+async def test_list_page_cpu_per_strategy(bench_client: AsyncClient, sample_tag_id: int):
+    """Each strategy spends less CPU per 100-item page than the one it replaces."""
+    routes = {
+        "GET /api/v1/posts": ("/api/v1/posts", {}, ("orm", "core", "json", "cards")),
+        "GET /api/v1/search/posts": ("/api/v1/search/posts", {"q": "python"}, ("orm", "core")),
+        "GET /api/v1/tags/{tag_id}/posts": (
+            f"/api/v1/tags/{sample_tag_id}/posts",
+            {},
+            ("orm", "core", "json", "cards"),
+        ),
+    }
+
+    results = {}
+    for route, (path, params, strategies) in routes.items():
+        bodies = {}
+        for strategy in strategies:
+            settings.post_list_strategy = strategy
+
+            # Warm the statement caches outside the measured window
+            response = await bench_client.get(path, params={**params, "page_size": PAGE_SIZE})
+            assert response.status_code == 200
+            bodies[strategy] = response.json()
+
+            cpu_started = time.process_time()
+            wall_started = time.perf_counter()
+            for page in range(PAGES):
+                response = await bench_client.get(
+                    path, params={**params, "page": 1 + page % 5, "page_size": PAGE_SIZE}
+                )
+                assert response.status_code == 200
+            label = f"{route} [{strategy}]"
+            results[label] = PageCost(
+                route=label,
+                cpu_ms_per_page=(time.process_time() - cpu_started) * 1000 / PAGES,
+                wall_ms_per_page=(time.perf_counter() - wall_started) * 1000 / PAGES,
+            )
+
+        for strategy in strategies[1:]:
+            assert bodies[strategy]["total"] == bodies["orm"]["total"]
+            assert [item["id"] for item in bodies[strategy]["items"]] == [
+                item["id"] for item in bodies["orm"]["items"]
+            ]
+
+    write_results(
+        RESULTS_PATH,
+        list(results.values()),
+        run_metadata(pages=PAGES, page_size=PAGE_SIZE),
+    )
+
+    for route, (_, _, strategies) in routes.items():
+        cpu_bound = [strategy for strategy in strategies if strategy != "cards"]
+        for slower, faster in zip(cpu_bound, cpu_bound[1:]):
+            before = results[f"{route} [{slower}]"].cpu_ms_per_page
+            after = results[f"{route} [{faster}]"].cpu_ms_per_page
+            assert after < before, (
+                f"{route}: {faster} {after:.2f}ms vs {slower} {before:.2f}ms CPU per page"
+            )
+        if "cards" in strategies:
+            before = results[f"{route} [json]"].wall_ms_per_page
+            after = results[f"{route} [cards]"].wall_ms_per_page
+            assert after < before, (
+                f"{route}: cards {after:.2f}ms vs json {before:.2f}ms wall time per page"
+            )
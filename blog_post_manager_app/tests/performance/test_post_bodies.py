@@ -0,0 +1,187 @@
+"""List and tag pages on narrow posts vs. posts carrying their bodies.
+
+Post content and search vectors live in `post_bodies`, so the list and tag
+queries only read post metadata. This benchmark times 100-item pages of
+`GET /api/v1/posts` and `GET /api/v1/tags/{tag_id}/posts` with the `orm` and
+`core` list strategies, then rebuilds the pre-split layout as `posts_wide`
+(posts with their content and search vector inline, same hot index) and
+compares the shared buffers the same list, tag and count queries touch on
+it and on `posts_narrow`, an unpartitioned copy of posts (so partitioning
+does not weigh on the comparison), with `EXPLAIN (ANALYZE, BUFFERS)`.
+
+Opt-in like the other benchmarks:
+
+    RUN_BENCHMARKS=1 ENVIRONMENT=production pytest tests/performance/test_post_bodies.py
+
+Results are written to `tests/performance/results/post_bodies.json`.
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from tests.conftest import test_engine
+from tests.performance.benchmark import run_metadata, write_results
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1", reason="set RUN_BENCHMARKS=1 to run benchmarks"
+)
+
+RESULTS_PATH = Path(__file__).parent / "results" / "post_bodies.json"
+
+PAGES = int(os.getenv("BENCHMARK_PAGES", "50"))
+PAGE_SIZE = 100
+
+# The pre-split layout, posts with their bodies inline, and the split one;
+# both unpartitioned
+LAYOUT_DDL = [
+    "DROP TABLE IF EXISTS posts_narrow, posts_wide",
+    "CREATE TABLE posts_narrow AS SELECT * FROM posts",
+    "ALTER TABLE posts_narrow ADD PRIMARY KEY (id)",
+    """
+    CREATE INDEX ix_posts_narrow_status_created_at ON posts_narrow (status, created_at)
+    WHERE deleted_at IS NULL
+    """,
+    """
+    CREATE TABLE posts_wide AS
+    SELECT p.*, b.content, b.search_vector
+    FROM posts AS p JOIN post_bodies AS b ON b.post_id = p.id
+    """,
+    "ALTER TABLE posts_wide ADD PRIMARY KEY (id)",
+    """
+    CREATE INDEX ix_posts_wide_status_created_at ON posts_wide (status, created_at)
+    WHERE deleted_at IS NULL
+    """,
+]
+
+# Metadata-only queries shaped like the list, tag and count queries
+QUERIES = {
+    "list page": """
+        SELECT id, author_id, title, excerpt, status, publication_date, created_at
+        FROM {table}
+        WHERE status = 'published' AND deleted_at IS NULL
+        ORDER BY created_at DESC
+        LIMIT 100 OFFSET 400
+    """,
+    "tag page": """
+        SELECT p.id, p.author_id, p.title, p.excerpt, p.status, p.publication_date, p.created_at
+        FROM {table} AS p JOIN post_tags AS pt ON pt.post_id = p.id
+        WHERE pt.tag_id = :tag_id AND p.status = 'published' AND p.deleted_at IS NULL
+        ORDER BY p.created_at DESC
+        LIMIT 100
+    """,
+    "count": """
+        SELECT count(*) FROM {table} WHERE status = 'published' AND deleted_at IS NULL
+    """,
+}
+
+
+@dataclass
+class PageTime:
+    """Wall time per 100-item page for one route and list strategy."""
+
+    route: str
+    wall_ms_per_page: float
+
+
+@dataclass
+class BufferComparison:
+    """Shared buffers one query touches on posts_narrow and on posts_wide."""
+
+    route: str
+    narrow_buffers: int
+    wide_buffers: int
+
+
+def _shared_buffers(plan: Any) -> int:
+    """Shared buffers hit or read by a plan, from EXPLAIN (FORMAT JSON) output."""
+    root = plan[0]["Plan"]
+    return int(root.get("Shared Hit Blocks", 0)) + int(root.get("Shared Read Blocks", 0))
+
+
+async def _buffers(session: AsyncSession, query: str, table: str, tag_id: int) -> int:
+    """Run one query under EXPLAIN (ANALYZE, BUFFERS) and count its buffers."""
+    sql = query.format(table=table)
+    params = {"tag_id": tag_id} if ":tag_id" in sql else {}
+    result = await session.execute(
+        text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}"), params
+    )
+    return _shared_buffers(result.scalar_one())
+
+
+@pytest.mark.asyncio
+async def test_list_pages_skip_post_bodies(
+    bench_client: AsyncClient, seeded_session: AsyncSession, sample_tag_id: int
+):
+    """Metadata queries never touch more buffers than with bodies inline, tag pages far fewer."""
+    routes = {
+        "GET /api/v1/posts": "/api/v1/posts",
+        "GET /api/v1/tags/{tag_id}/posts": f"/api/v1/tags/{sample_tag_id}/posts",
+    }
+    results: list[Any] = []
+    for route, path in routes.items():
+        for strategy in ("orm", "core"):
+            settings.post_list_strategy = strategy
+
+            # Warm the statement caches outside the measured window
+            response = await bench_client.get(path, params={"page_size": PAGE_SIZE})
+            assert response.status_code == 200
+
+            started = time.perf_counter()
+            for page in range(PAGES):
+                response = await bench_client.get(
+                    path, params={"page": 1 + page % 5, "page_size": PAGE_SIZE}
+                )
+                assert response.status_code == 200
+            elapsed = time.perf_counter() - started
+            results.append(PageTime(f"{route} [{strategy}]", elapsed * 1000 / PAGES))
+
+    for statement in LAYOUT_DDL:
+        await seeded_session.execute(text(statement))
+    await seeded_session.commit()
+    # VACUUM cannot run inside a transaction block
+    async with test_engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.exec_driver_sql("VACUUM ANALYZE posts_narrow, posts_wide")
+
+    comparisons = []
+    try:
+        for label, query in QUERIES.items():
+            # The first run warms the cache, so both tables are measured from memory
+            for table in ("posts_narrow", "posts_wide"):
+                await _buffers(seeded_session, query, table, sample_tag_id)
+            comparisons.append(
+                BufferComparison(
+                    route=label,
+                    narrow_buffers=await _buffers(
+                        seeded_session, query, "posts_narrow", sample_tag_id
+                    ),
+                    wide_buffers=await _buffers(seeded_session, query, "posts_wide", sample_tag_id),
+                )
+            )
+    finally:
+        await seeded_session.rollback()
+        await seeded_session.execute(text("DROP TABLE IF EXISTS posts_narrow, posts_wide"))
+        await seeded_session.commit()
+
+    write_results(
+        RESULTS_PATH,
+        results + comparisons,
+        run_metadata(pages=PAGES, page_size=PAGE_SIZE),
+    )
+
+    # The tag page's heap fetches land on far fewer pages; the list page's rows
+    # sit on distinct pages in either layout and the count is index-only
+    by_query = {comparison.route: comparison for comparison in comparisons}
+    tag_page = by_query["tag page"]
+    assert tag_page.narrow_buffers * 2 < tag_page.wide_buffers, tag_page
+    for comparison in comparisons:
+        assert comparison.narrow_buffers <= comparison.wide_buffers * 1.1, comparison
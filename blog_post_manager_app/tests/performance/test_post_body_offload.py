@@ -0,0 +1,133 @@
+"""WAL and read cost of large post bodies, inline vs. offloaded to the blob store.
+
+Creates OFFLOAD_POSTS posts with distinct multi-megabyte bodies twice: once
+with every body kept in `post_bodies` and once with bodies offloaded to a
+filesystem blob store. For each it records the WAL PostgreSQL generated per
+post (`pg_current_wal_insert_lsn` before and after) and the post detail
+latency with a cold and a warm body cache, then checks that writing the same
+body again stores no new blob.
+
+Opt-in like the other benchmarks:
+
+    RUN_BENCHMARKS=1 ENVIRONMENT=production pytest tests/performance/test_post_body_offload.py
+
+Environment variables:
+    OFFLOAD_POSTS: posts created per layout (default 5)
+    OFFLOAD_BODY_BYTES: size of each body (default 2 MiB)
+
+Results are written to `tests/performance/results/post_body_offload.json`.
+"""
+
+import os
+import random
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.post import PostStatus
+from src.models.user import User
+from src.schemas.post import PostCreate
+from src.services.post_bodies import PostBodyStore
+from src.services.post_service import PostService
+from src.utils.blob_store import FilesystemBlobStore
+from tests.performance.benchmark import run_metadata, write_results
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1", reason="set RUN_BENCHMARKS=1 to run benchmarks"
+)
+
+RESULTS_PATH = Path(__file__).parent / "results" / "post_body_offload.json"
+
+POSTS = int(os.getenv("OFFLOAD_POSTS", "5"))
+BODY_BYTES = int(os.getenv("OFFLOAD_BODY_BYTES", str(2 * 1024 * 1024)))
+OFFLOAD_BYTES = 256 * 1024
+
+
+@dataclass
+class OffloadResult:
+    """WAL per post and detail latency for one body layout."""
+
+    route: str
+    wal_bytes_per_post: float
+    cold_detail_ms: float
+    warm_detail_ms: float
+
+
+def _body(seed: int) -> str:
+    """About BODY_BYTES of prose-like text from a 5000-word vocabulary."""
+    rng = random.Random(seed)
+    vocabulary = [
+        "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 10)))
+        for _ in range(5000)
+    ]
+    words = []
+    size = 0
+    while size < BODY_BYTES:
+        word = rng.choice(vocabulary)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)
+
+
+async def _wal_lsn(session: AsyncSession) -> int:
+    return int(
+        await session.scalar(text("SELECT pg_current_wal_insert_lsn() - '0/0'::pg_lsn"))
+    )
+
+
+async def _detail_ms(session: AsyncSession, store: PostBodyStore, post_id: int) -> float:
+    session.expunge_all()
+    started = time.perf_counter()
+    detail = await PostService(session, body_store=store).get_post_by_id(post_id)
+    elapsed = (time.perf_counter() - started) * 1000
+    assert len(detail.content.encode()) >= BODY_BYTES
+    return elapsed
+
+
+@pytest.mark.asyncio
+async def test_offloaded_bodies_skip_wal(seeded_session: AsyncSession, tmp_path: Path):
+    """Offloaded bodies write a fraction of the WAL, and identical ones are stored once."""
+    author = await seeded_session.get(User, 1)
+    assert author is not None
+    bodies = [_body(seed) for seed in range(POSTS)]
+
+    results = []
+    for layout, offload_bytes in (("inline", BODY_BYTES * 2), ("offloaded", OFFLOAD_BYTES)):
+        blobs = FilesystemBlobStore(str(tmp_path / layout))
+        store = PostBodyStore(blobs, offload_bytes=offload_bytes, cache_bytes=BODY_BYTES * 2)
+        post_service = PostService(seeded_session, body_store=store)
+
+        started_lsn = await _wal_lsn(seeded_session)
+        post_ids = [
+            (
+                await post_service.create_post(
+                    PostCreate(title=f"Large {layout}", content=body, status=PostStatus.published),
+                    author,
+                )
+            ).id
+            for body in bodies
+        ]
+        wal_bytes = await _wal_lsn(seeded_session) - started_lsn
+
+        # A fresh store has an empty cache: the first read goes to the blob store
+        reader = PostBodyStore(blobs, offload_bytes=offload_bytes, cache_bytes=BODY_BYTES * 2)
+        cold = await _detail_ms(seeded_session, reader, post_ids[0])
+        warm = await _detail_ms(seeded_session, reader, post_ids[0])
+        results.append(OffloadResult(layout, wal_bytes / POSTS, cold, warm))
+
+        if layout == "offloaded":
+            stored = sorted(path for path in blobs.root.rglob("*") if path.is_file())
+            assert len(stored) == POSTS
+            await post_service.create_post(PostCreate(title="Copy", content=bodies[0]), author)
+            assert sorted(path for path in blobs.root.rglob("*") if path.is_file()) == stored
+
+    write_results(
+        RESULTS_PATH, results, run_metadata(posts=POSTS, body_bytes=BODY_BYTES)
+    )
+
+    inline, offloaded = results
+    assert offloaded.wal_bytes_per_post * 5 < inline.wal_bytes_per_post, results
@@ -0,0 +1,145 @@
+"""Storage and read cost of post revisions, stored as snapshots and deltas.
+
+Creates one post with a REVISION_BODY_BYTES body, then autosaves it
+REVISION_SAVES times, each save rewriting one sentence and appending another.
+Records the bytes stored in post_revisions against the bytes the same
+history takes as one compressed full copy per revision, the update latency,
+and the time to rebuild the revision furthest from its snapshot. Also checks
+that the post detail never reads post_revisions.
+
+Opt-in like the other benchmarks:
+
+    RUN_BENCHMARKS=1 ENVIRONMENT=production pytest tests/performance/test_post_revisions.py
+
+Environment variables:
+    REVISION_SAVES: autosaves of the post (default 200)
+    REVISION_BODY_BYTES: size of the body (default 50 KB)
+
+Results are written to `tests/performance/results/post_revisions.json`.
+"""
+
+import os
+import random
+import statistics
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.models.post_revision import PostRevision
+from src.models.user import User
+from src.schemas.post import PostCreate, PostUpdate
+from src.services.post_service import PostService
+from tests.performance.benchmark import run_metadata, write_results
+from tests.unit.test_post_service import recorded_statements
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1", reason="set RUN_BENCHMARKS=1 to run benchmarks"
+)
+
+RESULTS_PATH = Path(__file__).parent / "results" / "post_revisions.json"
+
+SAVES = int(os.getenv("REVISION_SAVES", "200"))
+BODY_BYTES = int(os.getenv("REVISION_BODY_BYTES", "50000"))
+
+
+@dataclass
+class RevisionResult:
+    """Storage and latency of an autosaved post's history."""
+
+    saves: int
+    max_deltas: int
+    stored_bytes: int
+    full_copy_bytes: int
+    update_p50_ms: float
+    update_p95_ms: float
+    furthest_revision_ms: float
+
+
+def _sentence(rng: random.Random) -> str:
+    words = [
+        "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 9)))
+        for _ in range(rng.randint(8, 20))
+    ]
+    return " ".join(words).capitalize() + "."
+
+
+def _body(rng: random.Random) -> str:
+    """About BODY_BYTES of sentences, in paragraphs of eight."""
+    sentences: list[str] = []
+    while sum(len(sentence) + 1 for sentence in sentences) < BODY_BYTES:
+        sentences.append(_sentence(rng))
+    return "\n\n".join(
+        " ".join(sentences[start : start + 8]) for start in range(0, len(sentences), 8)
+    )
+
+
+def _autosave(content: str, rng: random.Random) -> str:
+    """The content with one sentence rewritten and a new one appended."""
+    sentences = content.split(". ")
+    sentences[rng.randrange(len(sentences))] = _sentence(rng).rstrip(".")
+    return ". ".join(sentences) + " " + _sentence(rng)
+
+
+@pytest.mark.asyncio
+async def test_autosaved_history_is_stored_as_deltas(seeded_session: AsyncSession):
+    """An autosaved post's history takes a fraction of its full copies."""
+    author = await seeded_session.get(User, 1)
+    assert author is not None
+    rng = random.Random(50)
+    post_service = PostService(seeded_session)
+
+    content = _body(rng)
+    post = await post_service.create_post(PostCreate(title="Autosaved", content=content), author)
+    full_copy_bytes = len(zlib.compress(content.encode()))
+
+    latencies = []
+    for _ in range(SAVES):
+        content = _autosave(content, rng)
+        started = time.perf_counter()
+        await post_service.update_post(post.id, PostUpdate(content=content), author)
+        latencies.append(time.perf_counter() - started)
+        full_copy_bytes += len(zlib.compress(content.encode()))
+
+    stored_bytes = await seeded_session.scalar(
+        select(func.sum(func.octet_length(PostRevision.data))).where(
+            PostRevision.post_id == post.id
+        )
+    )
+
+    # The latest revision before a snapshot rebuilds from the most deltas
+    furthest = await seeded_session.scalar(
+        select(func.max(PostRevision.revision)).where(
+            PostRevision.post_id == post.id,
+            PostRevision.deltas == settings.post_revision_max_deltas,
+        )
+    )
+    started = time.perf_counter()
+    await post_service.revisions.get_revision(post.id, furthest, author)
+    furthest_ms = (time.perf_counter() - started) * 1000
+
+    seeded_session.expunge_all()
+    with recorded_statements(seeded_session) as statements:
+        await post_service.get_post_by_id(post.id)
+    assert not any("post_revisions" in statement for statement in statements)
+
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    result = RevisionResult(
+        saves=SAVES,
+        max_deltas=settings.post_revision_max_deltas,
+        stored_bytes=stored_bytes,
+        full_copy_bytes=full_copy_bytes,
+        update_p50_ms=cuts[49] * 1000,
+        update_p95_ms=cuts[94] * 1000,
+        furthest_revision_ms=furthest_ms,
+    )
+    write_results(
+        RESULTS_PATH, [result], run_metadata(saves=SAVES, body_bytes=BODY_BYTES)
+    )
+
+    assert result.stored_bytes * 5 < result.full_copy_bytes, result
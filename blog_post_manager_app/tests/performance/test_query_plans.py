@@ -0,0 +1,190 @@
+"""Query-plan regression tests for every hot query.
+
+Each case runs a real service or route call against the seeded dataset, records
+the SQL it sends, and checks `EXPLAIN (FORMAT JSON)` for every SELECT:
+
+* no Seq Scan on relations outside the case's allow-list,
+* at least one of the expected indexes is used,
+* the planner's estimated total cost stays under the case's budget.
+
+Index scans of partitions count as scans of the posts index they belong to.
+Seq scans of hot partitions are allowed: each holds at most a month of posts.
+A separate test checks that a list page runs on the newest partitions only.
+
+Budgets are estimates for the dataset in `conftest.py`; adjust them together
+with the dataset, never to paper over a plan change.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.v1 import tags as tags_api
+from src.models.post import PostStatus
+from src.services.post_partitions import (
+    COLD_PARTITION,
+    FUTURE_PARTITION,
+    month_start,
+    partition_name,
+    utc_today,
+)
+from src.services.post_service import PostService
+from src.services.search_service import SearchService
+from tests.conftest import test_engine
+from tests.performance.conftest import RARE_SEARCH_TERM, SAMPLE_TAG_NAME
+from tests.performance.plans import StatementRecorder, explain_all, iter_plan_nodes
+
+# Small lookup tables that the planner may legitimately read in full
+SMALL_TABLES = frozenset({"users", "tags"})
+# Monthly partitions of posts and the (normally empty) one after them
+HOT_PARTITION = re.compile(rf"^posts_p\d{{6}}$|^{FUTURE_PARTITION}$")
+
+PAGE_COST_BUDGET = 1_000.0
+# Tag pages find their posts by ID, which probes the key of every partition
+TAG_PAGE_COST_BUDGET = 1_100.0
+# Search matches post bodies, then joins them to their posts
+SEARCH_COST_BUDGET = 1_500.0
+AGGREGATE_COST_BUDGET = 25_000.0
+
+
+@dataclass(frozen=True)
+class PlanCase:
+    """A hot query and the plan properties it must keep."""
+
+    name: str
+    run: Callable[[AsyncSession, int], Awaitable[object]]
+    expected_indexes: frozenset[str] = frozenset()
+    allowed_seq_scans: frozenset[str] = SMALL_TABLES
+    max_cost: float = PAGE_COST_BUDGET
+
+
+async def _first_published_post_id(session: AsyncSession) -> int:
+    page = await PostService(session).list_posts(page_size=1, status_filter=PostStatus.published)
+    return page.items[0].id
+
+
+async def _get_post_by_id(session: AsyncSession, tag_id: int) -> object:
+    return await PostService(session).get_post_by_id(await _first_published_post_id(session))
+
+
+PLAN_CASES = [
+    PlanCase(
+        name="list_posts_published",
+        run=lambda s, _: PostService(s).list_posts(status_filter=PostStatus.published),
+        expected_indexes=frozenset({"ix_posts_status_created_at"}),
+    ),
+    PlanCase(
+        name="list_posts_by_author",
+        run=lambda s, _: PostService(s).list_posts(
+            status_filter=PostStatus.published, author_id=7
+        ),
+        expected_indexes=frozenset({"ix_posts_author_id", "ix_posts_status_created_at"}),
+    ),
+    PlanCase(
+        name="list_posts_by_tag",
+        run=lambda s, _: PostService(s).list_posts(
+            status_filter=PostStatus.published, tag_names=[SAMPLE_TAG_NAME]
+        ),
+        expected_indexes=frozenset({"ix_post_tags_tag_id"}),
+        max_cost=TAG_PAGE_COST_BUDGET,
+    ),
+    PlanCase(
+        name="get_post_by_id",
+        run=_get_post_by_id,
+        expected_indexes=frozenset({"posts_pkey", "ix_posts_id"}),
+    ),
+    PlanCase(
+        name="search_posts_relevance",
+        run=lambda s, _: SearchService(s).search_posts(query=RARE_SEARCH_TERM),
+        expected_indexes=frozenset({"ix_post_bodies_search_vector"}),
+        max_cost=SEARCH_COST_BUDGET,
+    ),
+    PlanCase(
+        name="search_posts_by_date",
+        run=lambda s, _: SearchService(s).search_posts(query=RARE_SEARCH_TERM, sort_by="date"),
+        expected_indexes=frozenset({"ix_post_bodies_search_vector"}),
+        max_cost=SEARCH_COST_BUDGET,
+    ),
+    PlanCase(
+        name="popular_tags",
+        run=lambda s, _: SearchService(s).get_popular_tags(),
+        allowed_seq_scans=SMALL_TABLES | {COLD_PARTITION, "post_tags"},
+        max_cost=AGGREGATE_COST_BUDGET,
+    ),
+    PlanCase(
+        name="list_tags_with_counts",
+        run=lambda s, _: tags_api.list_tags(include_count=True, db=s),
+        allowed_seq_scans=SMALL_TABLES | {COLD_PARTITION, "post_tags"},
+        max_cost=AGGREGATE_COST_BUDGET,
+    ),
+    PlanCase(
+        name="list_tags_without_counts",
+        run=lambda s, _: tags_api.list_tags(include_count=False, db=s),
+    ),
+    PlanCase(
+        name="posts_by_tag",
+        run=lambda s, tag_id: tags_api.get_posts_by_tag(tag_id=tag_id, page=1, page_size=20, db=s),
+        expected_indexes=frozenset({"ix_post_tags_tag_id"}),
+        max_cost=TAG_PAGE_COST_BUDGET,
+    ),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("case", PLAN_CASES, ids=lambda case: case.name)
+async def test_query_plan(case: PlanCase, seeded_session: AsyncSession, sample_tag_id: int):
+    """Hot query keeps its index usage and stays within its cost budget."""
+    with StatementRecorder(test_engine) as recorder:
+        await case.run(seeded_session, sample_tag_id)
+
+    plans = await explain_all(seeded_session, recorder.statements)
+    assert plans, f"{case.name} issued no SELECT statements"
+
+    for plan in plans:
+        unexpected = {
+            relation
+            for relation in plan.seq_scans - case.allowed_seq_scans
+            if not HOT_PARTITION.match(relation)
+        }
+        assert not unexpected, (
+            f"{case.name}: Seq Scan on {sorted(unexpected)}\n{plan.statement}"
+        )
+        assert plan.total_cost <= case.max_cost, (
+            f"{case.name}: estimated cost {plan.total_cost:.0f} exceeds budget "
+            f"{case.max_cost:.0f}\n{plan.statement}"
+        )
+
+    if case.expected_indexes:
+        used = set().union(*(plan.indexes for plan in plans))
+        assert used & case.expected_indexes, (
+            f"{case.name}: expected one of {sorted(case.expected_indexes)}, "
+            f"plans used {sorted(used)}"
+        )
+
+
+@pytest.mark.asyncio
+async def test_list_page_prunes_older_partitions(seeded_session: AsyncSession):
+    """A first page of recent posts never executes the scans of older partitions."""
+    with StatementRecorder(test_engine) as recorder:
+        await PostService(seeded_session).list_posts(status_filter=PostStatus.published)
+    statement, parameters = next(
+        (statement, parameters)
+        for statement, parameters in recorder.statements
+        if "LIMIT" in statement
+    )
+
+    conn = await seeded_session.connection()
+    result = await conn.exec_driver_sql(
+        f"EXPLAIN (ANALYZE, FORMAT JSON) {statement}", tuple(parameters or ())
+    )
+    loops: dict[str, int] = {}
+    for node in iter_plan_nodes(result.scalar_one()[0]["Plan"]):
+        if "Relation Name" in node:
+            relation = node["Relation Name"]
+            loops[relation] = loops.get(relation, 0) + node["Actual Loops"]
+
+    assert loops.get(partition_name(month_start(utc_today())), 0) >= 1, loops
+    assert loops.get(COLD_PARTITION) == 0, loops
@@ -0,0 +1,132 @@
+"""Read-only session benchmark: latency and pool occupancy of GET routes.
+
+Runs the read routes twice over the in-process ASGI app, once with the
+read-only autocommit session they use (`get_read_db`) and once with the
+read-write session that commits after every request (`get_db`), and records
+latency together with how long each request keeps a pooled connection.
+
+Opt-in like the other benchmarks:
+
+    RUN_BENCHMARKS=1 ENVIRONMENT=production pytest tests/performance/test_read_sessions.py
+
+Results are written to `tests/performance/results/read_sessions.json`.
+"""
+
+import os
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database import engine, get_db, get_read_db
+from src.main import app
+from tests.performance.benchmark import percentiles, run_load, run_metadata, write_results
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1", reason="set RUN_BENCHMARKS=1 to run benchmarks"
+)
+
+RESULTS_PATH = Path(__file__).parent / "results" / "read_sessions.json"
+
+REQUESTS_PER_LEVEL = int(os.getenv("BENCHMARK_REQUESTS", "200"))
+CONCURRENCY = int(os.getenv("BENCHMARK_READ_CONCURRENCY", "32"))
+
+
+class HoldTimes:
+    """Collects how long connections stay checked out of the engine's pool."""
+
+    def __init__(self):
+        self.samples: List[float] = []
+        self.peak_checked_out = 0
+        self._pool = engine.sync_engine.pool
+
+    def _checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        connection_record.info["bench_checkout"] = time.perf_counter()
+        self.peak_checked_out = max(self.peak_checked_out, self._pool.checkedout())
+
+    def _checkin(self, dbapi_connection, connection_record) -> None:
+        started = connection_record.info.pop("bench_checkout", None)
+        if started is not None:
+            self.samples.append(time.perf_counter() - started)
+
+    def __enter__(self) -> "HoldTimes":
+        event.listen(self._pool, "checkout", self._checkout)
+        event.listen(self._pool, "checkin", self._checkin)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self._pool, "checkout", self._checkout)
+        event.remove(self._pool, "checkin", self._checkin)
+
+    def summary(self) -> Dict[str, float]:
+        """Mean and p95 hold time in ms, and the peak number of checked-out connections."""
+        return {
+            "hold_mean_ms": statistics.fmean(self.samples) * 1000 if self.samples else 0.0,
+            "hold_p95_ms": percentiles(self.samples)["p95_ms"],
+            "peak_checked_out": self.peak_checked_out,
+        }
+
+
+@pytest.mark.asyncio
+async def test_read_session_latency_and_pool_occupancy(
+    bench_client: AsyncClient, seeded_session: AsyncSession, sample_tag_id: int
+):
+    """Read-only sessions hold pooled connections no longer than commit-per-request ones."""
+    published = await seeded_session.execute(
+        text("SELECT id FROM posts WHERE status = 'published' ORDER BY id LIMIT 100")
+    )
+    published_ids = list(published.scalars().all())
+
+    routes = [
+        ("GET /api/v1/posts", lambda c, i: c.get("/api/v1/posts", params={"page": 1 + i % 5})),
+        (
+            "GET /api/v1/posts/{post_id}",
+            lambda c, i: c.get(f"/api/v1/posts/{published_ids[i % len(published_ids)]}"),
+        ),
+        (
+            "GET /api/v1/search/posts",
+            lambda c, i: c.get("/api/v1/search/posts", params={"q": "python"}),
+        ),
+        ("GET /api/v1/tags", lambda c, i: c.get("/api/v1/tags")),
+        (
+            "GET /api/v1/tags/{tag_id}/posts",
+            lambda c, i: c.get(f"/api/v1/tags/{sample_tag_id}/posts"),
+        ),
+    ]
+
+    results = []
+    occupancy = {}
+    for mode in ("commit", "read_only"):
+        if mode == "commit":
+            # The read routes with the old read-write, commit-per-request session
+            app.dependency_overrides[get_read_db] = get_db
+        else:
+            app.dependency_overrides.pop(get_read_db, None)
+
+        for route, factory in routes:
+            with HoldTimes() as hold_times:
+                result = await run_load(
+                    bench_client, route, factory, CONCURRENCY, REQUESTS_PER_LEVEL, 200
+                )
+            result.route = f"{route} [{mode}]"
+            results.append(result)
+            occupancy[result.route] = hold_times.summary()
+
+    metadata = run_metadata(
+        requests_per_level=REQUESTS_PER_LEVEL,
+        pool_occupancy=occupancy,
+    )
+    write_results(RESULTS_PATH, results, metadata)
+
+    assert not [r for r in results if r.errors]
+
+    for route, _ in routes:
+        commit = occupancy[f"{route} [commit]"]
+        read_only = occupancy[f"{route} [read_only]"]
+        # Generous margin: the point is catching a read path that holds longer again
+        assert read_only["hold_mean_ms"] <= commit["hold_mean_ms"] * 1.25, route
@@ -0,0 +1,265 @@
+"""Unit tests for database engine configuration."""
+
+import pytest
+from fastapi import Request
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from src.config import settings
+from src.database import (
+    CONCURRENT_COUNT,
+    CONNECTION_USED,
+    InstrumentedAsyncQueuePool,
+    ReadOnlySession,
+    engine_options,
+    execute_with_count,
+    get_db,
+    get_read_db,
+    has_spare_connections,
+    pool_capacity,
+)
+from src.models.post import Post
+from src.models.tag import Tag
+from src.utils.metrics import DB_LIST_COUNT_QUERIES, DB_REQUEST_SESSIONS
+from tests.conftest import TEST_DATABASE_URL
+
+
+def routed_request(method: str, template: str) -> Request:
+    """A request as routed to the route with this method and path template."""
+    return Request(
+        {
+            "type": "http",
+            "method": method,
+            "path": template,
+            "headers": [],
+            "state": {"route_template": template},
+        }
+    )
+
+
+class TestEngineOptions:
+    """Test cases for engine_options."""
+
+    def test_direct_connection_uses_pool_and_pre_ping(self):
+        """Test the default options for a direct PostgreSQL connection."""
+        options = engine_options(settings.model_copy(update={"db_pooler_mode": "none"}))
+
+        assert options["poolclass"] is InstrumentedAsyncQueuePool
+        assert options["pool_pre_ping"] is True
+        assert options["connect_args"] == {
+            "prepared_statement_cache_size": settings.db_prepared_statement_cache_size
+        }
+
+    def test_transaction_pooler_disables_statement_caches(self):
+        """Test that transaction pooling uses NullPool and unique statement names."""
+        options = engine_options(
+            settings.model_copy(update={"db_pooler_mode": "transaction"})
+        )
+        connect_args = options["connect_args"]
+        name_func = connect_args["prepared_statement_name_func"]
+
+        assert options["poolclass"] is NullPool
+        assert "pool_pre_ping" not in options
+        assert connect_args["statement_cache_size"] == 0
+        assert connect_args["prepared_statement_cache_size"] == 0
+        assert name_func() != name_func()
+
+    def test_transaction_pooler_small_app_pool(self):
+        """Test that a small app-side pool can be kept behind the pooler."""
+        options = engine_options(
+            settings.model_copy(
+                update={"db_pooler_mode": "transaction", "db_pooler_app_pool_size": 4}
+            )
+        )
+
+        assert options["poolclass"] is InstrumentedAsyncQueuePool
+        assert options["pool_size"] == 4
+        assert options["max_overflow"] == 0
+        assert "pool_pre_ping" not in options
+
+
+class TestReadOnlySession:
+    """Test cases for ReadOnlySession."""
+
+    def test_flush_rejects_pending_writes(self):
+        """Test that adding an object and flushing raises instead of writing."""
+        session = ReadOnlySession()
+        session.add(Tag(name="python"))
+
+        with pytest.raises(RuntimeError, match="read-only"):
+            session.flush()
+
+    def test_empty_flush_is_allowed(self):
+        """Test that a flush with nothing pending is a no-op."""
+        session = ReadOnlySession()
+
+        session.flush()
+
+
+class TestLazySessions:
+    """Test cases for connection checkout tracking of request sessions."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("dependency", [get_db, get_read_db])
+    async def test_unused_session_never_touches_pool(self, dependency):
+        """Test that a request that never queries is counted as not using the pool."""
+        unused = DB_REQUEST_SESSIONS.labels(connection="unused")
+        before = unused._value.get()
+
+        sessions = (
+            dependency(routed_request("GET", "/api/v1/posts"))
+            if dependency is get_read_db
+            else dependency()
+        )
+        session = await sessions.__anext__()
+        with pytest.raises(StopAsyncIteration):
+            await sessions.__anext__()
+
+        assert session.info.get(CONNECTION_USED) is None
+        assert unused._value.get() == before + 1
+
+    def test_first_query_marks_connection_used(self):
+        """Test that a session is flagged once it checks out a connection."""
+        with Session(create_engine("sqlite://")) as session:
+            assert CONNECTION_USED not in session.info
+
+            session.execute(text("SELECT 1"))
+
+            assert session.info[CONNECTION_USED] is True
+
+
+class TestExecuteWithCount:
+    """Test cases for running count and page queries side by side."""
+
+    def test_spare_connections_follow_pool_saturation(self, monkeypatch):
+        """Test that a connection is lent only while the pool stays below the threshold."""
+        pooled = create_async_engine(TEST_DATABASE_URL, pool_size=4, max_overflow=0)
+        pool = pooled.sync_engine.pool
+
+        assert has_spare_connections(pooled, 0.5)
+        assert not has_spare_connections(pooled, 0.0)
+
+        monkeypatch.setattr(pool, "checkedout", lambda: 2)
+        assert not has_spare_connections(pooled, 0.5)
+        assert has_spare_connections(pooled, 1.0)
+
+        monkeypatch.setattr(pool, "checkedout", lambda: 4)
+        assert not has_spare_connections(pooled, 1.0)
+
+    def test_guard_counts_every_connection_taken(self, monkeypatch):
+        """Test that a session that has not queried yet needs room for two connections."""
+        pooled = create_async_engine(TEST_DATABASE_URL, pool_size=4, max_overflow=0)
+        monkeypatch.setattr(pooled.sync_engine.pool, "checkedout", lambda: 1)
+
+        assert has_spare_connections(pooled, 0.5, needed=1)
+        assert not has_spare_connections(pooled, 0.5, needed=2)
+
+    def test_capacity_of_pools_without_limit(self):
+        """Test that unbounded pools have no capacity, so they never count as saturated."""
+        bounded = create_async_engine(TEST_DATABASE_URL, pool_size=4, max_overflow=2)
+        unbounded = create_async_engine(TEST_DATABASE_URL, pool_size=4, max_overflow=-1)
+        unpooled = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+
+        assert pool_capacity(bounded.sync_engine.pool) == 6
+        assert pool_capacity(unbounded.sync_engine.pool) is None
+        assert pool_capacity(unpooled.sync_engine.pool) is None
+        assert has_spare_connections(unbounded, 0.5, needed=2)
+
+    def test_unsized_pool_never_lends(self):
+        """Test that NullPool engines (behind PgBouncer) always run sequentially."""
+        unpooled = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+
+        assert not has_spare_connections(unpooled, 1.0)
+
+    @pytest.mark.asyncio
+    async def test_read_write_session_runs_sequentially(
+        self, db_session: AsyncSession, multiple_posts: list[Post]
+    ):
+        """Test that sessions that may hold writes keep both queries on one connection."""
+        sequential = DB_LIST_COUNT_QUERIES.labels(mode="sequential")
+        before = sequential._value.get()
+
+        total, result = await execute_with_count(
+            db_session, select(func.count(Post.id)), select(Post.id).order_by(Post.id).limit(3)
+        )
+
+        assert total == len(multiple_posts)
+        assert len(result.all()) == 3
+        assert sequential._value.get() == before + 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "method, template, concurrent",
+        [
+            ("GET", "/api/v1/search/posts", True),
+            ("GET", "/api/v1/posts", False),
+            ("POST", "/api/v1/search/posts", False),
+        ],
+    )
+    async def test_listed_routes_count_concurrently(
+        self, method: str, template: str, concurrent: bool, monkeypatch
+    ):
+        """Test that read sessions may count on a second connection on listed routes only."""
+        monkeypatch.setattr(
+            settings, "db_concurrent_count_routes", " get /api/v1/search/posts ,"
+        )
+
+        sessions = get_read_db(routed_request(method, template))
+        session = await sessions.__anext__()
+        await sessions.aclose()
+
+        assert session.info[CONCURRENT_COUNT] is concurrent
+
+    @pytest.mark.asyncio
+    async def test_unlisted_read_only_session_runs_sequentially(
+        self, multiple_posts: list[Post], monkeypatch
+    ):
+        """Test that read-only sessions of other routes count on their own connection."""
+        monkeypatch.setattr(settings, "db_concurrent_count_max_saturation", 1.0)
+        pooled = create_async_engine(TEST_DATABASE_URL, pool_size=2, max_overflow=0)
+        sequential = DB_LIST_COUNT_QUERIES.labels(mode="sequential")
+        before = sequential._value.get()
+
+        try:
+            async with AsyncSession(
+                pooled.execution_options(isolation_level="AUTOCOMMIT"),
+                sync_session_class=ReadOnlySession,
+            ) as session:
+                total, _ = await execute_with_count(
+                    session, select(func.count(Post.id)), select(Post.id).limit(3)
+                )
+        finally:
+            await pooled.dispose()
+
+        assert total == len(multiple_posts)
+        assert sequential._value.get() == before + 1
+
+    @pytest.mark.asyncio
+    async def test_read_only_session_counts_on_second_connection(
+        self, multiple_posts: list[Post], monkeypatch
+    ):
+        """Test that read-only sessions run the count concurrently with spare connections."""
+        monkeypatch.setattr(settings, "db_concurrent_count_max_saturation", 1.0)
+        pooled = create_async_engine(TEST_DATABASE_URL, pool_size=2, max_overflow=0)
+        concurrent = DB_LIST_COUNT_QUERIES.labels(mode="concurrent")
+        before = concurrent._value.get()
+
+        try:
+            async with AsyncSession(
+                pooled.execution_options(isolation_level="AUTOCOMMIT"),
+                sync_session_class=ReadOnlySession,
+            ) as session:
+                session.info[CONCURRENT_COUNT] = True
+                total, result = await execute_with_count(
+                    session,
+                    select(func.count(Post.id)),
+                    select(Post.id).order_by(Post.id).limit(3),
+                )
+        finally:
+            await pooled.dispose()
+
+        assert total == len(multiple_posts)
+        assert result.scalars().all() == sorted(post.id for post in multiple_posts)[:3]
+        assert concurrent._value.get() == before + 1
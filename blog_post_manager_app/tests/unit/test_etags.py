@@ -0,0 +1,27 @@
+"""Unit tests for post entity tags."""
+
+from src.utils.etags import parse_if_match, post_etag
+
+
+class TestETags:
+    """Test cases for ETag formatting and If-Match parsing."""
+
+    def test_post_etag_quotes_version(self):
+        """Test that the ETag is the quoted version."""
+        assert post_etag(3) == '"3"'
+
+    def test_missing_or_wildcard_accepts_any_version(self):
+        """Test that no header and `*` do not restrict the version."""
+        assert parse_if_match(None) is None
+        assert parse_if_match(" * ") is None
+
+    def test_parses_one_or_more_tags(self):
+        """Test parsing single and comma-separated tags."""
+        assert parse_if_match('"7"') == [7]
+        assert parse_if_match('"7", "9"') == [7, 9]
+
+    def test_weak_and_malformed_tags_never_match(self):
+        """Test that tags a strong comparison cannot match accept no version."""
+        assert parse_if_match('W/"7"') == []
+        assert parse_if_match("7") == []
+        assert parse_if_match('"abc"') == []
@@ -0,0 +1,72 @@
+"""Unit tests for health service."""
+
+import asyncio
+
+import pytest
+
+from src.database import engine
+from src.services.health_service import HealthService
+
+
+def _health_service(**overrides) -> HealthService:
+    options = {
+        "cache_seconds": 60.0,
+        "timeout_seconds": 0.05,
+        "saturation_threshold": 1.0,
+    }
+    options.update(overrides)
+    return HealthService(engine, engine, **options)
+
+
+@pytest.mark.asyncio
+class TestHealthService:
+    """Test cases for HealthService."""
+
+    async def test_probe_result_is_cached(self, monkeypatch):
+        """Test that concurrent and repeated checks share one probe."""
+        health_service = _health_service()
+        calls = []
+
+        async def probe():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+
+        monkeypatch.setattr(health_service, "_probe", probe)
+
+        results = await asyncio.gather(
+            *(health_service.database_connected() for _ in range(5))
+        )
+        await health_service.database_connected()
+
+        assert results == [True] * 5
+        assert len(calls) == 1
+
+    async def test_probe_timeout_reports_disconnected(self, monkeypatch):
+        """Test that a hanging probe makes the service not ready."""
+        health_service = _health_service()
+
+        async def probe():
+            await asyncio.sleep(1)
+
+        monkeypatch.setattr(health_service, "_probe", probe)
+
+        result = await health_service.readiness("test")
+
+        assert result.status == "unhealthy"
+        assert result.database == "disconnected"
+
+    async def test_saturated_pool_is_not_ready(self, monkeypatch):
+        """Test that reaching the saturation threshold makes the service not ready."""
+        health_service = _health_service(saturation_threshold=0.5)
+
+        async def probe():
+            return None
+
+        monkeypatch.setattr(health_service, "_probe", probe)
+        monkeypatch.setattr(engine.pool, "checkedout", lambda: engine.pool.size() * 2)
+
+        result = await health_service.readiness("test")
+
+        assert result.database == "connected"
+        assert result.pool.saturation >= 0.5
+        assert result.status == "unhealthy"
@@ -0,0 +1,182 @@
+"""Unit tests for idempotency keys."""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.post import Post
+from src.models.user import User
+from src.schemas.post import PostCreate
+from src.services.post_service import PostService
+from src.utils.idempotency import (
+    DatabaseIdempotencyStore,
+    IdempotentRequest,
+    MemoryIdempotencyStore,
+    request_fingerprint,
+)
+from tests.conftest import TestSessionLocal
+
+
+@pytest.mark.asyncio
+class TestMemoryIdempotencyStore:
+    """Test cases for the in-memory store."""
+
+    async def test_replays_completed_response(self):
+        """Test that a key replays the response recorded by its first request."""
+        store = MemoryIdempotencyStore(ttl_seconds=60, max_keys=10, wait_seconds=1)
+
+        assert await store.claim(None, "k", "fp") is None
+        await store.record(None, "k", '{"id": 1}')
+        await store.complete("k")
+
+        assert await store.claim(None, "k", "fp") == '{"id": 1}'
+
+    async def test_rejects_key_reused_for_another_request(self):
+        """Test that a key sent with another body is refused with 422."""
+        store = MemoryIdempotencyStore(ttl_seconds=60, max_keys=10, wait_seconds=1)
+        await store.claim(None, "k", "fp")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await store.claim(None, "k", "other")
+
+        assert exc_info.value.status_code == 422
+
+    async def test_duplicate_waits_for_in_flight_request(self):
+        """Test that a concurrent duplicate gets the first request's response."""
+        store = MemoryIdempotencyStore(ttl_seconds=60, max_keys=10, wait_seconds=1)
+        await store.claim(None, "k", "fp")
+
+        duplicate = asyncio.create_task(store.claim(None, "k", "fp"))
+        await asyncio.sleep(0.01)
+        assert not duplicate.done()
+
+        await store.record(None, "k", "response")
+        await store.complete("k")
+
+        assert await duplicate == "response"
+
+    async def test_duplicate_runs_after_release(self):
+        """Test that a duplicate claims the key when the first request fails."""
+        store = MemoryIdempotencyStore(ttl_seconds=60, max_keys=10, wait_seconds=1)
+        await store.claim(None, "k", "fp")
+
+        duplicate = asyncio.create_task(store.claim(None, "k", "fp"))
+        await asyncio.sleep(0.01)
+        await store.release("k")
+
+        assert await duplicate is None
+
+    async def test_duplicate_gives_up_after_wait(self):
+        """Test that a duplicate gets 409 while the first request is still running."""
+        store = MemoryIdempotencyStore(ttl_seconds=60, max_keys=10, wait_seconds=0.01)
+        await store.claim(None, "k", "fp")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await store.claim(None, "k", "fp")
+
+        assert exc_info.value.status_code == 409
+
+    async def test_keys_expire_and_are_bounded(self):
+        """Test TTL expiry and eviction of the least recently used key."""
+        expiring = MemoryIdempotencyStore(ttl_seconds=0, max_keys=10, wait_seconds=1)
+        await expiring.claim(None, "k", "fp")
+        await expiring.complete("k")
+        assert await expiring.claim(None, "k", "other") is None
+
+        bounded = MemoryIdempotencyStore(ttl_seconds=60, max_keys=2, wait_seconds=1)
+        for key in ("a", "b", "c"):
+            await bounded.claim(None, key, "fp")
+        assert list(bounded._entries) == ["b", "c"]
+
+
+@pytest.mark.asyncio
+class TestDatabaseIdempotencyStore:
+    """Test cases for the database store and its use by PostService."""
+
+    async def test_create_post_replays_first_response(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Test that repeating a create with the same key creates one post."""
+        store = DatabaseIdempotencyStore(ttl_seconds=60)
+        post_data = PostCreate(title="Once", content="Body", tags=["python"])
+        fingerprint = request_fingerprint(post_data)
+        post_service = PostService(db_session)
+
+        first = IdempotentRequest(store, "user:1|k", fingerprint)
+        created = await post_service.create_post(post_data, test_user, first)
+        retry = IdempotentRequest(store, "user:1|k", fingerprint)
+        replayed = await post_service.create_post(post_data, test_user, retry)
+
+        assert (first.replayed, retry.replayed) == (False, True)
+        assert replayed == created
+        assert await db_session.scalar(select(func.count(Post.id))) == 1
+
+    async def test_rejects_key_reused_for_another_request(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Test that a key sent with another body is refused with 422."""
+        store = DatabaseIdempotencyStore(ttl_seconds=60)
+        post_service = PostService(db_session)
+        first = PostCreate(title="First", content="Body")
+        second = PostCreate(title="Second", content="Body")
+
+        await post_service.create_post(
+            first, test_user, IdempotentRequest(store, "k", request_fingerprint(first))
+        )
+        with pytest.raises(HTTPException) as exc_info:
+            await post_service.create_post(
+                second, test_user, IdempotentRequest(store, "k", request_fingerprint(second))
+            )
+
+        assert exc_info.value.status_code == 422
+
+    async def test_expired_key_is_taken_over(self, db_session: AsyncSession, test_user: User):
+        """Test that a key past its TTL runs the request again."""
+        store = DatabaseIdempotencyStore(ttl_seconds=60)
+        post_service = PostService(db_session)
+        post_data = PostCreate(title="Twice", content="Body")
+        fingerprint = request_fingerprint(post_data)
+
+        await post_service.create_post(
+            post_data, test_user, IdempotentRequest(store, "k", fingerprint)
+        )
+        await db_session.execute(
+            text("UPDATE idempotency_keys SET expires_at = now() - interval '1 second'")
+        )
+        retry = IdempotentRequest(store, "k", fingerprint)
+        await post_service.create_post(post_data, test_user, retry)
+
+        assert not retry.replayed
+        assert await db_session.scalar(select(func.count(Post.id))) == 2
+
+    async def test_duplicate_waits_for_in_flight_transaction(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Test that a concurrent duplicate blocks on the claim and replays the commit."""
+        store = DatabaseIdempotencyStore(ttl_seconds=60)
+        post_data = PostCreate(title="Contended", content="Body")
+        fingerprint = request_fingerprint(post_data)
+        # The first request's response, recorded below while it holds the key
+        created = await PostService(db_session).create_post(post_data, test_user)
+
+        async with TestSessionLocal() as first_session, TestSessionLocal() as second_session:
+            first = IdempotentRequest(store, "k", fingerprint)
+            assert await first.claim(first_session) is None
+
+            duplicate = asyncio.create_task(
+                PostService(second_session).create_post(
+                    post_data, test_user, IdempotentRequest(store, "k", fingerprint)
+                )
+            )
+            await asyncio.sleep(0.2)
+            assert not duplicate.done()
+
+            await first.record(first_session, created.model_dump_json())
+            await first_session.commit()
+
+            assert await duplicate == created
+
+        assert await db_session.scalar(select(func.count(Post.id))) == 1
@@ -0,0 +1,76 @@
+"""Unit tests for Prometheus instrumentation helpers."""
+
+from types import SimpleNamespace
+
+from sqlalchemy.engine.interfaces import CacheStats
+
+from src.middleware.metrics import UNMATCHED_ROUTE, route_template
+from src.utils.metrics import (
+    DB_COMPILED_CACHE,
+    DB_PREPARED_STATEMENT_CACHE,
+    record_cache_lookups,
+    statement_class,
+)
+
+
+def _sample(counter, result: str) -> float:
+    return counter.labels(result=result)._value.get()
+
+
+class TestMetricsHelpers:
+    """Test cases for metrics label helpers."""
+
+    def test_statement_class_uses_leading_keyword(self):
+        """Test that statements are grouped by their leading keyword."""
+        assert statement_class("SELECT posts.id FROM posts") == "select"
+        assert statement_class("  insert INTO posts VALUES ($1)") == "insert"
+        assert statement_class("UPDATE posts SET title=$1") == "update"
+        assert statement_class("DELETE FROM posts") == "delete"
+        assert statement_class("WITH x AS (SELECT 1) SELECT * FROM x") == "with"
+
+    def test_statement_class_buckets_everything_else(self):
+        """Test that unknown or empty statements do not create new label values."""
+        assert statement_class("BEGIN") == "other"
+        assert statement_class("select pg_catalog.version()") == "select"
+        assert statement_class("") == "other"
+
+    def test_route_template_uses_route_path(self):
+        """Test that the templated route path is used instead of the raw URL."""
+        request = SimpleNamespace(
+            state=SimpleNamespace(),
+            scope={"route": SimpleNamespace(path="/api/v1/posts/{post_id}")},
+        )
+
+        assert route_template(request) == "/api/v1/posts/{post_id}"
+
+    def test_route_template_prefers_saved_template(self):
+        """Test that the template saved during routing wins over the route path."""
+        request = SimpleNamespace(
+            state=SimpleNamespace(route_template="/api/v1/posts/{post_id}"),
+            scope={"route": SimpleNamespace(path="/{post_id}")},
+        )
+
+        assert route_template(request) == "/api/v1/posts/{post_id}"
+
+    def test_route_template_unmatched(self):
+        """Test that unmatched requests share a single label value."""
+        request = SimpleNamespace(state=SimpleNamespace(), scope={})
+
+        assert route_template(request) == UNMATCHED_ROUTE
+
+    def test_record_cache_lookups(self):
+        """Test counting compiled and prepared statement cache hits and misses."""
+        cursor = SimpleNamespace(
+            _adapt_connection=SimpleNamespace(_prepared_statement_cache={"SELECT 1": object()})
+        )
+        compiled_hits = _sample(DB_COMPILED_CACHE, "hit")
+        prepared_hits = _sample(DB_PREPARED_STATEMENT_CACHE, "hit")
+        prepared_misses = _sample(DB_PREPARED_STATEMENT_CACHE, "miss")
+
+        context = SimpleNamespace(cache_hit=CacheStats.CACHE_HIT)
+        record_cache_lookups(cursor, "SELECT 1", context, False)
+        record_cache_lookups(cursor, "SELECT 2", context, False)
+
+        assert _sample(DB_COMPILED_CACHE, "hit") == compiled_hits + 2
+        assert _sample(DB_PREPARED_STATEMENT_CACHE, "hit") == prepared_hits + 1
+        assert _sample(DB_PREPARED_STATEMENT_CACHE, "miss") == prepared_misses + 1
@@ -0,0 +1,201 @@
+"""Unit tests for post bodies and their search vectors."""
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.post import PostStatus
+from src.models.post_body import PostBody
+from src.models.user import User
+from src.schemas.post import PostCreate, PostUpdate
+from src.services.post_bodies import PostBodyStore
+from src.services.post_service import PostService
+from src.services.search_service import SearchService
+from src.utils.blob_store import FilesystemBlobStore
+from tests.unit.test_post_service import recorded_statements
+
+# Offloaded with the 1 KiB threshold of body_store below
+LARGE_CONTENT = "Volcanoes erupt " + "basalt lava flows " * 100
+
+
+async def matches(db_session: AsyncSession, post_id: int, query: str) -> bool:
+    """Tell whether a post's stored search vector matches `query`."""
+    return bool(
+        await db_session.scalar(
+            select(
+                PostBody.search_vector.op("@@")(func.plainto_tsquery("english", query))
+            ).where(PostBody.post_id == post_id)
+        )
+    )
+
+
+@pytest.fixture
+def body_store(tmp_path: Path) -> PostBodyStore:
+    """Post body store offloading contents of 1 KiB or more to a temporary directory."""
+    return PostBodyStore(FilesystemBlobStore(str(tmp_path)), offload_bytes=1024, cache_bytes=4096)
+
+
+def stored_blobs(store: PostBodyStore) -> list[Path]:
+    """Blob files of a filesystem-backed body store."""
+    assert isinstance(store.blobs, FilesystemBlobStore)
+    return [path for path in store.blobs.root.rglob("*") if path.is_file()]
+
+
+@pytest.mark.asyncio
+class TestPostBodies:
+    """Test cases for post bodies."""
+
+    async def test_search_vector_follows_body_and_post_writes(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Test that writing the content, title or excerpt recomputes the search vector."""
+        post_service = PostService(db_session)
+        post = await post_service.create_post(
+            PostCreate(
+                title="Gardening",
+                content="Tomatoes and basil",
+                excerpt="Herbs",
+                status=PostStatus.published,
+            ),
+            test_user,
+        )
+        assert await matches(db_session, post.id, "gardening tomatoes herbs")
+
+        await post_service.update_post(post.id, PostUpdate(content="Peppers"), test_user)
+        assert await matches(db_session, post.id, "peppers")
+        assert not await matches(db_session, post.id, "tomatoes")
+
+        await post_service.update_post(
+            post.id, PostUpdate(title="Cooking", excerpt="Recipes"), test_user
+        )
+        assert await matches(db_session, post.id, "cooking peppers recipes")
+        assert not await matches(db_session, post.id, "gardening")
+
+        results = await SearchService(db_session).search_posts(query="peppers")
+        assert [item.id for item in results.items] == [post.id]
+
+    async def test_only_post_detail_reads_bodies(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Test that lists stay on posts while the detail loads the content."""
+        post_service = PostService(db_session)
+        post = await post_service.create_post(
+            PostCreate(title="Split", content="Full body text"), test_user
+        )
+        db_session.expunge_all()
+
+        for strategy in ("orm", "core", "json", "cards"):
+            lister = PostService(db_session, list_strategy=strategy)
+            with recorded_statements(db_session) as statements:
+                if strategy in ("json", "cards"):
+                    await lister.list_posts_json(status_filter=None)
+                else:
+                    await lister.list_posts(status_filter=None)
+            assert not any("post_bodies" in statement for statement in statements), strategy
+
+        detail = await post_service.get_post_by_id(post.id)
+        assert detail.content == "Full body text"
+
+    async def test_update_keeps_unchanged_content(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Test that an update leaving the content alone returns the stored one."""
+        post_service = PostService(db_session)
+        post = await post_service.create_post(
+            PostCreate(title="Kept", content="Stored body"), test_user
+        )
+
+        with recorded_statements(db_session) as statements:
+            updated = await post_service.update_post(
+                post.id, PostUpdate(title="Renamed", content="Stored body"), test_user
+            )
+
+        assert updated.content == "Stored body"
+        # UPDATE ... RETURNING, revision lookup and insert, card refresh: no body write
+        assert len(statements) == 4
+
+    async def test_large_bodies_are_offloaded_once(
+        self, db_session: AsyncSession, test_user: User, body_store: PostBodyStore
+    ):
+        """Test that identical large contents share one blob and stay searchable."""
+        post_service = PostService(db_session, body_store=body_store)
+        posts = [
+            await post_service.create_post(
+                PostCreate(title=title, content=LARGE_CONTENT, status=PostStatus.published),
+                test_user,
+            )
+            for title in ("First", "Second")
+        ]
+
+        bodies = (await db_session.execute(select(PostBody))).scalars().all()
+        assert {body.content for body in bodies} == {None}
+        assert len({body.blob_key for body in bodies}) == 1
+        assert len(stored_blobs(body_store)) == 1
+
+        assert await matches(db_session, posts[0].id, "first volcanoes basalt")
+        # The title trigger rebuilds the vector from the stored body terms
+        await post_service.update_post(posts[0].id, PostUpdate(title="Renamed"), test_user)
+        assert await matches(db_session, posts[0].id, "renamed volcanoes basalt")
+        assert not await matches(db_session, posts[0].id, "first")
+
+    async def test_offloaded_body_is_read_through_cache(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+        body_store: PostBodyStore,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test that the detail fetches an offloaded content once, then from the cache."""
+        post = await PostService(db_session, body_store=body_store).create_post(
+            PostCreate(title="Cached", content=LARGE_CONTENT), test_user
+        )
+        db_session.expunge_all()
+
+        reader = PostBodyStore(body_store.blobs, offload_bytes=1024, cache_bytes=4096)
+        reads: list[str] = []
+        read = reader.blobs.read
+
+        def counted_read(key: str) -> bytes:
+            reads.append(key)
+            return read(key)
+
+        monkeypatch.setattr(reader.blobs, "read", counted_read)
+
+        for _ in range(2):
+            detail = await PostService(db_session, body_store=reader).get_post_by_id(post.id)
+            assert detail.content == LARGE_CONTENT
+            db_session.expunge_all()
+        assert len(reads) == 1
+
+    async def test_update_between_inline_and_offloaded(
+        self, db_session: AsyncSession, test_user: User, body_store: PostBodyStore
+    ):
+        """Test that updates move a content in and out of the blob store as its size changes."""
+        post_service = PostService(db_session, body_store=body_store)
+        post = await post_service.create_post(
+            PostCreate(title="Growing", content="Short"), test_user
+        )
+
+        updated = await post_service.update_post(
+            post.id, PostUpdate(content=LARGE_CONTENT), test_user
+        )
+        assert updated.content == LARGE_CONTENT
+        body = await db_session.get(PostBody, post.id)
+        assert body.content is None and body.blob_key is not None
+
+        with recorded_statements(db_session) as statements:
+            unchanged = await post_service.update_post(
+                post.id, PostUpdate(content=LARGE_CONTENT, excerpt="Kept"), test_user
+            )
+        assert unchanged.content == LARGE_CONTENT
+        # UPDATE ... RETURNING (matched on the excerpt), revision lookup and
+        # insert, card refresh: no body write
+        assert len(statements) == 4
+
+        await post_service.update_post(post.id, PostUpdate(content="Short again"), test_user)
+        await db_session.refresh(body)
+        assert body.content == "Short again" and body.blob_key is None
+        assert await matches(db_session, post.id, "short")
+        assert not await matches(db_session, post.id, "basalt")
@@ -0,0 +1,132 @@
+"""Unit tests for post card statements."""
+
+from typing import List
+
+import pytest
+from sqlalchemy import Text, cast, delete, select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.post import Post
+from src.models.post_card import PostCard
+from src.models.tag import Tag
+from src.models.user import User
+from src.services.post_cards import (
+    CARDS_BY_CREATED_AT,
+    POST_CARD_DDL,
+    cards_page,
+    post_cards_upsert,
+    refresh_post_cards,
+)
+
+
+def compiled(stmt) -> str:
+    """Compile a statement for PostgreSQL."""
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestPostCards:
+    """Test cases for post card statements."""
+
+    def test_upsert_rebuilds_existing_cards(self):
+        """Test that refreshing a card overwrites every stored column."""
+        sql = compiled(post_cards_upsert([1, 2]))
+
+        assert sql.startswith(
+            "INSERT INTO post_cards (post_id, author_id, status, publication_date, "
+            "created_at, document) SELECT posts.id"
+        )
+        assert "json_build_object(" in sql
+        assert "WHERE posts.id IN (__[POSTCOMPILE_id_1])" in sql
+        assert "ON CONFLICT (post_id) DO UPDATE SET author_id = excluded.author_id" in sql
+        assert "document = excluded.document" in sql
+
+    def test_upsert_accepts_a_subquery(self):
+        """Test that cards can be rebuilt for every post selected by a query."""
+        sql = compiled(post_cards_upsert(select(Post.id)))
+
+        assert "WHERE posts.id IN (SELECT posts.id" in sql
+
+    def test_page_concatenates_stored_documents(self):
+        """Test that a page joins stored documents without rebuilding them."""
+        page = CARDS_BY_CREATED_AT.order_by(PostCard.created_at.desc()).limit(20)
+        sql = compiled(cards_page(page))
+
+        assert sql.startswith("SELECT convert_to(")
+        assert (
+            "string_agg(CAST(page.document AS TEXT), ',' "
+            "ORDER BY page.sort_key DESC, page.post_id)" in sql
+        )
+        assert "json_build_object" not in sql
+
+    def test_refresh_function_wraps_the_upsert(self):
+        """Test that the SQL function the triggers call is generated from the upsert."""
+        function = POST_CARD_DDL[0]
+
+        assert function.startswith("CREATE OR REPLACE FUNCTION refresh_post_cards(")
+        assert (
+            "WHERE posts.id = ANY (post_ids) AND posts.deleted_at IS NULL "
+            "ON CONFLICT (post_id)" in function
+        )
+        assert "DELETE FROM post_cards USING posts" in function
+        assert "%(" not in function and "__[POSTCOMPILE" not in function
+
+
+async def stored_cards(db_session: AsyncSession) -> List[str]:
+    """Documents of every card as stored text, in post order."""
+    result = await db_session.execute(
+        select(cast(PostCard.document, Text)).order_by(PostCard.post_id)
+    )
+    return list(result.scalars().all())
+
+
+@pytest.mark.asyncio
+class TestPostCardTriggers:
+    """Test that trigger-maintained cards equal cards built by post_cards_upsert."""
+
+    async def assert_cards_current(self, db_session: AsyncSession) -> List[str]:
+        """Rebuild every card with post_cards_upsert and compare with the stored ones."""
+        from_triggers = await stored_cards(db_session)
+        await db_session.execute(post_cards_upsert(select(Post.id)))
+        assert await stored_cards(db_session) == from_triggers
+        return from_triggers
+
+    async def test_tag_rename_rebuilds_cards(
+        self, db_session: AsyncSession, multiple_posts: list[Post], test_tags: list[Tag]
+    ):
+        """Test that renaming a tag rewrites the cards of its posts."""
+        await refresh_post_cards(db_session, [post.id for post in multiple_posts])
+        await db_session.execute(
+            update(Tag).where(Tag.id == test_tags[0].id).values(name="python3")
+        )
+
+        cards = await self.assert_cards_current(db_session)
+
+        assert any('"python3"' in card for card in cards)
+        assert not any('"python"' in card for card in cards)
+
+    async def test_tag_delete_rebuilds_cards(
+        self, db_session: AsyncSession, multiple_posts: list[Post], test_tags: list[Tag]
+    ):
+        """Test that deleting a tag removes it from the cards of its posts."""
+        await refresh_post_cards(db_session, [post.id for post in multiple_posts])
+        await db_session.execute(delete(Tag).where(Tag.id == test_tags[1].id))
+
+        cards = await self.assert_cards_current(db_session)
+
+        assert not any('"fastapi"' in card for card in cards)
+
+    async def test_author_update_rebuilds_cards(
+        self, db_session: AsyncSession, multiple_posts: list[Post], test_user: User
+    ):
+        """Test that updating an author rewrites the cards of their posts."""
+        await refresh_post_cards(db_session, [post.id for post in multiple_posts])
+        await db_session.execute(
+            update(User).where(User.id == test_user.id).values(full_name="Renamed Author")
+        )
+
+        cards = await self.assert_cards_current(db_session)
+
+        assert sum('"Renamed Author"' in card for card in cards) == sum(
+            post.author_id == test_user.id for post in multiple_posts
+        )
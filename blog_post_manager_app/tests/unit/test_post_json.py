@@ -0,0 +1,52 @@
+"""Unit tests for PostgreSQL-rendered list pages."""
+
+import json
+
+from sqlalchemy.dialects import postgresql
+
+from src.models.post import Post
+from src.services.post_json import POSTS_JSON_BY_CREATED_AT, iso_utc, json_page, paginated_json
+
+
+class TestPostJson:
+    """Test cases for JSON list page helpers."""
+
+    def test_envelope_matches_paginated_response(self):
+        """Test that the items array is wrapped with the pagination fields in order."""
+        document = paginated_json(b'[{"id" : 1}]', total=41, page=2, page_size=20)
+
+        assert json.loads(document) == {
+            "items": [{"id": 1}],
+            "total": 41,
+            "page": 2,
+            "page_size": 20,
+            "total_pages": 3,
+        }
+        assert list(json.loads(document)) == ["items", "total", "page", "page_size", "total_pages"]
+
+    def test_empty_page_has_zero_pages(self):
+        """Test the envelope for a page without items."""
+        document = json.loads(paginated_json(b"[]", total=0, page=1, page_size=20))
+
+        assert document["items"] == []
+        assert document["total_pages"] == 0
+
+    def test_timestamps_are_formatted_in_utc(self):
+        """Test that timestamps are rendered in UTC with a Z suffix."""
+        sql = str(
+            iso_utc(Post.created_at).compile(
+                dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+            )
+        )
+
+        assert "posts.created_at AT TIME ZONE 'UTC'" in sql
+        assert "'YYYY-MM-DD\"T\"HH24:MI:SS'" in sql
+        assert sql.endswith("|| 'Z'")
+
+    def test_page_is_one_bytea_value(self):
+        """Test that a page is aggregated in order and returned as UTF-8 bytes."""
+        page = POSTS_JSON_BY_CREATED_AT.order_by(Post.created_at.desc()).limit(20)
+        sql = str(json_page(page).compile(dialect=postgresql.dialect()))
+
+        assert sql.startswith("SELECT convert_to(")
+        assert "json_agg(page.item ORDER BY page.sort_key DESC, page.id)" in sql
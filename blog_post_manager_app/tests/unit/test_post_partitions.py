@@ -0,0 +1,202 @@
+"""Unit tests for the time partitions of posts."""
+
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Iterator, List, Tuple
+
+import pytest
+from sqlalchemy import event, func, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.models.post import Post, PostStatus, post_tags
+from src.models.post_body import PostBody
+from src.models.post_card import PostCard
+from src.models.user import User
+from src.schemas.post import PostCreate
+from src.services.post_partitions import (
+    COLD_PARTITION,
+    FUTURE_PARTITION,
+    add_months,
+    hot_window_start,
+    month_start,
+    partition_name,
+    utc_today,
+)
+from src.services.post_service import PostService
+from src.tools.post_partitions import ensure_partitions, monthly_partitions, tier_partitions
+from tests.conftest import test_engine
+
+
+def at(month) -> datetime:
+    """Mid-month timestamp in `month`."""
+    return datetime(month.year, month.month, 15, tzinfo=timezone.utc)
+
+
+async def create_post_at(db_session: AsyncSession, author: User, created_at: datetime) -> int:
+    """Create a published post with tags and move it to `created_at`."""
+    post = await PostService(db_session).create_post(
+        PostCreate(
+            title=f"Post of {created_at:%Y-%m}",
+            content="Body",
+            status=PostStatus.published,
+            tags=["partitions"],
+        ),
+        author,
+    )
+    # Updating the partition key moves the row to its partition
+    await db_session.execute(update(Post).where(Post.id == post.id).values(created_at=created_at))
+    await db_session.commit()
+    return post.id
+
+
+async def partition_of(db_session: AsyncSession, post_id: int) -> str:
+    """Name of the partition holding a post."""
+    return await db_session.scalar(
+        select(text("tableoid::regclass::text")).select_from(Post).where(Post.id == post_id)
+    )
+
+
+@contextmanager
+def recorded_executions(session: AsyncSession) -> Iterator[List[Tuple[str, Any]]]:
+    """Collect the SQL statements, with their parameters, sent on the session's engine."""
+    executions: List[Tuple[str, Any]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        executions.append((statement, parameters))
+
+    engine = session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield executions
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def scanned_relations(plan: dict) -> Iterator[Tuple[str, int]]:
+    """Relations scanned by a plan node and its children, with the node's loops."""
+    if "Relation Name" in plan:
+        yield plan["Relation Name"], plan["Actual Loops"]
+    for child in plan.get("Plans", []):
+        yield from scanned_relations(child)
+
+
+@pytest.mark.asyncio
+class TestPostPartitions:
+    """Test cases for the partitions of posts."""
+
+    async def test_list_page_stops_at_newest_partition(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Test that a page filled from the current month never scans older partitions."""
+        today = utc_today()
+        await create_post_at(db_session, test_user, at(add_months(month_start(today), -1)))
+        await create_post_at(db_session, test_user, at(add_months(month_start(today), -24)))
+        for _ in range(3):
+            await PostService(db_session).create_post(
+                PostCreate(title="Recent", content="Body", status=PostStatus.published),
+                test_user,
+            )
+        await db_session.commit()
+
+        with recorded_executions(db_session) as executions:
+            page = await PostService(db_session, list_strategy="core").list_posts(
+                page_size=3, status_filter=PostStatus.published
+            )
+        assert page.total == 5 and all(item.title == "Recent" for item in page.items)
+        statement, parameters = next(
+            execution for execution in executions if "LIMIT" in execution[0]
+        )
+
+        connection = await db_session.connection()
+        # Tables this small are cheaper to sort than to walk in index order;
+        # steer the planner to the ordered plan it picks for real tables
+        await connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        await connection.exec_driver_sql("SET LOCAL enable_sort = off")
+        result = await connection.exec_driver_sql(
+            f"EXPLAIN (ANALYZE, FORMAT JSON) {statement}", parameters
+        )
+        loops = dict(scanned_relations(result.scalar_one()[0]["Plan"]))
+        await db_session.rollback()
+
+        current = partition_name(month_start(today))
+        assert loops[current] >= 1
+        assert loops[COLD_PARTITION] == 0
+        assert loops[partition_name(add_months(month_start(today), -1))] == 0
+
+    async def test_ensure_partitions_takes_rows_from_future_partition(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Test that new months are created and rows already in their range moved into them."""
+        today = utc_today()
+        ahead = add_months(month_start(today), settings.post_partition_premake_months + 2)
+        post_id = await create_post_at(db_session, test_user, at(ahead))
+        assert await partition_of(db_session, post_id) == FUTURE_PARTITION
+        await db_session.commit()
+
+        created = await ensure_partitions(
+            test_engine, today, settings.post_partition_premake_months + 2
+        )
+
+        assert created == [
+            partition_name(add_months(month_start(today), months))
+            for months in (
+                settings.post_partition_premake_months + 1,
+                settings.post_partition_premake_months + 2,
+            )
+        ]
+        assert await partition_of(db_session, post_id) == partition_name(ahead)
+        assert await ensure_partitions(
+            test_engine, today, settings.post_partition_premake_months + 2
+        ) == []
+
+    async def test_tier_partitions_moves_old_months_to_cold(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Test that months leaving the hot window are folded into the cold partition."""
+        today = utc_today()
+        oldest = hot_window_start(today, settings.post_partition_hot_months)
+        post_id = await create_post_at(db_session, test_user, at(oldest))
+        assert await partition_of(db_session, post_id) == partition_name(oldest)
+        await db_session.commit()
+
+        moved = await tier_partitions(test_engine, today, settings.post_partition_hot_months - 1)
+
+        assert moved == [partition_name(oldest)]
+        assert await partition_of(db_session, post_id) == COLD_PARTITION
+        async with test_engine.connect() as conn:
+            assert oldest not in await monthly_partitions(conn)
+        post = await PostService(db_session).get_post_by_id(post_id)
+        assert post.content == "Body"
+
+        # Rows below the new bound are accepted by the cold partition only
+        await create_post_at(db_session, test_user, at(oldest))
+        assert await tier_partitions(
+            test_engine, today, settings.post_partition_hot_months - 1
+        ) == []
+
+    async def test_deleting_posts_removes_their_rows(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Test that the delete trigger removes tags, bodies and cards like a cascade."""
+        post_ids = [
+            await create_post_at(db_session, test_user, at(month_start(utc_today())))
+            for _ in range(2)
+        ]
+
+        await db_session.execute(Post.__table__.delete().where(Post.id == post_ids[0]))
+        await db_session.commit()
+
+        for table, column in (
+            (post_tags, post_tags.c.post_id),
+            (PostBody.__table__, PostBody.post_id),
+            (PostCard.__table__, PostCard.post_id),
+        ):
+            counts = dict(
+                (
+                    await db_session.execute(
+                        select(column, func.count()).select_from(table).group_by(column)
+                    )
+                ).all()
+            )
+            assert counts == {post_ids[1]: 1}, table.name
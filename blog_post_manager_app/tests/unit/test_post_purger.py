@@ -0,0 +1,93 @@
+"""Unit tests for the deleted post purger."""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.post import Post, post_tags
+from src.models.user import User
+from src.services.post_purger import PostPurger
+from src.services.post_service import PostService
+from tests.conftest import TestSessionLocal
+
+
+def make_purger(purge_after_seconds: int = 0, batch_size: int = 10) -> PostPurger:
+    """Build a purger over the test database."""
+    return PostPurger(
+        TestSessionLocal,
+        purge_after_seconds=purge_after_seconds,
+        batch_size=batch_size,
+        batch_interval_seconds=0.01,
+        idle_seconds=0.01,
+    )
+
+
+async def remaining_ids(db_session: AsyncSession) -> set[int]:
+    """IDs of the posts still stored, deleted or not."""
+    return set((await db_session.scalars(select(Post.id))).all())
+
+
+@pytest.mark.asyncio
+class TestPostPurger:
+    """Test cases for PostPurger."""
+
+    async def test_purges_due_deleted_posts_in_batches(
+        self, db_session: AsyncSession, multiple_posts: list[Post], test_user: User
+    ):
+        """Test that batches remove deleted posts, with their tag links, oldest first."""
+        ids = [post.id for post in multiple_posts]
+        post_service = PostService(db_session)
+        for post_id in ids[:3]:
+            await post_service.delete_post(post_id, test_user)
+        purger = make_purger(batch_size=2)
+
+        assert await purger.purge_batch(db_session) == 2
+        assert await purger.purge_batch(db_session) == 1
+        assert await purger.purge_batch(db_session) == 0
+
+        assert await remaining_ids(db_session) == set(ids[3:])
+        assert await db_session.scalar(
+            select(func.count()).select_from(post_tags).where(post_tags.c.post_id.in_(ids[:3]))
+        ) == 0
+
+    async def test_keeps_recently_deleted_posts(
+        self, db_session: AsyncSession, multiple_posts: list[Post], test_user: User
+    ):
+        """Test that posts deleted less than purge_after_seconds ago are kept."""
+        old_id, recent_id = multiple_posts[0].id, multiple_posts[1].id
+        post_service = PostService(db_session)
+        await post_service.delete_post(old_id, test_user)
+        await post_service.delete_post(recent_id, test_user)
+        await db_session.execute(
+            update(Post)
+            .where(Post.id == old_id)
+            .values(deleted_at=func.now() - timedelta(days=2))
+        )
+        await db_session.commit()
+
+        assert await make_purger(purge_after_seconds=86_400).purge_batch(db_session) == 1
+
+        ids = await remaining_ids(db_session)
+        assert old_id not in ids and recent_id in ids
+
+    async def test_background_task_purges_until_stopped(
+        self, db_session: AsyncSession, multiple_posts: list[Post], test_user: User
+    ):
+        """Test that the started purger works through the backlog and stops cleanly."""
+        ids = [post.id for post in multiple_posts]
+        post_service = PostService(db_session)
+        for post_id in ids[:3]:
+            await post_service.delete_post(post_id, test_user)
+        purger = make_purger(batch_size=1)
+
+        purger.start()
+        for _ in range(100):
+            await asyncio.sleep(0.02)
+            if await remaining_ids(db_session) == set(ids[3:]):
+                break
+        await purger.stop()
+
+        assert await remaining_ids(db_session) == set(ids[3:])
@@ -0,0 +1,195 @@
+"""Unit tests for post revisions and their deltas."""
+
+import random
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.models.post import Post
+from src.models.post_revision import PostRevision
+from src.models.user import User
+from src.schemas.post import PostCreate, PostUpdate
+from src.services import post_revisions
+from src.services.post_bodies import PostBodyStore
+from src.services.post_revisions import PostRevisionService, apply_delta, encode_delta
+from src.services.post_service import PostService
+from src.utils.blob_store import FilesystemBlobStore
+
+# About 50 KB of distinct sentences in paragraphs
+BODY = "\n\n".join(
+    " ".join(f"Paragraph {p} sentence {s} describes step {p * 10 + s}." for s in range(10))
+    for p in range(120)
+)
+
+
+def edited(body: str, seed: int) -> str:
+    """The body with one sentence rewritten and one appended, as by an autosave."""
+    rng = random.Random(seed)
+    sentence = f"sentence {rng.randrange(10)} describes step"
+    return body.replace(sentence, f"{sentence} (edit {seed})", 1) + f" Added {seed}."
+
+
+async def stored_revisions(db_session: AsyncSession, post_id: int) -> list[PostRevision]:
+    """A post's revisions, oldest first."""
+    return list(
+        (
+            await db_session.execute(
+                select(PostRevision)
+                .where(PostRevision.post_id == post_id)
+                .order_by(PostRevision.revision)
+            )
+        ).scalars()
+    )
+
+
+class TestDeltas:
+    """Test cases for delta encoding."""
+
+    @pytest.mark.parametrize(
+        "base, content",
+        [
+            ("", "New text."),
+            ("Old text.", ""),
+            ("One. Two. Three.", "One. Three. Four!"),
+            ("No sentence end", "No sentence end, but longer"),
+            ("Line\n\n\nbreaks\n", "Line\nbreaks\n\n"),
+            ("Ünïcode ✓. Text.", "Ünïcode ✓. Teхt?"),
+        ],
+    )
+    def test_delta_rebuilds_content(self, base: str, content: str):
+        """Test that applying a delta to its base gives the content back."""
+        assert apply_delta(base, encode_delta(base, content)) == content
+
+    def test_small_edit_stores_small_delta(self):
+        """Test that a one-sentence edit of a 50 KB body costs well under 1 KB."""
+        content = edited(BODY, 1)
+
+        delta = encode_delta(BODY, content)
+
+        assert apply_delta(BODY, delta) == content
+        assert len(delta) < 500
+
+
+@pytest.mark.asyncio
+class TestPostRevisions:
+    """Test cases for post revisions."""
+
+    async def test_updates_store_deltas_between_snapshots(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test that every revision rebuilds, reading at most max_deltas deltas."""
+        monkeypatch.setattr(settings, "post_revision_max_deltas", 3)
+        post_service = PostService(db_session)
+        post = await post_service.create_post(PostCreate(title="Draft", content=BODY), test_user)
+
+        contents = {post.version: BODY}
+        content = BODY
+        for seed in range(8):
+            content = edited(content, seed)
+            updated = await post_service.update_post(
+                post.id, PostUpdate(content=content), test_user
+            )
+            contents[updated.version] = content
+        # A title-only update records the same content
+        updated = await post_service.update_post(post.id, PostUpdate(title="Final"), test_user)
+        contents[updated.version] = content
+
+        revisions = await stored_revisions(db_session, post.id)
+        assert [revision.revision for revision in revisions] == sorted(contents)
+        assert [revision.deltas for revision in revisions] == [0, 1, 2, 3, 0, 1, 2, 3, 0, 1]
+        snapshot_bytes = len(revisions[0].data)
+        assert all(len(revision.data) * 20 < snapshot_bytes for revision in revisions[1:4])
+
+        applied: list[bytes] = []
+
+        def counted_apply(base: str, delta: bytes) -> str:
+            applied.append(delta)
+            return apply_delta(base, delta)
+
+        monkeypatch.setattr(post_revisions, "apply_delta", counted_apply)
+        revision_service = PostRevisionService(db_session)
+        for number, expected in contents.items():
+            applied.clear()
+            revision = await revision_service.get_revision(post.id, number, test_user)
+            assert revision.content == expected, number
+            assert len(applied) <= 3
+        assert revision.title == "Final"
+
+    async def test_list_and_restore(self, db_session: AsyncSession, test_user: User):
+        """Test that restoring a revision records a new one with its title, excerpt and content."""
+        post_service = PostService(db_session)
+        post = await post_service.create_post(
+            PostCreate(title="First", content="Original text."), test_user
+        )
+        await post_service.update_post(
+            post.id,
+            PostUpdate(title="Second", content="Rewritten text.", excerpt="Summary"),
+            test_user,
+        )
+
+        restored = await post_service.restore_revision(post.id, post.version, test_user)
+
+        assert (restored.title, restored.content, restored.excerpt) == (
+            "First",
+            "Original text.",
+            None,
+        )
+        page = await post_service.revisions.list_revisions(post.id, test_user)
+        assert page.total == 3
+        assert [item.revision for item in page.items] == [restored.version, 2, 1]
+        assert [item.title for item in page.items] == ["First", "Second", "First"]
+        assert page.items[-1].snapshot and not page.items[0].snapshot
+
+    async def test_revisions_are_private(
+        self, db_session: AsyncSession, test_user: User, test_user2: User
+    ):
+        """Test that only the author reads revisions, and missing ones are 404."""
+        post_service = PostService(db_session)
+        post = await post_service.create_post(
+            PostCreate(title="Private", content="Text."), test_user
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await post_service.revisions.get_revision(post.id, post.version, test_user2)
+        assert exc_info.value.status_code == 403
+
+        with pytest.raises(HTTPException) as exc_info:
+            await post_service.revisions.get_revision(post.id, post.version + 1, test_user)
+        assert exc_info.value.status_code == 404
+
+    async def test_offloaded_snapshot_references_blob(
+        self, db_session: AsyncSession, test_user: User, tmp_path: Path
+    ):
+        """Test that a snapshot of an offloaded content stores its blob key only."""
+        body_store = PostBodyStore(
+            FilesystemBlobStore(str(tmp_path)), offload_bytes=1024, cache_bytes=0
+        )
+        post_service = PostService(db_session, body_store=body_store)
+        post = await post_service.create_post(PostCreate(title="Large", content=BODY), test_user)
+        await post_service.update_post(post.id, PostUpdate(content=edited(BODY, 1)), test_user)
+
+        snapshot, delta = await stored_revisions(db_session, post.id)
+        assert snapshot.data is None and snapshot.blob_key is not None
+        assert delta.blob_key is None and len(delta.data) < 500
+        revision = await post_service.revisions.get_revision(post.id, 2, test_user)
+        assert revision.content == edited(BODY, 1)
+
+    async def test_deleting_posts_removes_revisions(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Test that the delete trigger removes a post's revisions."""
+        post_service = PostService(db_session)
+        post = await post_service.create_post(PostCreate(title="Gone", content="A."), test_user)
+        await post_service.update_post(post.id, PostUpdate(content="B."), test_user)
+
+        await db_session.execute(Post.__table__.delete().where(Post.id == post.id))
+        await db_session.commit()
+
+        assert await stored_revisions(db_session, post.id) == []
@@ -0,0 +1,79 @@
+"""Unit tests for the Core list query path."""
+
+from datetime import datetime, timezone
+
+from sqlalchemy.dialects import postgresql
+
+from src.models.post import PostStatus
+from src.services.post_rows import POST_ROWS, PostRow, post_list_items, post_row
+
+NOW = datetime(2025, 1, 14, 12, 0, tzinfo=timezone.utc)
+
+
+def _row(tag_ids, tag_names, tag_created_at, *extra):
+    return (
+        7, "Title", "Excerpt", PostStatus.published, NOW, NOW,
+        3, "author@example.com", "author1", "John Doe", True, NOW, NOW,
+        tag_ids, tag_names, tag_created_at, *extra,
+    )  # fmt: skip
+
+
+class TestPostRows:
+    """Test cases for Core list rows."""
+
+    def test_row_maps_author_and_tags(self):
+        """Test that tag arrays are zipped into tags and author columns into the author."""
+        post = post_row(_row([1, 2], ["fastapi", "python"], [NOW, NOW]))
+
+        assert isinstance(post, PostRow)
+        assert not hasattr(post, "__dict__")
+        assert post.author.username == "author1"
+        assert [(tag.id, tag.name) for tag in post.tags] == [(1, "fastapi"), (2, "python")]
+
+    def test_post_without_tags_gets_empty_list(self):
+        """Test that NULL tag arrays (no tags) become an empty list."""
+        assert post_row(_row(None, None, None)).tags == []
+
+    def test_extra_columns_are_ignored(self):
+        """Test that trailing columns such as a search rank do not affect mapping."""
+        post = post_row(_row([1], ["python"], [NOW], 0.75))
+
+        assert post.id == 7
+        assert len(post.tags) == 1
+
+    def test_items_validate_as_list_responses(self):
+        """Test that rows serialize exactly like ORM-backed list items."""
+        (item,) = post_list_items([_row([1], ["python"], [NOW])])
+
+        assert item.model_dump(mode="json") == {
+            "id": 7,
+            "title": "Title",
+            "excerpt": "Excerpt",
+            "status": "published",
+            "publication_date": "2025-01-14T12:00:00Z",
+            "created_at": "2025-01-14T12:00:00Z",
+            "author": {
+                "id": 3,
+                "email": "author@example.com",
+                "username": "author1",
+                "full_name": "John Doe",
+                "is_active": True,
+                "created_at": "2025-01-14T12:00:00Z",
+                "updated_at": "2025-01-14T12:00:00Z",
+            },
+            "tags": [
+                {
+                    "id": 1,
+                    "name": "python",
+                    "created_at": "2025-01-14T12:00:00Z",
+                    "post_count": None,
+                }
+            ],
+        }
+
+    def test_statement_aggregates_tags_in_one_query(self):
+        """Test that tags come from a lateral array_agg instead of extra queries."""
+        sql = str(POST_ROWS.compile(dialect=postgresql.dialect()))
+
+        assert "JOIN LATERAL" in sql
+        assert "array_agg(tags.name ORDER BY tags.name)" in sql
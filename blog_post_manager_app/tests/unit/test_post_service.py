@@ -1,14 +1,40 @@
 """Unit tests for post service."""
 
+import json
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, List
+
 import pytest
 from fastapi import HTTPException
+from sqlalchemy import event, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
 from src.models.post import Post, PostStatus
+from src.models.post_card import PostCard
 from src.models.tag import Tag
 from src.models.user import User
-from src.schemas.post import PostCreate, PostUpdate
+from src.schemas.post import PostBulkSelection, PostBulkUpdate, PostCreate, PostUpdate
+from src.services.post_cards import refresh_post_cards
 from src.services.post_service import PostService
+from src.services.search_service import SearchService
+
+
+@contextmanager
+def recorded_statements(session: AsyncSession) -> Iterator[List[str]]:
+    """Collect the SQL statements sent on the session's engine."""
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    engine = session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
 
 
 @pytest.mark.asyncio
@@ -174,6 +200,93 @@ class TestPostService:
             any(tag.name == "python" for tag in post.tags) for post in result.items
         )
 
+    async def test_list_posts_cached_statement_rebinds_tags(
+        self, db_session: AsyncSession, multiple_posts: list[Post]
+    ):
+        """Test that reusing the cached list statement binds the new tag names."""
+        post_service = PostService(db_session)
+
+        python_posts = await post_service.list_posts(tag_names=["python"])
+        fastapi_posts = await post_service.list_posts(tag_names=["fastapi"])
+
+        assert python_posts.total == 2
+        assert fastapi_posts.total == 2
+        assert all(
+            any(tag.name == "fastapi" for tag in post.tags) for post in fastapi_posts.items
+        )
+
+    async def test_list_posts_core_strategy_matches_orm(
+        self, db_session: AsyncSession, multiple_posts: list[Post]
+    ):
+        """Test that the Core list path returns the same items as the ORM path."""
+        orm = await PostService(db_session, list_strategy="orm").list_posts(
+            status_filter=None, page_size=100
+        )
+        core = await PostService(db_session, list_strategy="core").list_posts(
+            status_filter=None, page_size=100
+        )
+
+        def normalized(page):
+            return {
+                item.id: (item.model_dump(exclude={"tags"}), sorted(t.name for t in item.tags))
+                for item in page.items
+            }
+
+        assert core.total == orm.total == len(multiple_posts)
+        assert normalized(core) == normalized(orm)
+
+    async def test_list_posts_json_matches_pydantic_serialization(
+        self, db_session: AsyncSession, multiple_posts: list[Post]
+    ):
+        """Test that PostgreSQL-rendered pages equal the Pydantic-serialized ones."""
+        service = PostService(db_session, list_strategy="core")
+
+        expected = (await service.list_posts(status_filter=None, page_size=100)).model_dump(
+            mode="json"
+        )
+        rendered = json.loads(await service.list_posts_json(status_filter=None, page_size=100))
+
+        def by_id(items):
+            return {
+                item["id"]: {**item, "tags": sorted(item["tags"], key=lambda t: t["name"])}
+                for item in items
+            }
+
+        assert by_id(rendered.pop("items")) == by_id(expected.pop("items"))
+        assert rendered == expected
+
+    async def test_list_posts_cards_match_json(
+        self, db_session: AsyncSession, multiple_posts: list[Post]
+    ):
+        """Test that pages concatenated from post cards equal the JSON-rendered ones."""
+        await refresh_post_cards(db_session, [post.id for post in multiple_posts])
+        await db_session.commit()
+
+        for filters in ({}, {"author_id": multiple_posts[0].author_id}, {"tag_names": ["python"]}):
+            expected = await PostService(db_session, list_strategy="json").list_posts_json(
+                status_filter=PostStatus.published, page_size=3, **filters
+            )
+            rendered = await PostService(db_session, list_strategy="cards").list_posts_json(
+                status_filter=PostStatus.published, page_size=3, **filters
+            )
+
+            assert json.loads(rendered) == json.loads(expected)
+
+    async def test_post_writes_refresh_cards(self, db_session: AsyncSession, test_user: User):
+        """Test that creating and updating a post keeps its card current."""
+        post_service = PostService(db_session, list_strategy="cards")
+        post = await post_service.create_post(
+            PostCreate(title="Carded", content="Content", tags=["python"]), test_user
+        )
+        await post_service.update_post(post.id, PostUpdate(title="Recarded"), test_user)
+
+        page = json.loads(await post_service.list_posts_json(status_filter=None))
+
+        assert [(item["id"], item["title"]) for item in page["items"]] == [
+            (post.id, "Recarded")
+        ]
+        assert [tag["name"] for tag in page["items"][0]["tags"]] == ["python"]
+
     async def test_update_post_success(
         self, db_session: AsyncSession, test_post: Post, test_user: User
     ):
@@ -256,6 +369,50 @@ class TestPostService:
         with pytest.raises(HTTPException):
             await post_service.get_post_by_id(test_post.id)
 
+    async def test_delete_post_is_soft_and_hidden_from_reads(
+        self, db_session: AsyncSession, multiple_posts: list[Post], test_user: User
+    ):
+        """Test that a deleted post keeps its row but no read, update or delete finds it."""
+        deleted_id = multiple_posts[1].id  # published, tagged fastapi
+        await refresh_post_cards(db_session, [post.id for post in multiple_posts])
+        await db_session.commit()
+        post_service = PostService(db_session)
+
+        await post_service.delete_post(deleted_id, test_user)
+
+        deleted_at = await db_session.scalar(
+            select(Post.deleted_at).where(Post.id == deleted_id)
+        )
+        assert deleted_at is not None
+        assert await db_session.scalar(
+            select(func.count()).select_from(PostCard).where(PostCard.post_id == deleted_id)
+        ) == 0
+
+        for strategy in ("orm", "core"):
+            page = await PostService(db_session, list_strategy=strategy).list_posts(
+                status_filter=None, page_size=100
+            )
+            assert deleted_id not in {item.id for item in page.items}
+            assert page.total == len(multiple_posts) - 1
+        for strategy in ("json", "cards"):
+            page = json.loads(
+                await PostService(db_session, list_strategy=strategy).list_posts_json(
+                    status_filter=None, tag_names=["fastapi"]
+                )
+            )
+            assert deleted_id not in {item["id"] for item in page["items"]}
+            assert page["total"] == 1
+        found = await SearchService(db_session).search_posts(query="searchable")
+        assert deleted_id not in {item.id for item in found.items}
+
+        for write in (
+            post_service.update_post(deleted_id, PostUpdate(title="Back"), test_user),
+            post_service.delete_post(deleted_id, test_user),
+        ):
+            with pytest.raises(HTTPException) as exc_info:
+                await write
+            assert exc_info.value.status_code == 404
+
     async def test_delete_post_not_author(
         self, db_session: AsyncSession, test_post: Post, test_user2: User
     ):
@@ -277,3 +434,229 @@ class TestPostService:
             await post_service.delete_post(99999, test_user)
 
         assert exc_info.value.status_code == 404
+
+    async def test_update_post_not_found(self, db_session: AsyncSession, test_user: User):
+        """Test updating a non-existent post fails with 404."""
+        post_service = PostService(db_session)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await post_service.update_post(99999, PostUpdate(title="Missing"), test_user)
+
+        assert exc_info.value.status_code == 404
+
+    async def test_writes_run_one_statement_per_row_change(
+        self, db_session: AsyncSession, test_user: User, test_tags: list[Tag]
+    ):
+        """Test that writes no longer load the post before changing it."""
+        post_service = PostService(db_session)
+
+        with recorded_statements(db_session) as statements:
+            post = await post_service.create_post(
+                PostCreate(title="Counted", content="Content", tags=["python", "new-tag"]),
+                test_user,
+            )
+        # INSERT ... RETURNING, body upsert, first revision, tag upsert and link,
+        # card refresh
+        assert len(statements) == 5
+        assert [t.name for t in post.tags] == ["new-tag", "python"]
+
+        with recorded_statements(db_session) as statements:
+            updated = await post_service.update_post(
+                post.id, PostUpdate(title="Recounted"), test_user
+            )
+        # UPDATE ... RETURNING (with the current tags), latest revision lookup,
+        # revision insert, card refresh
+        assert len(statements) == 4
+        assert updated.title == "Recounted"
+        assert [t.name for t in updated.tags] == ["new-tag", "python"]
+
+        with recorded_statements(db_session) as statements:
+            await post_service.delete_post(post.id, test_user)
+        # UPDATE setting deleted_at, card refresh (dropping the card)
+        assert len(statements) == 2
+
+    async def test_update_post_without_changes_writes_nothing(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Test that resending the stored values skips the write and the card refresh."""
+        post_service = PostService(db_session)
+        post = await post_service.create_post(
+            PostCreate(
+                title="Autosaved",
+                content="Same content",
+                excerpt="Same excerpt",
+                status=PostStatus.published,
+                tags=["python", "fastapi"],
+            ),
+            test_user,
+        )
+
+        unchanged = PostUpdate(
+            title="Autosaved",
+            content="Same content",
+            excerpt="Same excerpt",
+            status=PostStatus.published,
+            tags=["fastapi", "python"],
+        )
+        with recorded_statements(db_session) as statements:
+            result = await post_service.update_post(post.id, unchanged, test_user)
+
+        # The UPDATE matching no row, then one read of the current post
+        assert len(statements) == 2
+        assert not any("refresh_post_cards" in statement for statement in statements)
+        assert result.updated_at == post.updated_at
+        assert result.publication_date == post.publication_date
+        assert [t.name for t in result.tags] == ["fastapi", "python"]
+
+    async def test_update_post_with_one_changed_field_writes(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Test that a change to any field, including the tags, still updates the post."""
+        post_service = PostService(db_session)
+        post = await post_service.create_post(
+            PostCreate(title="Draft", content="Body", tags=["python"]), test_user
+        )
+
+        retitled = await post_service.update_post(
+            post.id, PostUpdate(title="Draft", content="Body!"), test_user
+        )
+        retagged = await post_service.update_post(
+            post.id, PostUpdate(content="Body!", tags=["python", "sql"]), test_user
+        )
+
+        assert retitled.content == "Body!"
+        assert [t.name for t in retagged.tags] == ["python", "sql"]
+
+    async def test_update_post_without_changes_checks_ownership(
+        self, db_session: AsyncSession, test_post: Post, test_user2: User
+    ):
+        """Test that an update matching the stored values is still refused to non-authors."""
+        post_service = PostService(db_session)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await post_service.update_post(test_post.id, PostUpdate(), test_user2)
+
+        assert exc_info.value.status_code == 403
+
+    async def test_update_post_bumps_version_unless_unchanged(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Test that every write increments the version and a no-op keeps it."""
+        post_service = PostService(db_session)
+        post = await post_service.create_post(
+            PostCreate(title="Versioned", content="Body"), test_user
+        )
+
+        updated = await post_service.update_post(post.id, PostUpdate(title="V2"), test_user)
+        unchanged = await post_service.update_post(post.id, PostUpdate(title="V2"), test_user)
+
+        assert (post.version, updated.version, unchanged.version) == (1, 2, 2)
+
+    async def test_update_post_with_stale_version_fails(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Test that an update for a version that was replaced fails with 412."""
+        post_service = PostService(db_session)
+        post = await post_service.create_post(
+            PostCreate(title="Contended", content="Body"), test_user
+        )
+        await post_service.update_post(post.id, PostUpdate(title="First"), test_user, [1])
+
+        with pytest.raises(HTTPException) as exc_info:
+            await post_service.update_post(post.id, PostUpdate(title="Second"), test_user, [1])
+
+        assert exc_info.value.status_code == 412
+        assert exc_info.value.headers == {"ETag": '"2"'}
+        current = await post_service.get_post_by_id(post.id)
+        assert current.title == "First"
+
+    async def test_delete_post_with_stale_version_fails(
+        self, db_session: AsyncSession, test_post: Post, test_user: User
+    ):
+        """Test that a delete for another version fails with 412 and keeps the post."""
+        post_service = PostService(db_session)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await post_service.delete_post(test_post.id, test_user, [test_post.version + 1])
+
+        assert exc_info.value.status_code == 412
+        await post_service.delete_post(test_post.id, test_user, [test_post.version])
+
+    async def test_bulk_update_status_by_filter(
+        self, db_session: AsyncSession, multiple_posts: list[Post], test_user: User, monkeypatch
+    ):
+        """Test moving the caller's posts matching a filter, one chunk at a time."""
+        post_service = PostService(db_session)
+        monkeypatch.setattr(settings, "post_bulk_chunk_size", 1)
+        # Posts 1 and 3 are tagged python; both belong to test_user
+        before = {post.id: post.status for post in multiple_posts[:3]}
+        tagged = {multiple_posts[0].id, multiple_posts[2].id}
+
+        affected = await post_service.bulk_update_status(
+            PostBulkUpdate(filter={"tags": ["Python"]}, status=PostStatus.archived), test_user
+        )
+
+        assert affected == 2
+        for post_id, status in before.items():
+            current = await post_service.get_post_by_id(post_id)
+            assert current.status == (PostStatus.archived if post_id in tagged else status)
+
+    async def test_bulk_update_status_sets_publication_date_once(
+        self, db_session: AsyncSession, draft_post: Post, test_post: Post, test_user: User
+    ):
+        """Test that publishing dates new posts only and skips posts already published."""
+        post_service = PostService(db_session)
+        draft_id = draft_post.id
+        published = await post_service.get_post_by_id(test_post.id)
+
+        affected = await post_service.bulk_update_status(
+            PostBulkUpdate(ids=[draft_id, published.id], status=PostStatus.published),
+            test_user,
+        )
+
+        assert affected == 1
+        draft = await post_service.get_post_by_id(draft_id)
+        assert draft.publication_date is not None
+        assert draft.version == 2
+        assert await post_service.get_post_by_id(published.id) == published
+
+    async def test_bulk_writes_skip_other_authors_posts(
+        self, db_session: AsyncSession, multiple_posts: list[Post], test_user: User
+    ):
+        """Test that bulk writes only touch the caller's posts."""
+        post_service = PostService(db_session)
+        ids = [post.id for post in multiple_posts]
+
+        affected = await post_service.bulk_delete(PostBulkSelection(ids=ids), test_user)
+
+        assert affected == 4
+        remaining = await post_service.list_posts(status_filter=None)
+        assert {post.id for post in remaining.items} == set(ids[4:])
+
+    async def test_bulk_delete_by_date_range(
+        self, db_session: AsyncSession, multiple_posts: list[Post], test_user: User
+    ):
+        """Test deleting posts by creation date, with an exclusive upper bound."""
+        post_service = PostService(db_session)
+        old_id, kept_id = multiple_posts[0].id, multiple_posts[1].id
+        dates = {old_id: datetime(2020, 1, 1), kept_id: datetime(2021, 1, 1)}
+        for post_id, created_at in dates.items():
+            await db_session.execute(
+                update(Post).where(Post.id == post_id).values(created_at=created_at)
+            )
+        await db_session.commit()
+
+        affected = await post_service.bulk_delete(
+            PostBulkSelection(
+                filter={
+                    "created_after": datetime(2019, 1, 1),
+                    "created_before": datetime(2021, 1, 1),
+                }
+            ),
+            test_user,
+        )
+
+        assert affected == 1
+        with pytest.raises(HTTPException):
+            await post_service.get_post_by_id(old_id)
+        await post_service.get_post_by_id(kept_id)
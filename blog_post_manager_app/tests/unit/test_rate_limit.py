@@ -0,0 +1,91 @@
+"""Unit tests for rate limiting."""
+
+import pytest
+
+from src.utils.rate_limit import (
+    MemoryRateLimitBackend,
+    RateLimitBackend,
+    RateLimiter,
+    parse_route_budgets,
+    retry_after_header,
+)
+
+
+@pytest.mark.asyncio
+class TestRateLimiter:
+    """Test cases for the token-bucket rate limiter."""
+
+    async def test_allows_burst_then_rejects(self):
+        """Test that a bucket allows its capacity and then rejects."""
+        limiter = RateLimiter(MemoryRateLimitBackend(max_keys=10), default_per_minute=3)
+
+        results = [await limiter.check("ip:1.2.3.4", "GET /api/v1/posts") for _ in range(4)]
+
+        assert [r.allowed for r in results] == [True, True, True, False]
+        assert [r.remaining for r in results[:3]] == [2, 1, 0]
+        assert results[3].retry_after > 0
+        assert retry_after_header(results[3]) == "20"
+
+    async def test_budgets_are_per_client_and_route(self):
+        """Test that clients and routes have independent buckets and budgets."""
+        limiter = RateLimiter(
+            MemoryRateLimitBackend(max_keys=10),
+            default_per_minute=1,
+            route_budgets={"POST /api/v1/auth/login": 2},
+        )
+
+        assert (await limiter.check("user:1", "GET /api/v1/posts")).allowed
+        assert not (await limiter.check("user:1", "GET /api/v1/posts")).allowed
+        assert (await limiter.check("user:2", "GET /api/v1/posts")).allowed
+        assert (await limiter.check("user:1", "POST /api/v1/auth/login")).limit == 2
+
+    async def test_tokens_refill_over_time(self, monkeypatch):
+        """Test that tokens refill at budget per minute."""
+        now = [1000.0]
+        monkeypatch.setattr("src.utils.rate_limit.time.monotonic", lambda: now[0])
+        limiter = RateLimiter(MemoryRateLimitBackend(max_keys=10), default_per_minute=60)
+
+        for _ in range(60):
+            await limiter.check("ip:a", "GET /x")
+        assert not (await limiter.check("ip:a", "GET /x")).allowed
+
+        now[0] += 1.0
+        assert (await limiter.check("ip:a", "GET /x")).allowed
+
+    async def test_memory_backend_evicts_least_recently_used(self):
+        """Test that the number of buckets is bounded."""
+        backend = MemoryRateLimitBackend(max_keys=2)
+
+        await backend.hit("a", 1, 1 / 60)
+        await backend.hit("b", 1, 1 / 60)
+        await backend.hit("a", 1, 1 / 60)  # "a" is now most recently used
+        await backend.hit("c", 1, 1 / 60)
+
+        assert len(backend._buckets) == 2
+        assert set(backend._buckets) == {"a", "c"}
+
+    async def test_incomplete_backend_cannot_be_created(self):
+        """Test that a backend without hit() fails when it is instantiated."""
+
+        class Incomplete(RateLimitBackend):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+
+class TestRouteBudgets:
+    """Test cases for route budget parsing."""
+
+    def test_parse_route_budgets(self):
+        """Test parsing comma-separated route budgets."""
+        budgets = parse_route_budgets(
+            "post /api/v1/auth/login=20, GET /api/v1/posts/{post_id}=500,"
+        )
+
+        assert budgets == {"POST /api/v1/auth/login": 20, "GET /api/v1/posts/{post_id}": 500}
+
+    def test_parse_route_budgets_invalid(self):
+        """Test that malformed entries are rejected."""
+        with pytest.raises(ValueError):
+            parse_route_budgets("/api/v1/posts=abc")
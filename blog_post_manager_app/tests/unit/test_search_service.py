@@ -94,6 +94,46 @@ class TestSearchService:
         # Should return results (relevance sorting is internal)
         assert result.total >= 0
 
+    async def test_search_posts_core_strategy_ranks_results(
+        self, db_session: AsyncSession, test_post: Post, multiple_posts: list[Post]
+    ):
+        """Test that the Core search path finds the same posts as the ORM path."""
+        orm = await SearchService(db_session, list_strategy="orm").search_posts(
+            query="searchable", page_size=100
+        )
+        core = await SearchService(db_session, list_strategy="core").search_posts(
+            query="searchable", page_size=100
+        )
+
+        assert core.total == orm.total
+        assert {post.id for post in core.items} == {post.id for post in orm.items}
+
+    @pytest.mark.parametrize("sort_by", ["relevance", "date"])
+    async def test_search_pages_break_ties_by_id(
+        self, db_session: AsyncSession, multiple_posts: list[Post], sort_by: str
+    ):
+        """Test that equally ranked posts page newest ID first, alike in every strategy."""
+        # The published posts share one content template, so they rank equally
+        expected = sorted(
+            (post.id for post in multiple_posts if post.status.value == "published"),
+            reverse=True,
+        )
+        if sort_by == "date":
+            await db_session.execute(
+                Post.__table__.update().values(publication_date=multiple_posts[0].created_at)
+            )
+
+        for strategy in ("orm", "core"):
+            search_service = SearchService(db_session, list_strategy=strategy)
+            pages = [
+                await search_service.search_posts(
+                    query="searchable", sort_by=sort_by, page=page, page_size=2
+                )
+                for page in (1, 2, 3)
+            ]
+
+            assert [post.id for page in pages for post in page.items] == expected, strategy
+
     async def test_search_posts_sort_by_date(
         self, db_session: AsyncSession, multiple_posts: list[Post]
     ):
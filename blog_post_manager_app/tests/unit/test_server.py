@@ -0,0 +1,36 @@
+"""Unit tests for the production launcher."""
+
+import pytest
+
+from src.server import PoolLimits, derive_pool_limits, worker_count
+
+
+class TestServer:
+    """Test cases for launcher sizing."""
+
+    def test_no_budget_keeps_configured_limits(self):
+        """Test that configured limits are used when there is no budget."""
+        assert derive_pool_limits(None, 8, 10, 20) == PoolLimits(10, 20)
+
+    def test_budget_caps_total_connections(self):
+        """Test that all workers together stay within the budget."""
+        workers = 4
+        limits = derive_pool_limits(50, workers, 10, 20)
+
+        # Each worker also holds one health probe connection
+        assert workers * (limits.pool_size + limits.max_overflow + 1) <= 50
+        assert limits == PoolLimits(pool_size=10, max_overflow=1)
+
+    def test_small_budget_shrinks_pool_size(self):
+        """Test that the pool itself shrinks when the budget is tight."""
+        assert derive_pool_limits(12, 4, 10, 20) == PoolLimits(pool_size=2, max_overflow=0)
+
+    def test_budget_too_small(self):
+        """Test that an unusable budget is rejected."""
+        with pytest.raises(ValueError, match="too small"):
+            derive_pool_limits(7, 4, 10, 20)
+
+    def test_worker_count(self):
+        """Test resolving the configured or CPU-based worker count."""
+        assert worker_count(3) == 3
+        assert worker_count(0) >= 1